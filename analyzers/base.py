@@ -2,38 +2,44 @@
 AI 분석 기본 클래스
 """
 from abc import ABC, abstractmethod
-from typing import Dict, List
+from typing import Dict, List, Optional
 import logging
 from openai import OpenAI
 
+from utils import metrics
+from .usage import UsageTracker
+
 logger = logging.getLogger(__name__)
 
 
 class BaseAnalyzer(ABC):
     """AI 분석 기본 클래스"""
 
-    def __init__(self, api_key: str, base_url: str, model: str):
+    def __init__(self, api_key: str, base_url: str, model: str, usage: Optional[UsageTracker] = None):
         """
         Args:
             api_key: OpenAI API Key
             base_url: OpenAI Base URL
             model: 모델명
+            usage: 호출별 토큰/지연/비용을 기록할 UsageTracker (실행 단위로 공유)
         """
         self.client = OpenAI(api_key=api_key, base_url=base_url)
         self.model = model
         self.max_retries = 3
+        self.usage = usage
 
     @abstractmethod
     def analyze(self, data: Dict) -> Dict:
         """분석 수행 (추상 메서드)"""
         pass
 
-    def _call_ai(self, messages: List[Dict]) -> Dict:
+    def _call_ai(self, messages: List[Dict], category: str = "") -> Dict:
         """
         AI 호출 with 재시도
 
         Args:
             messages: 메시지 리스트
+            category: 토큰/비용 집계 단위 (요약 카테고리 키, 'insights' 등)
 
         Returns:
             AI 응답 (JSON 딕셔너리)
@@ -45,12 +51,17 @@ class BaseAnalyzer(ABC):
         import json
 
         for attempt in range(self.max_retries):
+            if attempt:
+                metrics.inc("news_collector_llm_retries_total", model=self.model)
+            response = None
+            started = time.perf_counter()
             try:
                 response = self.client.chat.completions.create(
                     model=self.model,
                     messages=messages,
                     response_format={"type": "json_object"}
                 )
+                self._record_call(time.perf_counter() - started, response, category)
 
                 content = response.choices[0].message.content
 
@@ -74,8 +85,37 @@ class BaseAnalyzer(ABC):
                     raise ValueError(f"Failed to parse AI response as JSON after {self.max_retries} attempts")
 
             except Exception as e:
+                if response is None:
+                    self._record_call(time.perf_counter() - started, None, category)
                 logger.warning(f"AI call attempt {attempt + 1} failed: {e}")
                 if attempt < self.max_retries - 1:
                     time.sleep(2 ** attempt)  # Exponential backoff
                 else:
                     raise
+
+    def _record_call(self, latency: float, response, category: str = "") -> None:
+        """
+        LLM 호출 1건의 지연 시간/결과/토큰 수 기록
+
+        Args:
+            latency: 호출 소요 시간(초)
+            response: 응답 (호출 실패 시 None, usage가 없는 호환 API는 토큰 0으로 기록)
+            category: 집계 카테고리
+        """
+        status = "ok" if response is not None else "error"
+        metrics.observe("news_collector_llm_request_seconds", latency, model=self.model)
+        metrics.inc("news_collector_llm_requests_total", model=self.model, status=status)
+        usage = getattr(response, "usage", None)
+        tokens = {}
+        for kind in ("prompt", "completion"):
+            value = getattr(usage, f"{kind}_tokens", None)
+            tokens[kind] = value if isinstance(value, int) else 0
+            if tokens[kind]:
+                metrics.inc(
+                    "news_collector_llm_tokens_total", tokens[kind], model=self.model, kind=kind, category=category or None
+                )
+        if self.usage is not None:
+            self.usage.record(
+                category or "uncategorized", self.model, latency,
+                prompt_tokens=tokens["prompt"], completion_tokens=tokens["completion"], status=status,
+            )
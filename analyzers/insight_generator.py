@@ -8,6 +8,9 @@ from .base import BaseAnalyzer
 
 logger = logging.getLogger(__name__)
 
+# 토큰/비용 집계 카테고리
+INSIGHTS_CATEGORY = "insights"
+
 
 class InsightGenerator(BaseAnalyzer):
     """전략 인사이트 생성기"""
@@ -89,7 +92,7 @@ JSON 형식으로 반환:
             return self._call_ai([
                 {"role": "system", "content": "당신은 통신사 로밍 사업 전략 전문가입니다."},
                 {"role": "user", "content": prompt}
-            ])
+            ], category=INSIGHTS_CATEGORY)
         except Exception as e:
             logger.error(f"Insight generation failed: {e}")
             return {
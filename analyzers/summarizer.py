@@ -1,11 +1,16 @@
 """
 STEP 1: 기사 요약 (GPT-4o-mini)
 """
-from typing import Dict, List
+from typing import Dict, List, Optional, Union
 import logging
 
 from .base import BaseAnalyzer
+from .usage import UsageTracker
+from utils import metrics
+from utils.article import ArticleBatch, ArticleLike
+from utils.checkpoint import STAGE_SUMMARIES
 from utils.helpers import inspect_global_trend_translation
+from utils.progress import ProgressCallback, report_progress
 
 logger = logging.getLogger(__name__)
 
@@ -13,43 +18,143 @@ logger = logging.getLogger(__name__)
 class Summarizer(BaseAnalyzer):
     """기사 요약기"""
     TRANSLATE_TO_KOREAN_CATEGORIES = {"global_trend"}
+    MAX_ARTICLES_PER_CATEGORY = 10
+
+    def __init__(
+        self,
+        api_key: str,
+        base_url: str,
+        model: str,
+        store=None,
+        run_id: Optional[str] = None,
+        usage: Optional[UsageTracker] = None,
+    ):
+        """
+        Args:
+            api_key: OpenAI API Key
+            base_url: OpenAI Base URL
+            model: 모델명
+            store: ArticleStore (지정 시 링크 단위 요약 캐시/기록에 사용)
+            run_id: 요약을 기록할 실행 ID
+            usage: 호출별 토큰/비용을 기록할 UsageTracker
+        """
+        super().__init__(api_key=api_key, base_url=base_url, model=model, usage=usage)
+        self.store = store
+        self.run_id = run_id
 
-    def analyze(self, data: Dict) -> Dict:
+    def analyze(self, data: Dict, progress: Optional[ProgressCallback] = None, checkpoint=None) -> Dict:
         """
         기사 요약 분석
 
         Args:
-            data: {'category_name': [articles...]}
+            data: {'category_name': ArticleBatch 또는 기사 리스트}
+            progress: 카테고리 요약 완료 시 호출할 진행 콜백 ('category_analyzed')
+            checkpoint: RunCheckpoint (지정 시 카테고리 요약을 저장하고, 이미 저장된 카테고리는 재사용)
 
         Returns:
             요약된 데이터
         """
         results = {}
 
-        for category, articles in data.items():
+        for done, (category, articles) in enumerate(data.items(), start=1):
             if not articles:
                 results[category] = []
+                report_progress(progress, "category_analyzed", category=category, count=0, done=done, total=len(data))
                 continue
 
-            # 카테고리별 텍스트 변환
-            articles_text = self._format_articles(articles)
+            stage = f"{STAGE_SUMMARIES}/{category}"
+            if checkpoint is not None and checkpoint.has(stage):
+                results[category] = checkpoint.load(stage)
+                logger.info(f"Summaries for {category} restored from checkpoint")
+                report_progress(
+                    progress, "category_analyzed",
+                    category=category, count=len(results[category]), done=done, total=len(data),
+                )
+                continue
 
-            # AI 요약 호출
-            summaries = self._summarize_category(category, articles_text)
-            if category == "global_trend":
-                summaries = self._enforce_global_trend_korean_only(summaries)
+            batch = ArticleBatch.coerce(articles)[:self.MAX_ARTICLES_PER_CATEGORY]
+            cached = self._find_cached_summaries(category, batch)
+            pending = batch.take(i for i, article in enumerate(batch) if article.link not in cached)
+            metrics.inc("news_collector_summary_cache_total", len(batch) - len(pending), category=category, result="hit")
+            metrics.inc("news_collector_summary_cache_total", len(pending), category=category, result="miss")
+
+            summaries: List[Dict] = []
+            if pending:
+                # 카테고리별 텍스트 변환
+                articles_text = self._format_articles(pending)
+
+                # AI 요약 호출
+                with metrics.timer("news_collector_stage_seconds", stage="summarize", category=category):
+                    summaries = self._summarize_category(category, articles_text)
+                if category == "global_trend":
+                    summaries = self._enforce_global_trend_korean_only(summaries)
+            else:
+                logger.info(f"Summary cache hit for all {len(batch)} articles in {category}")
+
+            if cached:
+                summaries = self._merge_cached_summaries(batch, cached, summaries)
+            self._record_summaries(category, summaries)
+            if checkpoint is not None:
+                checkpoint.save(stage, summaries)
             results[category] = summaries
+            report_progress(
+                progress, "category_analyzed",
+                category=category, count=len(summaries), done=done, total=len(data), cached=len(cached),
+            )
 
         return results
 
-    def _format_articles(self, articles: List[Dict]) -> str:
+    def _find_cached_summaries(self, category: str, batch: ArticleBatch) -> Dict[str, Dict]:
+        """저장소에 이미 요약된 링크 조회 (link -> summary)"""
+        if self.store is None:
+            return {}
+        try:
+            return self.store.find_summaries(category, [article.link for article in batch])
+        except Exception as e:
+            logger.warning(f"Summary cache lookup failed for {category}: {e}")
+            return {}
+
+    def _record_summaries(self, category: str, summaries: List[Dict]) -> None:
+        if self.store is None or not self.run_id:
+            return
+        try:
+            self.store.save_summaries(self.run_id, category, summaries)
+        except Exception as e:
+            logger.warning(f"Summary store write failed for {category}: {e}")
+
+    def _merge_cached_summaries(
+        self,
+        batch: ArticleBatch,
+        cached: Dict[str, Dict],
+        fresh: List[Dict],
+    ) -> List[Dict]:
+        """캐시 요약과 신규 요약을 기사 순서대로 병합하고 index를 다시 매긴다."""
+        fresh_by_link = {item.get("link"): item for item in fresh if isinstance(item, dict)}
+        merged: List[Dict] = []
+        used_links = set()
+        for article in batch:
+            item = cached.get(article.link) or fresh_by_link.get(article.link)
+            if item is None or article.link in used_links:
+                continue
+            merged.append(dict(item))
+            used_links.add(article.link)
+        # 링크가 원문과 달라진 신규 요약도 누락하지 않는다.
+        merged.extend(
+            dict(item) for item in fresh
+            if isinstance(item, dict) and item.get("link") not in used_links
+        )
+        for index, item in enumerate(merged, 1):
+            item["index"] = index
+        return merged
+
+    def _format_articles(self, articles: Union[ArticleBatch, List[ArticleLike]]) -> str:
         """기사를 텍스트로 변환"""
         formatted = []
-        for i, article in enumerate(articles[:10], 1):  # 최대 10개
+        for i, article in enumerate(ArticleBatch.coerce(articles)[:10], 1):  # 최대 10개
             formatted.append(
-                f"[{i}] {article['title']}\n"
-                f"링크: {article['link']}\n"
-                f"요약: {article['snippet']}\n"
+                f"[{i}] {article.title}\n"
+                f"링크: {article.link}\n"
+                f"요약: {article.snippet}\n"
             )
         return "\n".join(formatted)
 
@@ -87,7 +192,7 @@ class Summarizer(BaseAnalyzer):
             response = self._call_ai([
                 {"role": "system", "content": "당신은 뉴스 요약 전문가입니다. 응답은 반드시 JSON 객체로만 반환하세요."},
                 {"role": "user", "content": prompt}
-            ])
+            ], category=category)
 
             # 응답이 딕셔너리인지 확인
             if not isinstance(response, dict):
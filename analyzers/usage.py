@@ -0,0 +1,136 @@
+"""
+LLM 호출 토큰/지연/비용 집계 (호출 단위 기록 -> 카테고리/모델/실행 단위 합계)
+"""
+from __future__ import annotations
+
+import logging
+import threading
+from typing import Any, Dict, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+# 모델별 USD 단가 (입력, 출력 / 100만 토큰). 날짜가 붙은 모델명은 가장 긴 접두어로 매칭한다.
+DEFAULT_PRICES_PER_1M: Dict[str, Tuple[float, float]] = {
+    "gpt-4o-mini": (0.15, 0.60),
+    "gpt-4o": (2.50, 10.00),
+    "gpt-4.1-nano": (0.10, 0.40),
+    "gpt-4.1-mini": (0.40, 1.60),
+    "gpt-4.1": (2.00, 8.00),
+    "gpt-5-nano": (0.05, 0.40),
+    "gpt-5-mini": (0.25, 2.00),
+    "gpt-5": (1.25, 10.00),
+}
+
+USAGE_FIELDS = ("calls", "failed_calls", "prompt_tokens", "completion_tokens", "total_tokens", "latency_seconds", "cost_usd")
+
+
+def parse_price_overrides(text: str) -> Dict[str, Tuple[float, float]]:
+    """
+    LLM_PRICING 설정 파싱 ("모델=입력단가/출력단가;..." USD/100만 토큰)
+
+    Raises:
+        ValueError: 형식 오류
+    """
+    prices: Dict[str, Tuple[float, float]] = {}
+    for entry in (text or "").split(";"):
+        entry = entry.strip()
+        if not entry:
+            continue
+        try:
+            model, pair = entry.split("=", 1)
+            prompt_price, completion_price = pair.split("/", 1)
+            prices[model.strip()] = (float(prompt_price), float(completion_price))
+        except ValueError:
+            raise ValueError(f"LLM_PRICING entry must look like 'model=0.15/0.60': {entry!r}")
+    return prices
+
+
+def resolve_price(model: str, prices: Dict[str, Tuple[float, float]]) -> Optional[Tuple[float, float]]:
+    """모델 단가 (정확히 일치 -> 가장 긴 접두어, 모르면 None)"""
+    if model in prices:
+        return prices[model]
+    matches = [name for name in prices if model.startswith(name)]
+    return prices[max(matches, key=len)] if matches else None
+
+
+def _empty_totals() -> Dict[str, Any]:
+    return {field: 0 for field in USAGE_FIELDS}
+
+
+def _add(totals: Dict[str, Any], record: Dict[str, Any]) -> None:
+    totals["calls"] += 1
+    totals["failed_calls"] += 0 if record["status"] == "ok" else 1
+    totals["prompt_tokens"] += record["prompt_tokens"]
+    totals["completion_tokens"] += record["completion_tokens"]
+    totals["total_tokens"] += record["prompt_tokens"] + record["completion_tokens"]
+    totals["latency_seconds"] = round(totals["latency_seconds"] + record["latency_seconds"], 3)
+    if record["cost_usd"] is None or totals["cost_usd"] is None:
+        # 단가를 모르는 모델이 섞이면 비용 합계는 알 수 없음
+        totals["cost_usd"] = None
+    else:
+        totals["cost_usd"] = round(totals["cost_usd"] + record["cost_usd"], 6)
+
+
+def summarize_usage(records: List[Dict[str, Any]]) -> Dict[str, Any]:
+    """
+    호출 기록 합계
+
+    Returns:
+        실행 합계 필드 + {'categories': {카테고리: 합계}, 'models': {모델: 합계}}
+    """
+    totals = _empty_totals()
+    categories: Dict[str, Dict[str, Any]] = {}
+    models: Dict[str, Dict[str, Any]] = {}
+    for record in records:
+        _add(totals, record)
+        _add(categories.setdefault(record["category"], _empty_totals()), record)
+        _add(models.setdefault(record["model"], _empty_totals()), record)
+    return {**totals, "categories": categories, "models": models}
+
+
+class UsageTracker:
+    """
+    실행 1건의 LLM 호출 기록.
+
+    Summarizer/InsightGenerator가 같은 tracker를 공유하며, 카테고리는 호출 위치에서 지정한다
+    (요약: 카테고리 키, 인사이트: 'insights').
+    """
+
+    def __init__(self, prices: Optional[Dict[str, Tuple[float, float]]] = None):
+        self.prices = {**DEFAULT_PRICES_PER_1M, **(prices or {})}
+        self._lock = threading.Lock()
+        self._records: List[Dict[str, Any]] = []
+
+    def record(
+        self,
+        category: str,
+        model: str,
+        latency_seconds: float,
+        prompt_tokens: int = 0,
+        completion_tokens: int = 0,
+        status: str = "ok",
+    ) -> Dict[str, Any]:
+        price = resolve_price(model, self.prices)
+        cost = None
+        if price is not None:
+            cost = round((prompt_tokens * price[0] + completion_tokens * price[1]) / 1_000_000, 6)
+        record = {
+            "category": category,
+            "model": model,
+            "prompt_tokens": prompt_tokens,
+            "completion_tokens": completion_tokens,
+            "latency_seconds": round(latency_seconds, 3),
+            "status": status,
+            "cost_usd": cost,
+        }
+        with self._lock:
+            self._records.append(record)
+        return record
+
+    @property
+    def records(self) -> List[Dict[str, Any]]:
+        with self._lock:
+            return list(self._records)
+
+    def summary(self) -> Dict[str, Any]:
+        return summarize_usage(self.records)
@@ -0,0 +1,3 @@
+"""
+오프라인 벤치마크 (녹화된 API 응답 + 로컬 스텁 서버)
+"""
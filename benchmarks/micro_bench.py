@@ -0,0 +1,231 @@
+"""
+필터/중복 제거/0404 분류 마이크로 벤치마크 (합성 데이터, 처리량 + 최대 메모리)
+
+처리량은 추적 없이 측정하고, 최대 메모리는 tracemalloc을 켠 두 번째 패스에서 측정한다
+(tracemalloc은 할당마다 비용이 있어 처리량 측정과 분리한다).
+
+Usage:
+    python -m benchmarks.micro_bench --count 1000000 --post-count 100000
+    python -m benchmarks.micro_bench --targets keyword_filter dedup_within --count 5000000 --chunk-size 200000
+"""
+from __future__ import annotations
+
+import argparse
+import gc
+import logging
+import platform
+import sys
+import time
+import tracemalloc
+from dataclasses import asdict
+from datetime import datetime
+from typing import Callable, Dict, List, Optional
+
+import main
+from benchmarks.pipeline_bench import DEFAULT_OUTPUT_DIR, write_result
+from benchmarks.synthetic import SyntheticArticleGenerator, SyntheticProfile
+from collectors.mofa_0404_collector import Mofa0404Collector
+from filters.deduplicator import Deduplicator
+from filters.keyword_filter import KeywordFilter
+from filters.time_filter import TimeFilter
+
+logger = logging.getLogger(__name__)
+
+TARGETS = ("keyword_filter", "time_filter", "dedup_within", "dedup_cross", "classify_0404")
+DEFAULT_COUNT = 1_000_000
+# 0404 분류는 공지 1건당 문장 단위 정규식 검사를 하므로 기사 필터보다 훨씬 느리다.
+DEFAULT_POST_COUNT = 100_000
+DEFAULT_CHUNK_SIZE = 100_000
+
+
+def _build_operation(target: str, generator: SyntheticArticleGenerator, filters_config: Dict) -> Callable:
+    """청크 1개를 처리하고 통과 건수를 반환하는 함수 (상태가 있는 대상은 청크 간 상태를 유지)"""
+    if target == "keyword_filter":
+        keyword_filter = KeywordFilter(
+            blacklist_domains=filters_config["blacklist_domains"],
+            excluded_keywords=filters_config["excluded_keywords"],
+            global_trend_rules=filters_config.get("global_trend", {}),
+        )
+        return lambda batch: len(keyword_filter.filter_articles(batch))
+    if target == "time_filter":
+        time_filter = TimeFilter(window_hours=generator.profile.window_hours)
+        return lambda batch: len(time_filter.filter_batch(batch))
+    if target == "dedup_within":
+        deduplicator = Deduplicator()
+        return lambda batch: len(deduplicator.deduplicate_within_category(batch))
+    if target == "dedup_cross":
+        return lambda batch: len(Deduplicator().deduplicate_cross_categories(batch))
+    if target == "classify_0404":
+        collector = Mofa0404Collector()
+        return lambda posts: sum(
+            1 for title, body in posts if collector._classify_post(title=title, body_text=body)
+        )
+    raise ValueError(f"Unknown micro benchmark target: {target}")
+
+
+def _chunks(target: str, generator: SyntheticArticleGenerator, count: int, chunk_size: int):
+    if target == "classify_0404":
+        return generator.iter_0404_batches(count, chunk_size)
+    return generator.iter_batches(count, chunk_size)
+
+
+def _new_generator(profile: SyntheticProfile, filters_config: Dict, now: datetime) -> SyntheticArticleGenerator:
+    return SyntheticArticleGenerator(
+        profile,
+        blacklist_domains=filters_config["blacklist_domains"],
+        excluded_keywords=filters_config["excluded_keywords"],
+        now=now,
+    )
+
+
+def run_micro_benchmark(
+    target: str,
+    count: int = DEFAULT_COUNT,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    profile: Optional[SyntheticProfile] = None,
+    measure_memory: bool = True,
+    filters_config: Optional[Dict] = None,
+) -> Dict:
+    """
+    합성 데이터 count건으로 대상 1개를 측정한다.
+
+    Args:
+        target: TARGETS 중 하나
+        count: 생성할 기사/공지 수
+        chunk_size: 한 번에 생성/처리할 건수
+        profile: 합성 데이터 분포 (기본 SyntheticProfile())
+        measure_memory: False면 tracemalloc 패스를 건너뛴다
+        filters_config: categories.yaml의 filters 설정 (None이면 로드)
+
+    Returns:
+        {'target', 'items', 'passed', 'seconds', 'items_per_sec', 'peak_memory_mb', 'working_memory_mb', 'generated'}
+    """
+    profile = profile or SyntheticProfile()
+    filters_config = filters_config or main.load_categories()["filters"]
+    now = datetime.now().astimezone()
+
+    # 1) 처리량: 생성 시간은 빼고 대상 호출 시간만 합산
+    generator = _new_generator(profile, filters_config, now)
+    operation = _build_operation(target, generator, filters_config)
+    seconds = 0.0
+    passed = 0
+    for chunk in _chunks(target, generator, count, chunk_size):
+        started = time.perf_counter()
+        passed += operation(chunk)
+        seconds += time.perf_counter() - started
+        del chunk
+
+    result = {
+        "target": target,
+        "items": count,
+        "passed": passed,
+        "seconds": round(seconds, 4),
+        "items_per_sec": round(count / seconds) if seconds else None,
+        "peak_memory_mb": None,
+        "working_memory_mb": None,
+        "generated": dict(generator.stats),
+    }
+    if not measure_memory:
+        return result
+
+    # 2) 메모리: 같은 시드로 다시 생성하며 추적
+    #    peak = 입력 청크 + 대상 작업 메모리 + 누적 상태(중복 제거 seen set 등)의 최댓값
+    #    working = 대상 호출 중 입력 청크 대비 추가로 잡은 메모리의 최댓값
+    del operation
+    gc.collect()
+    generator = _new_generator(profile, filters_config, now)
+    tracemalloc.start()
+    try:
+        operation = _build_operation(target, generator, filters_config)
+        working = 0
+        for chunk in _chunks(target, generator, count, chunk_size):
+            before, _ = tracemalloc.get_traced_memory()
+            tracemalloc.reset_peak()
+            operation(chunk)
+            working = max(working, tracemalloc.get_traced_memory()[1] - before)
+            del chunk
+        peak = tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+    result["peak_memory_mb"] = round(peak / 1024 / 1024, 1)
+    result["working_memory_mb"] = round(working / 1024 / 1024, 1)
+    return result
+
+
+def format_table(results: List[Dict]) -> str:
+    header = f"{'target':<16}{'items':>12}{'passed':>12}{'seconds':>10}{'items/s':>12}{'peak MB':>10}{'work MB':>10}"
+    lines = [header, "-" * len(header)]
+    for run in results:
+        peak = f"{run['peak_memory_mb']:.1f}" if run["peak_memory_mb"] is not None else "-"
+        working = f"{run['working_memory_mb']:.1f}" if run["working_memory_mb"] is not None else "-"
+        lines.append(
+            f"{run['target']:<16}{run['items']:>12,}{run['passed']:>12,}{run['seconds']:>10.2f}"
+            f"{run['items_per_sec'] or 0:>12,}{peak:>10}{working:>10}"
+        )
+    return "\n".join(lines)
+
+
+def parse_args(argv: Optional[List[str]] = None) -> argparse.Namespace:
+    defaults = SyntheticProfile()
+    parser = argparse.ArgumentParser(description="Micro benchmarks for filters, dedup and 0404 classification")
+    parser.add_argument("--targets", nargs="+", choices=TARGETS, default=list(TARGETS))
+    parser.add_argument("--count", type=int, default=DEFAULT_COUNT, help="Synthetic articles per article target")
+    parser.add_argument("--post-count", type=int, default=DEFAULT_POST_COUNT, help="Synthetic 0404 posts")
+    parser.add_argument("--chunk-size", type=int, default=DEFAULT_CHUNK_SIZE)
+    parser.add_argument("--duplicate-rate", type=float, default=defaults.duplicate_rate)
+    parser.add_argument("--blacklist-rate", type=float, default=defaults.blacklist_rate)
+    parser.add_argument("--excluded-keyword-rate", type=float, default=defaults.excluded_keyword_rate)
+    parser.add_argument("--english-rate", type=float, default=defaults.english_rate)
+    parser.add_argument("--in-window-rate", type=float, default=defaults.in_window_rate)
+    parser.add_argument("--missing-date-rate", type=float, default=defaults.missing_date_rate)
+    parser.add_argument("--telecom-post-rate", type=float, default=defaults.telecom_post_rate)
+    parser.add_argument("--seed", type=int, default=defaults.seed)
+    parser.add_argument("--no-memory", action="store_true", help="Skip the tracemalloc pass")
+    parser.add_argument("--output-dir", default=DEFAULT_OUTPUT_DIR, help="Directory for the JSON result")
+    parser.add_argument("--log-level", default="ERROR", help="Log level for pipeline modules")
+    return parser.parse_args(argv)
+
+
+def main_cli(argv: Optional[List[str]] = None) -> int:
+    args = parse_args(argv)
+    logging.basicConfig(level=getattr(logging, args.log_level.upper(), logging.ERROR))
+    profile = SyntheticProfile(
+        duplicate_rate=args.duplicate_rate,
+        blacklist_rate=args.blacklist_rate,
+        excluded_keyword_rate=args.excluded_keyword_rate,
+        english_rate=args.english_rate,
+        in_window_rate=args.in_window_rate,
+        missing_date_rate=args.missing_date_rate,
+        telecom_post_rate=args.telecom_post_rate,
+        seed=args.seed,
+    )
+    filters_config = main.load_categories()["filters"]
+
+    results = []
+    for target in args.targets:
+        run = run_micro_benchmark(
+            target, count=args.post_count if target == "classify_0404" else args.count,
+            chunk_size=args.chunk_size, profile=profile,
+            measure_memory=not args.no_memory, filters_config=filters_config,
+        )
+        results.append(run)
+        print(f"{target}: {run['items_per_sec'] or 0:,} items/s", file=sys.stderr)
+
+    print(format_table(results))
+    path = write_result(
+        {
+            "created_at": datetime.now().strftime("%Y-%m-%dT%H:%M:%S"),
+            "python": platform.python_version(),
+            "profile": asdict(profile),
+            "chunk_size": args.chunk_size,
+            "results": results,
+        },
+        args.output_dir,
+        prefix="micro",
+    )
+    print(f"\nResult: {path}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main_cli())
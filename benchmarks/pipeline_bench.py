@@ -0,0 +1,268 @@
+"""
+파이프라인 오프라인 벤치마크 (수집/필터/중복 제거/요약/렌더링 단계별 소요 시간)
+
+실제 수집기/필터/분석기/렌더러를 그대로 쓰고, 외부 API만 FixtureStubServer로 대체한다.
+
+Usage:
+    python -m benchmarks.pipeline_bench --scales 1 10 100 --latency-ms 30
+    python -m benchmarks.pipeline_bench --baseline output/benchmarks/baseline.json --max-regression 0.25
+"""
+from __future__ import annotations
+
+import argparse
+import json
+import logging
+import os
+import platform
+import sys
+import tempfile
+import time
+from contextlib import contextmanager
+from datetime import datetime, timedelta
+from typing import Dict, Iterator, List, Optional
+
+import main
+from analyzers.insight_generator import InsightGenerator
+from analyzers.summarizer import Summarizer
+from analyzers.usage import UsageTracker
+from benchmarks.stub_server import FixtureStubServer
+from collectors.google_collector import GoogleCollector
+from collectors.mofa_0404_collector import Mofa0404Collector
+from collectors.naver_collector import NaverCollector
+from filters.deduplicator import Deduplicator
+from filters.keyword_filter import KeywordFilter
+from filters.time_filter import TimeFilter
+from notifiers.email_formatter import EmailFormatter
+from notifiers.web_generator import WebGenerator
+from utils.article import ArticleBatch
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_OUTPUT_DIR = "output/benchmarks"
+DEFAULT_SCALES = (1, 10, 100)
+STAGES = ("collect", "collect_0404", "filter", "dedup", "summarize", "insights", "render")
+# 이보다 짧은 단계는 회귀 판정에서 제외한다 (타이머 잡음)
+MIN_COMPARABLE_SECONDS = 0.05
+
+
+class StageTimer:
+    """단계별 누적 소요 시간(초)"""
+
+    def __init__(self):
+        self.seconds: Dict[str, float] = {stage: 0.0 for stage in STAGES}
+
+    @contextmanager
+    def stage(self, name: str) -> Iterator[None]:
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.seconds[name] += time.perf_counter() - started
+
+
+def _limit_keywords(categories: Dict, max_keywords: Optional[int]) -> Dict:
+    if not max_keywords:
+        return categories
+    return {key: {**config, "keywords": config["keywords"][:max_keywords]} for key, config in categories.items()}
+
+
+def run_benchmark(scale: int, latency_ms: float = 0.0, max_keywords: Optional[int] = None) -> Dict:
+    """
+    볼륨 배수 1개에 대해 파이프라인을 스텁 서버로 실행하고 단계별 소요 시간을 잰다.
+
+    Args:
+        scale: 볼륨 배수 (스텁 응답 항목 수 x scale)
+        latency_ms: 스텁 응답 지연(ms)
+        max_keywords: 카테고리별 키워드 수 상한 (빠른 확인용, None이면 categories.yaml 전체)
+
+    Returns:
+        {'scale', 'stages': {단계: 초}, 'counts': {...}, 'requests': {경로: 요청 수}}
+    """
+    config = main.load_categories()
+    categories = _limit_keywords(config["categories"], max_keywords)
+    filters_config = config["filters"]
+    timer = StageTimer()
+    counts: Dict[str, int] = {}
+
+    with FixtureStubServer(latency_ms=latency_ms, scale=scale) as stub, \
+            tempfile.TemporaryDirectory(prefix="news_bench_") as tmp:
+        naver = NaverCollector(client_id="bench", client_secret="bench")
+        naver.base_url = stub.naver_base_url
+        naver.request_delay = 0
+        google = GoogleCollector(api_key="bench", search_engine_id="bench")
+        google.base_url = stub.google_base_url
+
+        raw: Dict[str, ArticleBatch] = {}
+        with timer.stage("collect"):
+            for cat_key, cat_config in categories.items():
+                raw[cat_key] = main._collect_category_sources(cat_key, cat_config, naver, google, fetch_limit=100)
+        counts["raw"] = sum(len(batch) for batch in raw.values())
+
+        today_kst = stub.now.strftime("%Y-%m-%d")
+        yesterday_kst = (stub.now - timedelta(days=1)).strftime("%Y-%m-%d")
+        mofa = Mofa0404Collector(max_pages=scale + 1)
+        mofa.BOARD_URLS = stub.board_urls
+        mofa.SITE_URL = stub.url
+        with timer.stage("collect_0404"):
+            alerts = mofa.collect_keyword_posts_by_date_range(yesterday_kst, today_kst)
+        counts["external_alerts"] = len(alerts)
+
+        time_filter = TimeFilter(window_hours=24)
+        keyword_filter = KeywordFilter(
+            blacklist_domains=filters_config["blacklist_domains"],
+            excluded_keywords=filters_config["excluded_keywords"],
+            global_trend_rules=filters_config.get("global_trend", {}),
+        )
+        filtered: Dict[str, ArticleBatch] = {}
+        with timer.stage("filter"):
+            for cat_key, batch in raw.items():
+                batch = main._run_filter("time", cat_key, time_filter.filter_batch, batch)
+                filtered[cat_key] = main._run_filter(
+                    "keyword", cat_key, lambda articles: keyword_filter.filter_articles(articles, category=cat_key), batch
+                )
+        counts["filtered"] = sum(len(batch) for batch in filtered.values())
+
+        deduplicator = Deduplicator()
+        collected: Dict[str, ArticleBatch] = {}
+        with timer.stage("dedup"):
+            for cat_key, batch in filtered.items():
+                collected[cat_key] = main._run_filter("dedup", cat_key, deduplicator.deduplicate_within_category, batch)
+                for article in collected[cat_key]:
+                    article.category = cat_key
+            all_articles = ArticleBatch()
+            for batch in collected.values():
+                all_articles.extend(batch)
+            unique = Deduplicator().deduplicate_cross_categories(all_articles)
+        counts["deduplicated"] = sum(len(batch) for batch in collected.values())
+        counts["unique"] = len(unique)
+
+        usage = UsageTracker()
+        summarizer = Summarizer(api_key="bench", base_url=stub.openai_base_url, model="gpt-4o-mini", usage=usage)
+        with timer.stage("summarize"):
+            summary_data = summarizer.analyze(collected)
+        counts["summaries"] = sum(len(items) for items in summary_data.values())
+
+        insight_generator = InsightGenerator(
+            api_key="bench", base_url=stub.openai_base_url, model="gpt-4o-mini", usage=usage
+        )
+        with timer.stage("insights"):
+            insight_data = insight_generator.analyze(summary_data)
+
+        analyzed = {**insight_data, "external_alerts": alerts, "llm_usage": usage.summary()}
+        for category, summaries in summary_data.items():
+            analyzed[f"section_{category}"] = summaries
+        with timer.stage("render"):
+            html_content = EmailFormatter().format(analyzed)
+            WebGenerator().generate(analyzed, output_path=os.path.join(tmp, "web", "daily_report.html"))
+        counts["email_bytes"] = len(html_content.encode("utf-8"))
+        requests_by_route = dict(stub.request_counts)
+
+    return {
+        "scale": scale,
+        "stages": {stage: round(seconds, 4) for stage, seconds in timer.seconds.items()},
+        "total_seconds": round(sum(timer.seconds.values()), 4),
+        "counts": counts,
+        "requests": requests_by_route,
+    }
+
+
+def compare_results(current: Dict, baseline: Dict, max_regression: float) -> List[str]:
+    """
+    기준 결과 대비 회귀 단계 목록
+
+    Args:
+        current: 이번 벤치마크 결과
+        baseline: 기준 벤치마크 결과 (같은 형식)
+        max_regression: 허용 증가율 (0.25 = 25% 느려질 때까지 허용)
+
+    Returns:
+        회귀 설명 문자열 리스트 (비어 있으면 통과)
+    """
+    baseline_runs = {run["scale"]: run for run in baseline.get("runs", [])}
+    regressions = []
+    for run in current.get("runs", []):
+        base_run = baseline_runs.get(run["scale"])
+        if base_run is None:
+            continue
+        for stage, seconds in run["stages"].items():
+            base_seconds = base_run["stages"].get(stage)
+            if base_seconds is None or max(seconds, base_seconds) < MIN_COMPARABLE_SECONDS:
+                continue
+            if seconds > base_seconds * (1 + max_regression):
+                regressions.append(
+                    f"scale {run['scale']}x {stage}: {seconds:.3f}s vs baseline {base_seconds:.3f}s "
+                    f"(+{(seconds / base_seconds - 1) * 100 if base_seconds else float('inf'):.0f}%)"
+                )
+    return regressions
+
+
+def format_table(result: Dict) -> str:
+    """단계 x 배수 소요 시간 표"""
+    runs = result["runs"]
+    header = f"{'stage':<14}" + "".join(f"{str(run['scale']) + 'x':>12}" for run in runs)
+    lines = [header, "-" * len(header)]
+    for stage in STAGES:
+        lines.append(f"{stage:<14}" + "".join(f"{run['stages'][stage]:>11.3f}s" for run in runs))
+    lines.append(f"{'total':<14}" + "".join(f"{run['total_seconds']:>11.3f}s" for run in runs))
+    for key in ("raw", "filtered", "unique", "summaries", "external_alerts"):
+        lines.append(f"{key:<14}" + "".join(f"{run['counts'][key]:>12}" for run in runs))
+    return "\n".join(lines)
+
+
+def write_result(result: Dict, output_dir: str = DEFAULT_OUTPUT_DIR, prefix: str = "pipeline") -> str:
+    """벤치마크 결과 JSON 저장 (<output_dir>/<prefix>_<시각>.json)"""
+    os.makedirs(output_dir, exist_ok=True)
+    path = os.path.join(output_dir, f"{prefix}_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json")
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(result, f, ensure_ascii=False, indent=2)
+    return path
+
+
+def parse_args(argv: Optional[List[str]] = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Offline pipeline benchmark against recorded API fixtures")
+    parser.add_argument("--scales", type=int, nargs="+", default=list(DEFAULT_SCALES), help="Volume multipliers")
+    parser.add_argument("--latency-ms", type=float, default=0.0, help="Stub response latency in milliseconds")
+    parser.add_argument("--max-keywords", type=int, default=None, help="Limit keywords per category")
+    parser.add_argument("--output-dir", default=DEFAULT_OUTPUT_DIR, help="Directory for the JSON result")
+    parser.add_argument("--baseline", help="Previous result JSON to compare against")
+    parser.add_argument(
+        "--max-regression", type=float, default=0.25,
+        help="Allowed slowdown ratio per stage before failing (0.25 = 25%%)",
+    )
+    parser.add_argument("--log-level", default="ERROR", help="Log level for pipeline modules")
+    return parser.parse_args(argv)
+
+
+def main_cli(argv: Optional[List[str]] = None) -> int:
+    args = parse_args(argv)
+    logging.basicConfig(level=getattr(logging, args.log_level.upper(), logging.ERROR))
+
+    result = {
+        "created_at": datetime.now().strftime("%Y-%m-%dT%H:%M:%S"),
+        "latency_ms": args.latency_ms,
+        "max_keywords": args.max_keywords,
+        "python": platform.python_version(),
+        "runs": [],
+    }
+    for scale in args.scales:
+        run = run_benchmark(scale, latency_ms=args.latency_ms, max_keywords=args.max_keywords)
+        result["runs"].append(run)
+        print(f"scale {scale}x: {run['total_seconds']:.3f}s ({run['counts']['raw']} raw articles)", file=sys.stderr)
+
+    print(format_table(result))
+    print(f"\nResult: {write_result(result, args.output_dir)}")
+
+    if args.baseline:
+        with open(args.baseline, "r", encoding="utf-8") as f:
+            regressions = compare_results(result, json.load(f), args.max_regression)
+        if regressions:
+            print("\nPerformance regressions:")
+            for line in regressions:
+                print(f"  {line}")
+            return 1
+        print(f"\nNo regressions beyond {args.max_regression:.0%} against {args.baseline}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main_cli())
@@ -0,0 +1,300 @@
+"""
+녹화된 Naver/Google/0404/OpenAI 응답을 서빙하는 로컬 스텁 서버
+
+- 응답 지연(latency_ms)과 볼륨 배수(scale)를 지정할 수 있다.
+- 녹화 시각(RECORDED_AT) 기준 게시일을 현재 시각 기준으로 옮겨 시간 필터를 실제처럼 통과시킨다.
+- scale배로 복제한 항목은 링크/제목에 요청별 태그를 붙여 서로 다른 기사로 취급되게 한다
+  (원본 항목은 제목을 유지하므로 키워드 간 중복은 실제처럼 제목 기준으로 걸러진다).
+"""
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+import os
+import re
+import threading
+import time
+from datetime import date, datetime, timedelta, timezone
+from email.utils import format_datetime, parsedate_to_datetime
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Dict, List, Optional
+from urllib.parse import parse_qs, urlparse
+from zoneinfo import ZoneInfo
+
+logger = logging.getLogger(__name__)
+
+FIXTURES_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "fixtures")
+KST = ZoneInfo("Asia/Seoul")
+
+# 픽스처를 녹화한 시각 (모든 게시일은 이 시각 기준 상대 위치를 유지한 채 현재 시각으로 이동한다)
+RECORDED_AT = datetime(2026, 3, 2, 9, 0, tzinfo=KST)
+
+NAVER_ENDPOINTS = ("news", "blog", "cafearticle")
+BOARD_KEYS = ("embsyNtc", "safetyNtc")
+QUERY_TAG = "__BENCH_Q__"
+
+_LIST_ROW_PATTERN = re.compile(r"<tr>\s*<td class=\"num\">[\s\S]*?</tr>\s*", re.IGNORECASE)
+_ARTICLE_ID_PATTERN = re.compile(r"ATC(\d+)")
+_ISO_DATE_PATTERN = re.compile(r"\d{4}-\d{2}-\d{2}")
+_SNIPPET_DATE_PATTERN = re.compile(r"^([A-Z][a-z]{2} \d{1,2}, \d{4})")
+_PROMPT_ITEM_PATTERN = re.compile(r"^\[(?P<index>\d+)\] (?P<title>.*)\n링크: (?P<link>.*)\n요약: (?P<snippet>.*)$", re.MULTILINE)
+
+
+def load_fixture(name: str, fixtures_dir: str = FIXTURES_DIR):
+    """픽스처 파일 로드 (.json은 파싱, 그 외는 텍스트)"""
+    with open(os.path.join(fixtures_dir, name), "r", encoding="utf-8") as f:
+        return json.load(f) if name.endswith(".json") else f.read()
+
+
+def _tag_link(link: str, tag: str) -> str:
+    return f"{link}{'&' if '?' in link else '?'}bench={tag}"
+
+
+def _replicate(items: List[Dict], scale: int, rewrite) -> List[Dict]:
+    """항목을 scale배로 복제 (복제본 k>=1은 제목에도 태그를 붙인다)"""
+    replicated = []
+    for copy_index in range(scale):
+        for item in items:
+            clone = rewrite(dict(item))
+            tag = f"{QUERY_TAG}.{copy_index}"
+            clone["link"] = _tag_link(clone["link"], tag)
+            if copy_index:
+                clone["title"] = f"{clone['title']} #{tag}"
+            replicated.append(clone)
+    return replicated
+
+
+class FixtureStubServer:
+    """
+    녹화 응답 스텁 서버 (with 문으로 시작/종료)
+
+    Example:
+        with FixtureStubServer(latency_ms=50, scale=10) as stub:
+            naver.base_url = stub.naver_base_url
+    """
+
+    def __init__(
+        self,
+        latency_ms: float = 0.0,
+        scale: int = 1,
+        fixtures_dir: str = FIXTURES_DIR,
+        now: Optional[datetime] = None,
+    ):
+        """
+        Args:
+            latency_ms: 모든 응답에 더할 지연 시간(ms)
+            scale: 볼륨 배수 (검색 응답 항목 수, 0404 목록 페이지 수에 곱한다)
+            fixtures_dir: 픽스처 디렉토리
+            now: 게시일 이동 기준 시각 (기본 현재 시각)
+        """
+        if scale < 1:
+            raise ValueError("scale must be >= 1")
+        self.latency = max(0.0, latency_ms) / 1000
+        self.scale = scale
+        self.fixtures_dir = fixtures_dir
+        self.now = (now or datetime.now(timezone.utc)).astimezone(KST)
+        self.shift = self.now - RECORDED_AT
+        self.day_shift = timedelta(days=(self.now.date() - RECORDED_AT.date()).days)
+        self.request_counts: Dict[str, int] = {}
+        self._lock = threading.Lock()
+        self._bodies = self._prepare_bodies()
+        self._httpd: Optional[ThreadingHTTPServer] = None
+        self._thread: Optional[threading.Thread] = None
+
+    # ----- 서버 수명 -----
+
+    def start(self) -> "FixtureStubServer":
+        stub = self
+
+        class Handler(_StubHandler):
+            server_stub = stub
+
+        self._httpd = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        self._httpd.daemon_threads = True
+        self._thread = threading.Thread(target=self._httpd.serve_forever, name="bench-stub", daemon=True)
+        self._thread.start()
+        logger.info(f"Benchmark stub server listening on {self.url} (scale={self.scale})")
+        return self
+
+    def stop(self) -> None:
+        if self._httpd is not None:
+            self._httpd.shutdown()
+            self._httpd.server_close()
+            self._httpd = None
+
+    def __enter__(self) -> "FixtureStubServer":
+        return self.start()
+
+    def __exit__(self, *exc) -> None:
+        self.stop()
+
+    @property
+    def url(self) -> str:
+        host, port = self._httpd.server_address[:2]
+        return f"http://{host}:{port}"
+
+    @property
+    def naver_base_url(self) -> str:
+        return f"{self.url}/v1/search"
+
+    @property
+    def google_base_url(self) -> str:
+        return f"{self.url}/customsearch/v1"
+
+    @property
+    def openai_base_url(self) -> str:
+        return f"{self.url}/v1"
+
+    @property
+    def board_urls(self) -> Dict[str, str]:
+        return {board: f"{self.url}/bbs/{board}/list" for board in BOARD_KEYS}
+
+    @property
+    def total_requests(self) -> int:
+        with self._lock:
+            return sum(self.request_counts.values())
+
+    # ----- 응답 본문 준비 (요청마다 태그 치환만 하도록 미리 직렬화) -----
+
+    def _prepare_bodies(self) -> Dict[str, bytes]:
+        bodies = {}
+        build_date = format_datetime(self.now)
+        for endpoint in NAVER_ENDPOINTS:
+            fixture = load_fixture(f"naver_{endpoint}.json", self.fixtures_dir)
+            items = _replicate(fixture["items"], self.scale, self._shift_naver_item)
+            payload = {**fixture, "lastBuildDate": build_date, "display": len(items), "items": items}
+            bodies[f"naver/{endpoint}"] = json.dumps(payload, ensure_ascii=False).encode("utf-8")
+
+        fixture = load_fixture("google_customsearch.json", self.fixtures_dir)
+        items = _replicate(fixture["items"], self.scale, self._shift_google_item)
+        bodies["google"] = json.dumps({**fixture, "items": items}, ensure_ascii=False).encode("utf-8")
+
+        bodies["0404/detail"] = load_fixture("0404_detail.html", self.fixtures_dir).encode("utf-8")
+        return bodies
+
+    def _shift_naver_item(self, item: Dict) -> Dict:
+        if item.get("pubDate"):
+            item["pubDate"] = format_datetime(parsedate_to_datetime(item["pubDate"]) + self.shift)
+        if item.get("postdate"):
+            shifted = datetime.strptime(item["postdate"], "%Y%m%d") + self.day_shift
+            item["postdate"] = shifted.strftime("%Y%m%d")
+        return item
+
+    def _shift_google_item(self, item: Dict) -> Dict:
+        metatags = [dict(tag) for tag in (item.get("pagemap") or {}).get("metatags", [])]
+        for tag in metatags:
+            for key, value in tag.items():
+                if key.endswith("published_time"):
+                    shifted = datetime.fromisoformat(value.replace("Z", "+00:00")) + self.shift
+                    tag[key] = shifted.isoformat()
+        if metatags:
+            item["pagemap"] = {**item["pagemap"], "metatags": metatags}
+
+        def shift_snippet_date(match: re.Match) -> str:
+            shifted = datetime.strptime(match.group(1), "%b %d, %Y") + self.day_shift
+            return f"{shifted.strftime('%b')} {shifted.day}, {shifted.year}"
+
+        item["snippet"] = _SNIPPET_DATE_PATTERN.sub(shift_snippet_date, item.get("snippet", ""))
+        return item
+
+    def _shift_board_date(self, match: re.Match) -> str:
+        return (date.fromisoformat(match.group(0)) + self.day_shift).isoformat()
+
+    def render_board_list(self, board: str, page_index: int) -> bytes:
+        """0404 목록 페이지 (scale 페이지까지 행을 채우고 이후는 빈 목록)"""
+        page = load_fixture("0404_list.html", self.fixtures_dir).replace("/bbs/embsyNtc/", f"/bbs/{board}/")
+        page = _ISO_DATE_PATTERN.sub(self._shift_board_date, page)
+        if page_index > self.scale:
+            page = _LIST_ROW_PATTERN.sub("", page)
+        else:
+            page = _ARTICLE_ID_PATTERN.sub(lambda m: f"ATC{m.group(1)}{page_index:04d}", page)
+        return page.encode("utf-8")
+
+    def static_body(self, key: str) -> bytes:
+        return self._bodies[key]
+
+    def search_body(self, key: str, query: str) -> bytes:
+        tag = hashlib.md5(query.encode("utf-8")).hexdigest()[:8]
+        return self._bodies[key].replace(QUERY_TAG.encode(), tag.encode())
+
+    def chat_completion(self, request: Dict) -> bytes:
+        """요약 프롬프트는 기사별 요약을, 그 외(인사이트)는 녹화된 인사이트를 반환한다."""
+        prompt = request["messages"][-1]["content"]
+        if '"summaries"' in prompt:
+            summaries = [
+                {
+                    "index": int(match.group("index")),
+                    "title": match.group("title"),
+                    "summary": f"{match.group('snippet')[:120]} 요약입니다.",
+                    "link": match.group("link"),
+                }
+                for match in _PROMPT_ITEM_PATTERN.finditer(prompt)
+            ]
+            content = {"summaries": summaries}
+        else:
+            content = load_fixture("openai_insights.json", self.fixtures_dir)
+        completion = load_fixture("openai_chat_completion.json", self.fixtures_dir)
+        content_text = json.dumps(content, ensure_ascii=False)
+        completion["model"] = request.get("model", completion["model"])
+        completion["choices"][0]["message"]["content"] = content_text
+        prompt_tokens = sum(len(message["content"]) for message in request["messages"]) // 2
+        completion_tokens = len(content_text) // 2
+        completion["usage"] = {
+            "prompt_tokens": prompt_tokens,
+            "completion_tokens": completion_tokens,
+            "total_tokens": prompt_tokens + completion_tokens,
+        }
+        return json.dumps(completion, ensure_ascii=False).encode("utf-8")
+
+    def count(self, route: str) -> None:
+        with self._lock:
+            self.request_counts[route] = self.request_counts.get(route, 0) + 1
+
+
+class _StubHandler(BaseHTTPRequestHandler):
+    server_stub: FixtureStubServer
+    protocol_version = "HTTP/1.1"
+    # keep-alive 세션에서 헤더/본문 분할 전송이 지연 ACK(~40ms)에 걸리지 않게 한다.
+    disable_nagle_algorithm = True
+
+    def log_message(self, format, *args) -> None:
+        pass
+
+    def do_GET(self) -> None:
+        stub = self.server_stub
+        parsed = urlparse(self.path)
+        query = parse_qs(parsed.query)
+        parts = parsed.path.strip("/").split("/")
+
+        if parsed.path.startswith("/v1/search/") and parsed.path.endswith(".json"):
+            endpoint = parts[-1][:-len(".json")]
+            if endpoint in NAVER_ENDPOINTS:
+                return self._respond(f"naver/{endpoint}", stub.search_body(f"naver/{endpoint}", query.get("query", [""])[0]))
+        elif parsed.path == "/customsearch/v1":
+            return self._respond("google", stub.search_body("google", query.get("q", [""])[0]))
+        elif len(parts) >= 3 and parts[0] == "bbs" and parts[1] in BOARD_KEYS:
+            if parts[2] == "list":
+                page_index = int(query.get("pageIndex", ["1"])[0])
+                return self._respond("0404/list", stub.render_board_list(parts[1], page_index), "text/html")
+            if "detail" in parts[-1]:
+                return self._respond("0404/detail", stub.static_body("0404/detail"), "text/html")
+        self._respond("not_found", b'{"error": "not found"}', status=404)
+
+    def do_POST(self) -> None:
+        if urlparse(self.path).path != "/v1/chat/completions":
+            return self._respond("not_found", b'{"error": "not found"}', status=404)
+        length = int(self.headers.get("Content-Length") or 0)
+        request = json.loads(self.rfile.read(length) or b"{}")
+        self._respond("openai", self.server_stub.chat_completion(request))
+
+    def _respond(self, route: str, body: bytes, content_type: str = "application/json", status: int = 200) -> None:
+        stub = self.server_stub
+        stub.count(route)
+        if stub.latency:
+            time.sleep(stub.latency)
+        self.send_response(status)
+        self.send_header("Content-Type", f"{content_type}; charset=utf-8")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
@@ -0,0 +1,256 @@
+"""
+대용량 합성 데이터 생성기 (필터/중복 제거/0404 분류 규모 테스트용)
+
+- 한국어/영어 기사와 0404 공지(제목, 본문)를 시드 고정으로 생성한다.
+- 중복(제목/링크), 블랙리스트 도메인, 제외 키워드 비율과 게시일 분포(윈도우 내/외/누락)를 지정할 수 있다.
+- 수백만 건도 청크 단위(ArticleBatch)로 흘려보내므로 전체를 메모리에 올리지 않는다.
+"""
+from __future__ import annotations
+
+import random
+from collections import Counter
+from dataclasses import dataclass
+from datetime import datetime, timedelta, timezone
+from typing import Iterator, List, Optional, Sequence, Tuple
+
+from utils.article import Article, ArticleBatch
+
+KO_BRANDS = ("SKT", "KT", "LG유플러스", "유심사", "말톡", "도시락 eSIM", "핀다이렉트", "로밍도깨비", "이지이심")
+KO_TOPICS = ("로밍 요금제", "데이터 로밍", "eSIM 상품", "해외 데이터", "바로 로밍", "여행 유심", "로밍 고객센터")
+KO_EVENTS = ("개편", "출시", "가격 인하", "후기 급증", "이용자 200만 돌파", "서비스 확대", "품질 논란", "재구매 1위")
+KO_DESTINATIONS = ("일본", "베트남", "태국", "필리핀", "미국", "유럽", "대만", "중국")
+KO_SNIPPETS = (
+    "{dest} 여행객 사이에서 {brand} {topic}이 인기를 끌고 있다.",
+    "{brand}는 {dest} 노선을 중심으로 {topic} 혜택을 늘린다고 밝혔다.",
+    "직접 써본 {brand} {topic} 후기입니다. {dest}에서 속도가 안정적이었어요.",
+)
+EN_BRANDS = ("Vodafone", "Orange", "Airalo", "Holafly", "Ubigi", "Deutsche Telekom", "Telefonica", "Starlink")
+EN_TOPICS = ("roaming revenue", "travel eSIM", "5G SA roaming", "satellite connectivity", "MVNO roaming", "SGP.32 eSIM")
+EN_EVENTS = ("grows 20%", "launches in Asia", "faces price pressure", "signs new deal", "hits 10M users", "expands coverage")
+EN_SNIPPETS = (
+    "{brand} said {topic} demand in {dest} continued to rise this quarter.",
+    "Analysts expect {topic} to reshape how {brand} serves travellers to {dest}.",
+)
+EN_DESTINATIONS = ("Europe", "Asia", "Latin America", "the Middle East", "Africa")
+
+NEWS_DOMAINS = ("www.etnews.com", "www.zdnet.co.kr", "www.hankyung.com", "www.yna.co.kr", "www.mk.co.kr")
+BLOG_DOMAINS = ("blog.naver.com", "cafe.naver.com")
+GLOBAL_DOMAINS = ("www.mobileworldlive.com", "www.lightreading.com", "www.telecomtv.com", "www.gsma.com")
+
+# 0404 공지 (제목, 본문) 템플릿
+TELECOM_POSTS = (
+    ("[{country}] 일부 지역 {service} {disruption} 안내",
+     "ㅇ 현재 {country} {region} 일대에서 {service} {disruption} 현상이 발생하고 있습니다. ㅇ 복구 일정은 미정입니다."),
+    ("[{country}] 통신망 {disruption} 발생",
+     "ㅇ 최근 {region} 지역 통신망 {disruption}로 데이터 로밍과 문자 수신이 원활하지 않습니다."),
+)
+ADVISORY_POSTS = (
+    ("[{country}] 우기철 안전 여행 안내",
+     "ㅇ 우기철 {region} 지역 방문 시 통신 두절 가능성이 있으니 참고하시기 바랍니다."),
+)
+EXCLUDED_POSTS = (
+    ("[{country}] {region} 화산 활동에 따른 출입 제한",
+     "ㅇ {region} 화산 분화로 인근 지역 출입 제한 및 통신 장애가 예상됩니다."),
+)
+GENERAL_POSTS = (
+    ("[{country}] {region} 축제 기간 소매치기 주의",
+     "ㅇ {region} 축제 기간 중 관광객 대상 소매치기가 늘고 있으니 소지품 관리에 유의하시기 바랍니다."),
+    ("[{country}] 대규모 집회 예정 안내",
+     "ㅇ {region} 도심에서 대규모 집회가 예정되어 있어 교통 혼잡이 예상됩니다."),
+)
+COUNTRIES = ("필리핀", "튀르키예", "태국", "이란", "일본", "프랑스", "케냐", "페루")
+REGIONS = ("수도권", "북부", "남부 해안", "국경", "섬 지역", "산악")
+SERVICES = ("인터넷", "데이터 로밍", "국제전화", "SMS", "이동통신")
+DISRUPTIONS = ("장애", "중단", "두절", "접속 불가", "먹통")
+
+# 복제 중복에 쓸 최근 원본 기사 수
+DUPLICATE_POOL_SIZE = 10_000
+
+
+@dataclass
+class SyntheticProfile:
+    """합성 데이터 분포 설정 (비율은 0~1)"""
+
+    duplicate_rate: float = 0.15
+    blacklist_rate: float = 0.05
+    excluded_keyword_rate: float = 0.05
+    english_rate: float = 0.2
+    in_window_rate: float = 0.7
+    missing_date_rate: float = 0.02
+    window_hours: int = 24
+    max_age_days: int = 7
+    telecom_post_rate: float = 0.1
+    advisory_post_rate: float = 0.05
+    excluded_post_rate: float = 0.05
+    seed: int = 42
+
+
+class SyntheticArticleGenerator:
+    """
+    시드 고정 합성 기사/0404 공지 생성기
+
+    생성한 항목 종류별 건수는 `stats`에 누적된다 (duplicate_title, duplicate_link, blacklist,
+    excluded_keyword, in_window, stale, missing_date, english, 0404 분류 종류).
+    """
+
+    def __init__(
+        self,
+        profile: Optional[SyntheticProfile] = None,
+        blacklist_domains: Sequence[str] = ("promo", "deal", "login"),
+        excluded_keywords: Sequence[str] = ("이벤트", "쿠폰", "game"),
+        now: Optional[datetime] = None,
+    ):
+        self.profile = profile or SyntheticProfile()
+        self.blacklist_domains = list(blacklist_domains)
+        self.excluded_keywords = list(excluded_keywords)
+        self.now = now or datetime.now(timezone.utc)
+        self.stats: Counter = Counter()
+        self._random = random.Random(self.profile.seed)
+        self._pool: List[Article] = []
+        self._serial = 0
+
+    def iter_articles(self, count: int) -> Iterator[Article]:
+        """기사 count건 생성"""
+        for _ in range(count):
+            yield self._next_article()
+
+    def batch(self, count: int) -> ArticleBatch:
+        return ArticleBatch(self.iter_articles(count))
+
+    def iter_batches(self, count: int, chunk_size: int = 100_000) -> Iterator[ArticleBatch]:
+        """기사 count건을 chunk_size 단위 ArticleBatch로 생성"""
+        remaining = count
+        while remaining > 0:
+            size = min(chunk_size, remaining)
+            remaining -= size
+            yield self.batch(size)
+
+    def iter_0404_posts(self, count: int) -> Iterator[Tuple[str, str]]:
+        """0404 공지 (제목, 본문) count건 생성 (통신 장애/권고성/제외 패턴/일반 공지 비율은 profile 기준)"""
+        rng = self._random
+        profile = self.profile
+        for _ in range(count):
+            roll = rng.random()
+            if roll < profile.telecom_post_rate:
+                kind, templates = "post_telecom", TELECOM_POSTS
+            elif roll < profile.telecom_post_rate + profile.advisory_post_rate:
+                kind, templates = "post_advisory", ADVISORY_POSTS
+            elif roll < profile.telecom_post_rate + profile.advisory_post_rate + profile.excluded_post_rate:
+                kind, templates = "post_excluded", EXCLUDED_POSTS
+            else:
+                kind, templates = "post_general", GENERAL_POSTS
+            self.stats[kind] += 1
+            title, body = rng.choice(templates)
+            values = {
+                "country": rng.choice(COUNTRIES),
+                "region": rng.choice(REGIONS),
+                "service": rng.choice(SERVICES),
+                "disruption": rng.choice(DISRUPTIONS),
+            }
+            # 실제 공지처럼 일반 안내 문단을 덧붙여 본문 길이를 맞춘다.
+            filler = " ".join(
+                rng.choice(GENERAL_POSTS)[1].format(**values) for _ in range(rng.randint(2, 6))
+            )
+            yield title.format(**values), f"{body.format(**values)} {filler}"
+
+    def iter_0404_batches(self, count: int, chunk_size: int = 100_000) -> Iterator[List[Tuple[str, str]]]:
+        remaining = count
+        while remaining > 0:
+            size = min(chunk_size, remaining)
+            remaining -= size
+            yield list(self.iter_0404_posts(size))
+
+    def _next_article(self) -> Article:
+        rng = self._random
+        profile = self.profile
+
+        if self._pool and rng.random() < profile.duplicate_rate:
+            return self._duplicate(rng.choice(self._pool))
+
+        self._serial += 1
+        english = rng.random() < profile.english_rate
+        if english:
+            self.stats["english"] += 1
+            article = self._english_article(self._serial)
+        else:
+            article = self._korean_article(self._serial)
+
+        if rng.random() < profile.blacklist_rate:
+            self.stats["blacklist"] += 1
+            article.link = f"{article.link}/{rng.choice(self.blacklist_domains)}"
+        if rng.random() < profile.excluded_keyword_rate:
+            self.stats["excluded_keyword"] += 1
+            article.snippet = f"{article.snippet} {rng.choice(self.excluded_keywords)} 진행 중"
+
+        article.published = self._published()
+        if len(self._pool) < DUPLICATE_POOL_SIZE:
+            self._pool.append(article)
+        else:
+            self._pool[rng.randrange(DUPLICATE_POOL_SIZE)] = article
+        return article
+
+    def _korean_article(self, serial: int) -> Article:
+        rng = self._random
+        brand, topic, dest = rng.choice(KO_BRANDS), rng.choice(KO_TOPICS), rng.choice(KO_DESTINATIONS)
+        blog = rng.random() < 0.4
+        domain = rng.choice(BLOG_DOMAINS) if blog else rng.choice(NEWS_DOMAINS)
+        return Article(
+            title=f"{brand}, {dest} {topic} {rng.choice(KO_EVENTS)} ({serial})",
+            link=f"https://{domain}/article/{serial}",
+            snippet=rng.choice(KO_SNIPPETS).format(brand=brand, topic=topic, dest=dest),
+            source="Naver Blog" if blog else "Naver News",
+            query=f"{brand} {topic}",
+            type="domestic",
+        )
+
+    def _english_article(self, serial: int) -> Article:
+        rng = self._random
+        brand, topic, dest = rng.choice(EN_BRANDS), rng.choice(EN_TOPICS), rng.choice(EN_DESTINATIONS)
+        domain = rng.choice(GLOBAL_DOMAINS)
+        return Article(
+            title=f"{brand} {topic} {rng.choice(EN_EVENTS)} in {dest} ({serial})",
+            link=f"https://{domain}/news/{serial}",
+            snippet=rng.choice(EN_SNIPPETS).format(brand=brand, topic=topic, dest=dest),
+            source="Google",
+            source_domain=domain,
+            query=topic,
+            type="global",
+        )
+
+    def _duplicate(self, original: Article) -> Article:
+        """같은 제목(표기만 다름) 또는 같은 링크의 재등장"""
+        rng = self._random
+        self._serial += 1
+        if rng.random() < 0.5:
+            self.stats["duplicate_title"] += 1
+            title = f"<b>{original.title}</b>"
+            link = f"{original.link}?dup={self._serial}"
+        else:
+            self.stats["duplicate_link"] += 1
+            title = f"{original.title} - 재전송 {self._serial}"
+            link = original.link
+        return Article(
+            title=title,
+            link=link,
+            snippet=original.snippet,
+            source=original.source,
+            published=original.published,
+            source_domain=original.source_domain,
+            query=original.query,
+            type=original.type,
+        )
+
+    def _published(self) -> Optional[datetime]:
+        rng = self._random
+        profile = self.profile
+        roll = rng.random()
+        if roll < profile.missing_date_rate:
+            self.stats["missing_date"] += 1
+            return None
+        if roll < profile.missing_date_rate + profile.in_window_rate:
+            self.stats["in_window"] += 1
+            age_seconds = rng.uniform(0, profile.window_hours * 3600)
+        else:
+            self.stats["stale"] += 1
+            age_seconds = rng.uniform(profile.window_hours * 3600, profile.max_age_days * 86400)
+        return self.now - timedelta(seconds=age_seconds)
@@ -2,8 +2,11 @@
 수집 계층 기본 클래스
 """
 from abc import ABC, abstractmethod
-from typing import List, Dict
+from typing import List, Dict, Optional
 import logging
+import time
+
+from utils import metrics
 
 logger = logging.getLogger(__name__)
 
@@ -30,6 +33,25 @@ class BaseCollector(ABC):
         """
         pass
 
+    def _record_request(self, provider: str, endpoint: str, started: float, status: str, response=None) -> None:
+        """
+        HTTP 요청 1건의 지연 시간/상태/응답 크기 기록
+
+        Args:
+            provider: 'naver', 'google', '0404'
+            endpoint: API 엔드포인트/페이지 종류
+            started: time.perf_counter() 요청 시작 시각
+            status: HTTP 상태 코드 또는 'timeout'/'error'
+            response: requests 응답 (응답 바이트 집계용)
+        """
+        metrics.observe(
+            "news_collector_http_request_seconds", time.perf_counter() - started, provider=provider, endpoint=endpoint
+        )
+        metrics.inc("news_collector_http_requests_total", provider=provider, endpoint=endpoint, status=status)
+        content: Optional[bytes] = getattr(response, "content", None)
+        if isinstance(content, (bytes, bytearray, str)):
+            metrics.inc("news_collector_http_response_bytes_total", len(content), provider=provider, endpoint=endpoint)
+
     def log_stats(self):
         """수집 통계 로그"""
         logger.info(
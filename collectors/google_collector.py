@@ -7,9 +7,11 @@ from email.utils import parsedate_to_datetime
 import re
 from typing import Any, Dict, List, Optional, Tuple
 import logging
+import time
 from urllib.parse import urlparse
 
 from .base import BaseCollector
+from utils.article import Article
 from utils.exceptions import APIError
 
 logger = logging.getLogger(__name__)
@@ -106,7 +108,7 @@ class GoogleCollector(BaseCollector):
         parsed = urlparse(str(link or ""))
         return parsed.netloc.lower()
 
-    def collect(self, query: str, limit: int = 5) -> List[Dict]:
+    def collect(self, query: str, limit: int = 5) -> List[Article]:
         """
         Google Custom Search API 수집
 
@@ -121,15 +123,19 @@ class GoogleCollector(BaseCollector):
             "key": self.api_key,
             "cx": self.search_engine_id,
             "q": query,
-            "num": limit
+            "num": min(limit, 10)  # Custom Search API 최대 10건
         }
 
+        started = time.perf_counter()
+        status = "error"
+        response = None
         try:
             response = requests.get(
                 self.base_url,
                 params=params,
                 timeout=10
             )
+            status = str(response.status_code)
 
             if response.status_code != 200:
                 raise APIError(f"Google API failed: {response.status_code}")
@@ -145,19 +151,19 @@ class GoogleCollector(BaseCollector):
                 if not published:
                     quality_flags.append('missing_published_date')
 
-                article = {
-                    'title': item.get('title'),
-                    'link': item.get('link'),
-                    'snippet': item.get('snippet'),
-                    'source': 'Google',
-                    'published': published,
-                    'published_raw': published_raw,
-                    'freshness_source': freshness_source,
-                    'source_domain': source_domain,
-                    'query': query,
-                    'quality_flags': quality_flags,
-                    'type': 'global'
-                }
+                article = Article(
+                    title=item.get('title'),
+                    link=item.get('link'),
+                    snippet=item.get('snippet'),
+                    source='Google',
+                    published=published,
+                    published_raw=published_raw,
+                    freshness_source=freshness_source,
+                    source_domain=source_domain,
+                    query=query,
+                    quality_flags=quality_flags,
+                    type='global'
+                )
 
                 articles.append(article)
                 self.collected_count += 1
@@ -165,8 +171,11 @@ class GoogleCollector(BaseCollector):
             return articles
 
         except requests.exceptions.Timeout:
+            status = "timeout"
             logger.error(f"Google API timeout: {query}")
             return []
         except Exception as e:
             logger.error(f"Google API exception: {e}")
             raise
+        finally:
+            self._record_request("google", "customsearch", started, status, response)
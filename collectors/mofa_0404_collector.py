@@ -6,6 +6,7 @@ from __future__ import annotations
 import html
 import logging
 import re
+import time
 from datetime import datetime
 from typing import Dict, List, Optional
 from zoneinfo import ZoneInfo
@@ -20,6 +21,7 @@ logger = logging.getLogger(__name__)
 class Mofa0404Collector(BaseCollector):
     """0404 게시판에서 KST 날짜 범위의 통신/로밍 관련 공지를 수집한다."""
 
+    SITE_URL = "https://0404.go.kr"
     BOARD_URLS = {
         "embsyNtc": "https://0404.go.kr/bbs/embsyNtc/list",
         "safetyNtc": "https://0404.go.kr/bbs/safetyNtc/list",
@@ -200,8 +202,7 @@ class Mofa0404Collector(BaseCollector):
         for page_index in range(1, self.max_pages + 1):
             page_url = f"{list_url}?pageIndex={page_index}"
             try:
-                response = self.session.get(page_url, timeout=15)
-                response.raise_for_status()
+                response = self._get(page_url, "list")
                 page_html = response.text
                 consecutive_failures = 0
             except Exception as e:
@@ -227,7 +228,7 @@ class Mofa0404Collector(BaseCollector):
                 elif date_text < start_date_kst:
                     older_exists = True
 
-            logger.info(
+            logger.debug(
                 f"[0404] {board_name} page {page_index}: parsed={len(list_items)}, in_range={len(target_items)}"
             )
 
@@ -235,13 +236,13 @@ class Mofa0404Collector(BaseCollector):
                 match = item["match"]
                 date_text = item["date_text"]
                 relative_link = html.unescape(match.group("link").strip())
-                link = f"https://0404.go.kr{relative_link}"
+                link = f"{self.SITE_URL}{relative_link}"
                 title = self._to_one_line(match.group("title"))
 
                 body_text = self._fetch_detail_body(link)
                 match_result = self._classify_post(title=title, body_text=body_text)
                 if not match_result:
-                    logger.info(f"[0404] Skipped non-telecom post: {title}")
+                    logger.debug(f"[0404] Skipped non-telecom post: {title}")
                     continue
 
                 content_preview = body_text
@@ -272,10 +273,25 @@ class Mofa0404Collector(BaseCollector):
         logger.info(f"[0404] {board_name} matched posts: {len(results)}")
         return results
 
-    def _fetch_detail_body(self, detail_url: str) -> str:
+    def _get(self, url: str, endpoint: str) -> requests.Response:
+        """게시판 페이지 요청 (실패 시 예외, 요청 메트릭 기록)"""
+        started = time.perf_counter()
+        status = "error"
+        response = None
         try:
-            response = self.session.get(detail_url, timeout=15)
+            response = self.session.get(url, timeout=15)
+            status = str(response.status_code)
             response.raise_for_status()
+            return response
+        except requests.exceptions.Timeout:
+            status = "timeout"
+            raise
+        finally:
+            self._record_request("0404", endpoint, started, status, response)
+
+    def _fetch_detail_body(self, detail_url: str) -> str:
+        try:
+            response = self._get(detail_url, "detail")
         except Exception as e:
             logger.warning(f"[0404] Failed to load detail page: {detail_url} ({e})")
             return ""
@@ -7,9 +7,11 @@ from email.utils import parsedate_to_datetime
 from datetime import datetime, timezone
 from typing import List, Dict
 import logging
+import threading
 import time
 
 from .base import BaseCollector
+from utils.article import Article
 from utils.exceptions import APIError, RateLimitError
 
 logger = logging.getLogger(__name__)
@@ -18,15 +20,18 @@ logger = logging.getLogger(__name__)
 class NaverCollector(BaseCollector):
     """Naver Search API 수집기"""
 
+    # API 키 단위 rate limit이므로 요청 간 딜레이는 모든 인스턴스(스레드)가 공유한다.
+    _throttle_lock = threading.Lock()
+    _last_request_time = 0.0
+
     def __init__(self, client_id: str, client_secret: str, debug_mode: bool = False):
         super().__init__(debug_mode)
         self.client_id = client_id
         self.client_secret = client_secret
         self.base_url = "https://openapi.naver.com/v1/search"
         self.request_delay = 0.3  # API 요청 간 딜레이 (초)
-        self.last_request_time = 0
 
-    def collect(self, query: str, limit: int = 5) -> List[Dict]:
+    def collect(self, query: str, limit: int = 5) -> List[Article]:
         """
         기본 수집 메서드 (News API 사용)
 
@@ -39,19 +44,19 @@ class NaverCollector(BaseCollector):
         """
         return self.collect_from_news(query, limit)
 
-    def collect_from_news(self, query: str, limit: int = 5) -> List[Dict]:
+    def collect_from_news(self, query: str, limit: int = 5) -> List[Article]:
         """Naver News API 수집"""
         return self._call_api("news", query, limit)
 
-    def collect_from_blog(self, query: str, limit: int = 5) -> List[Dict]:
+    def collect_from_blog(self, query: str, limit: int = 5) -> List[Article]:
         """Naver Blog API 수집"""
         return self._call_api("blog", query, limit)
 
-    def collect_from_cafe(self, query: str, limit: int = 5) -> List[Dict]:
+    def collect_from_cafe(self, query: str, limit: int = 5) -> List[Article]:
         """Naver Cafe API 수집"""
         return self._call_api("cafearticle", query, limit)
 
-    def _call_api(self, endpoint: str, query: str, limit: int) -> List[Dict]:
+    def _call_api(self, endpoint: str, query: str, limit: int) -> List[Article]:
         """
         Naver API 공통 호출
 
@@ -67,10 +72,11 @@ class NaverCollector(BaseCollector):
             APIError: API 호출 실패
         """
         # API 요청 간 딜레이 적용 (rate limit 방지)
-        current_time = time.time()
-        time_since_last_request = current_time - self.last_request_time
-        if time_since_last_request < self.request_delay:
-            time.sleep(self.request_delay - time_since_last_request)
+        with NaverCollector._throttle_lock:
+            time_since_last_request = time.time() - NaverCollector._last_request_time
+            if time_since_last_request < self.request_delay:
+                time.sleep(self.request_delay - time_since_last_request)
+            NaverCollector._last_request_time = time.time()
 
         headers = {
             "X-Naver-Client-Id": self.client_id,
@@ -79,18 +85,21 @@ class NaverCollector(BaseCollector):
 
         params = {
             "query": query,
-            "display": limit,
+            "display": min(limit, 100),  # Search API 최대 100건
             "sort": "date"
         }
 
+        started = time.perf_counter()
+        status = "error"
+        response = None
         try:
-            self.last_request_time = time.time()
             response = requests.get(
                 f"{self.base_url}/{endpoint}.json",
                 headers=headers,
                 params=params,
                 timeout=10
             )
+            status = str(response.status_code)
 
             if response.status_code == 429:
                 logger.warning(f"Naver API rate limit exceeded for query: {query}")
@@ -101,9 +110,10 @@ class NaverCollector(BaseCollector):
                 return []
 
             data = response.json()
-            return self._parse_items(data.get('items', []), endpoint)
+            return self._parse_items(data.get('items', []), endpoint, query=query)
 
         except requests.exceptions.Timeout:
+            status = "timeout"
             logger.error(f"Naver API timeout: {query}")
             return []
         except RateLimitError:
@@ -112,8 +122,10 @@ class NaverCollector(BaseCollector):
         except Exception as e:
             logger.error(f"Naver API exception: {e}")
             return []
+        finally:
+            self._record_request("naver", endpoint, started, status, response)
 
-    def _parse_items(self, items: List[Dict], endpoint: str) -> List[Dict]:
+    def _parse_items(self, items: List[Dict], endpoint: str, query: str = "") -> List[Article]:
         """API 응답 파싱"""
         parsed_articles = []
 
@@ -132,14 +144,15 @@ class NaverCollector(BaseCollector):
             # 링크 정제
             clean_link = self._clean_naver_link(item.get('link', ''), endpoint)
 
-            article = {
-                'title': item.get('title'),
-                'link': clean_link,
-                'snippet': item.get('description'),
-                'source': f"Naver {endpoint.capitalize()}",
-                'published': pub_date,
-                'type': 'domestic'
-            }
+            article = Article(
+                title=item.get('title'),
+                link=clean_link,
+                snippet=item.get('description'),
+                source=f"Naver {endpoint.capitalize()}",
+                published=pub_date,
+                query=query,
+                type='domestic'
+            )
 
             parsed_articles.append(article)
             self.collected_count += 1
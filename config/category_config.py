@@ -0,0 +1,221 @@
+"""
+카테고리/필터 설정 서비스 (config/categories.yaml)
+
+- 파일을 한 번 파싱해 검증하고, 파생 매처(KeywordFilter)까지 만들어 캐시한다.
+- 조회 때마다 stat(mtime/size)만 확인하고, 바뀐 경우에만 다시 읽는다. 내용 해시가 같으면
+  (touch, 같은 내용 재저장) 다시 파싱하지 않는다.
+- 오래 떠 있는 웹 프로세스도 다음 실행부터 수정된 키워드를 쓴다 (재시작 불필요).
+  수정본이 잘못되었으면 오류를 남기고 마지막 정상 설정을 계속 쓴다.
+"""
+import hashlib
+import logging
+import os
+import threading
+from dataclasses import dataclass
+from typing import Any, Dict, List, Optional, Tuple
+
+from filters.keyword_filter import KeywordFilter
+from utils.exceptions import ValidationError
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_CATEGORIES_PATH = "config/categories.yaml"
+
+# main._collect_category_sources가 지원하는 수집 소스
+KNOWN_SOURCES = ("naver_news", "naver_blog", "naver_cafe", "google_search")
+FILTER_LISTS = ("blacklist_domains", "excluded_keywords")
+GLOBAL_TREND_LISTS = ("excluded_domains", "excluded_url_patterns", "excluded_keywords", "required_keywords")
+
+
+@dataclass(frozen=True)
+class CategoryConfig:
+    """
+    검증된 카테고리 설정 1개 버전 (읽기 전용으로 공유한다)
+
+    data는 yaml 원본 구조({'categories': ..., 'filters': ...})이고,
+    keyword_filter는 filters로 미리 만든 필터다 (스레드 간 공유 가능).
+    """
+
+    path: str
+    digest: str
+    data: Dict[str, Any]
+    keyword_filter: KeywordFilter
+
+    @property
+    def categories(self) -> Dict[str, Dict[str, Any]]:
+        return self.data["categories"]
+
+    @property
+    def filters(self) -> Dict[str, Any]:
+        return self.data["filters"]
+
+
+def _string_list_errors(value: Any, where: str, required: bool = False) -> List[str]:
+    if value is None and not required:
+        return []
+    if not isinstance(value, list) or (required and not value):
+        return [f"{where} must be a {'non-empty ' if required else ''}list"]
+    return [f"{where}[{i}] must be a non-empty string" for i, item in enumerate(value) if not isinstance(item, str) or not item.strip()]
+
+
+def validate_category_config(data: Any) -> None:
+    """
+    카테고리 설정 구조 검증
+
+    Args:
+        data: yaml 파싱 결과
+
+    Raises:
+        ValidationError: 잘못된 설정 (모든 오류를 한 번에 보고)
+    """
+    if not isinstance(data, dict):
+        raise ValidationError("Category config must be a mapping with 'categories' and 'filters'")
+
+    errors: List[str] = []
+    categories = data.get("categories")
+    if not isinstance(categories, dict) or not categories:
+        errors.append("categories must be a non-empty mapping")
+        categories = {}
+
+    seen_ids: Dict[Any, str] = {}
+    for key, category in categories.items():
+        where = f"categories.{key}"
+        if not isinstance(category, dict):
+            errors.append(f"{where} must be a mapping")
+            continue
+        cat_id = category.get("id")
+        if not isinstance(cat_id, int) or isinstance(cat_id, bool):
+            errors.append(f"{where}.id must be an integer")
+        elif cat_id in seen_ids:
+            errors.append(f"{where}.id {cat_id} duplicates categories.{seen_ids[cat_id]}.id")
+        else:
+            seen_ids[cat_id] = key
+        if not isinstance(category.get("name"), str) or not category["name"].strip():
+            errors.append(f"{where}.name must be a non-empty string")
+        errors.extend(_string_list_errors(category.get("keywords"), f"{where}.keywords", required=True))
+        sources = category.get("sources")
+        source_errors = _string_list_errors(sources, f"{where}.sources", required=True)
+        errors.extend(source_errors)
+        if not source_errors:
+            unknown = [source for source in sources if source not in KNOWN_SOURCES]
+            if unknown:
+                errors.append(f"{where}.sources has unknown source(s): {', '.join(unknown)} (choose from {', '.join(KNOWN_SOURCES)})")
+
+    filters = data.get("filters")
+    if not isinstance(filters, dict):
+        errors.append("filters must be a mapping")
+    else:
+        for name in FILTER_LISTS:
+            errors.extend(_string_list_errors(filters.get(name), f"filters.{name}", required=True))
+        global_trend = filters.get("global_trend")
+        if global_trend is not None:
+            if not isinstance(global_trend, dict):
+                errors.append("filters.global_trend must be a mapping")
+            else:
+                for name in GLOBAL_TREND_LISTS:
+                    errors.extend(_string_list_errors(global_trend.get(name), f"filters.global_trend.{name}"))
+
+    if errors:
+        raise ValidationError("Invalid category config: " + "; ".join(errors))
+
+
+def compile_category_config(path: str, content: bytes, digest: Optional[str] = None) -> CategoryConfig:
+    """
+    설정 파일 내용 파싱 -> 검증 -> 파생 매처 생성
+
+    Raises:
+        ValidationError: yaml 문법 오류 또는 잘못된 설정
+    """
+    import yaml
+
+    try:
+        data = yaml.safe_load(content.decode("utf-8"))
+    except (yaml.YAMLError, UnicodeDecodeError) as e:
+        raise ValidationError(f"Category config {path} is not valid YAML: {e}") from e
+    validate_category_config(data)
+
+    filters = data["filters"]
+    keyword_filter = KeywordFilter(
+        blacklist_domains=filters["blacklist_domains"],
+        excluded_keywords=filters["excluded_keywords"],
+        global_trend_rules=filters.get("global_trend") or {},
+    )
+    return CategoryConfig(
+        path=path,
+        digest=digest or hashlib.sha256(content).hexdigest(),
+        data=data,
+        keyword_filter=keyword_filter,
+    )
+
+
+class CategoryConfigService:
+    """
+    설정 파일 1개의 캐시 (파일 mtime/크기로 변경 감지, 내용 해시로 재컴파일 여부 결정)
+
+    get()은 변경이 없으면 stat 1회로 끝난다. 여러 스레드(웹 요청, 분석 작업)에서 호출해도 된다.
+    """
+
+    def __init__(self, path: str = DEFAULT_CATEGORIES_PATH):
+        self.path = path
+        self._lock = threading.Lock()
+        self._signature: Optional[Tuple[int, int]] = None
+        self._config: Optional[CategoryConfig] = None
+
+    def _current_signature(self) -> Tuple[int, int]:
+        stat = os.stat(self.path)
+        return stat.st_mtime_ns, stat.st_size
+
+    def get(self) -> CategoryConfig:
+        """
+        현재 설정
+
+        Raises:
+            FileNotFoundError: 설정 파일이 없고 캐시된 설정도 없음
+            ValidationError: 처음 읽은 설정이 잘못됨 (이미 정상 설정이 있으면 그것을 유지)
+        """
+        try:
+            signature = self._current_signature()
+        except OSError:
+            if self._config is None:
+                raise
+            return self._config  # 편집기 저장 중 잠시 없어진 경우 등
+        if signature == self._signature and self._config is not None:
+            return self._config
+
+        with self._lock:
+            if signature == self._signature and self._config is not None:
+                return self._config
+            with open(self.path, "rb") as f:
+                content = f.read()
+            digest = hashlib.sha256(content).hexdigest()
+            if self._config is not None and digest == self._config.digest:
+                self._signature = signature
+                return self._config
+            try:
+                config = compile_category_config(self.path, content, digest)
+            except ValidationError as e:
+                if self._config is None:
+                    raise
+                # 같은 잘못된 내용으로 매번 다시 파싱하지 않도록 서명은 갱신한다.
+                self._signature = signature
+                logger.error(f"{e}; keeping previous category config ({self._config.digest[:12]})")
+                return self._config
+            if self._config is not None:
+                logger.info(f"Category config reloaded: {self.path} ({config.digest[:12]})")
+            self._config = config
+            self._signature = signature
+            return config
+
+
+_services: Dict[str, CategoryConfigService] = {}
+_services_lock = threading.Lock()
+
+
+def get_category_config(path: str = DEFAULT_CATEGORIES_PATH) -> CategoryConfig:
+    """경로별 공유 서비스로 현재 카테고리 설정 조회 (프로세스 안에서 캐시)"""
+    key = os.path.abspath(path)
+    with _services_lock:
+        service = _services.get(key)
+        if service is None:
+            service = _services[key] = CategoryConfigService(path)
+    return service.get()
@@ -1,13 +1,32 @@
 """
 대시보드/CLI 공통 수신자 저장소
+
+- 조회는 프로세스 안 캐시를 쓰고, 파일 서명(inode/mtime/크기)이 바뀌었을 때만 다시 읽는다.
+- 추가/삭제는 파일 잠금(`email_recipients.json.lock`) 안에서 최신 파일을 다시 읽어 고친 뒤
+  임시 파일 + rename으로 저장한다 (대시보드 동시 요청, 다른 프로세스와 경쟁해도 유실/손상 없음).
 """
 from __future__ import annotations
 
 import json
+import logging
+import os
+import threading
+from contextlib import contextmanager
 from pathlib import Path
-from typing import Dict, List, Tuple
+from typing import Dict, Iterator, List, Optional, Tuple
+
+from utils.exceptions import LockHeldError
+from utils.file_lock import FileLock
+
+logger = logging.getLogger(__name__)
 
 RECIPIENTS_FILE = Path(__file__).parent / "email_recipients.json"
+LOCK_TIMEOUT_SECONDS = 5.0
+
+# (파일 경로, 파일 서명, 설정) - 테스트가 RECIPIENTS_FILE을 바꿔도 섞이지 않도록 경로도 키로 쓴다
+_cache: Optional[Tuple[Path, Tuple[int, int, int], Dict]] = None
+_cache_lock = threading.Lock()
+_thread_lock = threading.Lock()
 
 GROUP_TO_KEY = {
     "report": "report_recipients",
@@ -102,36 +121,124 @@ def _migrate_or_normalize(raw: Dict) -> Tuple[Dict, bool]:
     return normalized, True
 
 
-def _save_config(data: Dict) -> None:
-    RECIPIENTS_FILE.parent.mkdir(parents=True, exist_ok=True)
-    with open(RECIPIENTS_FILE, "w", encoding="utf-8") as f:
-        json.dump(data, f, ensure_ascii=False, indent=2)
+def _copy_config(config: Dict) -> Dict:
+    return {key: list(value) if isinstance(value, list) else value for key, value in config.items()}
 
 
-def load_config() -> Dict:
-    if not RECIPIENTS_FILE.exists():
-        data = _default_config()
-        _save_config(data)
-        return data
+def _file_signature(stat: os.stat_result) -> Tuple[int, int, int]:
+    # 저장은 임시 파일 + rename이므로 inode가 바뀐다 (같은 mtime 단위 안의 재저장도 구분)
+    return stat.st_ino, stat.st_mtime_ns, stat.st_size
+
+
+def _remember(path: Path, signature: Optional[Tuple[int, int, int]], config: Dict) -> Dict:
+    global _cache
+    with _cache_lock:
+        _cache = (path, signature, config) if signature is not None else None
+    return config
 
+
+def _cached(path: Path) -> Optional[Dict]:
+    """캐시가 현재 파일과 같으면 캐시된 설정 (stat 1회)"""
+    try:
+        signature = _file_signature(path.stat())
+    except OSError:
+        return None
+    with _cache_lock:
+        if _cache is not None and _cache[0] == path and _cache[1] == signature:
+            return _cache[2]
+    return None
+
+
+def _read_config(path: Path) -> Tuple[Dict, Optional[Tuple[int, int, int]], bool]:
+    """
+    파일 읽기 + 정규화
+
+    Returns:
+        (설정, 읽은 파일의 서명, 파일을 다시 써야 하는지)
+    """
     try:
-        with open(RECIPIENTS_FILE, "r", encoding="utf-8") as f:
+        with open(path, "r", encoding="utf-8") as f:
             raw = json.load(f)
-    except Exception:
-        data = _default_config()
-        _save_config(data)
-        return data
-
+            signature = _file_signature(os.fstat(f.fileno()))
+    except FileNotFoundError:
+        return _default_config(), None, True
+    except (OSError, ValueError) as e:
+        logger.error(f"Recipient file {path} is unreadable ({e}); resetting to default recipients")
+        return _default_config(), None, True
     normalized, changed = _migrate_or_normalize(raw)
+    return normalized, signature, changed
+
+
+@contextmanager
+def _write_lock(path: Path) -> Iterator[None]:
+    """
+    수신자 파일 쓰기 잠금 (같은 프로세스의 스레드 + 다른 프로세스)
+
+    Raises:
+        LockHeldError: LOCK_TIMEOUT_SECONDS 안에 잠금을 얻지 못함
+    """
+    with _thread_lock:
+        lock = FileLock(f"{path}.lock", owner="recipient_store")
+        if not lock.acquire(timeout=LOCK_TIMEOUT_SECONDS):
+            raise LockHeldError(f"Recipient file {path} is locked by another process: {lock.holder() or 'unknown'}")
+        try:
+            yield
+        finally:
+            lock.release()
+
+
+def _save_config(data: Dict) -> None:
+    """임시 파일에 쓰고 rename (읽는 쪽은 항상 완전한 파일을 본다). _write_lock 안에서 호출한다."""
+    path = RECIPIENTS_FILE
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = f"{path}.tmp"
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        json.dump(data, f, ensure_ascii=False, indent=2)
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(tmp_path, path)
+    _remember(path, _file_signature(path.stat()), _copy_config(data))
+
+
+def _load_locked(path: Path) -> Dict:
+    """쓰기 잠금 안에서 최신 설정 (정규화/기본값 저장이 필요하면 여기서 저장)"""
+    cached = _cached(path)
+    if cached is not None:
+        return cached
+    config, signature, changed = _read_config(path)
     if changed:
-        _save_config(normalized)
-    return normalized
+        _save_config(config)
+        return _cached(path) or config
+    return _remember(path, signature, config)
+
+
+def _current_config() -> Dict:
+    """캐시된 설정 (파일이 바뀌었을 때만 다시 읽는다). 수정하지 말 것"""
+    path = RECIPIENTS_FILE
+    cached = _cached(path)
+    if cached is not None:
+        return cached
+    config, signature, changed = _read_config(path)
+    if not changed:
+        return _remember(path, signature, config)
+    # 없거나 예전 형식인 파일은 잠금을 잡고 다시 확인한 뒤 저장한다 (다른 프로세스가 먼저 고쳤을 수 있다)
+    try:
+        with _write_lock(path):
+            return _load_locked(path)
+    except LockHeldError as e:
+        # 조회는 실패시키지 않는다: 정규화한 설정을 캐시하지 않고 돌려주고, 저장은 다음 조회/수정에 맡긴다
+        logger.warning(f"{e}; using normalized recipients without saving")
+        return config
+
+
+def load_config() -> Dict:
+    """수신자 설정 (복사본이므로 수정해도 캐시에 영향 없음)"""
+    return _copy_config(_current_config())
 
 
 def get_group_recipients(group: str = "report") -> List[str]:
     key = GROUP_TO_KEY.get(group, GROUP_TO_KEY["report"])
-    config = load_config()
-    return list(config.get(key, []))
+    return list(_current_config().get(key, []))
 
 
 def add_group_recipient(email: str, group: str = "report") -> Tuple[bool, str, List[str]]:
@@ -145,14 +252,14 @@ def add_group_recipient(email: str, group: str = "report") -> Tuple[bool, str, L
     if not is_valid_email(email):
         return False, "올바른 이메일 형식이 아닙니다", []
 
-    config = load_config()
-    recipients = list(config.get(key, []))
-    if email in recipients:
-        return False, "이미 존재하는 이메일 주소입니다", recipients
+    with _write_lock(RECIPIENTS_FILE):
+        config = _load_locked(RECIPIENTS_FILE)
+        recipients = list(config.get(key, []))
+        if email in recipients:
+            return False, "이미 존재하는 이메일 주소입니다", recipients
 
-    recipients.append(email)
-    config[key] = recipients
-    _save_config(config)
+        recipients.append(email)
+        _save_config({**config, key: recipients})
     return True, "이메일이 추가되었습니다", recipients
 
 
@@ -162,14 +269,14 @@ def remove_group_recipient(email: str, group: str = "report") -> Tuple[bool, str
         return False, "유효하지 않은 그룹입니다", []
 
     email = _normalize_email(email)
-    config = load_config()
-    recipients = list(config.get(key, []))
+    with _write_lock(RECIPIENTS_FILE):
+        config = _load_locked(RECIPIENTS_FILE)
+        recipients = list(config.get(key, []))
 
-    if email not in recipients:
-        return False, "존재하지 않는 이메일 주소입니다", recipients
+        if email not in recipients:
+            return False, "존재하지 않는 이메일 주소입니다", recipients
 
-    recipients.remove(email)
-    config[key] = recipients
-    _save_config(config)
+        recipients.remove(email)
+        _save_config({**config, key: recipients})
     return True, "이메일이 삭제되었습니다", recipients
 
@@ -43,12 +43,31 @@ class Settings:
     api: APISettings
     email: EmailSettings
     debug_mode: bool = False
+    log_debug_sample_every: int = 100
     time_window_hours: int = 24
     max_articles_per_category: int = 10
     email_top_n: int = 3
     email_summary_max_chars: int = 140
     web_default_visible_n: int = 3
     web_summary_max_chars: int = 180
+    article_store_enabled: bool = True
+    article_store_path: str = "output/store/news_collector.db"
+    report_archive_enabled: bool = True
+    report_archive_retention_days: int = 365
+    report_archive_max_mb: int = 500
+    job_queue_path: str = "output/store/jobs.db"
+    analysis_worker_mode: str = "external"
+    web_host: str = "0.0.0.0"
+    web_port: int = 5000
+    web_workers: int = 0
+    web_threads: int = 8
+    schedule_cron: str = "0 9 * * *"
+    schedule_jitter_seconds: int = 60
+    schedule_catchup_hours: int = 6
+    schedule_prewarm_minutes: int = 10
+    checkpoint_enabled: bool = True
+    checkpoint_keep_runs: int = 14
+    llm_pricing: str = ""
 
 
 def load_settings() -> Settings:
@@ -98,10 +117,29 @@ def load_settings() -> Settings:
             recipients=recipients
         ),
         debug_mode=os.getenv('DEBUG_MODE', 'false').lower() == 'true',
+        log_debug_sample_every=int(os.getenv('LOG_DEBUG_SAMPLE_EVERY', '100')),
         time_window_hours=int(os.getenv('TIME_WINDOW_HOURS', '24')),
         max_articles_per_category=int(os.getenv('MAX_ARTICLES_PER_CATEGORY', '10')),
         email_top_n=int(os.getenv('EMAIL_TOP_N', '3')),
         email_summary_max_chars=int(os.getenv('EMAIL_SUMMARY_MAX_CHARS', '140')),
         web_default_visible_n=int(os.getenv('WEB_DEFAULT_VISIBLE_N', '3')),
         web_summary_max_chars=int(os.getenv('WEB_SUMMARY_MAX_CHARS', '180')),
+        article_store_enabled=os.getenv('ARTICLE_STORE_ENABLED', 'true').lower() == 'true',
+        article_store_path=os.getenv('ARTICLE_STORE_PATH', 'output/store/news_collector.db'),
+        report_archive_enabled=os.getenv('REPORT_ARCHIVE_ENABLED', 'true').lower() == 'true',
+        report_archive_retention_days=int(os.getenv('REPORT_ARCHIVE_RETENTION_DAYS', '365')),
+        report_archive_max_mb=int(os.getenv('REPORT_ARCHIVE_MAX_MB', '500')),
+        job_queue_path=os.getenv('JOB_QUEUE_PATH', 'output/store/jobs.db'),
+        analysis_worker_mode=os.getenv('ANALYSIS_WORKER_MODE', 'external').strip().lower(),
+        web_host=os.getenv('WEB_HOST', '0.0.0.0'),
+        web_port=int(os.getenv('WEB_PORT', '5000')),
+        web_workers=int(os.getenv('WEB_WORKERS', '0')),
+        web_threads=int(os.getenv('WEB_THREADS', '8')),
+        schedule_cron=os.getenv('SCHEDULE_CRON', '0 9 * * *'),
+        schedule_jitter_seconds=int(os.getenv('SCHEDULE_JITTER_SECONDS', '60')),
+        schedule_catchup_hours=int(os.getenv('SCHEDULE_CATCHUP_HOURS', '6')),
+        schedule_prewarm_minutes=int(os.getenv('SCHEDULE_PREWARM_MINUTES', '10')),
+        checkpoint_enabled=os.getenv('CHECKPOINT_ENABLED', 'true').lower() == 'true',
+        checkpoint_keep_runs=int(os.getenv('CHECKPOINT_KEEP_RUNS', '14')),
+        llm_pricing=os.getenv('LLM_PRICING', ''),
     )
@@ -1,8 +1,10 @@
 """
-중복 제거 (카테고리 내 + 카테고리 간)
+중복 제거 (카테고리 내 + 카테고리 간 + 이전 실행)
 """
-from typing import List, Dict
+from datetime import datetime
+from typing import Iterable, Optional, Union
 import logging
+from utils.article import ArticleBatch, ArticleLike
 from utils.helpers import clean_html, normalize_title
 
 logger = logging.getLogger(__name__)
@@ -11,35 +13,55 @@ logger = logging.getLogger(__name__)
 class Deduplicator:
     """중복 제거"""
 
-    def __init__(self):
+    def __init__(self, store=None, reported_before: Optional[datetime] = None):
+        """
+        Args:
+            store: ArticleStore (지정하면 이전 실행에서 이미 리포트한 링크도 제외)
+            reported_before: 이 시각 이전에 끝난 윈도우의 실행만 이전 리포트로 본다
+        """
         self.seen_titles: set = set()
         self.seen_links: set = set()
+        self.store = store
+        self.reported_before = reported_before
+
+    def remember(self, articles: Union[ArticleBatch, Iterable[ArticleLike]]) -> None:
+        """
+        이미 통과한 기사(예: 체크포인트에서 복원한 카테고리)를 본 것으로 등록한다.
+
+        Args:
+            articles: 기사 리스트 또는 ArticleBatch
+        """
+        for article in ArticleBatch.coerce(articles):
+            self.seen_titles.add(normalize_title(article.title))
+            self.seen_links.add(article.link)
 
-    def deduplicate_within_category(self, articles: List[Dict]) -> List[Dict]:
+    def deduplicate_within_category(self, articles: Union[ArticleBatch, Iterable[ArticleLike]]) -> ArticleBatch:
         """
         동일 카테고리 내 중복 제거 (제목 + URL)
 
         Args:
-            articles: 기사 리스트
+            articles: 기사 리스트 또는 ArticleBatch
 
         Returns:
-            중복 제거된 기사 리스트
+            중복 제거된 ArticleBatch
         """
-        unique_articles = []
+        articles = ArticleBatch.coerce(articles)
+        unique_articles = ArticleBatch()
+        reported = self._reported_links(articles)
 
         for article in articles:
             # 제목 정규화
-            clean_title = normalize_title(article['title'])
-            link = article['link']
+            clean_title = normalize_title(article.title)
+            link = article.link
 
             if clean_title in self.seen_titles:
                 continue
-            if link in self.seen_links:
+            if link in self.seen_links or link in reported:
                 continue
 
             # HTML 태그 정리
-            article['title'] = clean_html(article['title'])
-            article['snippet'] = clean_html(article['snippet'])
+            article.title = clean_html(article.title)
+            article.snippet = clean_html(article.snippet)
 
             unique_articles.append(article)
             self.seen_titles.add(clean_title)
@@ -48,21 +70,32 @@ class Deduplicator:
         logger.info(f"Deduplication: {len(unique_articles)}/{len(articles)} unique")
         return unique_articles
 
-    def deduplicate_cross_categories(self, articles: List[Dict]) -> List[Dict]:
+    def _reported_links(self, articles: ArticleBatch) -> set:
+        """이전 실행에서 이미 리포트한 링크 (저장소 인덱스 조회, 실패 시 빈 집합)"""
+        if self.store is None or self.reported_before is None or not len(articles):
+            return set()
+        try:
+            return self.store.reported_links((article.link for article in articles), self.reported_before)
+        except Exception as e:
+            logger.warning(f"Reported link lookup failed: {e}")
+            return set()
+
+    def deduplicate_cross_categories(self, articles: Union[ArticleBatch, Iterable[ArticleLike]]) -> ArticleBatch:
         """
         카테고리 간 중복 제거 (URL 기반)
 
         Args:
-            articles: 기사 리스트
+            articles: 기사 리스트 또는 ArticleBatch
 
         Returns:
-            중복 제거된 기사 리스트
+            중복 제거된 ArticleBatch
         """
+        articles = ArticleBatch.coerce(articles)
         seen_links = {}
-        unique_articles = []
+        unique_articles = ArticleBatch()
 
         for article in articles:
-            link = article['link']
+            link = article.link
 
             if link not in seen_links:
                 seen_links[link] = True
@@ -1,14 +1,42 @@
 """
 키워드 필터링 (스팸, 광고, 게임)
 """
-from typing import Dict, List, Optional, Set
+from typing import Dict, Iterable, List, Optional, Set, Union
 import logging
+import re
+
+from utils.article import Article, ArticleBatch, ArticleLike
 
 logger = logging.getLogger(__name__)
 
 
+class SubstringMatcher:
+    """
+    여러 부분 문자열 중 하나라도 포함되는지 검사 (`any(needle in text ...)`와 같은 결과)
+
+    패턴들을 생성 시 정규식 대안(alternation) 하나로 컴파일해, 기사 1건마다 패턴 수만큼
+    파이썬 루프를 도는 대신 한 번의 C 수준 검색으로 끝낸다. 긴 패턴을 먼저 두어 로그에
+    더 구체적인 매치가 남는다.
+    """
+
+    def __init__(self, needles: Iterable[str]):
+        self.needles = frozenset(needle for needle in needles if needle)
+        ordered = sorted(self.needles, key=lambda needle: (-len(needle), needle))
+        self._pattern = re.compile("|".join(map(re.escape, ordered))) if ordered else None
+
+    def __bool__(self) -> bool:
+        return self._pattern is not None
+
+    def search(self, text: str) -> Optional[str]:
+        """text에 포함된 패턴 1개 (없으면 None)"""
+        if self._pattern is None:
+            return None
+        match = self._pattern.search(text)
+        return match.group() if match else None
+
+
 class KeywordFilter:
-    """키워드 기반 필터링"""
+    """키워드 기반 필터링 (규칙별 매처는 생성 시 한 번만 컴파일하므로 인스턴스를 재사용한다)"""
 
     def __init__(
         self,
@@ -37,48 +65,54 @@ class KeywordFilter:
             value.lower() for value in rules.get("required_keywords", [])
         )
 
-    def _validate_global_trend(self, article: Dict) -> bool:
-        link = str(article.get('link', '')).lower()
-        title = str(article.get('title', '')).lower()
-        snippet = str(article.get('snippet', '')).lower()
-        query = str(article.get('query', '')).lower()
-        source_domain = str(article.get('source_domain', '')).lower()
+        self._blacklist_matcher = SubstringMatcher(self.blacklist_domains)
+        self._excluded_matcher = SubstringMatcher(self.excluded_keywords)
+        self._gt_domain_matcher = SubstringMatcher(self.global_trend_excluded_domains)
+        self._gt_url_matcher = SubstringMatcher(self.global_trend_excluded_url_patterns)
+        self._gt_excluded_matcher = SubstringMatcher(self.global_trend_excluded_keywords)
+        self._gt_required_matcher = SubstringMatcher(self.global_trend_required_keywords)
+
+    def _validate_global_trend(self, article: Article) -> bool:
+        link = article.link_lower
+        title = article.title_lower
+        snippet = article.snippet_lower
+        query = article.query_lower
+        source_domain = article.source_domain_lower
         combined_text = f"{title} {snippet} {query}".strip()
 
-        if any(domain in source_domain for domain in self.global_trend_excluded_domains):
+        if self._gt_domain_matcher.search(source_domain):
             logger.debug(f"Filtered global_trend by domain: {source_domain}")
             return False
 
-        if any(pattern in link for pattern in self.global_trend_excluded_url_patterns):
+        if self._gt_url_matcher.search(link):
             logger.debug(f"Filtered global_trend by URL pattern: {link}")
             return False
 
-        if any(keyword in combined_text for keyword in self.global_trend_excluded_keywords):
+        if self._gt_excluded_matcher.search(combined_text):
             logger.debug(f"Filtered global_trend by excluded keyword: {title[:50]}")
             return False
 
-        if self.global_trend_required_keywords and not any(
-            keyword in combined_text for keyword in self.global_trend_required_keywords
-        ):
+        if self._gt_required_matcher and not self._gt_required_matcher.search(combined_text):
             logger.debug(f"Filtered global_trend by missing required keyword: {title[:50]}")
             return False
 
         return True
 
-    def validate(self, article: Dict, category: str = "") -> bool:
+    def validate(self, article: ArticleLike, category: str = "") -> bool:
         """
         기사 검증
 
         Args:
-            article: 기사 딕셔너리
+            article: 기사 (Article 또는 딕셔너리)
             category: 카테고리 키
 
         Returns:
             유효하면 True
         """
-        link = article.get('link', '')
-        title = article.get('title', '').lower()
-        snippet = article.get('snippet', '').lower()
+        article = Article.from_dict(article)
+        link = str(article.link or '')
+        title = article.title_lower
+        snippet = article.snippet_lower
 
         # 1. Cafe/Blog URL 필터링 (News API에서 반환되는 경우)
         if 'cafe.naver.com' in link or 'blog.naver.com' in link:
@@ -87,19 +121,18 @@ class KeywordFilter:
                 return False
 
         # 2. 블랙리스트 도메인
-        if any(blocked in link for blocked in self.blacklist_domains):
+        if self._blacklist_matcher.search(link):
             logger.debug(f"Filtered: URL blacklist - {title[:50]}")
             return False
 
         # 3. 제외 키워드 (제목 + 요약)
-        combined_text = f"{title} {snippet}"
-        for bad_word in self.excluded_keywords:
-            if bad_word in combined_text:
-                logger.debug(f"Filtered: Keyword '{bad_word}' - {title[:50]}")
-                return False
+        bad_word = self._excluded_matcher.search(f"{title} {snippet}")
+        if bad_word:
+            logger.debug(f"Filtered: Keyword '{bad_word}' - {title[:50]}")
+            return False
 
         # 4. URL에 포함된 키워드
-        if any(bad_word in link.lower() for bad_word in self.excluded_keywords):
+        if self._excluded_matcher.search(article.link_lower):
             logger.debug(f"Filtered: Link keyword - {title[:50]}")
             return False
 
@@ -108,17 +141,24 @@ class KeywordFilter:
 
         return True
 
-    def filter_articles(self, articles: List[Dict], category: str = "") -> List[Dict]:
+    def filter_articles(
+        self,
+        articles: Union[ArticleBatch, Iterable[ArticleLike]],
+        category: str = "",
+    ) -> ArticleBatch:
         """
         기사 리스트 키워드 필터링
 
         Args:
-            articles: 기사 리스트
+            articles: 기사 리스트 또는 ArticleBatch
             category: 카테고리 키
 
         Returns:
-            필터링된 기사 리스트
+            필터링된 ArticleBatch
         """
-        filtered = [a for a in articles if self.validate(a, category=category)]
-        logger.info(f"Keyword filter: {len(filtered)}/{len(articles)} passed")
+        batch = ArticleBatch.coerce(articles)
+        filtered = batch.take(
+            i for i, article in enumerate(batch) if self.validate(article, category=category)
+        )
+        logger.info(f"Keyword filter: {len(filtered)}/{len(batch)} passed")
         return filtered
@@ -1,27 +1,52 @@
 """
 시간 필터링 (24시간 윈도우)
 """
+from bisect import bisect_left, bisect_right
 from datetime import datetime, timezone, timedelta
-from typing import List, Dict, Optional
+from typing import Iterable, List, Optional, Union
 import logging
 
+from utils.article import MISSING_EPOCH, ArticleBatch, ArticleLike
+from utils.time_windows import to_epoch_us
+
 logger = logging.getLogger(__name__)
 
+# epoch 열 비교 상한 (end_time이 없는 윈도우)
+MAX_EPOCH = 2 ** 63 - 1
+
+# 게시일 누락 기사 처리 정책
+MISSING_DATE_KEEP = "keep"
+MISSING_DATE_DROP = "drop"
+MISSING_DATE_POLICIES = (MISSING_DATE_KEEP, MISSING_DATE_DROP)
+
 
 class TimeFilter:
     """시간 기반 필터링"""
 
-    def __init__(self, window_hours: int = 24, start_time: Optional[datetime] = None, end_time: Optional[datetime] = None):
+    def __init__(
+        self,
+        window_hours: int = 24,
+        start_time: Optional[datetime] = None,
+        end_time: Optional[datetime] = None,
+        missing_date_policy: str = MISSING_DATE_KEEP,
+    ):
         """
         Args:
             window_hours: 시간 윈도우 (기본 24시간)
             start_time: 시작 시간 (UTC)
             end_time: 종료 시간 (UTC)
+            missing_date_policy: 게시일 누락 기사 처리 ('keep' 포함 / 'drop' 제외)
         """
+        if missing_date_policy not in MISSING_DATE_POLICIES:
+            raise ValueError(f"Invalid missing_date_policy: {missing_date_policy}")
+
         self.window_hours = window_hours
         self.cutoff_time = datetime.now(timezone.utc) - timedelta(hours=window_hours)
         self.start_time = self._normalize_datetime(start_time) if start_time else self.cutoff_time
         self.end_time = self._normalize_datetime(end_time) if end_time else None
+        self.missing_date_policy = missing_date_policy
+        self._start_epoch = to_epoch_us(self.start_time)
+        self._end_epoch = to_epoch_us(self.end_time) if self.end_time else None
 
     def _normalize_datetime(self, dt: datetime) -> datetime:
         if dt.tzinfo is None:
@@ -39,7 +64,7 @@ class TimeFilter:
             윈도우 내에 있으면 True
         """
         if not pub_date:
-            return True  # 날짜 파싱 실패 시 포함
+            return self.missing_date_policy == MISSING_DATE_KEEP  # 기본: 날짜 파싱 실패 시 포함
 
         pub_date = self._normalize_datetime(pub_date)
         if self.end_time is None:
@@ -54,20 +79,85 @@ class TimeFilter:
 
         return is_valid
 
-    def filter_articles(self, articles: List[Dict]) -> List[Dict]:
+    def select_indices(
+        self,
+        articles: Union[ArticleBatch, Iterable[ArticleLike]],
+        missing_date_policy: Optional[str] = None,
+    ) -> List[int]:
+        """
+        윈도우 `[start_time, end_time)`에 포함되는 기사 인덱스를 반환한다.
+
+        datetime 대신 batch에 캐시된 epoch 정수 열(ArticleBatch.published_epochs)로 비교한다.
+        정렬 열(ArticleBatch.sorted_epochs)이 이미 있으면 구간 경계를 bisect로 찾아 구간 크기에만
+        비례하고, 없으면 정렬하지 않고 epoch 열을 한 번 훑는다 (한 번만 거르는 수집 경로에서 정렬 비용을 내지 않는다).
+        호출: collect_articles(정기 실행/백필 윈도우), benchmarks의 time_filter 측정.
+
+        Args:
+            articles: 기사 리스트 또는 ArticleBatch
+            missing_date_policy: 게시일 누락 처리 정책 (None이면 인스턴스 설정 사용)
+
+        Returns:
+            통과한 기사 인덱스 리스트 (입력 순서 유지)
+        """
+        policy = missing_date_policy or self.missing_date_policy
+        if policy not in MISSING_DATE_POLICIES:
+            raise ValueError(f"Invalid missing_date_policy: {policy}")
+
+        batch = ArticleBatch.coerce(articles)
+        keep_missing = policy == MISSING_DATE_KEEP
+        start = self._start_epoch
+        end = self._end_epoch if self._end_epoch is not None else MAX_EPOCH
+        cached = batch.cached_sorted_epochs()
+        if cached is None:
+            return [
+                index for index, epoch in enumerate(batch.published_epochs())
+                if start <= epoch < end or (keep_missing and epoch == MISSING_EPOCH)
+            ]
+
+        order, epochs = cached
+        low = bisect_left(epochs, start)
+        high = bisect_left(epochs, end)
+        selected = order[low:high] if low < high else []
+        if keep_missing:
+            selected = order[:bisect_right(epochs, MISSING_EPOCH)] + selected
+
+        # 입력 순서 유지
+        selected.sort()
+        return selected
+
+    def filter_batch(
+        self,
+        articles: Union[ArticleBatch, Iterable[ArticleLike]],
+        missing_date_policy: Optional[str] = None,
+    ) -> ArticleBatch:
+        """
+        select_indices 결과로 필터링된 ArticleBatch를 반환한다.
+
+        Args:
+            articles: 기사 리스트 또는 ArticleBatch
+            missing_date_policy: 게시일 누락 처리 정책 (None이면 인스턴스 설정 사용)
+
+        Returns:
+            필터링된 ArticleBatch
+        """
+        batch = ArticleBatch.coerce(articles)
+        filtered = batch.take(self.select_indices(batch, missing_date_policy=missing_date_policy))
+
+        logger.info(f"Time filter: {len(filtered)}/{len(batch)} passed")
+        return filtered
+
+    def filter_articles(self, articles: Union[ArticleBatch, Iterable[ArticleLike]]) -> ArticleBatch:
         """
         기사 리스트 시간 필터링
 
         Args:
-            articles: 기사 리스트
+            articles: 기사 리스트 또는 ArticleBatch
 
         Returns:
-            필터링된 기사 리스트
+            필터링된 ArticleBatch
         """
-        filtered = []
-        for article in articles:
-            if self.is_valid(article.get('published')):
-                filtered.append(article)
+        batch = ArticleBatch.coerce(articles)
+        filtered = batch.take([index for index, article in enumerate(batch) if self.is_valid(article.published)])
 
-        logger.info(f"Time filter: {len(filtered)}/{len(articles)} passed")
+        logger.info(f"Time filter: {len(filtered)}/{len(batch)} passed")
         return filtered
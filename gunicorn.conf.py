@@ -0,0 +1,39 @@
+"""
+gunicorn 설정 (python serve_web.py 또는 gunicorn wsgi:app -c gunicorn.conf.py)
+
+- 멀티 프로세스 + 스레드(gthread) 워커: SSE 스트림이 요청 스레드 하나만 점유하도록 한다.
+- 설정 변경/코드 배포 후 `kill -HUP <master pid>`로 요청 유실 없이 워커를 교체한다.
+- 분석 파이프라인은 `python worker.py`가 실행한다. 요청 워커 안에서 실행하는 embedded 모드는 거부한다.
+"""
+import multiprocessing
+import os
+
+bind = f"{os.getenv('WEB_HOST', '0.0.0.0')}:{os.getenv('WEB_PORT', '5000')}"
+workers = int(os.getenv('WEB_WORKERS', '0')) or min(multiprocessing.cpu_count() * 2 + 1, 8)
+threads = int(os.getenv('WEB_THREADS', '8'))
+worker_class = 'gthread'
+
+# gthread 워커의 timeout은 워커 프로세스 응답 감시용 (SSE처럼 오래 열린 요청은 끊지 않는다)
+timeout = 60
+graceful_timeout = 30
+keepalive = 5
+
+# 메모리 누적 방지를 위해 일정 요청 수마다 워커 교체 (jitter로 동시 재시작 방지)
+max_requests = 2000
+max_requests_jitter = 200
+
+accesslog = '-'
+errorlog = '-'
+loglevel = os.getenv('WEB_LOG_LEVEL', 'info')
+proc_name = 'news-collector-web'
+
+
+def on_starting(server):
+    mode = os.getenv('ANALYSIS_WORKER_MODE', 'external').strip().lower()
+    if mode != 'external':
+        # 요청 워커는 max_requests/timeout으로 재활용·종료되므로 그 안의 파이프라인이 중간에 끊긴다.
+        server.log.error(
+            f"ANALYSIS_WORKER_MODE={mode} is not supported under gunicorn: analysis jobs would run inside "
+            "request worker processes that get recycled. Set ANALYSIS_WORKER_MODE=external and run `python worker.py`."
+        )
+        raise SystemExit(1)
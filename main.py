@@ -1,60 +1,153 @@
 """
 SKT 로밍팀 뉴스 수집 시스템 메인 실행 파일
-"""
-import yaml
-import logging
-from typing import Dict, List
-
-from config.settings import load_settings
-from config.recipient_store import get_group_recipients
-from utils.logger import setup_logger
-from utils.exceptions import NewsCollectorError
-from utils.time_windows import get_collection_window_kst
-
-# 수집 계층
-from collectors.naver_collector import NaverCollector
-from collectors.google_collector import GoogleCollector
-from collectors.mofa_0404_collector import Mofa0404Collector
-
-# 필터링 계층
-from filters.time_filter import TimeFilter
-from filters.keyword_filter import KeywordFilter
-from filters.deduplicator import Deduplicator
 
-# 분석 계층
-from analyzers.summarizer import Summarizer
-from analyzers.insight_generator import InsightGenerator
+수집/필터/분석/발송 계층과 설정(.env), 저장소, yaml은 쓰는 함수 안에서 import한다.
+`python main.py list-recipients`처럼 짧은 명령은 openai/requests 등을 불러오지 않고 바로 끝난다
+(tests/test_startup.py의 import 시간 예산 참고).
+"""
+from __future__ import annotations
 
-# 발송 계층
-from notifiers.email_formatter import EmailFormatter
-from notifiers.smtp_sender import SMTPSender
-from notifiers.web_generator import WebGenerator
+import argparse
+import json
+import logging
+import os
+import sys
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from contextlib import contextmanager
+from datetime import datetime, timedelta, timezone
+from typing import TYPE_CHECKING, Callable, Dict, Iterator, List, Optional, Tuple
+
+from config.recipient_store import GROUP_TO_KEY, get_group_recipients
+from utils.article import ArticleBatch
+from utils.checkpoint import (
+    DEFAULT_CHECKPOINT_DIR,
+    STATUS_ANALYZED,
+    STATUS_COLLECTED,
+    STATUS_COMPLETED,
+    STATUS_FAILED,
+    STATUS_RUNNING,
+    STAGE_EXTERNAL_ALERTS,
+    STAGE_FILTERED,
+    STAGE_INSIGHTS,
+    STAGE_RAW,
+    STAGE_SUMMARIES,
+    RunCheckpoint,
+    prune_checkpoints,
+)
+from utils import metrics
+from utils.logger import bind_log_context, log_context, setup_logger
+from utils.exceptions import CheckpointNotFoundError, NewsCollectorError
+from utils.file_lock import pipeline_lock
+from utils.profiling import RunProfiler, parse_profile_stages, profile_stage
+from utils.progress import ProgressCallback, report_progress
+from utils.scheduler import CronSchedule, ScheduledJob, Scheduler
+from utils.time_windows import CollectionWindow, get_collection_window_kst, split_backfill_windows
+
+if TYPE_CHECKING:
+    from analyzers.usage import UsageTracker
+    from notifiers.web_generator import WebGenerator
 
 
 def load_categories(config_path: str = "config/categories.yaml") -> Dict:
     """
-    카테고리 설정 로드
+    카테고리 설정 로드 (파일이 바뀌었을 때만 다시 파싱하는 캐시, config/category_config.py)
 
     Args:
         config_path: 설정 파일 경로
 
     Returns:
-        카테고리 설정
+        카테고리 설정 (프로세스 안에서 공유하므로 수정하지 않는다)
+
+    Raises:
+        ValidationError: 잘못된 설정
     """
-    with open(config_path, 'r', encoding='utf-8') as f:
-        return yaml.safe_load(f)
+    from config.category_config import get_category_config
 
+    return get_category_config(config_path).data
 
-def collect_articles(settings) -> Dict:
+
+def _collect_category_sources(
+    cat_key: str, cat_config: Dict, naver_collector, google_collector, fetch_limit: int
+) -> ArticleBatch:
+    """카테고리 1개의 키워드 x 소스 수집 (필터 적용 전)"""
+    logger = logging.getLogger("news_collector")
+    category_articles = ArticleBatch()
+    sources = cat_config['sources']
+    keywords = cat_config['keywords']
+    fetchers = (
+        ('naver_news', 'Naver News', naver_collector.collect_from_news),
+        ('naver_blog', 'Naver Blog', naver_collector.collect_from_blog),
+        ('naver_cafe', 'Naver Cafe', naver_collector.collect_from_cafe),
+        ('google_search', 'Google Search', google_collector.collect),
+    )
+
+    for keyword in keywords:
+        logger.debug(f"  Keyword: {keyword}")
+
+        for source, label, fetch in fetchers:
+            if source not in sources:
+                continue
+            try:
+                with metrics.timer("news_collector_source_seconds", category=cat_key, source=source):
+                    articles = fetch(keyword, limit=fetch_limit)
+                category_articles.extend(articles)
+                metrics.inc(
+                    "news_collector_source_articles_total", len(articles),
+                    category=cat_key, keyword=keyword, source=source,
+                )
+            except Exception as e:
+                metrics.inc("news_collector_source_errors_total", category=cat_key, source=source)
+                logger.error(f"    {label} failed: {e}")
+
+    return category_articles
+
+
+def _run_filter(name: str, category: str, apply, articles: ArticleBatch) -> ArticleBatch:
+    """필터 1단계 실행 + 소요 시간/통과·제외 건수 기록"""
+    with metrics.timer("news_collector_filter_seconds", filter=name, category=category):
+        passed = apply(articles)
+    metrics.inc("news_collector_filter_articles_total", len(passed), filter=name, category=category, result="passed")
+    metrics.inc(
+        "news_collector_filter_articles_total", len(articles) - len(passed),
+        filter=name, category=category, result="dropped",
+    )
+    return passed
+
+
+@metrics.timed("news_collector_stage_seconds", stage="collect")
+def collect_articles(
+    settings,
+    window: Optional[CollectionWindow] = None,
+    fetch_limit: int = 5,
+    store=None,
+    run_id: Optional[str] = None,
+    progress: Optional[ProgressCallback] = None,
+    checkpoint: Optional[RunCheckpoint] = None,
+    stored_articles: Optional[Dict[str, ArticleBatch]] = None,
+) -> Dict:
     """
     기사 수집 메인 함수
 
     Args:
         settings: 설정 객체
+        window: 수집 윈도우 (None이면 현재 시각 기준 윈도우)
+        fetch_limit: 키워드/소스별 API 요청 건수
+        store: ArticleStore (지정 시 필터링된 기사를 run_id로 기록)
+        run_id: 실행 ID
+        progress: 카테고리 수집 완료 시 호출할 진행 콜백 ('category_collected')
+        checkpoint: 실행 체크포인트 (지정 시 카테고리별 수집/필터 결과를 저장하고, 이미 있으면 재사용)
+        stored_articles: 저장소에 남은 이전 실행 기사 (있는 카테고리는 API 수집 대신 현재 규칙으로 다시 필터링)
 
     Returns:
-        카테고리별 기사 딕셔너리
+        카테고리별 ArticleBatch 딕셔너리
     """
+    from collectors.google_collector import GoogleCollector
+    from collectors.naver_collector import NaverCollector
+    from config.category_config import get_category_config
+    from filters.deduplicator import Deduplicator
+    from filters.time_filter import MISSING_DATE_KEEP, TimeFilter
+
     logger = logging.getLogger("news_collector")
     logger.info("=== Starting News Collection ===")
 
@@ -71,11 +164,11 @@ def collect_articles(settings) -> Dict:
         debug_mode=settings.debug_mode
     )
 
-    # 필터 초기화
-    config = load_categories()
-    filters_config = config['filters']
+    # 필터 초기화 (설정과 키워드 매처는 파일이 바뀌었을 때만 다시 만든다)
+    config = get_category_config()
 
-    window = get_collection_window_kst(window_hours=settings.time_window_hours)
+    if window is None:
+        window = get_collection_window_kst(window_hours=settings.time_window_hours)
     logger.info(
         f"Collection window ({window.label}): "
         f"KST {window.start_kst.strftime('%Y-%m-%d %H:%M')} ~ {window.end_kst.strftime('%Y-%m-%d %H:%M')}"
@@ -85,81 +178,78 @@ def collect_articles(settings) -> Dict:
         start_time=window.start_utc,
         end_time=window.end_utc
     )
-    keyword_filter = KeywordFilter(
-        blacklist_domains=filters_config['blacklist_domains'],
-        excluded_keywords=filters_config['excluded_keywords'],
-        global_trend_rules=filters_config.get('global_trend', {})
-    )
-    deduplicator = Deduplicator()
+    keyword_filter = config.keyword_filter
+    # 저장소가 있으면 이전 윈도우의 완료된 실행이 이미 리포트한 기사도 제외한다 (link_hash 인덱스 조회)
+    deduplicator = Deduplicator(store=store, reported_before=window.start_utc)
 
     # 카테고리별 수집
-    categories = config['categories']
-    collected_data: Dict[str, List] = {}
+    categories = config.categories
+    collected_data: Dict[str, ArticleBatch] = {}
 
-    for cat_key, cat_config in categories.items():
+    for done, (cat_key, cat_config) in enumerate(categories.items(), start=1):
         logger.info(f"\n[{cat_config['id']}] {cat_config['name']}")
 
-        category_articles = []
-        sources = cat_config['sources']
-        keywords = cat_config['keywords']
-
-        for keyword in keywords:
-            logger.info(f"  Keyword: {keyword}")
-
-            # Naver News
-            if 'naver_news' in sources:
-                try:
-                    articles = naver_collector.collect_from_news(keyword, limit=5)
-                    category_articles.extend(articles)
-                except Exception as e:
-                    logger.error(f"    Naver News failed: {e}")
-
-            # Naver Blog
-            if 'naver_blog' in sources:
-                try:
-                    articles = naver_collector.collect_from_blog(keyword, limit=5)
-                    category_articles.extend(articles)
-                except Exception as e:
-                    logger.error(f"    Naver Blog failed: {e}")
-
-            # Naver Cafe
-            if 'naver_cafe' in sources:
-                try:
-                    articles = naver_collector.collect_from_cafe(keyword, limit=5)
-                    category_articles.extend(articles)
-                except Exception as e:
-                    logger.error(f"    Naver Cafe failed: {e}")
-
-            # Google Search
-            if 'google_search' in sources:
-                try:
-                    articles = google_collector.collect(keyword, limit=5)
-                    category_articles.extend(articles)
-                except Exception as e:
-                    logger.error(f"    Google Search failed: {e}")
+        filtered_stage = f"{STAGE_FILTERED}/{cat_key}"
+        if checkpoint is not None and checkpoint.has(filtered_stage):
+            collected_data[cat_key] = checkpoint.load_articles(filtered_stage)
+            # 이후 카테고리의 중복 제거가 중단 전과 같은 결과가 되도록 복원된 기사를 먼저 등록한다.
+            deduplicator.remember(collected_data[cat_key])
+            logger.info(f"  Restored from checkpoint: {len(collected_data[cat_key])} articles")
+            report_progress(
+                progress, "category_collected",
+                category=cat_key, count=len(collected_data[cat_key]), done=done, total=len(categories),
+            )
+            continue
+
+        raw_stage = f"{STAGE_RAW}/{cat_key}"
+        if checkpoint is not None and checkpoint.has(raw_stage):
+            category_articles = checkpoint.load_articles(raw_stage)
+            logger.info(f"  Restored raw articles from checkpoint: {len(category_articles)}")
+        elif stored_articles is not None and cat_key in stored_articles:
+            category_articles = ArticleBatch(stored_articles[cat_key])
+            logger.info(f"  Re-filtering stored articles: {len(category_articles)}")
+        else:
+            category_articles = _collect_category_sources(
+                cat_key, cat_config, naver_collector, google_collector, fetch_limit
+            )
+            if checkpoint is not None:
+                checkpoint.save_articles(raw_stage, category_articles)
 
         # 필터링
         logger.info(f"  Filtering articles...")
 
         # 시간 필터링
-        category_articles = time_filter.filter_articles(category_articles)
+        category_articles = _run_filter(
+            "time", cat_key,
+            lambda batch: time_filter.filter_batch(batch, missing_date_policy=MISSING_DATE_KEEP), category_articles
+        )
 
         # 키워드 필터링
-        category_articles = keyword_filter.filter_articles(category_articles, category=cat_key)
+        category_articles = _run_filter(
+            "keyword", cat_key, lambda batch: keyword_filter.filter_articles(batch, category=cat_key), category_articles
+        )
 
         # 중복 제거
-        category_articles = deduplicator.deduplicate_within_category(category_articles)
+        category_articles = _run_filter(
+            "dedup", cat_key, deduplicator.deduplicate_within_category, category_articles
+        )
 
         # 카테고리 태그 추가
         for article in category_articles:
-            article['category'] = cat_key
+            article.category = cat_key
 
         collected_data[cat_key] = category_articles
+        if checkpoint is not None:
+            checkpoint.save_articles(filtered_stage, category_articles)
         logger.info(f"  Collected: {len(category_articles)} articles")
+        report_progress(
+            progress, "category_collected",
+            category=cat_key, count=len(category_articles), done=done, total=len(categories),
+        )
 
     # 카테고리 간 중복 제거
     logger.info("\n[Deduplicating across categories...")
-    all_articles = []
+    all_articles = ArticleBatch()
     for articles in collected_data.values():
         all_articles.extend(articles)
 
@@ -168,67 +258,126 @@ def collect_articles(settings) -> Dict:
 
     logger.info(f"Total unique articles: {len(unique_articles)}")
 
+    if store is not None and run_id:
+        try:
+            saved = store.save_articles(run_id, collected_data)
+            logger.info(f"Article store: {saved} articles recorded (run {run_id})")
+        except Exception as e:
+            logger.error(f"Article store write failed: {e}")
+
     return collected_data
 
 
-def collect_external_alerts(settings) -> List[Dict]:
-    """0404 게시판 날짜 범위(KST) 키워드 매칭 공지를 수집한다."""
+@metrics.timed("news_collector_stage_seconds", stage="external_alerts")
+def collect_external_alerts(
+    settings,
+    window: Optional[CollectionWindow] = None,
+    store=None,
+    run_id: Optional[str] = None,
+    checkpoint: Optional[RunCheckpoint] = None,
+) -> List[Dict]:
+    """0404 게시판 날짜 범위(KST) 키워드 매칭 공지를 수집한다 (성공한 수집만 체크포인트에 남긴다)."""
     logger = logging.getLogger("news_collector")
     logger.info("\n=== Collecting 0404 External Alerts ===")
 
+    if checkpoint is not None and checkpoint.has(STAGE_EXTERNAL_ALERTS):
+        alerts = checkpoint.load(STAGE_EXTERNAL_ALERTS)
+        logger.info(f"External alerts restored from checkpoint: {len(alerts)}")
+        return alerts
+
     try:
-        window = get_collection_window_kst(window_hours=settings.time_window_hours)
+        if window is None:
+            window = get_collection_window_kst(window_hours=settings.time_window_hours)
         start_date_kst = window.start_kst.strftime("%Y-%m-%d")
         end_date_kst = window.end_kst.strftime("%Y-%m-%d")
         logger.info(
             f"[0404] Date window (KST): {start_date_kst} ~ {end_date_kst} "
             f"(time boundary {window.start_kst.strftime('%H:%M')}~{window.end_kst.strftime('%H:%M')})"
         )
+        from collectors.mofa_0404_collector import Mofa0404Collector
+
         collector = Mofa0404Collector(debug_mode=settings.debug_mode)
         alerts = collector.collect_keyword_posts_by_date_range(start_date_kst, end_date_kst)
         logger.info(f"External alerts collected: {len(alerts)}")
+        if store is not None and run_id:
+            store.save_external_alerts(run_id, alerts)
+        if checkpoint is not None:
+            checkpoint.save(STAGE_EXTERNAL_ALERTS, alerts)
         return alerts
     except Exception as e:
         logger.error(f"External alert collection failed: {e}")
         return []
 
 
-def analyze_articles(collected_data: Dict, settings) -> Dict:
+@metrics.timed("news_collector_stage_seconds", stage="analyze")
+def analyze_articles(
+    collected_data: Dict,
+    settings,
+    store=None,
+    run_id: Optional[str] = None,
+    progress: Optional[ProgressCallback] = None,
+    checkpoint: Optional[RunCheckpoint] = None,
+) -> Dict:
     """
     AI 분석 메인 함수
 
     Args:
         collected_data: 수집된 데이터
         settings: 설정 객체
+        store: ArticleStore (지정 시 요약 캐시 조회 및 요약/인사이트 기록)
+        run_id: 실행 ID
+        progress: 카테고리 요약 완료 시 호출할 진행 콜백 ('category_analyzed')
+        checkpoint: 실행 체크포인트 (카테고리 요약/인사이트를 저장하고, 이미 있으면 재사용)
 
     Returns:
         분석된 데이터
     """
+    from analyzers.insight_generator import InsightGenerator
+    from analyzers.summarizer import Summarizer
+    from analyzers.usage import UsageTracker, parse_price_overrides
+
     logger = logging.getLogger("news_collector")
     logger.info("\n=== Starting AI Analysis ===")
 
     # STEP 1: 기사 요약 (GPT-4o-mini)
     logger.info("STEP 1: Summarizing articles with gpt-4o-mini-2024-07-18...")
+    usage = UsageTracker(prices=parse_price_overrides(settings.llm_pricing))
     summarizer = Summarizer(
         api_key=settings.api.openai_api_key,
         base_url=settings.api.openai_base_url,
-        model=settings.api.model_basic
+        model=settings.api.model_basic,
+        store=store,
+        run_id=run_id,
+        usage=usage,
     )
 
-    summary_data = summarizer.analyze(collected_data)
+    summary_data = summarizer.analyze(collected_data, progress=progress, checkpoint=checkpoint)
 
     # STEP 2: 전략 인사이트 (GPT-5)
     logger.info("STEP 2: Generating insights with gpt-4o-mini-2024-07-18...")
     insight_generator = InsightGenerator(
         api_key=settings.api.openai_api_key,
         base_url=settings.api.openai_base_url,
-        model=settings.api.model_advanced
+        model=settings.api.model_advanced,
+        usage=usage,
     )
 
-    insight_data = insight_generator.analyze(summary_data)
+    if checkpoint is not None and checkpoint.has(STAGE_INSIGHTS):
+        insight_data = checkpoint.load(STAGE_INSIGHTS)
+        logger.info("Insights restored from checkpoint")
+    else:
+        insight_data = insight_generator.analyze(summary_data)
+        if checkpoint is not None:
+            checkpoint.save(STAGE_INSIGHTS, insight_data)
+    if store is not None and run_id:
+        try:
+            store.save_insights(run_id, insight_data)
+        except Exception as e:
+            logger.error(f"Insight store write failed: {e}")
 
     # 데이터 병합
     final_data = {**insight_data}
+    final_data['llm_usage'] = record_llm_usage(usage, store=store, run_id=run_id)
 
     # 카테고리별 섹션 데이터 추가
     for category, summaries in summary_data.items():
@@ -239,24 +388,112 @@ def analyze_articles(collected_data: Dict, settings) -> Dict:
     return final_data
 
 
-def send_report(analyzed_data: Dict, settings):
+def record_llm_usage(usage: UsageTracker, store=None, run_id: Optional[str] = None) -> Dict:
+    """
+    LLM 호출 기록 저장 + 실행 합계 로그
+
+    Returns:
+        실행 단위 토큰/비용 합계 (저장소가 있으면 재개 전 시도까지 포함한 실행 전체 기준)
+    """
+    from analyzers.usage import summarize_usage
+
+    logger = logging.getLogger("news_collector")
+    summary = usage.summary()
+    if store is not None and run_id:
+        try:
+            store.save_llm_usage(run_id, usage.records)
+            summary = summarize_usage(store.load_llm_usage(run_id))
+        except Exception as e:
+            logger.error(f"LLM usage store write failed: {e}")
+
+    cost = f"${summary['cost_usd']:.4f}" if summary["cost_usd"] is not None else "unknown cost"
+    logger.info(
+        f"LLM usage: {summary['calls']} calls, {summary['prompt_tokens']} prompt + "
+        f"{summary['completion_tokens']} completion tokens, {cost}"
+    )
+    for category, totals in sorted(summary["categories"].items(), key=lambda item: -item[1]["total_tokens"]):
+        logger.info(
+            f"  {category}: {totals['calls']} calls, {totals['total_tokens']} tokens, "
+            f"{totals['latency_seconds']:.1f}s"
+        )
+    return summary
+
+
+def build_web_generator(settings, store=None) -> WebGenerator:
+    """
+    설정 기반 WebGenerator 생성 (리포트 아카이브 설정 포함)
+
+    Args:
+        settings: 설정 객체
+        store: ArticleStore (지정 시 리포트 경로를 실행에 기록)
+
+    Returns:
+        WebGenerator
+    """
+    from notifiers.web_generator import WebGenerator
+    from storage.report_archive import open_report_archive
+
+    return WebGenerator(
+        default_visible_n=settings.web_default_visible_n,
+        summary_max_chars=settings.web_summary_max_chars,
+        store=store,
+        archive=open_report_archive(settings),
+    )
+
+
+@metrics.timed("news_collector_stage_seconds", stage="report")
+def send_report(analyzed_data: Dict, settings, store=None, run_id: Optional[str] = None) -> str:
     """
     리포트 발송 메인 함수
 
     Args:
         analyzed_data: 분석된 데이터
         settings: 설정 객체
+        store: ArticleStore (지정 시 리포트 경로를 실행에 기록)
+        run_id: 실행 ID
+
+    Returns:
+        이력 리포트 파일 경로
     """
     logger = logging.getLogger("news_collector")
     logger.info("\n=== Sending Report ===")
 
+    send_report_email(analyzed_data, settings)
+
+    # 웹 페이지 생성
+    logger.info("Generating web page...")
+    web_generator = build_web_generator(settings, store=store)
+    with metrics.timer("news_collector_render_seconds", output="web"):
+        history_path = web_generator.generate(analyzed_data, run_id=run_id)
+
+    logger.info("Report generation completed")
+    return history_path
+
+
+def send_report_email(analyzed_data: Dict, settings) -> None:
+    """
+    리포트 메일 + 해외 안전 공지 알림 발송 (웹 리포트 생성 제외)
+
+    Args:
+        analyzed_data: 분석된 데이터
+        settings: 설정 객체
+
+    Raises:
+        Exception: 리포트 메일 발송 실패
+    """
+    from notifiers.email_formatter import EmailFormatter
+    from notifiers.smtp_sender import SMTPSender
+
+    logger = logging.getLogger("news_collector")
+
     # 이메일 생성 및 발송
     logger.info("Generating email...")
     email_formatter = EmailFormatter(
         top_n=settings.email_top_n,
         summary_max_chars=settings.email_summary_max_chars,
     )
-    html_content = email_formatter.format(analyzed_data)
+    with metrics.timer("news_collector_render_seconds", output="email"):
+        html_content = email_formatter.format(analyzed_data)
 
     logger.info("Sending email...")
     smtp_sender = SMTPSender(
@@ -269,7 +506,8 @@ def send_report(analyzed_data: Dict, settings):
         logger.warning("No report recipients configured. Skipping report email.")
     else:
         try:
-            smtp_sender.send(html_content, report_recipients)
+            with metrics.timer("news_collector_email_seconds", kind="report"):
+                smtp_sender.send(html_content, report_recipients)
             logger.info(f"Report email sent successfully to {len(report_recipients)} recipients")
         except Exception as e:
             logger.error(f"Email send failed: {e}")
@@ -278,16 +516,6 @@ def send_report(analyzed_data: Dict, settings):
     alerts = analyzed_data.get('external_alerts', [])
     send_safety_alert_notification(alerts, settings)
 
-    # 웹 페이지 생성
-    logger.info("Generating web page...")
-    web_generator = WebGenerator(
-        default_visible_n=settings.web_default_visible_n,
-        summary_max_chars=settings.web_summary_max_chars,
-    )
-    web_generator.generate(analyzed_data)
-
-    logger.info("Report generation completed")
-
 
 def send_safety_alert_notification(alerts: List[Dict], settings) -> bool:
     """
@@ -300,6 +528,9 @@ def send_safety_alert_notification(alerts: List[Dict], settings) -> bool:
     Returns:
         발송 성공 여부
     """
+    from notifiers.email_formatter import EmailFormatter
+    from notifiers.smtp_sender import SMTPSender
+
     logger = logging.getLogger("news_collector")
 
     if not alerts:
@@ -334,69 +565,973 @@ def send_safety_alert_notification(alerts: List[Dict], settings) -> bool:
         return False
 
 
+BACKFILL_STATE_DIR = "output/backfill"
+
+
+def _backfill_window_key(window: CollectionWindow) -> str:
+    return window.end_kst.strftime("%Y%m%d_%H%M%S")
+
+
+def _load_backfill_state(state_path: str, start_date_kst: str, end_date_kst: str) -> Dict:
+    if os.path.exists(state_path):
+        try:
+            with open(state_path, 'r', encoding='utf-8') as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            logging.getLogger("news_collector").warning(f"Backfill state unreadable, starting over: {state_path}")
+    return {"start_date": start_date_kst, "end_date": end_date_kst, "completed": {}, "failed": {}}
+
+
+def _save_backfill_state(state_path: str, state: Dict) -> None:
+    os.makedirs(os.path.dirname(state_path), exist_ok=True)
+    tmp_path = f"{state_path}.tmp"
+    with open(tmp_path, 'w', encoding='utf-8') as f:
+        json.dump(state, f, ensure_ascii=False, indent=2)
+    os.replace(tmp_path, state_path)
+
+
+def complete_run(store, run_id: str, report_path: Optional[str] = None) -> None:
+    """
+    실행을 완료 처리하고 전문 검색 인덱스를 증분 갱신한다.
+
+    Args:
+        store: ArticleStore
+        run_id: 실행 ID
+        report_path: 생성된 리포트 경로
+    """
+    from storage.search_index import SearchIndex
+
+    logger = logging.getLogger("news_collector")
+    store.finish_run(run_id, report_path=report_path)
+    try:
+        SearchIndex(store).index_pending()
+    except Exception as e:
+        logger.error(f"Search index update failed: {e}")
+
+
+def run_backfill_window(window: CollectionWindow, settings, fetch_limit: int = 5, store=None) -> str:
+    """
+    과거 윈도우 1개에 대해 수집 -> 분석 -> 0404 수집 -> 이력 리포트 생성을 수행한다.
+
+    저장소에 같은 윈도우로 기록된 이전 실행이 있으면 그 기사를 현재 필터 규칙으로 다시 필터링/분석하고,
+    없는 카테고리만 API로 다시 수집한다 (검색 API는 최근 결과 위주라 오래된 윈도우는 기사가 적게 나올 수 있다).
+
+    Args:
+        window: 수집 윈도우
+        settings: 설정 객체
+        fetch_limit: 키워드/소스별 API 요청 건수
+        store: ArticleStore (지정 시 윈도우별 실행으로 기록하고 이전 기사를 재사용)
+
+    Returns:
+        생성된 이력 리포트 경로
+    """
+    from storage.article_store import new_run_id
+
+    logger = logging.getLogger("news_collector")
+    run_id = new_run_id(window.end_kst) if store is not None else None
+    bind_log_context(run_id=run_id)
+    stored_articles = None
+    if store is not None:
+        stored_run_id = store.find_window_run(window)
+        if stored_run_id:
+            stored_articles = store.load_articles(stored_run_id)
+            logger.info(
+                f"[Backfill] {window.label}: re-filtering {sum(len(a) for a in stored_articles.values())} "
+                f"stored articles from run {stored_run_id}"
+            )
+        else:
+            logger.warning(
+                f"[Backfill] {window.label}: no stored articles for this window; "
+                f"re-collecting from search APIs (old windows may return few results)"
+            )
+        store.start_run(run_id, window)
+    try:
+        collected_data = collect_articles(
+            settings, window=window, fetch_limit=fetch_limit, store=store, run_id=run_id,
+            stored_articles=stored_articles,
+        )
+        analyzed_data = analyze_articles(collected_data, settings, store=store, run_id=run_id)
+        analyzed_data['external_alerts'] = collect_external_alerts(settings, window=window, store=store, run_id=run_id)
+
+        web_generator = build_web_generator(settings, store=store)
+        # 최신 리포트(daily_report.html)는 덮어쓰지 않고 윈도우 종료 시각 기준 이력만 남긴다.
+        history_path = web_generator.generate(
+            analyzed_data, report_time=window.end_kst, update_latest=False, run_id=run_id
+        )
+    except Exception:
+        if run_id:
+            store.finish_run(run_id, status="failed")
+        raise
+    if run_id:
+        complete_run(store, run_id, report_path=history_path)
+    return history_path
+
+
+def run_backfill(
+    settings,
+    start_date_kst: str,
+    end_date_kst: str,
+    max_workers: int = 2,
+    resume: bool = True,
+    fetch_limit: int = 5,
+    store=None,
+) -> Dict:
+    """
+    KST 날짜 범위를 일별 윈도우로 나눠 리포트를 재생성한다.
+
+    윈도우 완료 시마다 `output/backfill/backfill_<start>_<end>.json`에 체크포인트를 남기며,
+    resume=True면 이미 완료된 윈도우는 건너뛴다. 토/일 윈도우는 월요일 구간에 포함되므로 만들지 않는다.
+    정기 실행/대시보드 분석과 겹치지 않도록 파이프라인 잠금을 잡고 실행한다.
+
+    Args:
+        settings: 설정 객체
+        start_date_kst: 시작일 (YYYY-MM-DD)
+        end_date_kst: 종료일 (YYYY-MM-DD)
+        max_workers: 동시에 처리할 윈도우 수 (API 쿼터를 고려해 작게 유지)
+        resume: 체크포인트 기준 이어서 실행 여부
+        fetch_limit: 키워드/소스별 API 요청 건수
+        store: ArticleStore (윈도우 간 공유)
+
+    Returns:
+        백필 상태 딕셔너리 (completed/failed)
+
+    Raises:
+        LockHeldError: 다른 실행이 파이프라인 잠금을 보유 중
+    """
+    logger = logging.getLogger("news_collector")
+    windows = split_backfill_windows(start_date_kst, end_date_kst, window_hours=settings.time_window_hours)
+    state_path = os.path.join(
+        BACKFILL_STATE_DIR,
+        f"backfill_{start_date_kst.replace('-', '')}_{end_date_kst.replace('-', '')}.json",
+    )
+    if store is None:
+        logger.warning("[Backfill] Article store disabled; every window is re-collected from search APIs")
+
+    with pipeline_lock("backfill"):
+        if resume:
+            state = _load_backfill_state(state_path, start_date_kst, end_date_kst)
+        else:
+            state = {"start_date": start_date_kst, "end_date": end_date_kst, "completed": {}, "failed": {}}
+        state_lock = threading.Lock()
+
+        pending = [w for w in windows if _backfill_window_key(w) not in state["completed"]]
+        logger.info(
+            f"=== Backfill {start_date_kst} ~ {end_date_kst}: "
+            f"{len(pending)}/{len(windows)} windows pending (workers={max_workers}) ==="
+        )
+
+        with ThreadPoolExecutor(max_workers=max(1, max_workers)) as executor:
+            futures = {
+                executor.submit(run_backfill_window, window, settings, fetch_limit, store): window
+                for window in pending
+            }
+            for future in as_completed(futures):
+                window = futures[future]
+                key = _backfill_window_key(window)
+                try:
+                    history_path = future.result()
+                    with state_lock:
+                        state["completed"][key] = history_path
+                        state["failed"].pop(key, None)
+                        _save_backfill_state(state_path, state)
+                    logger.info(f"[Backfill] {window.label} ({key}) -> {history_path}")
+                except Exception as e:
+                    with state_lock:
+                        state["failed"][key] = str(e)
+                        _save_backfill_state(state_path, state)
+                    logger.error(f"[Backfill] {window.label} ({key}) failed: {e}")
+
+    logger.info(
+        f"=== Backfill finished: completed={len(state['completed'])}, failed={len(state['failed'])} ==="
+    )
+    return state
+
+
+def resolve_run_checkpoint(
+    settings,
+    window: Optional[CollectionWindow] = None,
+    resume_run_id: Optional[str] = None,
+) -> Tuple[str, CollectionWindow, Optional[RunCheckpoint]]:
+    """
+    실행 ID/윈도우/체크포인트 결정.
+
+    resume_run_id가 있으면 해당 실행('latest'면 가장 최근 미완료 실행)의 체크포인트를 열어
+    같은 실행 ID와 윈도우로 이어서 실행한다. 재개할 실행이 없으면 새 실행을 시작한다.
+
+    Raises:
+        CheckpointNotFoundError: 지정한 실행 ID의 체크포인트가 없음
+    """
+    from storage.article_store import new_run_id
+
+    logger = logging.getLogger("news_collector")
+    if resume_run_id:
+        if resume_run_id == "latest":
+            checkpoint = RunCheckpoint.latest_incomplete(DEFAULT_CHECKPOINT_DIR)
+        else:
+            checkpoint = RunCheckpoint.open(DEFAULT_CHECKPOINT_DIR, resume_run_id)
+        if checkpoint is not None:
+            logger.info(
+                f"Resuming run {checkpoint.run_id} (completed stages: {len(checkpoint.completed_stages())})"
+            )
+            checkpoint.mark(STATUS_RUNNING)
+            return checkpoint.run_id, checkpoint.window, checkpoint
+        logger.info("No incomplete run to resume; starting a new run")
+
+    run_id = new_run_id()
+    window = window or get_collection_window_kst(window_hours=settings.time_window_hours)
+    checkpoint = RunCheckpoint.create(DEFAULT_CHECKPOINT_DIR, run_id, window) if settings.checkpoint_enabled else None
+    return run_id, window, checkpoint
+
+
+def finish_run_checkpoint(settings, checkpoint: Optional[RunCheckpoint], status: str, **fields) -> None:
+    """체크포인트 상태 기록 후 오래된 체크포인트 정리"""
+    if checkpoint is None:
+        return
+    checkpoint.mark(status, **fields)
+    prune_checkpoints(DEFAULT_CHECKPOINT_DIR, settings.checkpoint_keep_runs)
+
+
+def run_daily_pipeline(
+    settings,
+    window: Optional[CollectionWindow] = None,
+    fetch_limit: int = 5,
+    store=None,
+    resume_run_id: Optional[str] = None,
+    profile=None,
+) -> Optional[str]:
+    """
+    수집 -> 분석 -> 0404 수집 -> 리포트 발송 (CLI/스케줄러 공통)
+
+    Args:
+        settings: 설정 객체
+        window: 수집 윈도우 (None이면 현재 시각 기준 윈도우)
+        fetch_limit: 키워드/소스별 API 요청 건수
+        store: ArticleStore
+        resume_run_id: 이어서 실행할 실행 ID ('latest'면 가장 최근 미완료 실행)
+        profile: 프로파일할 단계 (None이면 끔, True/'all'이면 전체, 'collect,analyze'처럼 지정)
+
+    Returns:
+        생성된 이력 리포트 경로 (수집 기사가 없으면 None)
+    """
+    logger = logging.getLogger("news_collector")
+    run_id, window, checkpoint = resolve_run_checkpoint(settings, window=window, resume_run_id=resume_run_id)
+    bind_log_context(run_id=run_id)
+    run_metrics = metrics.RunMetrics(run_id)
+    profiler = RunProfiler(run_id, parse_profile_stages(profile)) if profile is not None else None
+    if store is not None:
+        store.start_run(run_id, window)
+
+    try:
+        # 1. 데이터 수집
+        with profile_stage(profiler, "collect"):
+            collected_data = collect_articles(
+                settings, window=window, fetch_limit=fetch_limit, store=store, run_id=run_id, checkpoint=checkpoint
+            )
+
+        if not collected_data:
+            logger.error("[ERROR] No articles collected")
+            if store is not None:
+                store.finish_run(run_id, status="failed")
+            finish_run_checkpoint(settings, checkpoint, STATUS_FAILED, error="no articles collected")
+            run_metrics.finish("failed")
+            return None
+
+        # 2. AI 분석
+        with profile_stage(profiler, "analyze"):
+            analyzed_data = analyze_articles(
+                collected_data, settings, store=store, run_id=run_id, checkpoint=checkpoint
+            )
+        with profile_stage(profiler, "external_alerts"):
+            analyzed_data['external_alerts'] = collect_external_alerts(
+                settings, window=window, store=store, run_id=run_id, checkpoint=checkpoint
+            )
+
+        # 3. 리포트 발송
+        with profile_stage(profiler, "report"):
+            history_path = send_report(analyzed_data, settings, store=store, run_id=run_id)
+    except Exception as e:
+        if store is not None:
+            store.finish_run(run_id, status="failed")
+        finish_run_checkpoint(settings, checkpoint, STATUS_FAILED, error=str(e))
+        run_metrics.finish("failed")
+        if checkpoint is not None:
+            logger.info(f"Resume with: python main.py --resume {run_id}")
+        raise
+    if store is not None:
+        complete_run(store, run_id, report_path=history_path)
+    finish_run_checkpoint(settings, checkpoint, STATUS_COMPLETED, report_path=history_path)
+    run_metrics.finish("completed")
+    return history_path
+
+
+def prewarm_caches(settings, report_time: datetime, fetch_limit: int = 5, store=None) -> None:
+    """
+    정기 리포트 직전 요약 캐시 예열.
+
+    리포트 예정 시각 기준 윈도우로 기사를 미리 수집/요약해 저장소에 기록해 두면,
+    본 실행은 그 사이 새로 올라온 기사만 LLM으로 요약한다 (Summarizer 링크 단위 캐시).
+    저장소가 없으면 캐시할 곳이 없으므로 건너뛴다.
+
+    Args:
+        settings: 설정 객체
+        report_time: 리포트 예정 시각 (KST)
+        fetch_limit: 키워드/소스별 API 요청 건수
+        store: ArticleStore
+    """
+    from analyzers.summarizer import Summarizer
+    from analyzers.usage import UsageTracker, parse_price_overrides
+    from storage.article_store import new_run_id
+    from storage.search_index import SearchIndex
+
+    logger = logging.getLogger("news_collector")
+    if store is None:
+        logger.info("Pre-warm skipped: article store disabled")
+        return
+
+    window = get_collection_window_kst(
+        window_hours=settings.time_window_hours,
+        now_utc=min(report_time, datetime.now(timezone.utc)),
+    )
+    run_id = new_run_id()
+    bind_log_context(run_id=run_id)
+    run_metrics = metrics.RunMetrics(run_id)
+    store.start_run(run_id, window)
+    try:
+        collected_data = collect_articles(settings, window=window, fetch_limit=fetch_limit, store=store, run_id=run_id)
+        usage = UsageTracker(prices=parse_price_overrides(settings.llm_pricing))
+        Summarizer(
+            api_key=settings.api.openai_api_key,
+            base_url=settings.api.openai_base_url,
+            model=settings.api.model_basic,
+            store=store,
+            run_id=run_id,
+            usage=usage,
+        ).analyze(collected_data)
+        record_llm_usage(usage, store=store, run_id=run_id)
+        SearchIndex(store).index_pending()
+    except Exception:
+        store.finish_run(run_id, status="failed")
+        run_metrics.finish("failed")
+        raise
+    # 예열 실행은 리포트 이력/검색 대상(completed)에 포함하지 않는다.
+    store.finish_run(run_id, status="prewarm")
+    run_metrics.finish("prewarm")
+
+
+def build_scheduler(settings, store=None, fetch_limit: int = 5) -> Scheduler:
+    """
+    정기 리포트 스케줄러 구성 (SCHEDULE_* 설정)
+
+    - 리포트: SCHEDULE_CRON(KST) 예정 시각 기준 수집 윈도우로 실행 (월요일은 금 09:00~월 09:00 특수 윈도우)
+    - pre-warm: 리포트 SCHEDULE_PREWARM_MINUTES분 전 요약 캐시 예열
+    - 두 작업 모두 파이프라인 파일 잠금을 잡으며, 다른 실행(CLI/대시보드)이 진행 중이면 건너뛴다.
+    """
+    logger = logging.getLogger("news_collector")
+    cron = CronSchedule(settings.schedule_cron)
+
+    def run_report(scheduled: datetime) -> None:
+        # 늦게 보충 실행되더라도 예정 시각 기준 윈도우를 사용한다.
+        window = get_collection_window_kst(window_hours=settings.time_window_hours, now_utc=scheduled)
+        with pipeline_lock("scheduler"), log_context():
+            run_daily_pipeline(settings, window=window, fetch_limit=fetch_limit, store=store)
+
+    def run_prewarm(scheduled: datetime) -> None:
+        lock = pipeline_lock("scheduler-prewarm")
+        if not lock.acquire():
+            logger.warning(f"Pre-warm skipped: pipeline lock held ({lock.holder() or 'unknown'})")
+            return
+        try:
+            with log_context():
+                prewarm_caches(
+                    settings,
+                    report_time=scheduled + timedelta(minutes=settings.schedule_prewarm_minutes),
+                    fetch_limit=fetch_limit,
+                    store=store,
+                )
+        finally:
+            lock.release()
+
+    jobs = [
+        ScheduledJob(
+            name="report",
+            cron=cron,
+            func=run_report,
+            jitter_seconds=settings.schedule_jitter_seconds,
+            catchup_seconds=settings.schedule_catchup_hours * 3600,
+        )
+    ]
+    if settings.schedule_prewarm_minutes > 0:
+        jobs.append(ScheduledJob(
+            name="prewarm",
+            cron=cron,
+            func=run_prewarm,
+            offset=-timedelta(minutes=settings.schedule_prewarm_minutes),
+            jitter_seconds=min(settings.schedule_jitter_seconds, settings.schedule_prewarm_minutes * 30),
+        ))
+    return Scheduler(jobs, state_path="output/scheduler/state.json")
+
+
 class NewsCollector:
     """뉴스 수집기 클래스 - 웹 인터페이스를 위한 통합 인터페이스"""
 
-    def __init__(self):
-        """뉴스 수집기 초기화"""
+    def __init__(
+        self,
+        progress: Optional[ProgressCallback] = None,
+        resume_run_id: Optional[str] = None,
+        profile=None,
+    ):
+        """
+        뉴스 수집기 초기화
+
+        Args:
+            progress: 카테고리별 수집/요약 진행 콜백
+            resume_run_id: 이어서 실행할 실행 ID ('latest'면 가장 최근 미완료 실행)
+            profile: 프로파일할 단계 (None이면 끔, True/'all'이면 전체, 'collect,analyze'처럼 지정)
+
+        Raises:
+            ValueError: 알 수 없는 프로파일 단계
+        """
+        from config.settings import load_settings
+        from storage.article_store import open_article_store
+
+        self.progress = progress
+        self.resume_run_id = resume_run_id
+        self.profile = profile
+        if profile is not None:
+            parse_profile_stages(profile)
         self.settings = load_settings()
-        self.logger = setup_logger(debug_mode=self.settings.debug_mode)
+        self.logger = setup_logger(
+            debug_mode=self.settings.debug_mode, debug_sample_every=self.settings.log_debug_sample_every
+        )
+        self.store = open_article_store(self.settings)
+        self.run_id: Optional[str] = None
+        self.window: Optional[CollectionWindow] = None
+        self.checkpoint: Optional[RunCheckpoint] = None
+        self.run_metrics: Optional[metrics.RunMetrics] = None
+        self.profiler: Optional[RunProfiler] = None
+
+    def _ensure_run(self) -> None:
+        """실행 ID와 수집 윈도우를 한 번만 결정한다 (수집/0404 수집이 같은 윈도우를 사용)."""
+        if self.run_id is not None:
+            return
+        self.run_id, self.window, self.checkpoint = resolve_run_checkpoint(
+            self.settings, resume_run_id=self.resume_run_id
+        )
+        self.run_metrics = metrics.RunMetrics(self.run_id)
+        bind_log_context(run_id=self.run_id)
+        if self.profile is not None:
+            self.profiler = RunProfiler(self.run_id, parse_profile_stages(self.profile))
+        if self.store is not None:
+            self.store.start_run(self.run_id, self.window)
 
     def collect_all_categories(self):
         """모든 카테고리에서 뉴스 수집"""
         self.logger.info("=== Starting News Collection ===")
-        collected_data = collect_articles(self.settings)
+        self._ensure_run()
+        with profile_stage(self.profiler, "collect"):
+            collected_data = collect_articles(
+                self.settings, window=self.window, store=self.store, run_id=self.run_id, progress=self.progress,
+                checkpoint=self.checkpoint,
+            )
         return collected_data
 
     def collect_external_alerts(self):
         self.logger.info("=== Collecting 0404 External Alerts ===")
-        return collect_external_alerts(self.settings)
+        self._ensure_run()
+        with profile_stage(self.profiler, "external_alerts"):
+            return collect_external_alerts(
+                self.settings, window=self.window, store=self.store, run_id=self.run_id, checkpoint=self.checkpoint
+            )
 
     def analyze_news(self, collected_data):
         """수집된 뉴스 분석"""
         self.logger.info("=== Starting AI Analysis ===")
-        analyzed_data = analyze_articles(collected_data, self.settings)
+        self._ensure_run()
+        with profile_stage(self.profiler, "analyze"):
+            analyzed_data = analyze_articles(
+                collected_data, self.settings, store=self.store, run_id=self.run_id, progress=self.progress,
+                checkpoint=self.checkpoint,
+            )
         return analyzed_data
 
     def save_results(self, analyzed_data):
         """분석 결과 저장 (웹 페이지 생성)"""
         self.logger.info("=== Saving Results ===")
+        self._ensure_run()
         # 웹 페이지만 생성 (이메일 발송 제외)
-        from notifiers.web_generator import WebGenerator
-        web_generator = WebGenerator(
-            default_visible_n=self.settings.web_default_visible_n,
-            summary_max_chars=self.settings.web_summary_max_chars,
-        )
-        web_generator.generate(analyzed_data)
+        with profile_stage(self.profiler, "report"):
+            web_generator = build_web_generator(self.settings, store=self.store)
+            with metrics.timer("news_collector_render_seconds", output="web"):
+                history_path = web_generator.generate(analyzed_data, run_id=self.run_id)
+        if self.store is not None:
+            complete_run(self.store, self.run_id, report_path=history_path)
+        finish_run_checkpoint(self.settings, self.checkpoint, STATUS_COMPLETED, report_path=history_path)
+        self.run_metrics.finish("completed")
         self.logger.info("Results saved successfully")
         return True
 
-    def run_full_pipeline(self):
-        """전체 파이프라인 실행 (수집 -> 분석 -> 저장)"""
-        collected_data = self.collect_all_categories()
+    def fail_run(self, error: str) -> None:
+        """
+        실행 실패 기록 (저장소 실행 상태, 체크포인트, 실행 지표). 실행이 시작되지 않았으면 아무것도 하지 않는다.
 
-        if not collected_data:
-            self.logger.error("[ERROR] No articles collected")
-            return None
+        Args:
+            error: 체크포인트에 남길 오류 메시지
+        """
+        if self.run_id is None:
+            return
+        if self.store is not None:
+            self.store.finish_run(self.run_id, status="failed")
+        finish_run_checkpoint(self.settings, self.checkpoint, STATUS_FAILED, error=error)
+        self.run_metrics.finish("failed")
+        if self.checkpoint is not None:
+            self.logger.info(f"Resume with: python main.py --resume {self.run_id}")
+
+    def run_full_pipeline(self, profile=None):
+        """
+        전체 파이프라인 실행 (수집 -> 분석 -> 저장)
+
+        Args:
+            profile: 이번 실행에서 프로파일할 단계 (생성자 profile과 같은 형식, None이면 생성자 설정 유지)
+        """
+        if profile is not None and self.run_id is None:
+            parse_profile_stages(profile)
+            self.profile = profile
+        try:
+            collected_data = self.collect_all_categories()
 
-        analyzed_data = self.analyze_news(collected_data)
-        analyzed_data['external_alerts'] = self.collect_external_alerts()
-        self.save_results(analyzed_data)
+            if not collected_data:
+                self.logger.error("[ERROR] No articles collected")
+                self.fail_run("no articles collected")
+                return None
+
+            analyzed_data = self.analyze_news(collected_data)
+            analyzed_data['external_alerts'] = self.collect_external_alerts()
+            self.save_results(analyzed_data)
+        except Exception as e:
+            self.fail_run(str(e))
+            raise
 
         return analyzed_data
 
 
-def main():
-    """메인 실행 함수"""
+def open_stage_checkpoint(run_id: str = "latest") -> RunCheckpoint:
+    """
+    단계 명령이 이어 받을 실행 체크포인트 열기
+
+    Args:
+        run_id: 실행 ID ('latest'면 상태와 관계없이 가장 최근 실행)
+
+    Raises:
+        CheckpointNotFoundError: 체크포인트가 없음
+    """
+    if run_id != "latest":
+        return RunCheckpoint.open(DEFAULT_CHECKPOINT_DIR, run_id)
+    checkpoint = RunCheckpoint.latest(DEFAULT_CHECKPOINT_DIR)
+    if checkpoint is None:
+        raise CheckpointNotFoundError(f"No run checkpoint under {DEFAULT_CHECKPOINT_DIR}. Start one with: python main.py collect")
+    return checkpoint
+
+
+def load_checkpoint_articles(checkpoint: RunCheckpoint) -> Dict[str, ArticleBatch]:
+    """
+    체크포인트의 카테고리별 필터 결과 복원 (categories.yaml 순서)
+
+    Raises:
+        CheckpointNotFoundError: 수집/필터가 끝나지 않은 카테고리가 있음
+    """
+    categories = list(load_categories()['categories'])
+    missing = [category for category in categories if not checkpoint.has(f"{STAGE_FILTERED}/{category}")]
+    if missing:
+        raise CheckpointNotFoundError(
+            f"Run {checkpoint.run_id} has no collected articles for {', '.join(missing)}. "
+            f"Run: python main.py collect --run {checkpoint.run_id}"
+        )
+    return {category: checkpoint.load_articles(f"{STAGE_FILTERED}/{category}") for category in categories}
+
+
+def load_checkpoint_report_data(checkpoint: RunCheckpoint, store=None) -> Dict:
+    """
+    체크포인트의 요약/인사이트/0404 공지로 리포트 입력(analyzed_data) 복원 (LLM 호출 없음)
+
+    Args:
+        checkpoint: 실행 체크포인트
+        store: ArticleStore (지정 시 실행 LLM 사용량 포함)
+
+    Returns:
+        분석된 데이터
+
+    Raises:
+        CheckpointNotFoundError: 수집 또는 요약/인사이트 단계가 끝나지 않음
+    """
+    from analyzers.usage import summarize_usage
+
+    logger = logging.getLogger("news_collector")
+    collected_data = load_checkpoint_articles(checkpoint)
+    missing = [
+        category for category, articles in collected_data.items()
+        if articles and not checkpoint.has(f"{STAGE_SUMMARIES}/{category}")
+    ]
+    if missing or not checkpoint.has(STAGE_INSIGHTS):
+        raise CheckpointNotFoundError(
+            f"Run {checkpoint.run_id} is not analyzed yet (missing: {', '.join(missing) or STAGE_INSIGHTS}). "
+            f"Run: python main.py analyze {checkpoint.run_id}"
+        )
+
+    data = dict(checkpoint.load(STAGE_INSIGHTS))
+    if store is not None:
+        data['llm_usage'] = summarize_usage(store.load_llm_usage(checkpoint.run_id))
+    for category, articles in collected_data.items():
+        data[f'section_{category}'] = checkpoint.load(f"{STAGE_SUMMARIES}/{category}") if articles else []
+    if checkpoint.has(STAGE_EXTERNAL_ALERTS):
+        data['external_alerts'] = checkpoint.load(STAGE_EXTERNAL_ALERTS)
+    else:
+        logger.warning(
+            f"Run {checkpoint.run_id} has no 0404 alerts; continuing without them "
+            f"(collect with: python main.py 0404 {checkpoint.run_id})"
+        )
+        data['external_alerts'] = []
+    return data
+
+
+@contextmanager
+def stage_command_run(
+    open_checkpoint: Callable[[], RunCheckpoint],
+    store=None,
+    done_status: Optional[str] = None,
+) -> Iterator[RunCheckpoint]:
+    """
+    단계 명령 공통 실행 블록
+
+    파이프라인 잠금을 잡은 뒤 체크포인트를 열고(새 실행이면 생성), 실행 상관 ID를 붙인다.
+    - 정상 종료: done_status(없으면 시작 전 상태)로 체크포인트/저장소 실행 상태를 기록한다.
+    - 예외: 실패로 기록한다. 이미 완료(completed)된 실행은 리포트가 이력/검색에서 빠지지 않도록
+      상태를 유지하고 체크포인트에 stage_error만 남긴다.
+
+    Args:
+        open_checkpoint: 체크포인트를 열거나 만드는 함수
+        store: ArticleStore
+        done_status: 정상 종료 시 기록할 상태 (예: collected, analyzed)
+
+    Raises:
+        LockHeldError: 다른 실행이 파이프라인 잠금을 보유 중
+        CheckpointNotFoundError: 체크포인트가 없음
+    """
+    with pipeline_lock("cli"):
+        checkpoint = open_checkpoint()
+        bind_log_context(run_id=checkpoint.run_id)
+        if store is not None:
+            store.start_run(checkpoint.run_id, checkpoint.window)
+        previous = checkpoint.status
+        completed = previous == STATUS_COMPLETED
+        if not completed:
+            checkpoint.mark(STATUS_RUNNING)
+        try:
+            yield checkpoint
+        except Exception as e:
+            if completed:
+                checkpoint.mark(STATUS_COMPLETED, stage_error=str(e))
+            else:
+                if store is not None:
+                    store.finish_run(checkpoint.run_id, status="failed")
+                checkpoint.mark(STATUS_FAILED, error=str(e))
+            raise
+        if not completed:
+            status = done_status or previous
+            checkpoint.mark(status)
+            if store is not None:
+                store.mark_run(checkpoint.run_id, status)
+
+
+def collect_command(args: argparse.Namespace, settings, store=None) -> int:
+    """수집/필터 단계만 실행 (새 실행을 만들거나, --run 실행의 남은/다시 할 수집을 실행)"""
+    from storage.article_store import new_run_id
+
+    def open_checkpoint() -> RunCheckpoint:
+        if args.run:
+            return open_stage_checkpoint(args.run)
+        window = get_collection_window_kst(window_hours=settings.time_window_hours)
+        return RunCheckpoint.create(DEFAULT_CHECKPOINT_DIR, new_run_id(), window)
+
+    with stage_command_run(open_checkpoint, store, done_status=STATUS_COLLECTED) as checkpoint:
+        if args.refilter or args.force:
+            # 수집 결과가 바뀌면 요약/인사이트도 다시 만들어야 한다.
+            stale = (STAGE_FILTERED, STAGE_SUMMARIES, STAGE_INSIGHTS) + ((STAGE_RAW,) if args.force else ())
+            checkpoint.discard(*stale)
+        collected_data = collect_articles(
+            settings, window=checkpoint.window, fetch_limit=args.fetch_limit, store=store,
+            run_id=checkpoint.run_id, checkpoint=checkpoint,
+        )
+    total = sum(len(articles) for articles in collected_data.values())
+    print(f"{checkpoint.run_id}: {total} articles in {len(collected_data)} categories")
+    return 0
+
+
+def analyze_command(args: argparse.Namespace, settings, store=None) -> int:
+    """체크포인트의 수집 결과로 AI 요약/인사이트만 실행 (저장된 카테고리 요약/인사이트는 재사용)"""
+    with stage_command_run(lambda: open_stage_checkpoint(args.run_id), store, done_status=STATUS_ANALYZED) as checkpoint:
+        collected_data = load_checkpoint_articles(checkpoint)
+        if args.force:
+            checkpoint.discard(STAGE_SUMMARIES, STAGE_INSIGHTS)
+        analyze_articles(collected_data, settings, store=store, run_id=checkpoint.run_id, checkpoint=checkpoint)
+    print(f"{checkpoint.run_id}: {len(checkpoint.categories(STAGE_SUMMARIES))} categories summarized")
+    return 0
+
+
+def external_alerts_command(args: argparse.Namespace, settings, store=None) -> int:
+    """실행 윈도우의 0404 공지만 다시 수집 (실패하면 이전 수집 결과를 유지)"""
+    with stage_command_run(lambda: open_stage_checkpoint(args.run_id), store) as checkpoint:
+        previous = checkpoint.load(STAGE_EXTERNAL_ALERTS) if checkpoint.has(STAGE_EXTERNAL_ALERTS) else None
+        checkpoint.discard(STAGE_EXTERNAL_ALERTS)
+        alerts = collect_external_alerts(
+            settings, window=checkpoint.window, store=store, run_id=checkpoint.run_id, checkpoint=checkpoint
+        )
+        if not checkpoint.has(STAGE_EXTERNAL_ALERTS):
+            if previous is not None:
+                checkpoint.save(STAGE_EXTERNAL_ALERTS, previous)
+            print(f"{checkpoint.run_id}: 0404 collection failed (see log)", file=sys.stderr)
+            return 1
+    print(f"{checkpoint.run_id}: {len(alerts)} external alerts")
+    return 0
+
+
+def render_command(args: argparse.Namespace, settings, store=None) -> int:
+    """
+    체크포인트로 웹 리포트만 다시 생성 (수집/LLM 호출 없음)
+
+    같은 실행을 다시 렌더링하면 처음 리포트 시각을 재사용하되, 기존 이력은 덮어쓰지 않고 다음 빈 이름으로 새 이력을 남긴다.
+    체크포인트가 정리(prune)된 실행은 저장소에 남은 요약/인사이트/0404 공지로 렌더링한다.
+    """
+    if store is not None and args.run_id != "latest" and store.get_run(args.run_id) is not None:
+        try:
+            RunCheckpoint.open(DEFAULT_CHECKPOINT_DIR, args.run_id)
+        except CheckpointNotFoundError:
+            return render_from_store(args, settings, store)
+    with stage_command_run(lambda: open_stage_checkpoint(args.run_id), store) as checkpoint:
+        analyzed_data = load_checkpoint_report_data(checkpoint, store)
+        report_time = checkpoint.manifest.get("report_time")
+        report_time = datetime.fromisoformat(report_time) if report_time else datetime.now()
+        web_generator = build_web_generator(settings, store=store)
+        with metrics.timer("news_collector_render_seconds", output="web"):
+            history_path = web_generator.generate(
+                analyzed_data, report_time=report_time, update_latest=not args.history_only,
+                run_id=checkpoint.run_id,
+            )
+    if store is not None:
+        complete_run(store, checkpoint.run_id, report_path=history_path)
+    finish_run_checkpoint(
+        settings, checkpoint, STATUS_COMPLETED, report_path=history_path, report_time=report_time.isoformat()
+    )
+    print(history_path)
+    return 0
+
+
+def _stored_report_time(run: Dict) -> datetime:
+    """저장소 실행 기록의 리포트 시각 (이력 리포트 파일명, 없으면 실행 ID의 시각)"""
+    for value, prefix in ((os.path.basename(run.get("report_path") or ""), "daily_report_"), (run["run_id"], "")):
+        try:
+            return datetime.strptime(value[len(prefix):len(prefix) + 15], "%Y%m%d_%H%M%S")
+        except ValueError:
+            continue
+    return datetime.now()
+
+
+def render_from_store(args: argparse.Namespace, settings, store) -> int:
+    """체크포인트가 없는 실행을 저장소 기록만으로 다시 렌더링 (LLM 호출 없음)"""
+    logger = logging.getLogger("news_collector")
+    with pipeline_lock("cli"):
+        bind_log_context(run_id=args.run_id)
+        run = store.get_run(args.run_id)
+        report_time = _stored_report_time(run)
+        logger.info(f"Run {args.run_id} has no checkpoint; rendering from article store")
+        web_generator = build_web_generator(settings, store=store)
+        with metrics.timer("news_collector_render_seconds", output="web"):
+            history_path = web_generator.generate_from_store(
+                args.run_id, report_time=report_time, update_latest=not args.history_only,
+            )
+        complete_run(store, args.run_id, report_path=history_path)
+    print(history_path)
+    return 0
+
+
+def send_command(args: argparse.Namespace, settings, store=None) -> int:
+    """체크포인트로 리포트 메일/해외 안전 공지 알림만 다시 발송 (웹 리포트는 그대로)"""
+    with pipeline_lock("cli"):
+        checkpoint = open_stage_checkpoint(args.run_id)
+        analyzed_data = load_checkpoint_report_data(checkpoint, store)
+        bind_log_context(run_id=checkpoint.run_id)
+        send_report_email(analyzed_data, settings)
+    print(f"{checkpoint.run_id}: report email sent")
+    return 0
+
+
+def list_recipients_command(args: argparse.Namespace) -> int:
+    """수신자 목록 출력 (그룹 지정 시 한 줄에 한 명, 스크립트 입력용)"""
+    if args.group:
+        for email in get_group_recipients(args.group):
+            print(email)
+        return 0
+    for group in GROUP_TO_KEY:
+        recipients = get_group_recipients(group)
+        print(f"[{group}] {len(recipients)}")
+        for email in recipients:
+            print(f"  {email}")
+    return 0
+
+
+def send_latest_command(args: argparse.Namespace) -> int:
+    """대시보드 '메일 발송'과 같이 가장 최근 리포트 HTML을 수신자에게 발송 (수집/분석 없음)"""
+    from dotenv import load_dotenv
+    from web.report_index import ReportIndex
+
+    load_dotenv()
+    recipients = args.to or get_group_recipients(args.group)
+    if not recipients:
+        print(f"No {args.group} recipients configured", file=sys.stderr)
+        return 1
+
+    index = ReportIndex(args.output_dir)
+    entry = index.latest()
+    if entry is None:
+        print(f"No report found under {args.output_dir}/web. Run the pipeline first.", file=sys.stderr)
+        return 1
+    if args.dry_run:
+        print(f"Would send {entry.path} to {len(recipients)} recipients")
+        return 0
+
+    gmail_user = os.getenv('GMAIL_USER')
+    gmail_app_password = os.getenv('GMAIL_APP_PASSWORD')
+    if not gmail_user or not gmail_app_password:
+        print("GMAIL_USER and GMAIL_APP_PASSWORD must be set (.env)", file=sys.stderr)
+        return 1
+
+    from notifiers.smtp_sender import SMTPSender
+
+    SMTPSender(user=gmail_user, password=gmail_app_password).send(index.read_html(entry), recipients)
+    print(f"Sent {entry.path} to {len(recipients)} recipients")
+    return 0
+
+
+def benchmark_command(args: argparse.Namespace) -> int:
+    """오프라인 파이프라인/마이크로 벤치마크 실행 (나머지 인자는 각 벤치마크 CLI로 전달)"""
+    if args.suite == "micro":
+        from benchmarks.micro_bench import main_cli
+    else:
+        from benchmarks.pipeline_bench import main_cli
+    return main_cli(args.bench_args)
+
+
+# 설정/로거/저장소 없이 바로 실행하는 명령
+COMMANDS = {
+    "list-recipients": list_recipients_command,
+    "send-latest": send_latest_command,
+    "benchmark": benchmark_command,
+}
+
+# 파이프라인 단계 명령: 설정/로거/저장소를 한 번 준비해 넘기고, 실행 체크포인트로 단계 결과를 주고받는다
+STAGE_COMMANDS = {
+    "collect": collect_command,
+    "analyze": analyze_command,
+    "0404": external_alerts_command,
+    "render": render_command,
+    "send": send_command,
+}
+
+
+def parse_args(argv: Optional[List[str]] = None) -> argparse.Namespace:
+    """CLI 인자 파싱 (하위 명령이 없으면 전체 파이프라인 실행)"""
+    parser = argparse.ArgumentParser(description="SKT 로밍팀 뉴스 수집 시스템")
+    commands = parser.add_subparsers(dest="command", metavar="COMMAND")
+
+    recipients_parser = commands.add_parser("list-recipients", help="수신자 목록 출력")
+    recipients_parser.add_argument("--group", choices=list(GROUP_TO_KEY), help="그룹 (생략 시 전체 그룹)")
+
+    send_parser = commands.add_parser("send-latest", help="가장 최근 리포트를 수집/분석 없이 메일로 발송")
+    send_parser.add_argument("--group", choices=list(GROUP_TO_KEY), default="report", help="수신자 그룹 (기본 report)")
+    send_parser.add_argument("--to", nargs="+", metavar="EMAIL", help="그룹 대신 지정한 주소로 발송")
+    send_parser.add_argument("--output-dir", default="output", help="리포트 출력 디렉토리 (기본 output)")
+    send_parser.add_argument("--dry-run", action="store_true", help="발송하지 않고 대상 리포트/수신자 수만 출력")
+
+    bench_parser = commands.add_parser("benchmark", help="오프라인 벤치마크 (python main.py benchmark pipeline --scales 1 10)")
+    bench_parser.add_argument("suite", choices=("pipeline", "micro"), help="pipeline: 녹화 응답 파이프라인, micro: 합성 데이터")
+    bench_parser.add_argument("bench_args", nargs=argparse.REMAINDER, help="벤치마크 CLI 인자")
+
+    collect_parser = commands.add_parser("collect", help="수집/필터 단계만 실행 (새 실행 체크포인트 생성)")
+    collect_parser.add_argument("--run", metavar="RUN_ID", help="기존 실행의 수집을 이어서/다시 실행 ('latest'면 가장 최근 실행)")
+    collect_parser.add_argument("--refilter", action="store_true", help="저장된 원본 기사로 필터/중복 제거만 다시 실행")
+    collect_parser.add_argument("--force", action="store_true", help="원본 기사부터 다시 수집")
+    collect_parser.add_argument("--fetch-limit", type=int, default=5, help="키워드/소스별 API 요청 건수 (기본 5)")
+
+    stage_help = {
+        "analyze": "체크포인트의 수집 결과로 AI 요약/인사이트만 실행",
+        "0404": "실행 윈도우의 0404 공지만 다시 수집",
+        "render": "체크포인트로 웹 리포트만 다시 생성",
+        "send": "체크포인트로 리포트 메일/안전 공지 알림만 다시 발송",
+    }
+    stage_parsers = {}
+    for name, help_text in stage_help.items():
+        stage_parsers[name] = commands.add_parser(name, help=help_text)
+        stage_parsers[name].add_argument(
+            "run_id", nargs="?", default="latest", metavar="RUN_ID", help="실행 ID (생략 시 가장 최근 실행)"
+        )
+    stage_parsers["analyze"].add_argument("--force", action="store_true", help="저장된 요약/인사이트를 버리고 다시 분석")
+    stage_parsers["render"].add_argument(
+        "--history-only", action="store_true", help="최신 리포트(daily_report.html)는 두고 이력 리포트만 생성"
+    )
+
+    parser.add_argument(
+        "--backfill",
+        nargs=2,
+        metavar=("START_DATE", "END_DATE"),
+        help="KST 날짜 범위(YYYY-MM-DD YYYY-MM-DD)의 이력 리포트를 재생성",
+    )
+    parser.add_argument("--backfill-workers", type=int, default=2, help="백필 동시 처리 윈도우 수 (기본 2)")
+    parser.add_argument("--no-resume", action="store_true", help="백필 체크포인트를 무시하고 처음부터 실행")
+    parser.add_argument("--fetch-limit", type=int, default=5, help="키워드/소스별 API 요청 건수 (기본 5)")
+    parser.add_argument("--schedule", action="store_true", help="SCHEDULE_CRON(KST) 일정으로 정기 실행 (종료 시까지 대기)")
+    parser.add_argument(
+        "--resume",
+        nargs="?",
+        const="latest",
+        metavar="RUN_ID",
+        help="중단된 실행을 체크포인트에서 이어서 실행 (RUN_ID 생략 시 가장 최근 미완료 실행)",
+    )
+    parser.add_argument(
+        "--profile",
+        nargs="?",
+        const="all",
+        metavar="STAGES",
+        help="단계별 cProfile/tracemalloc 결과를 output/logs/profile_<RUN_ID>에 기록 "
+             "(collect,analyze,external_alerts,report 중 콤마 구분, 생략 시 전체)",
+    )
+    args = parser.parse_args(argv)
+    if args.command == "collect" and (args.refilter or args.force) and not args.run:
+        parser.error("--refilter/--force require --run RUN_ID")
+    if args.profile is not None:
+        try:
+            parse_profile_stages(args.profile)
+        except ValueError as e:
+            parser.error(str(e))
+    return args
+
+
+def main(argv: Optional[List[str]] = None) -> Optional[int]:
+    """메인 실행 함수 (하위 명령은 종료 코드를 반환)"""
+    args = parse_args(argv)
+
     # 윈도우 환경에서 한글 출력을 위한 인코딩 설정
-    import sys
     import io
     if sys.platform == 'win32':
         sys.stdout = io.TextIOWrapper(sys.stdout.buffer, encoding='utf-8')
         sys.stderr = io.TextIOWrapper(sys.stderr.buffer, encoding='utf-8')
 
+    # 짧은 하위 명령은 설정/로거/저장소 초기화 없이 바로 실행
+    if args.command in COMMANDS:
+        return COMMANDS[args.command](args)
+
+    from config.settings import load_settings
+    from storage.article_store import open_article_store
+
     # 먼저 기본 로거 초기화 (설정 로드 전)
-    import logging
     logging.basicConfig(
         level=logging.INFO,
         format='[%(levelname)s] %(message)s'
@@ -408,34 +1543,57 @@ def main():
         settings = load_settings()
 
         # 상세 로거 초기화 (설정 로드 후)
-        logger = setup_logger(debug_mode=settings.debug_mode)
+        logger = setup_logger(debug_mode=settings.debug_mode, debug_sample_every=settings.log_debug_sample_every)
         logger.info("=== NewsCollector v2.0 Started ===")
         logger.info(f"Debug Mode: {settings.debug_mode}")
 
-        # 1. 데이터 수집
-        collected_data = collect_articles(settings)
-
-        if not collected_data:
-            logger.error("[ERROR] No articles collected")
+        store = open_article_store(settings)
+
+        if args.command:
+            return STAGE_COMMANDS[args.command](args, settings, store)
+
+        if args.backfill:
+            state = run_backfill(
+                settings,
+                start_date_kst=args.backfill[0],
+                end_date_kst=args.backfill[1],
+                max_workers=args.backfill_workers,
+                resume=not args.no_resume,
+                fetch_limit=args.fetch_limit,
+                store=store,
+            )
+            if state["failed"]:
+                logger.error(f"Backfill failed for {len(state['failed'])} window(s): {', '.join(sorted(state['failed']))}")
+                return 1
             return
 
-        # 2. AI 분석
-        analyzed_data = analyze_articles(collected_data, settings)
-        analyzed_data['external_alerts'] = collect_external_alerts(settings)
+        if args.schedule:
+            build_scheduler(settings, store=store, fetch_limit=args.fetch_limit).run_forever()
+            return
 
-        # 3. 리포트 발송
-        send_report(analyzed_data, settings)
+        with pipeline_lock("cli"):
+            if run_daily_pipeline(
+                settings, fetch_limit=args.fetch_limit, store=store, resume_run_id=args.resume,
+                profile=args.profile,
+            ) is None:
+                return
 
         logger.info("\n=== NewsCollector v2.0 Completed Successfully ===")
 
+    except CheckpointNotFoundError as e:
+        logger.error(f"Checkpoint Error: {e}")
+        return 1
     except ValueError as e:
         logger.error(f"Configuration Error: {e}")
         logger.error("Please check your .env file")
+        return 1
     except NewsCollectorError as e:
         logger.error(f"Application Error: {e}")
+        return 1
     except Exception as e:
         logger.exception(f"Unexpected Error: {e}")
+        return 1
 
 
 if __name__ == "__main__":
-    main()
+    sys.exit(main())
@@ -2,10 +2,13 @@
 웹 페이지 생성
 """
 from datetime import datetime
+import gzip
 import html as html_lib
 import os
-from typing import Dict, List
+from typing import Dict, List, Optional
 import logging
+from storage.report_archive import append_manifest, history_created_at, unused_history_filename
+from utils.exceptions import LockHeldError
 from utils.helpers import ensure_global_trend_korean_text
 
 logger = logging.getLogger(__name__)
@@ -23,34 +26,130 @@ class WebGenerator:
         "voc_esim": "5. eSIM VoC",
     }
 
-    def __init__(self, template_dir: str = "notifiers/templates", default_visible_n: int = 3, summary_max_chars: int = 180):
+    def __init__(
+        self,
+        template_dir: str = "notifiers/templates",
+        default_visible_n: int = 3,
+        summary_max_chars: int = 180,
+        store=None,
+        archive=None,
+    ):
         self.template_dir = template_dir
         self.default_visible_n = max(1, default_visible_n)
         self.summary_max_chars = max(80, summary_max_chars)
+        self.store = store
+        self.archive = archive
 
-    def generate(self, data: Dict, output_path: str = "output/web/daily_report.html"):
+    def generate(
+        self,
+        data: Dict,
+        output_path: str = "output/web/daily_report.html",
+        report_time: Optional[datetime] = None,
+        update_latest: bool = True,
+        run_id: Optional[str] = None,
+    ) -> str:
         """
         HTML 웹 페이지 생성
 
         Args:
             data: 분석 데이터
             output_path: 출력 경로
+            report_time: 리포트 기준 시각 (이력 파일명/본문 날짜, 기본 현재 시각)
+            update_latest: False면 최신 리포트(output_path)는 건드리지 않고 이력만 저장
+            run_id: 실행 ID (리포트 manifest에 기록)
+
+        Returns:
+            이력 리포트 파일 경로 (아카이브 사용 시 실제 파일이 아닌 /output 논리 경로)
         """
+        report_time = report_time or datetime.now()
         os.makedirs(os.path.dirname(output_path), exist_ok=True)
-        rendered = self._render_html(data)
-        with open(output_path, "w", encoding="utf-8") as f:
-            f.write(rendered)
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+        rendered = self._render_html(data, report_time=report_time)
+        if update_latest:
+            with open(output_path, "w", encoding="utf-8") as f:
+                f.write(rendered)
+            # 웹 서빙용 사전 압축본 (원본보다 나중에 써야 최신본으로 인정된다)
+            with open(f"{output_path}.gz", "wb") as f:
+                f.write(gzip.compress(rendered.encode("utf-8"), compresslevel=9, mtime=0))
+            logger.info(f"Web page generated (latest): {output_path}")
+
         history_dir = os.path.join(os.path.dirname(output_path), "history")
         os.makedirs(history_dir, exist_ok=True)
-        history_path = os.path.join(history_dir, f"daily_report_{timestamp}.html")
-        with open(history_path, "w", encoding="utf-8") as f:
-            f.write(rendered)
+        # 이력은 덮어쓰지 않는다 (같은 시각의 이력이 있으면 다음 빈 이름)
+        filename = unused_history_filename(history_dir, report_time)
+        history_path = os.path.join(history_dir, filename)
+        record = {
+            "filename": filename,
+            "created_at": history_created_at(filename).strftime("%Y-%m-%dT%H:%M:%S"),
+            "run_id": run_id,
+            "latest": update_latest,
+            **self.build_report_metadata(data),
+        }
+
+        if self.archive is not None:
+            # 이력은 압축 blob으로만 저장하고 history_path는 웹에서 쓰는 논리 경로로 유지한다.
+            digest = self.archive.add(record["filename"], rendered, record)
+            logger.info(f"Web page archived: {history_path} (blob {digest[:12]})")
+            try:
+                self.archive.compact()
+            except (OSError, LockHeldError) as e:
+                logger.warning(f"Report archive compaction failed: {e}")
+        else:
+            with open(history_path, "w", encoding="utf-8") as f:
+                f.write(rendered)
+            logger.info(f"Web page archived: {history_path}")
+            try:
+                append_manifest(history_dir, record)
+            except (OSError, LockHeldError) as e:
+                logger.warning(f"Report manifest write failed: {e}")
+        return history_path
+
+    def build_report_metadata(self, data: Dict) -> Dict:
+        """
+        리포트 요약 메타데이터 (카테고리별 기사 수, 0404 공지 수, LLM 토큰/비용 합계)
+
+        Args:
+            data: 분석 데이터
+
+        Returns:
+            {'article_counts', 'total_articles', 'alert_count'} (+ 'llm_usage')
+        """
+        article_counts = {
+            category: len(data.get(f"section_{category}") or [])
+            for category in self.CATEGORY_NAMES
+        }
+        metadata = {
+            "article_counts": article_counts,
+            "total_articles": sum(article_counts.values()),
+            "alert_count": len(data.get("external_alerts") or []),
+        }
+        usage = data.get("llm_usage")
+        if usage:
+            metadata["llm_usage"] = {
+                key: usage.get(key) for key in ("calls", "prompt_tokens", "completion_tokens", "total_tokens", "cost_usd")
+            }
+        return metadata
+
+    def generate_from_store(self, run_id: str, **kwargs) -> str:
+        """
+        저장소에 기록된 실행 결과(요약/인사이트/0404 공지/LLM 사용량)로 리포트를 다시 생성한다.
+
+        Args:
+            run_id: 실행 ID
+            **kwargs: generate() 옵션 (output_path, report_time, update_latest)
+
+        Returns:
+            이력 리포트 파일 경로
+        """
+        if self.store is None:
+            raise ValueError("WebGenerator.generate_from_store requires an article store")
+        from analyzers.usage import summarize_usage
 
-        logger.info(f"Web page generated (latest): {output_path}")
-        logger.info(f"Web page archived: {history_path}")
+        data = self.store.load_analyzed_data(run_id)
+        data["llm_usage"] = summarize_usage(self.store.load_llm_usage(run_id))
+        return self.generate(data, run_id=run_id, **kwargs)
 
-    def _render_html(self, data: Dict) -> str:
+    def _render_html(self, data: Dict, report_time: Optional[datetime] = None) -> str:
+        report_time = report_time or datetime.now()
         brief_items = self._format_today_brief(data)
         return f"""
         <!DOCTYPE html>
@@ -171,7 +270,7 @@ class WebGenerator:
         <body>
             <div class="container">
                 <h1>SKT 로밍팀 일일 뉴스 리포트</h1>
-                <p class="date"><strong>{datetime.now().strftime('%Y년 %m월 %d일')}</strong></p>
+                <p class="date"><strong>{report_time.strftime('%Y년 %m월 %d일')}</strong></p>
                 <div class="brief">
                     <h2>오늘의 5줄 요약</h2>
                     <ul>{brief_items}</ul>
@@ -10,4 +10,4 @@ sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
 from main import main
 
 if __name__ == "__main__":
-    main()
+    sys.exit(main())
@@ -0,0 +1,127 @@
+"""
+Production Web Server Launcher for News Collector Dashboard
+
+- gunicorn(멀티 프로세스 + 스레드, SIGHUP 무중단 재시작)을 우선 사용하고, 없거나 Windows면 waitress로 실행한다.
+- 분석 파이프라인은 항상 별도 worker.py 프로세스가 실행한다 (ANALYSIS_WORKER_MODE=external).
+  요청 워커는 max_requests/timeout으로 재활용·종료되므로 그 안에서 파이프라인을 돌리지 않는다.
+- 개발용 서버는 start_web.py를 그대로 사용한다.
+"""
+import argparse
+import importlib.util
+import logging
+import os
+import subprocess
+import sys
+from pathlib import Path
+from typing import List, Optional
+
+from dotenv import load_dotenv
+
+# Setup logging
+logging.basicConfig(
+    level=logging.INFO,
+    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+)
+logger = logging.getLogger(__name__)
+
+PROJECT_ROOT = Path(__file__).resolve().parent
+GUNICORN_CONFIG = PROJECT_ROOT / 'gunicorn.conf.py'
+SERVERS = ('auto', 'gunicorn', 'waitress')
+WORKER_MODE_EXTERNAL = 'external'
+
+
+def _is_installed(module: str) -> bool:
+    return importlib.util.find_spec(module) is not None
+
+
+def resolve_server(requested: str) -> Optional[str]:
+    """사용할 WSGI 서버 (설치되어 있지 않으면 None)"""
+    if requested == 'auto':
+        if os.name != 'nt' and _is_installed('gunicorn'):
+            return 'gunicorn'
+        return 'waitress' if _is_installed('waitress') else None
+    return requested if _is_installed(requested) else None
+
+
+def parse_args(argv: Optional[List[str]] = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="뉴스 수집기 웹 대시보드 (운영 모드)")
+    parser.add_argument("--host", default=os.getenv('WEB_HOST', '0.0.0.0'), help="바인드 주소 (기본 WEB_HOST 또는 0.0.0.0)")
+    parser.add_argument("--port", type=int, default=int(os.getenv('WEB_PORT', '5000')), help="포트 (기본 WEB_PORT 또는 5000)")
+    parser.add_argument("--workers", type=int, default=int(os.getenv('WEB_WORKERS', '0')),
+                        help="gunicorn 워커 프로세스 수 (0이면 CPU 기준 자동, waitress는 무시)")
+    parser.add_argument("--threads", type=int, default=int(os.getenv('WEB_THREADS', '8')), help="워커당 요청 스레드 수")
+    parser.add_argument("--server", choices=SERVERS, default='auto', help="WSGI 서버 (기본 auto: gunicorn → waitress)")
+    parser.add_argument("--no-worker", action="store_true",
+                        help="분석 worker.py를 함께 띄우지 않음 (systemd 등으로 따로 실행 중일 때)")
+    return parser.parse_args(argv)
+
+
+def run_gunicorn(args: argparse.Namespace) -> None:
+    from gunicorn.app.wsgiapp import run
+
+    argv = ['gunicorn', '--config', str(GUNICORN_CONFIG), '--bind', f'{args.host}:{args.port}',
+            '--threads', str(args.threads)]
+    if args.workers:
+        argv += ['--workers', str(args.workers)]
+    argv.append('wsgi:app')
+
+    sys.argv = argv
+    run()
+
+
+def run_waitress(args: argparse.Namespace) -> None:
+    from waitress import serve
+
+    from web.app import create_app
+
+    logger.info("waitress는 무중단 재시작(SIGHUP)을 지원하지 않습니다. 재배포 시 프로세스를 재시작하세요.")
+    serve(create_app(), host=args.host, port=args.port, threads=args.threads, channel_timeout=120)
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    """Start the production WSGI server"""
+    load_dotenv()
+    args = parse_args(argv)
+    server = resolve_server(args.server)
+    if server is None:
+        logger.error("WSGI 서버가 설치되어 있지 않습니다. `pip install gunicorn`(Linux/macOS) 또는 `pip install waitress`를 실행하세요.")
+        sys.exit(1)
+
+    mode = os.getenv('ANALYSIS_WORKER_MODE', WORKER_MODE_EXTERNAL).strip().lower()
+    if mode != WORKER_MODE_EXTERNAL:
+        logger.error(f"ANALYSIS_WORKER_MODE={mode}는 운영 서버에서 지원하지 않습니다. "
+                     "요청 워커가 재시작되면 실행 중인 분석이 끊깁니다. ANALYSIS_WORKER_MODE=external로 설정하세요.")
+        sys.exit(1)
+    os.environ['ANALYSIS_WORKER_MODE'] = WORKER_MODE_EXTERNAL
+
+    worker_process = None
+    if args.no_worker:
+        logger.info("--no-worker: 분석 작업은 별도로 실행 중인 `python worker.py`가 처리해야 합니다.")
+    else:
+        worker_process = subprocess.Popen([sys.executable, str(PROJECT_ROOT / 'worker.py')], cwd=str(PROJECT_ROOT))
+        logger.info(f"분석 worker 시작 (pid {worker_process.pid})")
+
+    logger.info("=" * 60)
+    logger.info(f"뉴스 수집기 웹 대시보드 시작 ({server}, 운영 모드)")
+    logger.info(f"서버 주소: http://{args.host}:{args.port}")
+    logger.info("=" * 60)
+
+    os.chdir(PROJECT_ROOT)
+    try:
+        if server == 'gunicorn':
+            run_gunicorn(args)
+        else:
+            run_waitress(args)
+    except KeyboardInterrupt:
+        logger.info("서버가 사용자에 의해 종료되었습니다")
+    finally:
+        if worker_process is not None:
+            worker_process.terminate()
+            try:
+                worker_process.wait(timeout=30)
+            except subprocess.TimeoutExpired:
+                worker_process.kill()
+
+
+if __name__ == '__main__':
+    main()
@@ -1,6 +1,10 @@
 """
 Web Server Launcher for News Collector Dashboard
+
+개발용 단일 프로세스 서버이므로 ANALYSIS_WORKER_MODE를 지정하지 않으면 분석 작업을 웹 프로세스 안에서 실행한다
+(embedded). 운영 서버(serve_web.py)는 항상 별도 worker.py 프로세스를 쓴다.
 """
+import os
 import sys
 import logging
 from pathlib import Path
@@ -16,6 +20,11 @@ logger = logging.getLogger(__name__)
 def main():
     """Start the Flask web server"""
     try:
+        from dotenv import load_dotenv
+
+        load_dotenv()
+        os.environ.setdefault('ANALYSIS_WORKER_MODE', 'embedded')
+
         # Import Flask app
         from web.app import create_app
 
@@ -0,0 +1,3 @@
+"""
+저장소 패키지
+"""
@@ -0,0 +1,490 @@
+"""
+SQLite 기사 저장소 (수집 기사 / 요약 / 인사이트 / 0404 공지의 영속 기록)
+"""
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+import os
+import sqlite3
+import threading
+import uuid
+from contextlib import contextmanager
+from datetime import datetime, timedelta, timezone
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Set
+
+from utils.article import Article, ArticleBatch
+from utils.time_windows import EPOCH_UTC, CollectionWindow, to_epoch_us
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_STORE_PATH = "output/store/news_collector.db"
+
+# SQLite 기본 변수 한도(999) 아래로 IN (...) 조회를 나눈다
+QUERY_CHUNK_SIZE = 500
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS runs (
+    run_id TEXT PRIMARY KEY,
+    started_at TEXT NOT NULL,
+    finished_at TEXT,
+    window_start TEXT,
+    window_end TEXT,
+    status TEXT NOT NULL DEFAULT 'running',
+    report_path TEXT
+);
+
+CREATE TABLE IF NOT EXISTS articles (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    run_id TEXT NOT NULL,
+    category TEXT NOT NULL,
+    link_hash TEXT NOT NULL,
+    link TEXT,
+    title TEXT,
+    snippet TEXT,
+    source TEXT,
+    source_domain TEXT,
+    query TEXT,
+    type TEXT,
+    published_at INTEGER,
+    published_raw TEXT,
+    freshness_source TEXT,
+    quality_flags TEXT,
+    extra TEXT,
+    collected_at TEXT NOT NULL,
+    UNIQUE (run_id, category, link_hash)
+);
+CREATE INDEX IF NOT EXISTS idx_articles_link_hash ON articles (link_hash);
+CREATE INDEX IF NOT EXISTS idx_articles_category_published ON articles (category, published_at);
+CREATE INDEX IF NOT EXISTS idx_articles_published ON articles (published_at);
+CREATE INDEX IF NOT EXISTS idx_articles_run ON articles (run_id);
+
+CREATE TABLE IF NOT EXISTS summaries (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    run_id TEXT NOT NULL,
+    category TEXT NOT NULL,
+    link_hash TEXT NOT NULL,
+    link TEXT,
+    title TEXT,
+    summary TEXT,
+    payload TEXT NOT NULL,
+    created_at TEXT NOT NULL,
+    UNIQUE (run_id, category, link_hash)
+);
+CREATE INDEX IF NOT EXISTS idx_summaries_category_link ON summaries (category, link_hash);
+CREATE INDEX IF NOT EXISTS idx_summaries_run ON summaries (run_id);
+
+CREATE TABLE IF NOT EXISTS insights (
+    run_id TEXT PRIMARY KEY,
+    strategic_insight TEXT,
+    key_findings TEXT,
+    recommendations TEXT,
+    created_at TEXT NOT NULL
+);
+
+CREATE TABLE IF NOT EXISTS external_alerts (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    run_id TEXT NOT NULL,
+    link_hash TEXT NOT NULL,
+    link TEXT,
+    board_name TEXT,
+    title TEXT,
+    content TEXT,
+    published_date TEXT,
+    payload TEXT NOT NULL,
+    created_at TEXT NOT NULL,
+    UNIQUE (run_id, link_hash)
+);
+CREATE INDEX IF NOT EXISTS idx_alerts_link_hash ON external_alerts (link_hash);
+CREATE INDEX IF NOT EXISTS idx_alerts_published ON external_alerts (published_date);
+CREATE INDEX IF NOT EXISTS idx_alerts_run ON external_alerts (run_id);
+
+CREATE TABLE IF NOT EXISTS llm_usage (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    run_id TEXT NOT NULL,
+    category TEXT NOT NULL,
+    model TEXT NOT NULL,
+    prompt_tokens INTEGER NOT NULL DEFAULT 0,
+    completion_tokens INTEGER NOT NULL DEFAULT 0,
+    latency_seconds REAL NOT NULL DEFAULT 0,
+    status TEXT NOT NULL DEFAULT 'ok',
+    cost_usd REAL,
+    created_at TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_llm_usage_run ON llm_usage (run_id);
+"""
+
+
+def hash_link(link: Optional[str]) -> str:
+    """링크 정규화 키 (sha1 hex)"""
+    return hashlib.sha1(str(link or "").strip().encode("utf-8")).hexdigest()
+
+
+def new_run_id(now: Optional[datetime] = None) -> str:
+    """실행 ID 생성 (YYYYMMDD_HHMMSS_<6자리 hex>)"""
+    now = now or datetime.now()
+    return f"{now.strftime('%Y%m%d_%H%M%S')}_{uuid.uuid4().hex[:6]}"
+
+
+def _now_iso() -> str:
+    return datetime.now(timezone.utc).isoformat()
+
+
+def _epoch_to_datetime(value: Optional[int]) -> Optional[datetime]:
+    if value is None:
+        return None
+    return EPOCH_UTC + timedelta(microseconds=value)
+
+
+class ArticleStore:
+    """
+    파이프라인 산출물을 SQLite(WAL)에 기록/조회한다.
+
+    하나의 연결을 스레드 간 공유하며 모든 접근은 내부 lock으로 직렬화한다.
+    """
+
+    def __init__(self, path: str = DEFAULT_STORE_PATH):
+        self.path = path
+        if path != ":memory:":
+            os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        self._lock = threading.RLock()
+        self._conn = sqlite3.connect(path, check_same_thread=False, timeout=30)
+        self._conn.row_factory = sqlite3.Row
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        with self._lock:
+            self._conn.executescript(SCHEMA)
+            self._conn.commit()
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
+
+    def _execute(self, sql: str, params: Iterable[Any] = ()) -> List[sqlite3.Row]:
+        with self._lock:
+            cursor = self._conn.execute(sql, tuple(params))
+            rows = cursor.fetchall()
+            self._conn.commit()
+            return rows
+
+    def _executemany(self, sql: str, rows: List[tuple]) -> None:
+        if not rows:
+            return
+        with self._lock:
+            self._conn.executemany(sql, rows)
+            self._conn.commit()
+
+    @contextmanager
+    def transaction(self) -> Iterator[sqlite3.Connection]:
+        """lock을 잡은 채 연결을 넘겨주고, 블록이 끝나면 커밋한다 (예외 시 롤백)."""
+        with self._lock:
+            try:
+                yield self._conn
+            except Exception:
+                self._conn.rollback()
+                raise
+            self._conn.commit()
+
+    # ------------------------------------------------------------------ runs
+    def start_run(self, run_id: str, window: Optional[CollectionWindow] = None) -> None:
+        self._execute(
+            "INSERT OR IGNORE INTO runs (run_id, started_at, window_start, window_end) VALUES (?, ?, ?, ?)",
+            (
+                run_id,
+                _now_iso(),
+                window.start_utc.isoformat() if window else None,
+                window.end_utc.isoformat() if window else None,
+            ),
+        )
+
+    def finish_run(self, run_id: str, status: str = "completed", report_path: Optional[str] = None) -> None:
+        self._execute(
+            "UPDATE runs SET finished_at = ?, status = ?, report_path = COALESCE(?, report_path) WHERE run_id = ?",
+            (_now_iso(), status, report_path, run_id),
+        )
+
+    def mark_run(self, run_id: str, status: str) -> None:
+        """실행 상태만 갱신 (이미 completed인 실행은 그대로 둔다)"""
+        self._execute(
+            "UPDATE runs SET status = ? WHERE run_id = ? AND status != 'completed'",
+            (status, run_id),
+        )
+
+    def get_run(self, run_id: str) -> Optional[Dict[str, Any]]:
+        rows = self._execute("SELECT * FROM runs WHERE run_id = ?", (run_id,))
+        return dict(rows[0]) if rows else None
+
+    # -------------------------------------------------------------- articles
+    def save_articles(self, run_id: str, collected_data: Dict[str, Any]) -> int:
+        """카테고리별 기사 저장 (run_id+category+link 기준 중복 무시)"""
+        collected_at = _now_iso()
+        rows = []
+        for category, articles in collected_data.items():
+            for article in ArticleBatch.coerce(articles):
+                rows.append((
+                    run_id,
+                    category,
+                    hash_link(article.link),
+                    article.link,
+                    article.title,
+                    article.snippet,
+                    article.source,
+                    article.source_domain,
+                    article.query,
+                    article.type,
+                    to_epoch_us(article.published) if article.published else None,
+                    article.published_raw,
+                    article.freshness_source,
+                    json.dumps(article.quality_flags, ensure_ascii=False),
+                    json.dumps(article.extra or {}, ensure_ascii=False, default=str),
+                    collected_at,
+                ))
+        self._executemany(
+            """
+            INSERT OR IGNORE INTO articles (
+                run_id, category, link_hash, link, title, snippet, source, source_domain, query, type,
+                published_at, published_raw, freshness_source, quality_flags, extra, collected_at
+            ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+            """,
+            rows,
+        )
+        return len(rows)
+
+    def load_articles(self, run_id: str) -> Dict[str, ArticleBatch]:
+        """실행 단위 카테고리별 기사 조회 (저장 순서 유지)"""
+        rows = self._execute("SELECT * FROM articles WHERE run_id = ? ORDER BY id", (run_id,))
+        collected: Dict[str, ArticleBatch] = {}
+        for row in rows:
+            collected.setdefault(row["category"], ArticleBatch()).append(self._row_to_article(row))
+        return collected
+
+    def reported_links(self, links: Iterable[str], before: datetime) -> Set[str]:
+        """
+        before 이전에 끝난 윈도우의 완료된 실행이 이미 리포트한 링크 (link_hash 인덱스 조회)
+
+        같은 윈도우를 다시 수집(재개, 백필 재실행)하거나 아직 완료되지 않은 실행의 기사는 포함하지 않는다.
+        """
+        by_hash = {hash_link(link): link for link in links if link}
+        hashes = list(by_hash)
+        found: Set[str] = set()
+        for start in range(0, len(hashes), QUERY_CHUNK_SIZE):
+            chunk = hashes[start:start + QUERY_CHUNK_SIZE]
+            placeholders = ",".join("?" for _ in chunk)
+            rows = self._execute(
+                f"""
+                SELECT DISTINCT articles.link_hash FROM articles JOIN runs ON runs.run_id = articles.run_id
+                WHERE articles.link_hash IN ({placeholders})
+                  AND runs.status = 'completed' AND runs.window_end <= ?
+                """,
+                [*chunk, before.astimezone(timezone.utc).isoformat()],
+            )
+            found.update(by_hash[row["link_hash"]] for row in rows)
+        return found
+
+    def find_window_run(self, window: CollectionWindow, exclude_run_id: Optional[str] = None) -> Optional[str]:
+        """같은 수집 윈도우로 기사를 기록한 가장 최근 실행 ID (없으면 None)"""
+        rows = self._execute(
+            """
+            SELECT run_id FROM runs
+            WHERE window_start = ? AND window_end = ? AND run_id != ?
+              AND EXISTS (SELECT 1 FROM articles WHERE articles.run_id = runs.run_id)
+            ORDER BY started_at DESC LIMIT 1
+            """,
+            (window.start_utc.isoformat(), window.end_utc.isoformat(), exclude_run_id or ""),
+        )
+        return rows[0]["run_id"] if rows else None
+
+    def _row_to_article(self, row: sqlite3.Row) -> Article:
+        published = row["published_at"]
+        return Article(
+            title=row["title"],
+            link=row["link"],
+            snippet=row["snippet"],
+            source=row["source"] or "",
+            published=_epoch_to_datetime(published),
+            published_raw=row["published_raw"] or "",
+            freshness_source=row["freshness_source"] or "",
+            source_domain=row["source_domain"] or "",
+            query=row["query"] or "",
+            quality_flags=json.loads(row["quality_flags"] or "[]"),
+            type=row["type"] or "",
+            category=row["category"],
+            extra=json.loads(row["extra"] or "{}"),
+        )
+
+    # ------------------------------------------------------------- summaries
+    def save_summaries(self, run_id: str, category: str, summaries: List[Dict]) -> None:
+        created_at = _now_iso()
+        rows = [
+            (
+                run_id,
+                category,
+                hash_link(item.get("link")),
+                item.get("link"),
+                item.get("title"),
+                item.get("summary"),
+                json.dumps(item, ensure_ascii=False, default=str),
+                created_at,
+            )
+            for item in summaries
+            if isinstance(item, dict) and item.get("link")
+        ]
+        self._executemany(
+            """
+            INSERT OR REPLACE INTO summaries (run_id, category, link_hash, link, title, summary, payload, created_at)
+            VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+            """,
+            rows,
+        )
+
+    def find_summaries(self, category: str, links: Iterable[str]) -> Dict[str, Dict]:
+        """카테고리+링크 기준 가장 최근 요약 조회 (link -> summary dict)"""
+        by_hash = {hash_link(link): link for link in links if link}
+        if not by_hash:
+            return {}
+        hashes = list(by_hash)
+        rows: List[sqlite3.Row] = []
+        for start in range(0, len(hashes), QUERY_CHUNK_SIZE):
+            chunk = hashes[start:start + QUERY_CHUNK_SIZE]
+            placeholders = ",".join("?" for _ in chunk)
+            rows.extend(self._execute(
+                f"""
+                SELECT link_hash, payload, created_at, id FROM summaries
+                WHERE category = ? AND link_hash IN ({placeholders})
+                """,
+                [category, *chunk],
+            ))
+        # 같은 링크가 여러 실행에 있으면 가장 최근 요약이 남도록 전체를 정렬해 덮어쓴다
+        rows.sort(key=lambda row: (row["created_at"], row["id"]))
+        found: Dict[str, Dict] = {}
+        for row in rows:
+            found[by_hash[row["link_hash"]]] = json.loads(row["payload"])
+        return found
+
+    def load_summaries(self, run_id: str) -> Dict[str, List[Dict]]:
+        rows = self._execute(
+            "SELECT category, payload FROM summaries WHERE run_id = ? ORDER BY id",
+            (run_id,),
+        )
+        summaries: Dict[str, List[Dict]] = {}
+        for row in rows:
+            summaries.setdefault(row["category"], []).append(json.loads(row["payload"]))
+        return summaries
+
+    # -------------------------------------------------------------- insights
+    def save_insights(self, run_id: str, insights: Dict) -> None:
+        self._execute(
+            """
+            INSERT OR REPLACE INTO insights (run_id, strategic_insight, key_findings, recommendations, created_at)
+            VALUES (?, ?, ?, ?, ?)
+            """,
+            (
+                run_id,
+                insights.get("strategic_insight", ""),
+                json.dumps(insights.get("key_findings", []), ensure_ascii=False),
+                json.dumps(insights.get("recommendations", []), ensure_ascii=False),
+                _now_iso(),
+            ),
+        )
+
+    def load_insights(self, run_id: str) -> Dict:
+        rows = self._execute("SELECT * FROM insights WHERE run_id = ?", (run_id,))
+        if not rows:
+            return {}
+        row = rows[0]
+        return {
+            "strategic_insight": row["strategic_insight"] or "",
+            "key_findings": json.loads(row["key_findings"] or "[]"),
+            "recommendations": json.loads(row["recommendations"] or "[]"),
+        }
+
+    # --------------------------------------------------------------- alerts
+    def save_external_alerts(self, run_id: str, alerts: List[Dict]) -> None:
+        created_at = _now_iso()
+        rows = [
+            (
+                run_id,
+                hash_link(alert.get("link")),
+                alert.get("link"),
+                alert.get("board_name"),
+                alert.get("title"),
+                alert.get("content_one_line"),
+                alert.get("published_date"),
+                json.dumps(alert, ensure_ascii=False, default=str),
+                created_at,
+            )
+            for alert in alerts
+            if isinstance(alert, dict)
+        ]
+        self._executemany(
+            """
+            INSERT OR REPLACE INTO external_alerts (
+                run_id, link_hash, link, board_name, title, content, published_date, payload, created_at
+            ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
+            """,
+            rows,
+        )
+
+    def load_external_alerts(self, run_id: str) -> List[Dict]:
+        rows = self._execute(
+            "SELECT payload FROM external_alerts WHERE run_id = ? ORDER BY id",
+            (run_id,),
+        )
+        return [json.loads(row["payload"]) for row in rows]
+
+    # ------------------------------------------------------------- llm usage
+    def save_llm_usage(self, run_id: str, records: List[Dict]) -> None:
+        """LLM 호출 기록 추가 (재개 실행은 이전 시도 호출에 이어서 쌓인다)"""
+        created_at = _now_iso()
+        self._executemany(
+            """
+            INSERT INTO llm_usage (
+                run_id, category, model, prompt_tokens, completion_tokens, latency_seconds, status, cost_usd, created_at
+            ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
+            """,
+            [
+                (
+                    run_id,
+                    record["category"],
+                    record["model"],
+                    record["prompt_tokens"],
+                    record["completion_tokens"],
+                    record["latency_seconds"],
+                    record["status"],
+                    record["cost_usd"],
+                    created_at,
+                )
+                for record in records
+            ],
+        )
+
+    def load_llm_usage(self, run_id: str) -> List[Dict]:
+        rows = self._execute(
+            """
+            SELECT category, model, prompt_tokens, completion_tokens, latency_seconds, status, cost_usd
+            FROM llm_usage WHERE run_id = ? ORDER BY id
+            """,
+            (run_id,),
+        )
+        return [dict(row) for row in rows]
+
+    # ---------------------------------------------------------------- report
+    def load_analyzed_data(self, run_id: str) -> Dict:
+        """리포트 렌더링 입력(analyzed_data) 형태로 실행 결과를 복원한다."""
+        data = dict(self.load_insights(run_id))
+        for category, summaries in self.load_summaries(run_id).items():
+            data[f"section_{category}"] = summaries
+        data["external_alerts"] = self.load_external_alerts(run_id)
+        return data
+
+
+def open_article_store(settings) -> Optional[ArticleStore]:
+    """설정에 따라 ArticleStore를 연다. 비활성화/실패 시 None (파이프라인은 계속 진행)."""
+    if not getattr(settings, "article_store_enabled", False):
+        return None
+    try:
+        return ArticleStore(settings.article_store_path)
+    except sqlite3.Error as e:
+        logger.error(f"Article store unavailable ({settings.article_store_path}): {e}")
+        return None
@@ -0,0 +1,364 @@
+"""
+SQLite 작업 큐 (웹 프로세스가 등록하고 worker 프로세스가 실행하는 분석 작업의 상태/이벤트 영속 기록)
+"""
+from __future__ import annotations
+
+import json
+import logging
+import os
+import sqlite3
+import threading
+import time
+import uuid
+from contextlib import contextmanager
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_JOB_QUEUE_PATH = "output/store/jobs.db"
+
+STATUS_PENDING = "pending"
+STATUS_RUNNING = "running"
+STATUS_COMPLETED = "completed"
+STATUS_FAILED = "failed"
+TERMINAL_STATUSES = (STATUS_COMPLETED, STATUS_FAILED)
+
+# heartbeat가 이 시간 이상 끊긴 running 작업은 worker가 죽은 것으로 보고 실패 처리 (recover_stale 기본값)
+STALE_JOB_SECONDS = 300
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS jobs (
+    job_id TEXT PRIMARY KEY,
+    kind TEXT NOT NULL,
+    status TEXT NOT NULL,
+    state TEXT NOT NULL,
+    worker_id TEXT,
+    created_at TEXT NOT NULL,
+    started_at TEXT,
+    finished_at TEXT,
+    heartbeat_at REAL,
+    finished_ts REAL
+);
+CREATE INDEX IF NOT EXISTS idx_jobs_kind_status ON jobs (kind, status);
+CREATE INDEX IF NOT EXISTS idx_jobs_status_created ON jobs (status, created_at);
+
+CREATE TABLE IF NOT EXISTS job_events (
+    job_id TEXT NOT NULL,
+    seq INTEGER NOT NULL,
+    event TEXT NOT NULL,
+    data TEXT NOT NULL,
+    PRIMARY KEY (job_id, seq)
+);
+"""
+
+
+class JobQueueFullError(RuntimeError):
+    """대기/실행 중 작업 수가 상한에 도달함"""
+
+
+def initial_state() -> Dict[str, Any]:
+    return {
+        'stage': None,
+        'progress': 0,
+        'news_collected': 0,
+        'news_analyzed': 0,
+        'categories': {},
+        'error': None,
+        'result': None,
+    }
+
+
+def job_payload(status: str, state: Dict[str, Any]) -> Dict[str, Any]:
+    """상태 조회/SSE 공통 응답 본문"""
+    return {
+        'status': status,
+        'stage': state.get('stage'),
+        'progress': state.get('progress', 0),
+        'news_collected': state.get('news_collected', 0),
+        'news_analyzed': state.get('news_analyzed', 0),
+        'categories': state.get('categories', {}),
+        'error': state.get('error'),
+        'result': state.get('result')
+    }
+
+
+def _now_iso() -> str:
+    return datetime.now().isoformat()
+
+
+class JobQueue:
+    """
+    작업 등록(enqueue) -> worker 선점(claim) -> 진행 이벤트 기록(update/apply) -> 종료.
+
+    여러 프로세스가 같은 DB 파일을 열어 쓰며, 상태 전이는 `BEGIN IMMEDIATE` 트랜잭션으로 직렬화한다.
+    같은 kind의 대기/실행 중 작업이 있으면 enqueue는 새 작업 대신 그 작업 ID를 돌려준다 (single-flight).
+    """
+
+    def __init__(self, path: str = DEFAULT_JOB_QUEUE_PATH):
+        self.path = path
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        self._conn = sqlite3.connect(path, check_same_thread=False, timeout=30, isolation_level=None)
+        self._conn.row_factory = sqlite3.Row
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.executescript(SCHEMA)
+        self._lock = threading.RLock()
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
+
+    @contextmanager
+    def _write(self) -> Iterator[sqlite3.Connection]:
+        """프로세스 간 쓰기 직렬화 (BEGIN IMMEDIATE ... COMMIT)"""
+        with self._lock:
+            self._conn.execute("BEGIN IMMEDIATE")
+            try:
+                yield self._conn
+            except BaseException:
+                self._conn.execute("ROLLBACK")
+                raise
+            self._conn.execute("COMMIT")
+
+    def _query(self, sql: str, params: Tuple = ()) -> List[sqlite3.Row]:
+        with self._lock:
+            return self._conn.execute(sql, params).fetchall()
+
+    @staticmethod
+    def _append_event(conn: sqlite3.Connection, job_id: str, event: str, data: Dict[str, Any]) -> int:
+        seq = conn.execute(
+            "SELECT COALESCE(MAX(seq), 0) + 1 FROM job_events WHERE job_id = ?", (job_id,)
+        ).fetchone()[0]
+        conn.execute(
+            "INSERT INTO job_events (job_id, seq, event, data) VALUES (?, ?, ?, ?)",
+            (job_id, seq, event, json.dumps(data, ensure_ascii=False)),
+        )
+        return seq
+
+    def enqueue(self, kind: str, max_active: int = 0, params: Optional[Dict[str, Any]] = None) -> Tuple[str, bool]:
+        """
+        작업 등록 (같은 kind의 대기/실행 중 작업이 있으면 그 작업에 합류).
+
+        Args:
+            kind: 작업 종류 (예: 'analysis')
+            max_active: 전체 대기+실행 작업 상한 (0이면 무제한)
+            params: worker에 넘길 실행 옵션 (기존 작업에 합류하면 무시)
+
+        Returns:
+            (job_id, 새로 등록했는지 여부)
+
+        Raises:
+            JobQueueFullError: 대기+실행 작업이 max_active개 이상
+        """
+        with self._write() as conn:
+            row = conn.execute(
+                "SELECT job_id FROM jobs WHERE kind = ? AND status IN (?, ?) ORDER BY created_at LIMIT 1",
+                (kind, STATUS_PENDING, STATUS_RUNNING),
+            ).fetchone()
+            if row:
+                return row["job_id"], False
+
+            if max_active:
+                active = conn.execute(
+                    "SELECT COUNT(*) FROM jobs WHERE status IN (?, ?)", (STATUS_PENDING, STATUS_RUNNING)
+                ).fetchone()[0]
+                if active >= max_active:
+                    raise JobQueueFullError(f"{active} jobs already running or queued")
+
+            job_id = str(uuid.uuid4())
+            state = initial_state()
+            state['params'] = params or {}
+            conn.execute(
+                "INSERT INTO jobs (job_id, kind, status, state, created_at) VALUES (?, ?, ?, ?, ?)",
+                (job_id, kind, STATUS_PENDING, json.dumps(state), _now_iso()),
+            )
+        return job_id, True
+
+    def claim(self, worker_id: str, kinds: Optional[List[str]] = None) -> Optional[Dict[str, Any]]:
+        """
+        가장 오래된 대기 작업을 선점해 running으로 바꾼다.
+
+        Returns:
+            {'job_id', 'kind'} 또는 None (대기 작업 없음)
+        """
+        sql = "SELECT job_id, kind FROM jobs WHERE status = ?"
+        params: List[Any] = [STATUS_PENDING]
+        if kinds:
+            sql += f" AND kind IN ({','.join('?' * len(kinds))})"
+            params.extend(kinds)
+        sql += " ORDER BY created_at LIMIT 1"
+
+        with self._write() as conn:
+            row = conn.execute(sql, params).fetchone()
+            if not row:
+                return None
+            conn.execute(
+                "UPDATE jobs SET status = ?, worker_id = ?, started_at = ?, heartbeat_at = ? WHERE job_id = ?",
+                (STATUS_RUNNING, worker_id, _now_iso(), time.time(), row["job_id"]),
+            )
+        return {'job_id': row["job_id"], 'kind': row["kind"]}
+
+    def apply(
+        self,
+        job_id: str,
+        event: str,
+        compute: Callable[[Dict[str, Any]], Optional[Dict[str, Any]]],
+        detail: Optional[Dict[str, Any]] = None,
+        status: Optional[str] = None,
+    ) -> None:
+        """
+        현재 상태로 갱신할 필드를 계산해 저장하고 이벤트를 추가한다.
+
+        Args:
+            job_id: 작업 ID
+            event: SSE 이벤트 이름
+            compute: state dict -> 갱신할 필드 (None이면 이벤트 없이 무시)
+            detail: 이벤트에 덧붙일 데이터
+            status: 바꿀 작업 상태 (completed/failed면 종료 처리)
+        """
+        with self._write() as conn:
+            row = conn.execute("SELECT status, state FROM jobs WHERE job_id = ?", (job_id,)).fetchone()
+            if not row:
+                return
+            state = json.loads(row["state"])
+            fields = compute(state)
+            if fields is None:
+                return
+            state.update(fields)
+            new_status = status or row["status"]
+
+            if new_status in TERMINAL_STATUSES:
+                conn.execute(
+                    "UPDATE jobs SET status = ?, state = ?, finished_at = ?, finished_ts = ?, heartbeat_at = ? "
+                    "WHERE job_id = ?",
+                    (new_status, json.dumps(state, ensure_ascii=False), _now_iso(), time.time(), time.time(), job_id),
+                )
+            else:
+                conn.execute(
+                    "UPDATE jobs SET status = ?, state = ?, heartbeat_at = ? WHERE job_id = ?",
+                    (new_status, json.dumps(state, ensure_ascii=False), time.time(), job_id),
+                )
+            self._append_event(conn, job_id, event, {**job_payload(new_status, state), 'detail': detail or {}})
+
+    def update(
+        self,
+        job_id: str,
+        event: str,
+        detail: Optional[Dict[str, Any]] = None,
+        status: Optional[str] = None,
+        **fields: Any,
+    ) -> None:
+        """상태 필드를 갱신하고 이벤트를 추가한다."""
+        self.apply(job_id, event, lambda state: fields, detail=detail, status=status)
+
+    def heartbeat(self, job_id: str) -> None:
+        with self._write() as conn:
+            conn.execute("UPDATE jobs SET heartbeat_at = ? WHERE job_id = ? AND status = ?",
+                         (time.time(), job_id, STATUS_RUNNING))
+
+    def get(self, job_id: str) -> Optional[Dict[str, Any]]:
+        """작업 상태 스냅샷 (없거나 정리된 작업이면 None)"""
+        rows = self._query("SELECT status, state FROM jobs WHERE job_id = ?", (job_id,))
+        if not rows:
+            return None
+        return job_payload(rows[0]["status"], json.loads(rows[0]["state"]))
+
+    def get_params(self, job_id: str) -> Dict[str, Any]:
+        """enqueue 때 넘긴 실행 옵션 (없으면 빈 dict)"""
+        rows = self._query("SELECT state FROM jobs WHERE job_id = ?", (job_id,))
+        if not rows:
+            return {}
+        return json.loads(rows[0]["state"]).get('params') or {}
+
+    def events(self, job_id: str, after: int = 0) -> Optional[Tuple[List[Dict[str, Any]], bool]]:
+        """
+        `after` 이후 이벤트와 작업 종료 여부.
+
+        Returns:
+            ([{'id', 'event', 'data'}], 종료 여부), 작업이 없으면 None
+        """
+        with self._lock:
+            job = self._conn.execute("SELECT status FROM jobs WHERE job_id = ?", (job_id,)).fetchone()
+            if not job:
+                return None
+            rows = self._conn.execute(
+                "SELECT seq, event, data FROM job_events WHERE job_id = ? AND seq > ? ORDER BY seq",
+                (job_id, after),
+            ).fetchall()
+        events = [{'id': row["seq"], 'event': row["event"], 'data': json.loads(row["data"])} for row in rows]
+        return events, job["status"] in TERMINAL_STATUSES
+
+    def wait_events(
+        self, job_id: str, after: int, timeout: float, poll_interval: float = 0.5, max_poll_interval: float = 4.0
+    ) -> Optional[Tuple[List[Dict[str, Any]], bool]]:
+        """
+        새 이벤트가 생기거나 작업이 끝날 때까지 최대 timeout초 폴링 (다른 프로세스의 기록도 보인다).
+
+        변화가 없으면 폴링 간격을 poll_interval부터 max_poll_interval까지 두 배씩 늘린다
+        (진행 이벤트는 카테고리 단위라 몇 초 늦어도 되고, 연결마다 SQLite 조회가 쌓이지 않게 한다).
+        """
+        deadline = time.monotonic() + timeout
+        interval = poll_interval
+        while True:
+            result = self.events(job_id, after)
+            if result is None or result[0] or result[1]:
+                return result
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                return result
+            time.sleep(min(interval, remaining))
+            interval = min(interval * 2, max_poll_interval)
+
+    def recover_stale(self, stale_seconds: float = STALE_JOB_SECONDS) -> int:
+        """
+        heartbeat가 stale_seconds 이상 끊긴 running 작업을 실패 처리한다 (worker 비정상 종료 대비).
+
+        Returns:
+            실패 처리한 작업 수
+        """
+        cutoff = time.time() - stale_seconds
+        rows = self._query(
+            "SELECT job_id FROM jobs WHERE status = ? AND heartbeat_at < ?", (STATUS_RUNNING, cutoff)
+        )
+        for row in rows:
+            logger.warning(f"Job {row['job_id']}: worker heartbeat lost, marking failed")
+            self.update(row["job_id"], STATUS_FAILED, status=STATUS_FAILED,
+                        error='작업자 프로세스가 응답하지 않아 중단되었습니다')
+        return len(rows)
+
+    def prune(self, ttl_seconds: float, max_jobs: int = 0) -> int:
+        """
+        완료 후 ttl_seconds가 지난 작업과 max_jobs를 넘는 오래된 완료 작업을 삭제한다.
+
+        Returns:
+            삭제한 작업 수
+        """
+        with self._write() as conn:
+            doomed = [row[0] for row in conn.execute(
+                "SELECT job_id FROM jobs WHERE finished_ts IS NOT NULL AND finished_ts < ?",
+                (time.time() - ttl_seconds,),
+            )]
+            if max_jobs:
+                total = conn.execute("SELECT COUNT(*) FROM jobs").fetchone()[0] - len(doomed)
+                if total > max_jobs:
+                    doomed += [row[0] for row in conn.execute(
+                        "SELECT job_id FROM jobs WHERE finished_ts IS NOT NULL AND finished_ts >= ? "
+                        "ORDER BY finished_ts LIMIT ?",
+                        (time.time() - ttl_seconds, total - max_jobs),
+                    )]
+            for job_id in doomed:
+                conn.execute("DELETE FROM job_events WHERE job_id = ?", (job_id,))
+                conn.execute("DELETE FROM jobs WHERE job_id = ?", (job_id,))
+        return len(doomed)
+
+
+def resolve_job_queue_path(path: Optional[str] = None) -> str:
+    """JOB_QUEUE_PATH (상대 경로는 프로젝트 루트 기준)"""
+    queue_path = Path(path or os.getenv('JOB_QUEUE_PATH', DEFAULT_JOB_QUEUE_PATH))
+    if not queue_path.is_absolute():
+        queue_path = Path(__file__).parent.parent / queue_path
+    return str(queue_path)
@@ -0,0 +1,312 @@
+"""
+리포트 이력 아카이브 (gzip 압축 + 내용 해시 중복 제거) 및 리포트 manifest
+"""
+from __future__ import annotations
+
+import gzip
+import hashlib
+import json
+import logging
+import os
+import re
+import threading
+from contextlib import contextmanager
+from datetime import datetime, timedelta
+from typing import Dict, Iterator, List, Optional
+
+from utils.exceptions import LockHeldError
+from utils.file_lock import FileLock
+
+logger = logging.getLogger(__name__)
+
+# 이력 디렉터리의 리포트 메타데이터 (JSON Lines, 리포트 생성 시 1줄씩 추가)
+REPORT_MANIFEST_NAME = "manifest.jsonl"
+MANIFEST_LOCK_NAME = "manifest.lock"
+MANIFEST_LOCK_TIMEOUT_SECONDS = 30.0
+BLOB_DIR_NAME = "blobs"
+BLOB_SUFFIX = ".html.gz"
+HISTORY_NAME_RE = re.compile(r"^daily_report_(\d{8}_\d{6})\.html$")
+
+# manifest 추가/재작성과 blob 정리를 직렬화한다 (compact 중 새 blob이 지워지지 않도록).
+# CLI, 스케줄러, worker.py, 웹, 백필이 같은 history/를 쓰므로 스레드 잠금 + 파일 잠금을 함께 쓴다.
+# 잠금은 history 디렉터리별로 따로 잡아 서로 다른 아카이브끼리는 막지 않는다.
+class _HistoryDirLock:
+    def __init__(self):
+        self.thread_lock = threading.RLock()
+        self.depth = 0
+
+
+_dir_locks: Dict[str, _HistoryDirLock] = {}
+_dir_locks_guard = threading.Lock()
+
+
+def _history_dir_lock(history_dir: str) -> _HistoryDirLock:
+    key = os.path.normcase(os.path.realpath(history_dir))
+    with _dir_locks_guard:
+        return _dir_locks.setdefault(key, _HistoryDirLock())
+
+
+@contextmanager
+def _manifest_lock(history_dir: str) -> Iterator[None]:
+    """
+    history/ 쓰기 잠금 (같은 프로세스의 스레드 + 다른 프로세스, 같은 스레드에서 중첩 가능)
+
+    Raises:
+        LockHeldError: MANIFEST_LOCK_TIMEOUT_SECONDS 안에 잠금을 얻지 못함
+    """
+    state = _history_dir_lock(history_dir)
+    if not state.thread_lock.acquire(timeout=MANIFEST_LOCK_TIMEOUT_SECONDS):
+        raise LockHeldError(f"Report history {history_dir} is locked by another thread")
+    try:
+        if state.depth:
+            state.depth += 1
+            try:
+                yield
+            finally:
+                state.depth -= 1
+            return
+
+        lock = FileLock(os.path.join(history_dir, MANIFEST_LOCK_NAME), owner="report_archive")
+        if not lock.acquire(timeout=MANIFEST_LOCK_TIMEOUT_SECONDS):
+            raise LockHeldError(f"Report history {history_dir} is locked by another process: {lock.holder() or 'unknown'}")
+        state.depth = 1
+        try:
+            yield
+        finally:
+            state.depth = 0
+            lock.release()
+    finally:
+        state.thread_lock.release()
+
+
+def load_manifest(history_dir: str) -> Dict[str, Dict]:
+    """filename -> 마지막 manifest 기록 (같은 파일을 다시 생성하면 뒤 기록이 우선)"""
+    records: Dict[str, Dict] = {}
+    try:
+        with open(os.path.join(history_dir, REPORT_MANIFEST_NAME), encoding="utf-8") as f:
+            for line in f:
+                try:
+                    record = json.loads(line)
+                except ValueError:
+                    logger.warning(f"Skipping malformed report manifest line: {line[:80]!r}")
+                    continue
+                if isinstance(record, dict) and record.get("filename"):
+                    records[record["filename"]] = record
+    except FileNotFoundError:
+        pass
+    return records
+
+
+def append_manifest(history_dir: str, record: Dict) -> None:
+    """manifest에 기록 1건 추가"""
+    with _manifest_lock(history_dir):
+        with open(os.path.join(history_dir, REPORT_MANIFEST_NAME), "a", encoding="utf-8") as f:
+            f.write(json.dumps(record, ensure_ascii=False) + "\n")
+
+
+def rewrite_manifest(history_dir: str, records: List[Dict]) -> None:
+    """manifest 전체 교체 (임시 파일 작성 후 rename)"""
+    path = os.path.join(history_dir, REPORT_MANIFEST_NAME)
+    tmp_path = f"{path}.tmp"
+    with _manifest_lock(history_dir):
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            for record in records:
+                f.write(json.dumps(record, ensure_ascii=False) + "\n")
+        os.replace(tmp_path, path)
+
+
+def unused_history_filename(history_dir: str, report_time: datetime) -> str:
+    """
+    아직 쓰이지 않은 이력 파일명 (이미 있으면 1초씩 뒤로 미룬 이름)
+
+    이력 파일명은 한 번만 쓴다. 웹에서 immutable로 캐시하므로 같은 실행을 다시 렌더링(render,
+    백필 --no-resume)해도 기존 이력을 덮어쓰지 않고 새 이력으로 남긴다.
+    """
+    taken = load_manifest(history_dir)
+    while True:
+        filename = f"daily_report_{report_time.strftime('%Y%m%d_%H%M%S')}.html"
+        if filename not in taken and not os.path.exists(os.path.join(history_dir, filename)):
+            return filename
+        report_time += timedelta(seconds=1)
+
+
+def history_created_at(filename: str) -> Optional[datetime]:
+    """이력 파일명 타임스탬프 (daily_report_YYYYMMDD_HHMMSS.html)"""
+    match = HISTORY_NAME_RE.match(filename)
+    if not match:
+        return None
+    try:
+        return datetime.strptime(match.group(1), "%Y%m%d_%H%M%S")
+    except ValueError:
+        return None
+
+
+class ReportArchive:
+    """
+    이력 리포트를 `history/blobs/<해시 앞 2자리>/<sha256>.html.gz`로 저장한다.
+
+    같은 내용의 리포트는 blob 하나를 공유하며, 이력 파일명 -> blob 매핑은 manifest의 `blob` 필드에 둔다.
+    gzip 출력은 mtime을 고정해 같은 HTML이면 같은 바이트가 되므로 그대로 `Content-Encoding: gzip`으로 서빙할 수 있다.
+    """
+
+    def __init__(self, history_dir: str, retention_days: int = 0, max_bytes: int = 0):
+        """
+        Args:
+            history_dir: 이력 디렉터리 (예: output/web/history)
+            retention_days: 보관 기간 (0이면 무제한)
+            max_bytes: blob 총 용량 상한 (0이면 무제한, 초과 시 오래된 리포트부터 삭제)
+        """
+        self.history_dir = history_dir
+        self.blob_dir = os.path.join(history_dir, BLOB_DIR_NAME)
+        self.retention_days = max(0, retention_days)
+        self.max_bytes = max(0, max_bytes)
+
+    def blob_path(self, digest: str) -> str:
+        return os.path.join(self.blob_dir, digest[:2], f"{digest}{BLOB_SUFFIX}")
+
+    def put(self, html: str) -> str:
+        """
+        리포트 HTML을 압축 저장한다 (이미 있으면 재사용).
+
+        Returns:
+            sha256 hex digest
+        """
+        raw = html.encode("utf-8")
+        digest = hashlib.sha256(raw).hexdigest()
+        path = self.blob_path(digest)
+        if os.path.exists(path):
+            return digest
+
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        tmp_path = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+        with open(tmp_path, "wb") as f:
+            f.write(gzip.compress(raw, compresslevel=9, mtime=0))
+        os.replace(tmp_path, path)
+        return digest
+
+    def add(self, filename: str, html: str, record: Dict) -> str:
+        """
+        이력 리포트 1건을 blob으로 저장하고 manifest에 `blob` 필드와 함께 기록한다.
+
+        Args:
+            filename: 이력 파일명 (daily_report_YYYYMMDD_HHMMSS.html)
+            html: 리포트 HTML
+            record: manifest 기록 (filename/blob은 덮어씀)
+
+        Returns:
+            sha256 hex digest
+
+        Raises:
+            LockHeldError: 다른 프로세스가 history/를 오래 잠그고 있음
+        """
+        with _manifest_lock(self.history_dir):
+            digest = self.put(html)
+            append_manifest(self.history_dir, {**record, "filename": filename, "blob": digest})
+        return digest
+
+    def read_text(self, digest: str) -> str:
+        with open(self.blob_path(digest), "rb") as f:
+            return gzip.decompress(f.read()).decode("utf-8")
+
+    def compact(self, now: Optional[datetime] = None) -> Dict[str, int]:
+        """
+        보관 정책 적용 및 정리.
+
+        1. 평문 이력 파일(daily_report_*.html)을 blob으로 옮긴다.
+        2. 보관 기간이 지난 리포트, 용량 상한을 넘는 오래된 리포트를 manifest에서 제거한다.
+        3. manifest에서 참조되지 않는 blob을 삭제한다.
+
+        Returns:
+            {'migrated', 'expired', 'removed_blobs', 'blob_bytes'}
+
+        Raises:
+            LockHeldError: 다른 프로세스가 history/를 오래 잠그고 있음
+        """
+        now = now or datetime.now()
+        stats = {"migrated": 0, "expired": 0, "removed_blobs": 0, "blob_bytes": 0}
+
+        with _manifest_lock(self.history_dir):
+            records = load_manifest(self.history_dir)
+            changed = False
+
+            for name in sorted(os.listdir(self.history_dir)):
+                if not history_created_at(name):
+                    continue
+                plain_path = os.path.join(self.history_dir, name)
+                with open(plain_path, encoding="utf-8") as f:
+                    digest = self.put(f.read())
+                record = records.setdefault(name, {
+                    "filename": name,
+                    "created_at": history_created_at(name).strftime("%Y-%m-%dT%H:%M:%S"),
+                })
+                record["blob"] = digest
+                os.remove(plain_path)
+                stats["migrated"] += 1
+                changed = True
+
+            ordered = sorted(records.values(), key=lambda r: (r.get("created_at", ""), r["filename"]))
+            if self.retention_days:
+                cutoff = (now - timedelta(days=self.retention_days)).strftime("%Y-%m-%dT%H:%M:%S")
+                kept = [r for r in ordered if r.get("created_at", "") >= cutoff]
+                stats["expired"] += len(ordered) - len(kept)
+                ordered = kept
+
+            sizes: Dict[str, int] = {}
+            for record in ordered:
+                digest = record.get("blob")
+                if digest and digest not in sizes:
+                    try:
+                        sizes[digest] = os.path.getsize(self.blob_path(digest))
+                    except OSError:
+                        sizes[digest] = 0
+
+            if self.max_bytes:
+                # 최신 리포트부터 용량을 채우고, 상한을 넘기는 시점 이전(더 오래된) 리포트는 제거한다.
+                used = 0
+                counted = set()
+                kept_reversed = []
+                for record in reversed(ordered):
+                    digest = record.get("blob")
+                    extra = sizes.get(digest, 0) if digest and digest not in counted else 0
+                    if extra and used + extra > self.max_bytes and kept_reversed:
+                        break
+                    used += extra
+                    if digest:
+                        counted.add(digest)
+                    kept_reversed.append(record)
+                stats["expired"] += len(ordered) - len(kept_reversed)
+                ordered = list(reversed(kept_reversed))
+
+            if stats["expired"]:
+                changed = True
+            if changed:
+                rewrite_manifest(self.history_dir, ordered)
+
+            referenced = {record["blob"] for record in ordered if record.get("blob")}
+            if os.path.isdir(self.blob_dir):
+                for prefix in os.listdir(self.blob_dir):
+                    prefix_dir = os.path.join(self.blob_dir, prefix)
+                    for name in os.listdir(prefix_dir):
+                        if name.endswith(BLOB_SUFFIX) and name[:-len(BLOB_SUFFIX)] not in referenced:
+                            os.remove(os.path.join(prefix_dir, name))
+                            stats["removed_blobs"] += 1
+
+            stats["blob_bytes"] = sum(sizes.get(digest, 0) for digest in referenced)
+
+        if stats["migrated"] or stats["expired"] or stats["removed_blobs"]:
+            logger.info(
+                f"Report archive compacted: migrated={stats['migrated']}, expired={stats['expired']}, "
+                f"removed_blobs={stats['removed_blobs']}, bytes={stats['blob_bytes']}"
+            )
+        return stats
+
+
+def open_report_archive(settings, history_dir: str = "output/web/history") -> Optional[ReportArchive]:
+    """설정에 따라 ReportArchive를 만든다 (비활성화 시 None → 평문 이력 저장)."""
+    if not getattr(settings, "report_archive_enabled", False):
+        return None
+    return ReportArchive(
+        history_dir,
+        retention_days=settings.report_archive_retention_days,
+        max_bytes=settings.report_archive_max_mb * 1024 * 1024,
+    )
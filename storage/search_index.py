@@ -0,0 +1,368 @@
+"""
+기사/요약/0404 공지 전문 검색 인덱스 (SQLite FTS5 + 한글 bigram)
+"""
+from __future__ import annotations
+
+import logging
+import re
+from datetime import date, datetime, time, timedelta, timezone
+from typing import Any, Dict, Iterable, List, Optional, Sequence
+
+from storage.article_store import ArticleStore, _epoch_to_datetime, _now_iso, hash_link
+from utils.time_windows import KST, to_epoch_us
+
+logger = logging.getLogger(__name__)
+
+DOC_TYPE_ARTICLE = "article"
+DOC_TYPE_SUMMARY = "summary"
+DOC_TYPE_ALERT = "alert"
+DOC_TYPES = (DOC_TYPE_ARTICLE, DOC_TYPE_SUMMARY, DOC_TYPE_ALERT)
+
+SORT_RECENT = "recent"
+SORT_RELEVANCE = "relevance"
+
+MAX_PAGE_SIZE = 100
+# 매칭 건수는 이 값까지만 센다 (그 이상은 total_capped=True).
+MAX_COUNT = 1000
+
+# doc_id = (게시 시각 초 << DOC_SEQ_BITS) | 일련번호.
+# FTS rowid 순서가 곧 게시일 순서가 되어 최신순 정렬/기간 필터를 FTS 인덱스에서 바로 처리한다.
+DOC_SEQ_BITS = 20
+
+# 문서 원문은 search_docs에, 토큰화된 텍스트는 contentless FTS5 테이블에 둔다.
+SEARCH_SCHEMA = """
+CREATE TABLE IF NOT EXISTS search_docs (
+    doc_id INTEGER PRIMARY KEY,
+    doc_type TEXT NOT NULL,
+    category TEXT NOT NULL DEFAULT '',
+    link_hash TEXT NOT NULL,
+    link TEXT,
+    title TEXT,
+    body TEXT,
+    source TEXT,
+    published_at INTEGER,
+    run_id TEXT NOT NULL,
+    UNIQUE (doc_type, category, link_hash)
+);
+
+CREATE VIRTUAL TABLE IF NOT EXISTS search_fts USING fts5(
+    title, body, content='', tokenize='unicode61 remove_diacritics 0'
+);
+
+CREATE TABLE IF NOT EXISTS search_index_state (
+    run_id TEXT PRIMARY KEY,
+    doc_count INTEGER NOT NULL,
+    indexed_at TEXT NOT NULL
+);
+"""
+
+_HANGUL = "가-힣ㄱ-ㆎ"
+_RUN_RE = re.compile(rf"[{_HANGUL}]+|[^\W_{_HANGUL}]+")
+_HANGUL_RE = re.compile(rf"[{_HANGUL}]+")
+
+
+def _runs(text: str) -> List[str]:
+    """한글 연속 구간과 그 외 문자/숫자 구간으로 분리 (소문자화)"""
+    return _RUN_RE.findall((text or "").lower())
+
+
+def _bigrams(run: str) -> List[str]:
+    return [run[i:i + 2] for i in range(len(run) - 1)]
+
+
+def tokenize(text: str) -> List[str]:
+    """
+    인덱싱용 토큰 분리.
+
+    한글은 띄어쓰기/조사와 무관하게 부분 일치가 되도록 2글자 단위(bigram)로 쪼개고,
+    영문/숫자는 단어 단위로 둔다. 예: "KT로밍 말톡후기" -> kt, 로밍, 말톡, 톡후, 후기
+
+    Args:
+        text: 원문
+
+    Returns:
+        토큰 리스트
+    """
+    tokens: List[str] = []
+    for run in _runs(text):
+        if len(run) > 1 and _HANGUL_RE.fullmatch(run):
+            tokens.extend(_bigrams(run))
+        else:
+            tokens.append(run)
+    return tokens
+
+
+def build_match_query(query: str) -> Optional[str]:
+    """
+    사용자 검색어를 FTS5 MATCH 식으로 변환한다.
+
+    공백으로 나뉜 각 검색어는 AND로 묶는다. 2글자 이상 한글은 bigram 구문(phrase)으로,
+    1글자 한글과 영문/숫자는 접두어 검색으로 변환한다.
+
+    Args:
+        query: 사용자 검색어
+
+    Returns:
+        MATCH 식 (검색 가능한 토큰이 없으면 None)
+    """
+    clauses: List[str] = []
+    for run in _runs(query):
+        if len(run) > 1 and _HANGUL_RE.fullmatch(run):
+            clauses.append('"' + " ".join(_bigrams(run)) + '"')
+        else:
+            clauses.append(f'"{run}"*')
+    return " ".join(clauses) or None
+
+
+def _index_text(text: Optional[str]) -> str:
+    return " ".join(tokenize(text or ""))
+
+
+def _date_start_epoch(value: date) -> int:
+    return to_epoch_us(datetime.combine(value, time.min, tzinfo=KST))
+
+
+def _doc_id_floor(epoch_us: int) -> int:
+    """게시 시각(epoch us)에 해당하는 doc_id 구간의 시작값"""
+    return (epoch_us // 1_000_000) << DOC_SEQ_BITS
+
+
+def _parse_date(value: Optional[str]) -> Optional[date]:
+    """'YYYY-MM-DD' / 'YYYY.MM.DD' 형식 날짜 파싱 (실패 시 None)"""
+    text = (value or "").strip()[:10].replace(".", "-")
+    try:
+        return datetime.strptime(text, "%Y-%m-%d").date()
+    except ValueError:
+        return None
+
+
+class SearchIndex:
+    """
+    ArticleStore와 같은 DB 파일에 전문 검색 인덱스를 유지한다.
+
+    doc_id는 게시 시각 기반 키라서 최신순 페이지와 기간 필터가 매칭 전체를 정렬하지 않고
+    FTS rowid 역순 스캔으로 끝난다. 실행이 끝날 때마다 index_pending()으로
+    아직 색인되지 않은 완료 실행만 추가한다. 같은 링크는 문서 유형/카테고리별로 처음 수집된 한 건만 색인한다.
+    """
+
+    def __init__(self, store: ArticleStore):
+        self.store = store
+        with store.transaction() as conn:
+            conn.executescript(SEARCH_SCHEMA)
+
+    # -------------------------------------------------------------- indexing
+    def index_pending(self) -> int:
+        """
+        색인되지 않은 완료 실행을 오래된 순으로 색인한다.
+
+        Returns:
+            새로 추가된 문서 수
+        """
+        rows = self.store._execute(
+            """
+            SELECT run_id FROM runs
+            WHERE status = 'completed' AND run_id NOT IN (SELECT run_id FROM search_index_state)
+            ORDER BY started_at
+            """
+        )
+        return sum(self.index_run(row["run_id"]) for row in rows)
+
+    def index_run(self, run_id: str) -> int:
+        """
+        실행 하나의 기사/요약/공지를 색인한다 (같은 run_id 재호출 시 no-op).
+
+        Args:
+            run_id: 실행 ID
+
+        Returns:
+            새로 추가된 문서 수
+        """
+        added = 0
+        with self.store.transaction() as conn:
+            if conn.execute("SELECT 1 FROM search_index_state WHERE run_id = ?", (run_id,)).fetchone():
+                return 0
+
+            for doc in self._collect_docs(conn, run_id):
+                if conn.execute(
+                    "SELECT 1 FROM search_docs WHERE doc_type = ? AND category = ? AND link_hash = ?",
+                    (doc["doc_type"], doc["category"], doc["link_hash"]),
+                ).fetchone():
+                    continue
+                doc["doc_id"] = self._next_doc_id(conn, doc["published_at"])
+                conn.execute(
+                    """
+                    INSERT INTO search_docs (
+                        doc_id, doc_type, category, link_hash, link, title, body, source, published_at, run_id
+                    ) VALUES (
+                        :doc_id, :doc_type, :category, :link_hash, :link, :title, :body, :source, :published_at, :run_id
+                    )
+                    """,
+                    doc,
+                )
+                conn.execute(
+                    "INSERT INTO search_fts (rowid, title, body) VALUES (?, ?, ?)",
+                    (doc["doc_id"], _index_text(doc["title"]), _index_text(doc["body"])),
+                )
+                added += 1
+
+            conn.execute(
+                "INSERT INTO search_index_state (run_id, doc_count, indexed_at) VALUES (?, ?, ?)",
+                (run_id, added, _now_iso()),
+            )
+
+        logger.info(f"Search index: {added} documents added (run {run_id})")
+        return added
+
+    @staticmethod
+    def _next_doc_id(conn, published_at: int) -> int:
+        floor = _doc_id_floor(published_at)
+        row = conn.execute(
+            "SELECT MAX(doc_id) FROM search_docs WHERE doc_id >= ? AND doc_id < ?",
+            (floor, floor + (1 << DOC_SEQ_BITS)),
+        ).fetchone()
+        return floor if row[0] is None else row[0] + 1
+
+    def _collect_docs(self, conn, run_id: str) -> Iterable[Dict[str, Any]]:
+        # 게시일이 없는 문서는 실행 시작 시각을 게시일로 간주한다.
+        run = conn.execute("SELECT started_at FROM runs WHERE run_id = ?", (run_id,)).fetchone()
+        started_at = datetime.fromisoformat(run["started_at"]) if run else datetime.now(timezone.utc)
+        fallback_epoch = to_epoch_us(started_at)
+
+        for row in conn.execute("SELECT * FROM articles WHERE run_id = ? ORDER BY id", (run_id,)):
+            yield {
+                "doc_type": DOC_TYPE_ARTICLE,
+                "category": row["category"],
+                "link_hash": row["link_hash"],
+                "link": row["link"],
+                "title": row["title"],
+                "body": row["snippet"],
+                "source": row["source"],
+                "published_at": row["published_at"] if row["published_at"] is not None else fallback_epoch,
+                "run_id": run_id,
+            }
+
+        summary_rows = conn.execute(
+            """
+            SELECT s.*, a.published_at AS article_published_at, a.source AS article_source
+            FROM summaries s
+            LEFT JOIN articles a
+                ON a.run_id = s.run_id AND a.category = s.category AND a.link_hash = s.link_hash
+            WHERE s.run_id = ?
+            ORDER BY s.id
+            """,
+            (run_id,),
+        )
+        for row in summary_rows:
+            published_at = row["article_published_at"]
+            yield {
+                "doc_type": DOC_TYPE_SUMMARY,
+                "category": row["category"],
+                "link_hash": row["link_hash"],
+                "link": row["link"],
+                "title": row["title"],
+                "body": row["summary"],
+                "source": row["article_source"],
+                "published_at": published_at if published_at is not None else fallback_epoch,
+                "run_id": run_id,
+            }
+
+        for row in conn.execute("SELECT * FROM external_alerts WHERE run_id = ? ORDER BY id", (run_id,)):
+            published = _parse_date(row["published_date"])
+            yield {
+                "doc_type": DOC_TYPE_ALERT,
+                "category": "",
+                "link_hash": row["link_hash"] or hash_link(row["link"]),
+                "link": row["link"],
+                "title": row["title"],
+                "body": row["content"],
+                "source": row["board_name"],
+                "published_at": _date_start_epoch(published) if published else fallback_epoch,
+                "run_id": run_id,
+            }
+
+    # --------------------------------------------------------------- search
+    def search(
+        self,
+        query: str,
+        doc_types: Optional[Sequence[str]] = None,
+        category: Optional[str] = None,
+        date_from: Optional[date] = None,
+        date_to: Optional[date] = None,
+        page: int = 1,
+        page_size: int = 20,
+        sort: str = SORT_RECENT,
+    ) -> Dict[str, Any]:
+        """
+        전문 검색.
+
+        Args:
+            query: 검색어 (공백 구분 AND)
+            doc_types: 문서 유형 필터 (article/summary/alert)
+            category: 카테고리 필터 (예: voc_esim)
+            date_from: 게시일 하한 (KST, 포함)
+            date_to: 게시일 상한 (KST, 포함)
+            page: 1부터 시작하는 페이지 번호
+            page_size: 페이지 크기 (최대 100)
+            sort: 'recent' (게시일 역순) / 'relevance' (bm25)
+
+        Returns:
+            {'items', 'total', 'total_capped', 'page', 'page_size', 'has_more'}
+        """
+        page = max(1, int(page))
+        page_size = min(max(1, int(page_size)), MAX_PAGE_SIZE)
+        result: Dict[str, Any] = {
+            "items": [], "total": 0, "total_capped": False, "page": page, "page_size": page_size, "has_more": False,
+        }
+
+        match = build_match_query(query)
+        if not match:
+            return result
+
+        conditions = ["search_fts MATCH ?"]
+        params: List[Any] = [match]
+        # 기간 필터는 doc_id(rowid) 범위로 변환해 FTS5가 직접 처리하게 한다.
+        if date_from:
+            conditions.append("search_fts.rowid >= ?")
+            params.append(_doc_id_floor(_date_start_epoch(date_from)))
+        if date_to:
+            conditions.append("search_fts.rowid < ?")
+            params.append(_doc_id_floor(_date_start_epoch(date_to + timedelta(days=1))))
+        if doc_types:
+            conditions.append(f"d.doc_type IN ({','.join('?' for _ in doc_types)})")
+            params.extend(doc_types)
+        if category:
+            conditions.append("d.category = ?")
+            params.append(category)
+
+        where = " AND ".join(conditions)
+        # CROSS JOIN으로 FTS 쪽을 바깥 루프에 고정한다 (유형/카테고리 필터 시에도 rowid 역순 스캔 유지).
+        from_clause = "FROM search_fts CROSS JOIN search_docs d ON d.doc_id = search_fts.rowid"
+        order = "bm25(search_fts), search_fts.rowid DESC" if sort == SORT_RELEVANCE else "search_fts.rowid DESC"
+
+        total = self.store._execute(
+            f"SELECT COUNT(*) FROM (SELECT 1 {from_clause} WHERE {where} LIMIT ?)",
+            [*params, MAX_COUNT + 1],
+        )[0][0]
+        rows = self.store._execute(
+            f"SELECT d.* {from_clause} WHERE {where} ORDER BY {order} LIMIT ? OFFSET ?",
+            [*params, page_size, (page - 1) * page_size],
+        )
+
+        result["total"] = min(total, MAX_COUNT)
+        result["total_capped"] = total > MAX_COUNT
+        result["has_more"] = len(rows) == page_size and (total > MAX_COUNT or page * page_size < total)
+        result["items"] = [self._row_to_item(row) for row in rows]
+        return result
+
+    def _row_to_item(self, row) -> Dict[str, Any]:
+        published = _epoch_to_datetime(row["published_at"])
+        return {
+            "type": row["doc_type"],
+            "category": row["category"],
+            "title": row["title"] or "",
+            "body": row["body"] or "",
+            "link": row["link"] or "",
+            "source": row["source"] or "",
+            "published_at": published.astimezone(KST).isoformat() if published else None,
+            "run_id": row["run_id"],
+        }
@@ -0,0 +1,164 @@
+import json
+import os
+import tempfile
+import threading
+import unittest
+from unittest.mock import patch
+
+from storage.job_queue import JobQueue
+from utils.file_lock import pipeline_lock
+from utils.progress import report_progress
+from web.app import create_app
+from web.task_manager import TaskManager
+
+
+class FakeCollector:
+    created = []
+
+    def __init__(self, progress=None, profile=None):
+        self.progress = progress
+        self.profile = profile
+        self.settings = None
+        FakeCollector.created.append(self)
+
+    def collect_all_categories(self):
+        report_progress(self.progress, "category_collected", category="voc_esim", count=3, done=1, total=2)
+        report_progress(self.progress, "category_collected", category="voc_roaming", count=2, done=2, total=2)
+        return {"voc_esim": [], "voc_roaming": []}
+
+    def analyze_news(self, all_news):
+        report_progress(self.progress, "category_analyzed", category="voc_esim", count=3, done=1, total=2)
+        return {}
+
+    def collect_external_alerts(self):
+        return []
+
+    def save_results(self, analyzed_news):
+        pass
+
+    def fail_run(self, error):
+        self.failed = error
+
+
+def parse_events(body):
+    events = []
+    for block in body.strip().split("\n\n"):
+        fields = dict(line.split(": ", 1) for line in block.split("\n") if not line.startswith(":"))
+        if "event" in fields:
+            events.append((int(fields["id"]), fields["event"], json.loads(fields["data"])))
+    return events
+
+
+class AnalysisEventsTests(unittest.TestCase):
+    def setUp(self):
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        queue = JobQueue(os.path.join(tmp.name, "jobs.db"))
+        self.addCleanup(queue.close)
+        self.client = create_app().test_client()
+        self.manager = TaskManager(queue=queue)
+        for target, value in (
+            ("web.routes.task_manager", self.manager),
+            ("utils.file_lock.PIPELINE_LOCK_PATH", os.path.join(tmp.name, "pipeline.lock")),
+        ):
+            patcher = patch(target, value)
+            patcher.start()
+            self.addCleanup(patcher.stop)
+
+    def _run(self, collector_cls, body=None):
+        with patch("main.NewsCollector", collector_cls):
+            response = self.client.post("/api/analysis/start", json=body)
+            self.task_id = response.get_json()["task_id"]
+            self.manager.shutdown(wait=True)
+        return response
+
+    def test_completed_task_streams_all_events_and_closes(self):
+        self._run(FakeCollector)
+
+        response = self.client.get(f"/api/analysis/events/{self.task_id}")
+
+        self.assertEqual("text/event-stream", response.mimetype)
+        self.assertEqual("no-cache", response.headers["Cache-Control"])
+        events = parse_events(response.get_data(as_text=True))
+        names = [name for _, name, _ in events]
+        self.assertIn("category_collected", names)
+        self.assertEqual("completed", names[-1])
+        self.assertEqual(list(range(1, len(events) + 1)), [event_id for event_id, _, _ in events])
+
+        final = events[-1][2]
+        self.assertEqual(100, final["progress"])
+        self.assertEqual(5, final["news_collected"])
+        self.assertEqual(3, final["news_analyzed"])
+        self.assertEqual({"collected": 3, "analyzed": 3}, final["categories"]["voc_esim"])
+        self.assertEqual(5, final["result"]["total"])
+
+    def test_last_event_id_resumes_stream(self):
+        self._run(FakeCollector)
+        total = len(self.manager.wait_events(self.task_id, 0, timeout=0)[0])
+        self.assertTrue(self.client.get(f"/api/analysis/status/{self.task_id}").get_json()["success"])
+
+        response = self.client.get(
+            f"/api/analysis/events/{self.task_id}", headers={"Last-Event-ID": str(total - 1)}
+        )
+
+        events = parse_events(response.get_data(as_text=True))
+        self.assertEqual([(total, "completed")], [(event_id, name) for event_id, name, _ in events])
+
+    def test_failed_task_emits_failed_event(self):
+        class BrokenCollector(FakeCollector):
+            def collect_all_categories(self):
+                raise RuntimeError("boom")
+
+        self._run(BrokenCollector)
+
+        events = parse_events(self.client.get(f"/api/analysis/events/{self.task_id}").get_data(as_text=True))
+        self.assertEqual("failed", events[-1][1])
+        self.assertEqual("boom", events[-1][2]["error"])
+        self.assertEqual("boom", FakeCollector.created[-1].failed)
+
+    def test_task_fails_while_pipeline_lock_held(self):
+        with pipeline_lock("cli"):
+            self._run(FakeCollector)
+
+        events = parse_events(self.client.get(f"/api/analysis/events/{self.task_id}").get_data(as_text=True))
+        self.assertEqual("failed", events[-1][1])
+        self.assertIn("진행 중", events[-1][2]["error"])
+
+    def test_profile_flag_is_passed_to_collector(self):
+        FakeCollector.created.clear()
+
+        response = self._run(FakeCollector, body={"profile": "collect,analyze"})
+
+        self.assertEqual("collect,analyze", response.get_json()["profile"])
+        self.assertEqual(["collect,analyze"], [collector.profile for collector in FakeCollector.created])
+
+    def test_unknown_profile_stage_is_rejected(self):
+        response = self.client.post("/api/analysis/start", json={"profile": "collect,bogus"})
+
+        self.assertEqual(400, response.status_code)
+        self.assertFalse(response.get_json()["success"])
+
+    def test_streams_beyond_limit_are_rejected_until_a_slot_frees(self):
+        self._run(FakeCollector)
+        with patch("web.routes._sse_slots", threading.BoundedSemaphore(1)) as slots:
+            self.assertTrue(slots.acquire(blocking=False))  # 다른 클라이언트가 스트림을 점유 중
+            busy = self.client.get(f"/api/analysis/events/{self.task_id}")
+            slots.release()
+
+            self.assertEqual(503, busy.status_code)
+            self.assertEqual("30", busy.headers["Retry-After"])
+            for _ in range(2):
+                response = self.client.get(f"/api/analysis/events/{self.task_id}")
+                self.assertEqual(200, response.status_code)
+                response.get_data()
+                response.close()
+
+    def test_unknown_task_returns_404(self):
+        response = self.client.get("/api/analysis/events/missing")
+
+        self.assertEqual(404, response.status_code)
+        self.assertFalse(response.get_json()["success"])
+
+
+if __name__ == "__main__":
+    unittest.main()
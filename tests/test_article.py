@@ -0,0 +1,90 @@
+from datetime import datetime, timezone
+import unittest
+
+from filters.deduplicator import Deduplicator
+from filters.keyword_filter import KeywordFilter
+from filters.time_filter import TimeFilter
+from utils.article import Article, ArticleBatch
+
+
+class ArticleRecordTests(unittest.TestCase):
+    def test_from_dict_keeps_unknown_keys_in_extra(self):
+        article = Article.from_dict({
+            "title": "말톡 후기",
+            "link": "https://blog.example.com/1",
+            "translation_status": "translated",
+        })
+
+        self.assertEqual("말톡 후기", article["title"])
+        self.assertEqual("translated", article["translation_status"])
+        self.assertIn("translation_status", article)
+        self.assertEqual("translated", article.to_dict()["translation_status"])
+
+    def test_dict_shim_get_matches_missing_key_semantics(self):
+        article = Article(title="Roaming", link="https://example.com")
+
+        self.assertEqual("", article.get("source_domain", ""))
+        self.assertIsNone(article.get("published"))
+        self.assertEqual("fallback", article.get("unknown", "fallback"))
+        with self.assertRaises(KeyError):
+            article["unknown"]
+
+    def test_lowercase_cache_invalidated_on_assignment(self):
+        article = Article(title="Travel ESIM")
+        self.assertEqual("travel esim", article.title_lower)
+
+        article["title"] = "Roaming NEWS"
+        self.assertEqual("roaming news", article.title_lower)
+
+    def test_contains_reflects_fields_present_in_source_dict(self):
+        article = Article.from_dict({"title": "말톡", "link": "https://a.example/1"})
+
+        self.assertIn("title", article)
+        self.assertNotIn("published", article)
+        self.assertEqual("fallback", article.get("source_domain", "fallback"))
+        self.assertEqual(["title", "link"], article.keys())
+        self.assertIsNone(article.extra)
+
+        article["published"] = None
+        self.assertIn("published", article)
+        self.assertIn("published", Article(title="direct"))
+
+    def test_articles_are_unhashable(self):
+        with self.assertRaises(TypeError):
+            hash(Article(title="a"))
+
+    def test_slots_reject_unknown_attributes(self):
+        article = Article()
+        with self.assertRaises(AttributeError):
+            article.unknown_field = "x"
+
+    def test_batch_take_and_slice_return_batches(self):
+        batch = ArticleBatch([{"title": f"t{i}", "link": f"l{i}"} for i in range(5)])
+
+        self.assertEqual(["t1", "t3"], [a.title for a in batch.take([1, 3])])
+        self.assertIsInstance(batch[:2], ArticleBatch)
+        self.assertEqual(["l0", "l1"], batch[:2].column("link"))
+
+
+class ArticleBatchFilterTests(unittest.TestCase):
+    def test_filters_accept_dicts_and_return_batches(self):
+        now = datetime(2026, 3, 30, 9, 0, tzinfo=timezone.utc)
+        articles = [
+            {"title": "<b>말톡</b> 후기", "snippet": "리뷰", "link": "https://a.example.com/1", "published": now},
+            {"title": "쿠폰 광고", "snippet": "광고", "link": "https://a.example.com/2", "published": now},
+            {"title": "말톡 후기", "snippet": "중복", "link": "https://a.example.com/3", "published": now},
+        ]
+
+        time_filter = TimeFilter(start_time=datetime(2026, 3, 29, tzinfo=timezone.utc))
+        keyword_filter = KeywordFilter(blacklist_domains=[], excluded_keywords=["광고"])
+
+        batch = time_filter.filter_articles(articles)
+        batch = keyword_filter.filter_articles(batch)
+        batch = Deduplicator().deduplicate_within_category(batch)
+
+        self.assertIsInstance(batch, ArticleBatch)
+        self.assertEqual(["말톡 후기"], [a.title for a in batch])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,138 @@
+from datetime import datetime, timezone
+import os
+import tempfile
+import unittest
+from unittest.mock import patch
+
+from analyzers.summarizer import Summarizer
+from filters.deduplicator import Deduplicator
+from notifiers.web_generator import WebGenerator
+from storage.article_store import ArticleStore
+from utils.article import Article, ArticleBatch
+from utils.time_windows import get_collection_window_kst
+
+
+def _article(index: int) -> Article:
+    return Article(
+        title=f"말톡 후기 {index}",
+        link=f"https://blog.example.com/{index}",
+        snippet="실사용 리뷰",
+        source="Naver Blog",
+        published=datetime(2026, 3, 30, 9, index, tzinfo=timezone.utc),
+        quality_flags=["sample"],
+    )
+
+
+class ArticleStoreTests(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmp.cleanup)
+        self.store = ArticleStore(os.path.join(self.tmp.name, "store", "news.db"))
+        self.addCleanup(self.store.close)
+
+    def test_uses_wal_journal(self):
+        mode = self.store._execute("PRAGMA journal_mode")[0][0]
+        self.assertEqual("wal", mode)
+
+    def test_articles_round_trip_by_run(self):
+        self.store.start_run("run-1")
+        self.store.save_articles("run-1", {"voc_esim": ArticleBatch([_article(1), _article(2)])})
+
+        loaded = self.store.load_articles("run-1")
+
+        self.assertEqual(["말톡 후기 1", "말톡 후기 2"], [a.title for a in loaded["voc_esim"]])
+        self.assertEqual(_article(1).published, loaded["voc_esim"][0].published)
+        self.assertEqual(["sample"], loaded["voc_esim"][0].quality_flags)
+        self.assertEqual("voc_esim", loaded["voc_esim"][0].category)
+
+    def test_find_summaries_chunks_large_link_lists(self):
+        links = [f"https://blog.example.com/{index}" for index in range(1200)]
+        self.store.save_summaries("run-1", "voc_esim", [{"title": "이전", "link": link} for link in links])
+        self.store.save_summaries("run-2", "voc_esim", [{"title": "최신", "link": links[-1]}])
+
+        with patch("storage.article_store.QUERY_CHUNK_SIZE", 500):
+            found = self.store.find_summaries("voc_esim", links)
+
+        self.assertEqual(1200, len(found))
+        self.assertEqual("최신", found[links[-1]]["title"])
+
+    def test_analyzed_data_restores_report_input(self):
+        self.store.start_run("run-1")
+        self.store.save_summaries("run-1", "voc_esim", [
+            {"index": 1, "title": "요약 제목", "summary": "요약", "link": "https://blog.example.com/1"},
+        ])
+        self.store.save_insights("run-1", {"strategic_insight": "인사이트", "key_findings": ["a"], "recommendations": []})
+        self.store.save_external_alerts("run-1", [{"title": "공지", "link": "https://0404.go.kr/1"}])
+
+        data = self.store.load_analyzed_data("run-1")
+
+        self.assertEqual("인사이트", data["strategic_insight"])
+        self.assertEqual("요약 제목", data["section_voc_esim"][0]["title"])
+        self.assertEqual("공지", data["external_alerts"][0]["title"])
+
+        history_path = WebGenerator(store=self.store).generate_from_store(
+            "run-1", output_path=os.path.join(self.tmp.name, "web", "daily_report.html")
+        )
+        with open(history_path, encoding="utf-8") as f:
+            self.assertIn("요약 제목", f.read())
+
+    def test_reported_links_only_counts_completed_earlier_windows(self):
+        earlier = get_collection_window_kst(now_utc=datetime(2026, 3, 30, 0, 0, tzinfo=timezone.utc))
+        current = get_collection_window_kst(now_utc=datetime(2026, 3, 31, 0, 0, tzinfo=timezone.utc))
+        for run_id, window, index in (("done", earlier, 1), ("failed", earlier, 2), ("same-window", current, 3)):
+            self.store.start_run(run_id, window)
+            self.store.save_articles(run_id, {"voc_esim": ArticleBatch([_article(index)])})
+        self.store.finish_run("done")
+        self.store.finish_run("failed", status="failed")
+        self.store.finish_run("same-window")
+        links = [_article(index).link for index in range(1, 5)]
+
+        with patch("storage.article_store.QUERY_CHUNK_SIZE", 2):
+            reported = self.store.reported_links(links, current.start_utc)
+
+        self.assertEqual({_article(1).link}, reported)
+
+        deduplicator = Deduplicator(store=self.store, reported_before=current.start_utc)
+        unique = deduplicator.deduplicate_within_category([_article(1), _article(2), _article(3)])
+        self.assertEqual([_article(2).link, _article(3).link], [a.link for a in unique])
+
+
+class SummarizerCacheTests(unittest.TestCase):
+    def setUp(self):
+        self.store = ArticleStore(":memory:")
+        self.addCleanup(self.store.close)
+        self.store.save_summaries("old-run", "voc_esim", [
+            {"index": 1, "title": "캐시 요약", "summary": "이전 요약", "link": "https://blog.example.com/1"},
+        ])
+
+    def test_only_uncached_articles_are_sent_to_ai(self):
+        summarizer = Summarizer(
+            api_key="test", base_url="https://api.openai.com/v1", model="gpt-4o-mini",
+            store=self.store, run_id="new-run",
+        )
+        fresh = [{"index": 1, "title": "새 요약", "summary": "신규", "link": "https://blog.example.com/2"}]
+
+        with patch.object(summarizer, "_summarize_category", return_value=fresh) as summarize:
+            result = summarizer.analyze({"voc_esim": [_article(1), _article(2)]})
+
+        prompt_text = summarize.call_args[0][1]
+        self.assertNotIn("https://blog.example.com/1", prompt_text)
+        self.assertIn("https://blog.example.com/2", prompt_text)
+        self.assertEqual(["캐시 요약", "새 요약"], [item["title"] for item in result["voc_esim"]])
+        self.assertEqual([1, 2], [item["index"] for item in result["voc_esim"]])
+        self.assertEqual(2, len(self.store.load_summaries("new-run")["voc_esim"]))
+
+    def test_full_cache_hit_skips_ai_call(self):
+        summarizer = Summarizer(
+            api_key="test", base_url="https://api.openai.com/v1", model="gpt-4o-mini", store=self.store,
+        )
+
+        with patch.object(summarizer, "_summarize_category") as summarize:
+            result = summarizer.analyze({"voc_esim": [_article(1)]})
+
+        summarize.assert_not_called()
+        self.assertEqual("캐시 요약", result["voc_esim"][0]["title"])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,154 @@
+from datetime import datetime
+import json
+import os
+import tempfile
+import unittest
+from unittest.mock import patch
+
+import main
+from config.settings import APISettings, EmailSettings, Settings
+from notifiers.web_generator import WebGenerator
+from storage.article_store import ArticleStore
+from utils import file_lock
+from utils.article import Article
+from utils.exceptions import LockHeldError
+from utils.file_lock import FileLock
+from utils.time_windows import KST, split_backfill_windows
+
+
+def _settings() -> Settings:
+    return Settings(
+        api=APISettings("id", "secret", "key", "cx", "openai", "https://api.openai.com/v1"),
+        email=EmailSettings("user@example.com", "password", []),
+    )
+
+
+class SplitBackfillWindowsTests(unittest.TestCase):
+    def test_daily_windows_end_at_report_hour(self):
+        windows = split_backfill_windows("2026-03-03", "2026-03-04")
+
+        self.assertEqual(2, len(windows))
+        self.assertEqual(datetime(2026, 3, 2, 9, tzinfo=KST), windows[0].start_kst)
+        self.assertEqual(datetime(2026, 3, 3, 9, tzinfo=KST), windows[0].end_kst)
+        self.assertFalse(windows[0].is_monday_special)
+
+    def test_monday_uses_weekend_window(self):
+        windows = split_backfill_windows("2026-03-09", "2026-03-09")
+
+        self.assertTrue(windows[0].is_monday_special)
+        self.assertEqual(datetime(2026, 3, 6, 9, tzinfo=KST), windows[0].start_kst)
+
+    def test_weekend_windows_are_covered_by_monday(self):
+        windows = split_backfill_windows("2026-03-06", "2026-03-09")
+
+        self.assertEqual(["2026-03-06", "2026-03-09"], [w.end_kst.date().isoformat() for w in windows])
+        self.assertEqual(4, len(split_backfill_windows("2026-03-06", "2026-03-09", skip_weekends=False)))
+
+    def test_reversed_range_rejected(self):
+        with self.assertRaises(ValueError):
+            split_backfill_windows("2026-03-05", "2026-03-01")
+
+
+class RunBackfillTests(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmp.cleanup)
+        self.lock_path = os.path.join(self.tmp.name, "pipeline.lock")
+        for patcher in (
+            patch.object(main, "BACKFILL_STATE_DIR", self.tmp.name),
+            patch.object(file_lock, "PIPELINE_LOCK_PATH", self.lock_path),
+        ):
+            patcher.start()
+            self.addCleanup(patcher.stop)
+
+    def test_resume_skips_completed_windows(self):
+        calls = []
+
+        def fake_window(window, settings, fetch_limit, store=None):
+            calls.append(window.end_kst.date().isoformat())
+            if window.end_kst.day == 4:
+                raise RuntimeError("quota exceeded")
+            return f"history/{window.end_kst:%Y%m%d}.html"
+
+        with patch.object(main, "run_backfill_window", side_effect=fake_window):
+            state = main.run_backfill(_settings(), "2026-03-03", "2026-03-05", max_workers=2)
+        self.assertEqual(2, len(state["completed"]))
+        self.assertIn("20260304_090000", state["failed"])
+
+        calls.clear()
+        with patch.object(main, "run_backfill_window", return_value="history/retry.html"):
+            state = main.run_backfill(_settings(), "2026-03-03", "2026-03-05")
+        self.assertEqual(3, len(state["completed"]))
+        self.assertEqual({}, state["failed"])
+
+        with open(os.path.join(self.tmp.name, "backfill_20260303_20260305.json"), encoding="utf-8") as f:
+            self.assertEqual(state, json.load(f))
+
+
+    def test_refuses_to_run_while_pipeline_lock_is_held(self):
+        holder = FileLock(self.lock_path, owner="scheduler")
+        self.assertTrue(holder.acquire())
+        self.addCleanup(holder.release)
+
+        with patch.object(main, "run_backfill_window") as run_window, self.assertRaises(LockHeldError):
+            main.run_backfill(_settings(), "2026-03-03", "2026-03-03")
+        run_window.assert_not_called()
+
+    def test_failed_windows_return_nonzero_exit_code(self):
+        with patch("config.settings.load_settings", return_value=_settings()), \
+                patch("storage.article_store.open_article_store", return_value=None), \
+                patch.object(main, "setup_logger"), \
+                patch.object(main, "run_backfill_window", side_effect=RuntimeError("quota exceeded")):
+            self.assertEqual(1, main.main(["--backfill", "2026-03-03", "2026-03-03"]))
+
+
+class BackfillWindowStoreTests(unittest.TestCase):
+    def setUp(self):
+        self.store = ArticleStore(":memory:")
+        self.addCleanup(self.store.close)
+        self.window = split_backfill_windows("2026-03-03", "2026-03-03")[0]
+
+    def _run_window(self):
+        with patch.object(main, "analyze_articles", return_value={}), \
+                patch.object(main, "collect_external_alerts", return_value=[]), \
+                patch.object(main, "build_web_generator") as generator, \
+                patch.object(main, "complete_run"), \
+                patch.object(main, "collect_articles", return_value={}) as collect:
+            generator.return_value.generate.return_value = "history/20260303.html"
+            main.run_backfill_window(self.window, _settings(), store=self.store)
+        return collect.call_args.kwargs["stored_articles"]
+
+    def test_reuses_articles_stored_for_the_same_window(self):
+        article = Article(title="로밍 요금", link="https://a.example/1", published=self.window.end_utc)
+        self.store.start_run("20260303_090000_aaaaaa", self.window)
+        self.store.save_articles("20260303_090000_aaaaaa", {"roaming": [article]})
+
+        stored = self._run_window()
+
+        self.assertEqual(["로밍 요금"], [a.title for a in stored["roaming"]])
+
+    def test_recollects_with_warning_when_nothing_is_stored(self):
+        with self.assertLogs("news_collector", level="WARNING") as logs:
+            self.assertIsNone(self._run_window())
+        self.assertIn("no stored articles", logs.output[0])
+
+
+class WebGeneratorHistoryOnlyTests(unittest.TestCase):
+    def test_history_only_generation_keeps_latest_report(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            output_path = os.path.join(tmp, "daily_report.html")
+            history_path = WebGenerator().generate(
+                {},
+                output_path=output_path,
+                report_time=datetime(2026, 3, 3, 9, tzinfo=KST),
+                update_latest=False,
+            )
+
+            self.assertFalse(os.path.exists(output_path))
+            self.assertTrue(history_path.endswith("daily_report_20260303_090000.html"))
+            with open(history_path, encoding="utf-8") as f:
+                self.assertIn("2026년 03월 03일", f.read())
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,56 @@
+from datetime import datetime, timezone
+import unittest
+
+import requests
+
+from benchmarks.pipeline_bench import STAGES, compare_results, run_benchmark
+from benchmarks.stub_server import FixtureStubServer
+from collectors.naver_collector import NaverCollector
+
+
+class FixtureStubServerTests(unittest.TestCase):
+    def test_naver_items_are_replicated_and_shifted_to_now(self):
+        now = datetime(2026, 10, 19, 3, 0, tzinfo=timezone.utc)
+        with FixtureStubServer(scale=3, now=now) as stub:
+            collector = NaverCollector(client_id="id", client_secret="secret")
+            collector.base_url = stub.naver_base_url
+            collector.request_delay = 0
+            first = collector.collect_from_news("KT 로밍", limit=100)
+            second = collector.collect_from_news("LGU+ 로밍", limit=100)
+
+        self.assertEqual(30, len(first))
+        self.assertEqual(datetime(2026, 10, 19, 2, 41, tzinfo=timezone.utc), first[0].published)
+        self.assertEqual(first[0].title, second[0].title)
+        self.assertNotEqual(first[0].link, second[0].link)
+        self.assertEqual(27, len({article.title for article in first}))  # 녹화본의 중복 제목은 복제본마다 유지
+        self.assertEqual(2, stub.request_counts["naver/news"])
+
+    def test_unknown_route_returns_404(self):
+        with FixtureStubServer() as stub:
+            response = requests.get(f"{stub.url}/v1/unknown", timeout=5)
+
+        self.assertEqual(404, response.status_code)
+
+
+class PipelineBenchmarkTests(unittest.TestCase):
+    def test_run_benchmark_times_every_stage(self):
+        result = run_benchmark(scale=2, max_keywords=1)
+
+        self.assertEqual(set(STAGES), set(result["stages"]))
+        self.assertGreater(result["counts"]["raw"], result["counts"]["filtered"])
+        self.assertGreater(result["counts"]["summaries"], 0)
+        self.assertEqual(20, result["counts"]["external_alerts"])
+        self.assertIn("openai", result["requests"])
+
+    def test_compare_flags_slow_stages_above_noise_floor(self):
+        baseline = {"runs": [{"scale": 10, "stages": {"collect": 1.0, "filter": 0.2, "render": 0.001}}]}
+        current = {"runs": [{"scale": 10, "stages": {"collect": 1.1, "filter": 0.4, "render": 0.01}}]}
+
+        regressions = compare_results(current, baseline, max_regression=0.25)
+
+        self.assertEqual(1, len(regressions))
+        self.assertIn("filter", regressions[0])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,106 @@
+import os
+import tempfile
+import unittest
+from unittest.mock import patch
+
+from config import category_config
+from config.category_config import CategoryConfigService, get_category_config, validate_category_config
+from utils.exceptions import ValidationError
+
+CONFIG = """
+categories:
+  roaming:
+    id: 0
+    name: "Roaming"
+    sources: ["naver_news"]
+    keywords: ["{keyword}"]
+filters:
+  blacklist_domains: ["promo"]
+  excluded_keywords: ["{excluded}"]
+"""
+
+
+class CategoryConfigServiceTests(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmp.cleanup)
+        self.path = os.path.join(self.tmp.name, "categories.yaml")
+        self.mtime = 1_700_000_000
+        self._write(keyword="로밍", excluded="광고")
+
+    def _write(self, text: str = CONFIG, **fields) -> None:
+        with open(self.path, "w", encoding="utf-8") as f:
+            f.write(text.format(**fields) if fields else text)
+        self.mtime += 10  # 같은 초 안의 재저장도 변경으로 보이게 mtime을 명시한다
+        os.utime(self.path, (self.mtime, self.mtime))
+
+    def test_parses_once_and_reloads_only_when_content_changes(self):
+        service = CategoryConfigService(self.path)
+        with patch.object(category_config, "compile_category_config", wraps=category_config.compile_category_config) as compile_:
+            first = service.get()
+            self.assertIs(first, service.get())
+
+            os.utime(self.path, (self.mtime + 5, self.mtime + 5))  # 내용은 그대로
+            self.assertIs(first, service.get())
+            self.assertEqual(1, compile_.call_count)
+
+            self._write(keyword="eSIM", excluded="쿠폰")
+            second = service.get()
+
+        self.assertEqual(2, compile_.call_count)
+        self.assertEqual(["eSIM"], second.categories["roaming"]["keywords"])
+        self.assertFalse(second.keyword_filter.validate({"title": "쿠폰 증정", "link": "https://a.example/1"}))
+        self.assertTrue(second.keyword_filter.validate({"title": "광고", "link": "https://a.example/1"}))
+
+    def test_invalid_edit_keeps_last_good_config(self):
+        service = CategoryConfigService(self.path)
+        good = service.get()
+
+        self._write("categories: [unclosed")
+        with self.assertLogs("config.category_config", level="ERROR"):
+            self.assertIs(good, service.get())
+
+        self._write(CONFIG.replace("naver_news", "bing"), keyword="로밍", excluded="광고")
+        with self.assertLogs("config.category_config", level="ERROR") as logs:
+            self.assertIs(good, service.get())
+        self.assertIn("unknown source(s): bing", logs.output[0])
+
+    def test_invalid_config_without_previous_version_raises(self):
+        self._write("categories: {}\nfilters: {}\n")
+        with self.assertRaisesRegex(ValidationError, "categories must be a non-empty mapping"):
+            CategoryConfigService(self.path).get()
+
+    def test_repository_config_is_valid(self):
+        config = get_category_config()
+
+        self.assertIn("global_trend", config.categories)
+        self.assertIs(config, get_category_config("config/categories.yaml"))
+
+
+class ValidateCategoryConfigTests(unittest.TestCase):
+    def test_reports_all_errors(self):
+        data = {
+            "categories": {
+                "a": {"id": 1, "name": "A", "sources": ["naver_news"], "keywords": ["x"]},
+                "b": {"id": 1, "name": "", "sources": [], "keywords": ["ok", ""]},
+            },
+            "filters": {"blacklist_domains": [], "excluded_keywords": ["x"], "global_trend": {"required_keywords": "x"}},
+        }
+
+        with self.assertRaises(ValidationError) as ctx:
+            validate_category_config(data)
+
+        message = str(ctx.exception)
+        for expected in (
+            "categories.b.id 1 duplicates categories.a.id",
+            "categories.b.name must be a non-empty string",
+            "categories.b.sources must be a non-empty list",
+            "categories.b.keywords[1] must be a non-empty string",
+            "filters.blacklist_domains must be a non-empty list",
+            "filters.global_trend.required_keywords must be a list",
+        ):
+            self.assertIn(expected, message)
+
+
+if __name__ == "__main__":
+    unittest.main()
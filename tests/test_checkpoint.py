@@ -0,0 +1,209 @@
+from datetime import datetime, timezone
+import os
+from types import SimpleNamespace
+import tempfile
+import unittest
+from unittest.mock import MagicMock, patch
+
+import main
+from analyzers.summarizer import Summarizer
+from config.settings import APISettings, EmailSettings, Settings
+from filters.keyword_filter import KeywordFilter
+from utils import metrics
+from utils.article import ArticleBatch
+from utils.checkpoint import (
+    STAGE_INSIGHTS,
+    STATUS_COMPLETED,
+    STATUS_FAILED,
+    RunCheckpoint,
+    list_checkpoint_runs,
+    prune_checkpoints,
+)
+from utils.exceptions import CheckpointNotFoundError
+from utils.time_windows import get_collection_window_kst
+
+
+def _settings() -> Settings:
+    return Settings(
+        api=APISettings("id", "secret", "key", "cx", "openai", "https://api.openai.com/v1"),
+        email=EmailSettings("user@example.com", "password", []),
+    )
+
+
+def _window():
+    return get_collection_window_kst(now_utc=datetime(2026, 3, 3, 0, 0, tzinfo=timezone.utc))
+
+
+class RunCheckpointTests(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmp.cleanup)
+
+    def test_articles_round_trip_with_published_datetime(self):
+        published = datetime(2026, 3, 2, 10, 30, tzinfo=timezone.utc)
+        checkpoint = RunCheckpoint.create(self.tmp.name, "20260303_090000_aaaaaa", _window())
+        checkpoint.save_articles("raw/roaming", ArticleBatch([
+            {"title": "로밍 요금", "link": "https://a.example/1", "published": published},
+        ]))
+
+        reopened = RunCheckpoint.open(self.tmp.name, "20260303_090000_aaaaaa")
+        self.assertTrue(reopened.has("raw/roaming"))
+        self.assertFalse(reopened.has("filtered/roaming"))
+        articles = reopened.load_articles("raw/roaming")
+        self.assertEqual(published, articles[0]["published"])
+        self.assertEqual(_window().start_utc, reopened.window.start_utc)
+        self.assertTrue(os.path.exists(os.path.join(self.tmp.name, "20260303_090000_aaaaaa", "raw__roaming.json")))
+
+    def test_latest_incomplete_skips_completed_runs(self):
+        RunCheckpoint.create(self.tmp.name, "20260302_090000_aaaaaa", _window()).mark(STATUS_FAILED)
+        RunCheckpoint.create(self.tmp.name, "20260303_090000_bbbbbb", _window()).mark(STATUS_COMPLETED)
+
+        latest = RunCheckpoint.latest_incomplete(self.tmp.name)
+        self.assertEqual("20260302_090000_aaaaaa", latest.run_id)
+
+    def test_latest_and_discard_by_stage_prefix(self):
+        RunCheckpoint.create(self.tmp.name, "20260302_090000_aaaaaa", _window())
+        checkpoint = RunCheckpoint.create(self.tmp.name, "20260303_090000_bbbbbb", _window())
+        checkpoint.mark(STATUS_COMPLETED)
+        for stage in ("filtered/roaming", "filtered/competitors", "summaries/roaming", STAGE_INSIGHTS):
+            checkpoint.save(stage, [])
+
+        latest = RunCheckpoint.latest(self.tmp.name)
+        self.assertEqual("20260303_090000_bbbbbb", latest.run_id)
+        self.assertEqual(["competitors", "roaming"], latest.categories("filtered"))
+
+        self.assertEqual(["insights", "summaries/roaming"], latest.discard("summaries", STAGE_INSIGHTS))
+        reopened = RunCheckpoint.open(self.tmp.name, latest.run_id)
+        self.assertEqual(["filtered/competitors", "filtered/roaming"], reopened.completed_stages())
+        self.assertFalse(os.path.exists(os.path.join(latest.dir, "summaries__roaming.json")))
+
+    def test_prune_keeps_most_recent_runs(self):
+        for day in range(1, 5):
+            RunCheckpoint.create(self.tmp.name, f"2026030{day}_090000_aaaaaa", _window())
+
+        self.assertEqual(2, prune_checkpoints(self.tmp.name, keep_runs=2))
+        self.assertEqual(
+            ["20260303_090000_aaaaaa", "20260304_090000_aaaaaa"],
+            sorted(list_checkpoint_runs(self.tmp.name)),
+        )
+
+
+class SummarizerCheckpointTests(unittest.TestCase):
+    def test_saved_categories_are_not_summarized_again(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            checkpoint = RunCheckpoint.create(tmp, "20260303_090000_aaaaaa", _window())
+            checkpoint.save("summaries/roaming", [{"index": 1, "title": "저장된 요약"}])
+            summarizer = Summarizer(api_key="key", base_url="https://api.openai.com/v1", model="gpt-4o-mini")
+            data = {
+                "roaming": ArticleBatch([{"title": "a", "link": "https://a.example/1"}]),
+                "competitors": ArticleBatch([{"title": "b", "link": "https://b.example/1"}]),
+            }
+
+            with patch.object(summarizer, "_summarize_category", return_value=[{"index": 1, "title": "신규"}]) as call:
+                result = summarizer.analyze(data, checkpoint=checkpoint)
+
+            call.assert_called_once()
+            self.assertEqual("competitors", call.call_args.args[0])
+            self.assertEqual([{"index": 1, "title": "저장된 요약"}], result["roaming"])
+            self.assertTrue(checkpoint.has("summaries/competitors"))
+
+
+class CollectArticlesResumeTests(unittest.TestCase):
+    def test_restored_categories_seed_deduplication(self):
+        published = datetime(2026, 3, 2, 10, 0, tzinfo=timezone.utc)
+        config = SimpleNamespace(
+            categories={
+                "roaming": {"id": 0, "name": "Roaming", "sources": ["naver_news"], "keywords": ["로밍"]},
+                "esim": {"id": 1, "name": "eSIM", "sources": ["naver_news"], "keywords": ["eSIM"]},
+            },
+            keyword_filter=KeywordFilter(blacklist_domains=[], excluded_keywords=[]),
+        )
+        with tempfile.TemporaryDirectory() as tmp:
+            checkpoint = RunCheckpoint.create(tmp, "20260303_090000_aaaaaa", _window())
+            checkpoint.save_articles("filtered/roaming", ArticleBatch([
+                {"title": "로밍 요금 인하", "link": "https://a.example/1", "published": published},
+            ]))
+            checkpoint.save_articles("raw/esim", ArticleBatch([
+                {"title": "로밍 요금 인하", "link": "https://b.example/2", "published": published},
+                {"title": "eSIM 개통", "link": "https://b.example/3", "published": published},
+            ]))
+
+            with patch("config.category_config.get_category_config", return_value=config):
+                collected = main.collect_articles(_settings(), window=_window(), checkpoint=checkpoint)
+
+        self.assertEqual(["eSIM 개통"], [article.title for article in collected["esim"]])
+
+
+class NewsCollectorFailureTests(unittest.TestCase):
+    def test_failed_pipeline_marks_checkpoint_and_store_run(self):
+        with tempfile.TemporaryDirectory() as tmp, \
+                patch.object(main, "DEFAULT_CHECKPOINT_DIR", tmp), \
+                patch.object(metrics, "DEFAULT_REPORT_DIR", os.path.join(tmp, "metrics")), \
+                patch("config.settings.load_settings", return_value=_settings()), \
+                patch("storage.article_store.open_article_store", return_value=MagicMock()) as open_store, \
+                patch.object(main, "setup_logger"), \
+                patch.object(main, "collect_articles", side_effect=RuntimeError("naver down")):
+            collector = main.NewsCollector()
+            with self.assertRaises(RuntimeError):
+                collector.run_full_pipeline()
+
+            failed = RunCheckpoint.open(tmp, collector.run_id)
+
+        self.assertEqual(STATUS_FAILED, failed.status)
+        self.assertEqual("naver down", failed.manifest["error"])
+        open_store.return_value.finish_run.assert_called_once_with(collector.run_id, status="failed")
+
+
+class RunDailyPipelineResumeTests(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmp.cleanup)
+        for patcher in (
+            patch.object(main, "DEFAULT_CHECKPOINT_DIR", self.tmp.name),
+            patch.object(metrics, "DEFAULT_REPORT_DIR", os.path.join(self.tmp.name, "metrics")),
+        ):
+            patcher.start()
+            self.addCleanup(patcher.stop)
+
+    def test_failed_run_resumes_with_same_run_id_and_window(self):
+        settings = _settings()
+        calls = []
+
+        def fake_collect(settings, window=None, fetch_limit=5, store=None, run_id=None, checkpoint=None):
+            calls.append((run_id, window.start_utc))
+            checkpoint.save_articles("filtered/roaming", ArticleBatch())
+            return {"roaming": ArticleBatch([{"title": "a", "link": "https://a.example/1"}])}
+
+        def fake_analyze(collected, settings, store=None, run_id=None, checkpoint=None):
+            checkpoint.save(STAGE_INSIGHTS, {})
+            return {}
+
+        with patch.object(main, "collect_articles", side_effect=fake_collect), \
+                patch.object(main, "analyze_articles", side_effect=RuntimeError("LLM quota")):
+            with self.assertRaises(RuntimeError):
+                main.run_daily_pipeline(settings, window=_window())
+
+        failed = RunCheckpoint.latest_incomplete(self.tmp.name)
+        self.assertEqual(STATUS_FAILED, failed.status)
+        self.assertEqual("LLM quota", failed.manifest["error"])
+
+        with patch.object(main, "collect_articles", side_effect=fake_collect), \
+                patch.object(main, "analyze_articles", side_effect=fake_analyze), \
+                patch.object(main, "collect_external_alerts", return_value=[]), \
+                patch.object(main, "send_report", return_value="history/report.html") as send:
+            path = main.run_daily_pipeline(settings, resume_run_id="latest")
+
+        self.assertEqual("history/report.html", path)
+        send.assert_called_once()
+        self.assertEqual(calls[0], calls[1])
+        completed = RunCheckpoint.open(self.tmp.name, failed.run_id)
+        self.assertEqual(STATUS_COMPLETED, completed.status)
+        self.assertIsNone(RunCheckpoint.latest_incomplete(self.tmp.name))
+
+    def test_resume_unknown_run_id_raises(self):
+        with self.assertRaises(CheckpointNotFoundError):
+            main.run_daily_pipeline(_settings(), resume_run_id="20990101_000000_ffffff", store=MagicMock())
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,91 @@
+import os
+import tempfile
+import time
+import unittest
+from unittest.mock import patch
+
+from storage.job_queue import JobQueue
+
+
+class JobQueueTests(unittest.TestCase):
+    def setUp(self):
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        self.path = os.path.join(tmp.name, "jobs.db")
+        self.queue = JobQueue(self.path)
+        self.addCleanup(self.queue.close)
+
+    def test_state_and_events_survive_reopen(self):
+        job_id, created = self.queue.enqueue("analysis")
+        self.assertTrue(created)
+        self.assertEqual("analysis", self.queue.claim("worker-a")["kind"])
+        self.queue.update(job_id, "stage", stage="collect", progress=10)
+        self.queue.update(job_id, "completed", status="completed", progress=100, result={"total": 3})
+
+        reopened = JobQueue(self.path)
+        self.addCleanup(reopened.close)
+        snapshot = reopened.get(job_id)
+        events, finished = reopened.events(job_id, after=1)
+
+        self.assertEqual("completed", snapshot["status"])
+        self.assertEqual({"total": 3}, snapshot["result"])
+        self.assertTrue(finished)
+        self.assertEqual([(2, "completed")], [(e["id"], e["event"]) for e in events])
+        self.assertEqual("collect", events[0]["data"]["stage"])
+
+    def test_wait_events_backs_off_while_idle(self):
+        job_id, _ = self.queue.enqueue("analysis")
+        clock = [0.0]
+        sleeps = []
+
+        def sleep(seconds):
+            sleeps.append(seconds)
+            clock[0] += seconds
+
+        with patch("storage.job_queue.time.monotonic", side_effect=lambda: clock[0]), \
+                patch("storage.job_queue.time.sleep", side_effect=sleep):
+            events, finished = self.queue.wait_events(job_id, after=1, timeout=20)
+
+        self.assertEqual(([], False), (events, finished))
+        self.assertEqual([0.5, 1.0, 2.0, 4.0, 4.0, 4.0, 4.0, 0.5], sleeps)
+
+    def test_claim_is_exclusive_across_connections(self):
+        job_id, _ = self.queue.enqueue("analysis")
+        other = JobQueue(self.path)
+        self.addCleanup(other.close)
+
+        self.assertEqual(job_id, other.claim("worker-b")["job_id"])
+        self.assertIsNone(self.queue.claim("worker-a"))
+        self.assertEqual("running", self.queue.get(job_id)["status"])
+        self.assertEqual((job_id, False), self.queue.enqueue("analysis"))
+
+    def test_stale_running_job_marked_failed(self):
+        job_id, _ = self.queue.enqueue("analysis")
+        self.queue.claim("worker-a")
+
+        with patch("storage.job_queue.time.time", return_value=time.time() + 600):
+            self.assertEqual(1, self.queue.recover_stale(300))
+
+        snapshot = self.queue.get(job_id)
+        self.assertEqual("failed", snapshot["status"])
+        self.assertTrue(snapshot["error"])
+        self.assertNotEqual(job_id, self.queue.enqueue("analysis")[0])
+
+    def test_prune_removes_expired_and_overflow_jobs(self):
+        finished = []
+        for _ in range(3):
+            job_id, _ = self.queue.enqueue("analysis")
+            self.queue.claim("worker-a")
+            self.queue.update(job_id, "completed", status="completed")
+            finished.append(job_id)
+
+        self.assertEqual(1, self.queue.prune(ttl_seconds=3600, max_jobs=2))
+        self.assertIsNone(self.queue.get(finished[0]))
+        self.assertIsNone(self.queue.events(finished[0]))
+
+        with patch("storage.job_queue.time.time", return_value=time.time() + 7200):
+            self.assertEqual(2, self.queue.prune(ttl_seconds=3600))
+
+
+if __name__ == "__main__":
+    unittest.main()
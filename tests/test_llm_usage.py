@@ -0,0 +1,115 @@
+import unittest
+from types import SimpleNamespace
+from unittest.mock import MagicMock, patch
+
+from analyzers.base import BaseAnalyzer
+from analyzers.usage import UsageTracker, parse_price_overrides, summarize_usage
+from notifiers.web_generator import WebGenerator
+from storage.article_store import ArticleStore
+from web import routes
+from web.app import create_app
+
+
+class _EchoAnalyzer(BaseAnalyzer):
+    def analyze(self, data):
+        return self._call_ai([{"role": "user", "content": "hi"}], category="voc_esim")
+
+
+class UsageTrackerTests(unittest.TestCase):
+    def test_cost_uses_longest_model_prefix(self):
+        tracker = UsageTracker()
+        record = tracker.record("voc_esim", "gpt-4o-mini-2024-07-18", 1.2, prompt_tokens=1_000_000, completion_tokens=0)
+
+        self.assertEqual(0.15, record["cost_usd"])
+
+    def test_unknown_model_makes_total_cost_unknown(self):
+        tracker = UsageTracker(prices=parse_price_overrides("local-llm=0/0"))
+        tracker.record("voc_esim", "local-llm", 0.5, prompt_tokens=100, completion_tokens=20)
+        tracker.record("insights", "mystery-model", 2.0, prompt_tokens=300, completion_tokens=50)
+        tracker.record("insights", "mystery-model", 0.1, status="error")
+
+        summary = tracker.summary()
+
+        self.assertEqual(3, summary["calls"])
+        self.assertEqual(1, summary["failed_calls"])
+        self.assertEqual(470, summary["total_tokens"])
+        self.assertIsNone(summary["cost_usd"])
+        self.assertEqual(0, summary["categories"]["voc_esim"]["cost_usd"])
+        self.assertEqual(2, summary["models"]["mystery-model"]["calls"])
+
+    def test_invalid_price_override_rejected(self):
+        with self.assertRaises(ValueError):
+            parse_price_overrides("gpt-4o-mini=0.15")
+
+
+class AnalyzerUsageTests(unittest.TestCase):
+    def test_call_ai_records_tokens_with_category(self):
+        tracker = UsageTracker()
+        analyzer = _EchoAnalyzer(api_key="key", base_url="https://api.openai.com/v1", model="gpt-4o-mini", usage=tracker)
+        analyzer.client = MagicMock()
+        analyzer.client.chat.completions.create.return_value = SimpleNamespace(
+            choices=[SimpleNamespace(message=SimpleNamespace(content='{"summaries": []}'))],
+            usage=SimpleNamespace(prompt_tokens=2000, completion_tokens=500),
+        )
+
+        analyzer.analyze({})
+
+        [record] = tracker.records
+        self.assertEqual("voc_esim", record["category"])
+        self.assertEqual(2000, record["prompt_tokens"])
+        self.assertEqual(500, record["completion_tokens"])
+        self.assertAlmostEqual(0.0006, record["cost_usd"])
+
+
+class UsagePersistenceTests(unittest.TestCase):
+    def setUp(self):
+        self.store = ArticleStore(":memory:")
+        self.addCleanup(self.store.close)
+        self.store.start_run("20260303_090000_aaaaaa")
+        tracker = UsageTracker()
+        tracker.record("voc_esim", "gpt-4o-mini", 1.5, prompt_tokens=1000, completion_tokens=200)
+        tracker.record("insights", "gpt-4o-mini", 3.0, prompt_tokens=4000, completion_tokens=800)
+        self.store.save_llm_usage("20260303_090000_aaaaaa", tracker.records)
+
+    def test_store_round_trip_aggregates_per_category(self):
+        summary = summarize_usage(self.store.load_llm_usage("20260303_090000_aaaaaa"))
+
+        self.assertEqual(2, summary["calls"])
+        self.assertEqual(6000, summary["total_tokens"])
+        self.assertEqual(4800, summary["categories"]["insights"]["total_tokens"])
+        self.assertEqual(4.5, summary["latency_seconds"])
+
+    def test_usage_endpoint(self):
+        client = create_app().test_client()
+        with patch.object(routes, "_get_article_store", return_value=self.store):
+            response = client.get("/api/runs/20260303_090000_aaaaaa/usage")
+            missing = client.get("/api/runs/unknown/usage")
+
+        data = response.get_json()
+        self.assertTrue(data["success"])
+        self.assertEqual(1200, data["categories"]["voc_esim"]["total_tokens"])
+        self.assertEqual(404, missing.status_code)
+
+    def test_usage_endpoint_when_store_disabled(self):
+        client = create_app().test_client()
+        with patch.dict("os.environ", {"ARTICLE_STORE_ENABLED": "false"}), \
+                patch("storage.article_store.ArticleStore") as store_cls:
+            response = client.get("/api/runs/20260303_090000_aaaaaa/usage")
+            search = client.get("/api/search?q=esim")
+
+        self.assertEqual(503, response.status_code)
+        self.assertEqual(503, search.status_code)
+        self.assertFalse(response.get_json()["success"])
+        store_cls.assert_not_called()
+
+    def test_report_metadata_includes_usage_totals(self):
+        summary = summarize_usage(self.store.load_llm_usage("20260303_090000_aaaaaa"))
+
+        metadata = WebGenerator().build_report_metadata({"llm_usage": summary})
+
+        self.assertEqual(6000, metadata["llm_usage"]["total_tokens"])
+        self.assertNotIn("categories", metadata["llm_usage"])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,126 @@
+import json
+import logging
+import logging.handlers
+import os
+import tempfile
+import threading
+import unittest
+
+from utils.logger import (
+    APP_LOGGERS,
+    DebugSampler,
+    bind_log_context,
+    current_log_context,
+    log_context,
+    setup_logger,
+    shutdown_logging,
+)
+
+
+def _record(lineno: int, level: int = logging.DEBUG) -> logging.LogRecord:
+    return logging.LogRecord("collectors.test", level, "collector.py", lineno, "msg", None, None)
+
+
+class SetupLoggerTests(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmp.cleanup)
+        root = logging.getLogger()
+        saved_handlers, saved_level = list(root.handlers), root.level
+        saved_levels = {name: logging.getLogger(name).level for name in APP_LOGGERS}
+
+        def restore():
+            shutdown_logging()
+            root.handlers[:] = saved_handlers
+            root.setLevel(saved_level)
+            for name, level in saved_levels.items():
+                logging.getLogger(name).setLevel(level)
+
+        self.addCleanup(restore)
+
+    def _records(self):
+        shutdown_logging()  # 리스너를 멈춰 큐를 비운다
+        (name,) = os.listdir(self.tmp.name)
+        with open(os.path.join(self.tmp.name, name), encoding="utf-8") as f:
+            return [json.loads(line) for line in f]
+
+    def test_records_from_any_module_are_written_as_json_with_correlation_ids(self):
+        setup_logger(log_dir=self.tmp.name)
+
+        with log_context(run_id=None):
+            with log_context(job_id="job-1"):
+                bind_log_context(run_id="20260302_090000_aaaaaa")
+                logging.getLogger("collectors.naver_collector").info("\n  Collected: %d articles", 3)
+                try:
+                    raise RuntimeError("boom")
+                except RuntimeError:
+                    logging.getLogger("news_collector").exception("Unexpected Error", extra={"category": "voc_esim"})
+            logging.getLogger("web.routes").warning("outside run")
+            after = current_log_context()
+
+        first, error, outside = self._records()
+        self.assertEqual("Collected: 3 articles", first["message"])
+        self.assertEqual("collectors.naver_collector", first["logger"])
+        self.assertEqual("20260302_090000_aaaaaa", first["run_id"])
+        self.assertEqual("job-1", first["job_id"])
+        self.assertIn("RuntimeError: boom", error["exc"])
+        self.assertEqual("voc_esim", error["category"])
+        self.assertNotIn("run_id", outside)
+        self.assertEqual({}, after)
+
+    def test_debug_lines_are_sampled_per_call_site_in_debug_mode(self):
+        setup_logger(log_dir=self.tmp.name, debug_mode=True, debug_sample_every=10)
+        log = logging.getLogger("collectors.mofa_0404_collector")
+
+        with log_context(run_id="run-a"):
+            for i in range(60):
+                log.debug(f"Skipped non-telecom post: {i}")
+
+        records = self._records()
+        self.assertEqual(20 + 4, len(records))  # burst 20 + 30/40/50/60번째
+        self.assertEqual(10, records[-1]["sampled_every"])
+        self.assertNotIn("sampled_every", records[0])
+
+    def test_setup_is_idempotent(self):
+        first = setup_logger(log_dir=self.tmp.name)
+        second = setup_logger(log_dir=self.tmp.name)
+
+        self.assertIs(first, second)
+        queue_handlers = [h for h in logging.getLogger().handlers if isinstance(h, logging.handlers.QueueHandler)]
+        self.assertEqual(1, len(queue_handlers))
+
+
+class LogContextTests(unittest.TestCase):
+    def test_context_is_scoped_to_thread_and_block(self):
+        seen = {}
+        before = current_log_context()
+
+        def other_thread():
+            seen["other"] = current_log_context()
+
+        with log_context(run_id="run-1"):
+            thread = threading.Thread(target=other_thread)
+            thread.start()
+            thread.join()
+            seen["inside"] = current_log_context()
+
+        self.assertEqual("run-1", seen["inside"]["run_id"])
+        self.assertEqual({}, seen["other"])
+        self.assertEqual(before, current_log_context())
+
+
+class DebugSamplerTests(unittest.TestCase):
+    def test_info_is_never_sampled_and_reset_restarts_burst(self):
+        sampler = DebugSampler(every=5, burst=2)
+
+        self.assertTrue(all(sampler.filter(_record(10, logging.INFO)) for _ in range(20)))
+        passed = [sampler.filter(_record(20)) for _ in range(10)]
+        self.assertEqual([True, True, False, False, True, False, False, False, False, True], passed)
+        self.assertTrue(sampler.filter(_record(30)))  # 다른 호출 위치는 따로 센다
+
+        sampler.reset()
+        self.assertTrue(sampler.filter(_record(20)))
+
+
+if __name__ == "__main__":
+    unittest.main()
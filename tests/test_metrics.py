@@ -0,0 +1,128 @@
+import json
+import tempfile
+import unittest
+from types import SimpleNamespace
+from unittest.mock import MagicMock, patch
+
+from analyzers.base import BaseAnalyzer
+from utils import metrics
+from utils.metrics import MetricsRegistry, RunMetrics, diff_snapshots, render_run_report_prometheus
+from web.app import create_app
+
+
+class _EchoAnalyzer(BaseAnalyzer):
+    def analyze(self, data):
+        return self._call_ai([{"role": "user", "content": "hi"}])
+
+
+class MetricsRegistryTests(unittest.TestCase):
+    def test_prometheus_text_has_counters_and_cumulative_buckets(self):
+        registry = MetricsRegistry(buckets=(0.1, 1.0))
+        registry.inc("news_collector_http_requests_total", provider="naver", status="200")
+        registry.inc("news_collector_http_requests_total", provider="naver", status="200")
+        registry.observe("news_collector_http_request_seconds", 0.05, provider="naver")
+        registry.observe("news_collector_http_request_seconds", 0.5, provider="naver")
+
+        text = registry.render_prometheus()
+
+        self.assertIn("# TYPE news_collector_http_requests_total counter", text)
+        self.assertIn('news_collector_http_requests_total{provider="naver",status="200"} 2', text)
+        self.assertIn('news_collector_http_request_seconds_bucket{provider="naver",le="0.1"} 1', text)
+        self.assertIn('news_collector_http_request_seconds_bucket{provider="naver",le="1"} 2', text)
+        self.assertIn('news_collector_http_request_seconds_bucket{provider="naver",le="+Inf"} 2', text)
+        self.assertIn('news_collector_http_request_seconds_count{provider="naver"} 2', text)
+
+    def test_label_values_are_escaped(self):
+        registry = MetricsRegistry()
+        registry.inc("news_collector_source_articles_total", keyword='say "hi"')
+
+        self.assertIn('keyword="say \\"hi\\""', registry.render_prometheus())
+
+    def test_diff_keeps_only_values_added_during_run(self):
+        registry = MetricsRegistry(buckets=(1.0,))
+        registry.inc("news_collector_llm_tokens_total", 100, kind="prompt")
+        registry.observe("news_collector_stage_seconds", 2.0, stage="collect")
+        before = registry.snapshot()
+        registry.inc("news_collector_llm_tokens_total", 40, kind="prompt")
+        registry.inc("news_collector_llm_tokens_total", 7, kind="completion")
+        registry.observe("news_collector_stage_seconds", 3.0, stage="analyze")
+
+        report = diff_snapshots(before, registry.snapshot())
+
+        self.assertEqual(
+            {"prompt": 40, "completion": 7},
+            {item["labels"]["kind"]: item["value"] for item in report["counters"]},
+        )
+        self.assertEqual(["analyze"], [item["labels"]["stage"] for item in report["timers"]])
+        self.assertEqual(3.0, report["timers"][0]["avg"])
+
+
+class RunMetricsTests(unittest.TestCase):
+    def test_finish_writes_run_report_and_last_run_gauges(self):
+        registry = MetricsRegistry()
+        run = RunMetrics("20260303_090000_aaaaaa", registry=registry)
+        with registry.timer("news_collector_stage_seconds", stage="collect"):
+            registry.inc("news_collector_source_articles_total", 5, category="voc_esim", source="naver_news")
+
+        with tempfile.TemporaryDirectory() as tmp:
+            path = run.finish("completed", report_dir=tmp)
+            with open(path, encoding="utf-8") as f:
+                report = json.load(f)
+            self.assertEqual(report, metrics.load_latest_run_report(tmp))
+
+        self.assertEqual("completed", report["status"])
+        self.assertEqual(5, report["counters"][0]["value"])
+        text = render_run_report_prometheus(report)
+        self.assertIn('news_collector_last_run_info{run_id="20260303_090000_aaaaaa",status="completed"} 1', text)
+        self.assertIn(
+            'news_collector_last_run_source_articles_total{category="voc_esim",source="naver_news"} 5', text
+        )
+        self.assertIn('news_collector_last_run_stage_seconds_count{stage="collect"} 1', text)
+
+
+class LLMCallMetricsTests(unittest.TestCase):
+    def test_call_ai_records_latency_tokens_and_retries(self):
+        analyzer = _EchoAnalyzer(api_key="key", base_url="https://api.openai.com/v1", model="test-model")
+        response = SimpleNamespace(
+            choices=[SimpleNamespace(message=SimpleNamespace(content='{"ok": true}'))],
+            usage=SimpleNamespace(prompt_tokens=120, completion_tokens=30),
+        )
+        analyzer.client = MagicMock()
+        analyzer.client.chat.completions.create.side_effect = [RuntimeError("timeout"), response]
+        registry = MetricsRegistry()
+
+        with patch.object(metrics, "REGISTRY", registry), patch("time.sleep"):
+            self.assertEqual({"ok": True}, analyzer.analyze({}))
+
+        values = {
+            (item["name"], tuple(sorted(item["labels"].items()))): item["value"]
+            for item in registry.snapshot()["counters"]
+        }
+        model = ("model", "test-model")
+        self.assertEqual(120, values[("news_collector_llm_tokens_total", (("kind", "prompt"), model))])
+        self.assertEqual(30, values[("news_collector_llm_tokens_total", (("kind", "completion"), model))])
+        self.assertEqual(1, values[("news_collector_llm_requests_total", (model, ("status", "error")))])
+        self.assertEqual(1, values[("news_collector_llm_requests_total", (model, ("status", "ok")))])
+        self.assertEqual(1, values[("news_collector_llm_retries_total", (model,))])
+
+
+class MetricsEndpointTests(unittest.TestCase):
+    def test_metrics_endpoint_serves_prometheus_text(self):
+        registry = MetricsRegistry()
+        registry.inc("news_collector_summary_cache_total", 3, category="voc_esim", result="hit")
+        client = create_app().test_client()
+
+        with patch.object(metrics, "REGISTRY", registry), \
+                patch.object(metrics, "load_latest_run_report", return_value=None):
+            response = client.get("/metrics")
+
+        self.assertEqual(200, response.status_code)
+        self.assertTrue(response.content_type.startswith("text/plain; version=0.0.4"))
+        self.assertIn(
+            'news_collector_summary_cache_total{category="voc_esim",result="hit"} 3',
+            response.get_data(as_text=True),
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,87 @@
+from datetime import datetime
+import gzip
+import os
+from pathlib import Path
+import tempfile
+import unittest
+
+from werkzeug.exceptions import NotFound
+
+from notifiers.web_generator import WebGenerator
+from web.app import create_app
+from web.output_files import IMMUTABLE_CACHE_CONTROL, REVALIDATE_CACHE_CONTROL, is_immutable_path, serve_output_file
+
+
+class ServeOutputFileTests(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmp.cleanup)
+        self.output_dir = Path(self.tmp.name)
+        self.app = create_app()
+        WebGenerator().generate(
+            {},
+            output_path=str(self.output_dir / "web" / "daily_report.html"),
+            report_time=datetime(2026, 3, 3, 9),
+        )
+
+    def _get(self, filepath, **headers):
+        with self.app.test_request_context(headers=headers):
+            response = serve_output_file(self.output_dir, filepath)
+            response.direct_passthrough = False
+            return response
+
+    def test_latest_report_served_precompressed_with_revalidation(self):
+        response = self._get("web/daily_report.html", **{"Accept-Encoding": "gzip, br"})
+
+        self.assertEqual(200, response.status_code)
+        self.assertEqual("gzip", response.headers["Content-Encoding"])
+        self.assertEqual("text/html; charset=utf-8", response.headers["Content-Type"])
+        self.assertEqual(REVALIDATE_CACHE_CONTROL, response.headers["Cache-Control"])
+        self.assertIn("2026년 03월 03일", gzip.decompress(response.get_data()).decode("utf-8"))
+        etag, weak = response.get_etag()
+        self.assertFalse(weak)
+        self.assertTrue(etag.endswith("-gzip"))
+
+        revalidated = self._get(
+            "web/daily_report.html", **{"Accept-Encoding": "gzip", "If-None-Match": f'"{etag}"'}
+        )
+        self.assertEqual(304, revalidated.status_code)
+        self.assertEqual(b"", revalidated.get_data())
+
+    def test_identity_and_gzip_representations_have_distinct_etags(self):
+        plain = self._get("web/daily_report.html")
+
+        self.assertNotIn("Content-Encoding", plain.headers)
+        self.assertIn("2026년 03월 03일", plain.get_data(as_text=True))
+        gzipped = self._get("web/daily_report.html", **{"Accept-Encoding": "gzip"})
+        self.assertNotEqual(plain.get_etag()[0], gzipped.get_etag()[0])
+
+    def test_history_reports_and_hash_named_blobs_are_immutable(self):
+        response = self._get("web/history/daily_report_20260303_090000.html")
+        self.assertEqual(IMMUTABLE_CACHE_CONTROL, response.headers["Cache-Control"])
+        latest = self._get("web/daily_report.html")
+        self.assertEqual(REVALIDATE_CACHE_CONTROL, latest.headers["Cache-Control"])
+
+        self.assertFalse(is_immutable_path("web/history/manifest.jsonl"))
+        self.assertFalse(is_immutable_path("web/history/daily_report_latest.html"))
+        self.assertTrue(is_immutable_path(f"web/history/blobs/ab/ab{'0' * 62}.html.gz"))
+        self.assertFalse(is_immutable_path(f"web/history/blobs/cd/ab{'0' * 62}.html.gz"))
+        self.assertFalse(is_immutable_path("web/history/blobs/ab/report.html.gz"))
+
+    def test_stale_precompressed_sibling_is_ignored(self):
+        latest = self.output_dir / "web" / "daily_report.html"
+        sibling = self.output_dir / "web" / "daily_report.html.gz"
+        stat = latest.stat()
+        os.utime(sibling, ns=(stat.st_atime_ns, stat.st_mtime_ns - 1_000_000_000))
+
+        response = self._get("web/daily_report.html", **{"Accept-Encoding": "gzip"})
+
+        self.assertNotIn("Content-Encoding", response.headers)
+
+    def test_path_outside_output_rejected(self):
+        with self.assertRaises(NotFound):
+            self._get("../secrets.txt")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,144 @@
+import os
+import pstats
+import tempfile
+import unittest
+from types import SimpleNamespace
+from unittest.mock import patch
+
+import main
+from utils import metrics, profiling
+from utils.profiling import RunProfiler, collapsed_stacks, parse_profile_stages, profile_stage
+from tests.test_checkpoint import _settings, _window
+
+
+def _busy(n: int) -> int:
+    return sum(len(str(i)) for i in range(n))
+
+
+def _fib(n: int) -> int:
+    return n if n < 2 else _fib(n - 1) + _fib(n - 2)
+
+
+class ParseProfileStagesTests(unittest.TestCase):
+    def test_all_and_true_select_every_stage(self):
+        self.assertIsNone(parse_profile_stages(True))
+        self.assertIsNone(parse_profile_stages("all"))
+        self.assertEqual({"collect", "report"}, parse_profile_stages(" collect, report "))
+
+    def test_unknown_stage_raises(self):
+        with self.assertRaises(ValueError):
+            parse_profile_stages("collect,render")
+
+
+class RunProfilerTests(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmp.cleanup)
+
+    def test_selected_stage_writes_pstats_collapsed_stacks_and_allocations(self):
+        profiler = RunProfiler("run1", {"collect"}, output_dir=self.tmp.name)
+
+        with profiler.stage("collect"):
+            data = [str(i) * 10 for i in range(20_000)]
+            _busy(50_000)
+        with profiler.stage("analyze"):
+            _busy(1_000)
+
+        directory = os.path.join(self.tmp.name, "profile_run1")
+        self.assertEqual(["collect.collapsed", "collect.pstats", "collect_alloc.txt"], sorted(os.listdir(directory)))
+        self.assertEqual(3, len(profiler.artifacts))
+        stats = pstats.Stats(os.path.join(directory, "collect.pstats"))
+        self.assertTrue(any(name == "_busy" for _, _, name in stats.stats))
+        with open(os.path.join(directory, "collect.collapsed"), encoding="utf-8") as f:
+            lines = f.read().splitlines()
+        self.assertTrue(any("_busy (test_profiling.py" in line for line in lines))
+        self.assertTrue(all(line.rsplit(" ", 1)[1].isdigit() for line in lines))
+        with open(os.path.join(directory, "collect_alloc.txt"), encoding="utf-8") as f:
+            self.assertIn("test_profiling.py", f.read())
+        del data
+
+    def test_nested_stage_is_not_profiled_twice(self):
+        profiler = RunProfiler("run2", output_dir=self.tmp.name, memory=False)
+
+        with profiler.stage("report"):
+            with profiler.stage("collect"):
+                _busy(1_000)
+
+        self.assertEqual(
+            ["report.collapsed", "report.pstats"], sorted(os.listdir(os.path.join(self.tmp.name, "profile_run2")))
+        )
+
+    def test_collapsed_stacks_attribute_self_time_to_call_paths(self):
+        profiler = RunProfiler("run3", output_dir=self.tmp.name, memory=False)
+        with profiler.stage("analyze"):
+            _busy(20_000)
+
+        stats = pstats.Stats(os.path.join(self.tmp.name, "profile_run3", "analyze.pstats"))
+        stacks = collapsed_stacks(stats)
+        paths = {line.rsplit(" ", 1)[0] for line in stacks}
+        self.assertTrue(any(
+            path.startswith("_busy (test_profiling.py") and path.endswith(f";<genexpr> (test_profiling.py:{_busy.__code__.co_firstlineno + 1})")
+            for path in paths
+        ))
+
+    def test_recursive_stage_body_still_produces_stacks(self):
+        profiler = RunProfiler("run4", output_dir=self.tmp.name, memory=False)
+        with profiler.stage("analyze"):
+            _fib(18)
+
+        stats = pstats.Stats(os.path.join(self.tmp.name, "profile_run4", "analyze.pstats"))
+        stacks = collapsed_stacks(stats)
+
+        self.assertTrue(any(line.startswith("_fib (test_profiling.py") for line in stacks))
+        total_us = sum(int(line.rsplit(" ", 1)[1]) for line in stacks)
+        self.assertAlmostEqual(stats.total_tt * 1_000_000, total_us, delta=len(stacks))
+
+    def test_dense_call_graph_is_linear(self):
+        # 층마다 모든 함수가 다음 층 모든 함수를 호출: 경로를 펼치면 20^8개
+        layers = [[(f"mod{depth}.py", i, f"f{depth}_{i}") for i in range(20)] for depth in range(9)]
+        edge = (1, 1, 0.001, 0.01)
+        raw = {func: (1, 1, 0.001, 0.2, {}) for func in layers[0]}
+        for upper, lower in zip(layers, layers[1:]):
+            for func in lower:
+                raw[func] = (20, 20, 0.001, 0.2, {caller: edge for caller in upper})
+
+        stacks = collapsed_stacks(SimpleNamespace(stats=raw))
+
+        self.assertEqual(9 * 20, len(stacks))
+        self.assertEqual(9 * 20 * 1000, sum(int(line.rsplit(" ", 1)[1]) for line in stacks))
+
+    def test_profile_stage_without_profiler_is_noop(self):
+        with profile_stage(None, "collect"):
+            pass
+
+
+class RunDailyPipelineProfileTests(unittest.TestCase):
+    def test_profile_option_writes_artifacts_per_selected_stage(self):
+        with tempfile.TemporaryDirectory() as tmp, \
+                patch.object(main, "DEFAULT_CHECKPOINT_DIR", tmp), \
+                patch.object(metrics, "DEFAULT_REPORT_DIR", os.path.join(tmp, "metrics")), \
+                patch.object(profiling, "DEFAULT_PROFILE_DIR", os.path.join(tmp, "logs")), \
+                patch.object(main, "collect_articles", return_value={"roaming": [{"title": "a"}]}), \
+                patch.object(main, "analyze_articles", return_value={}), \
+                patch.object(main, "collect_external_alerts", return_value=[]), \
+                patch.object(main, "send_report", return_value="history/report.html"):
+            main.run_daily_pipeline(_settings(), window=_window(), profile="collect,report")
+
+            (run_dir,) = os.listdir(os.path.join(tmp, "logs"))
+            files = sorted(os.listdir(os.path.join(tmp, "logs", run_dir)))
+
+        self.assertTrue(run_dir.startswith("profile_"))
+        self.assertEqual(
+            ["collect.collapsed", "collect.pstats", "collect_alloc.txt",
+             "report.collapsed", "report.pstats", "report_alloc.txt"],
+            files,
+        )
+
+    def test_cli_rejects_unknown_profile_stage(self):
+        with self.assertRaises(SystemExit), patch("sys.stderr"):
+            main.parse_args(["--profile", "bogus"])
+        self.assertEqual("all", main.parse_args(["--profile"]).profile)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,140 @@
+import json
+import os
+import subprocess
+import sys
+import tempfile
+import threading
+import unittest
+from pathlib import Path
+from unittest.mock import patch
+
+from config import recipient_store
+from utils.exceptions import LockHeldError
+from utils.file_lock import FileLock
+from web.app import create_app
+
+ROOT = Path(__file__).resolve().parent.parent
+
+ADD_SCRIPT = """
+import sys
+from pathlib import Path
+from config import recipient_store
+recipient_store.RECIPIENTS_FILE = Path(sys.argv[1])
+for i in range(10):
+    ok, message, _ = recipient_store.add_group_recipient(f"{sys.argv[2]}-{i}@example.com")
+    assert ok, message
+"""
+
+
+class RecipientStoreTests(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmp.cleanup)
+        self.path = Path(self.tmp.name) / "email_recipients.json"
+        self._write({"schema_version": 2, "report_recipients": ["a@example.com"], "safety_alert_recipients": []})
+        patcher = patch.object(recipient_store, "RECIPIENTS_FILE", self.path)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def _write(self, data) -> None:
+        tmp_path = f"{self.path}.new"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(data, f)
+        os.replace(tmp_path, self.path)
+
+    def _on_disk(self):
+        with open(self.path, encoding="utf-8") as f:
+            return json.load(f)
+
+    def test_lookups_are_cached_until_the_file_changes(self):
+        with patch.object(recipient_store, "_read_config", wraps=recipient_store._read_config) as read:
+            self.assertEqual(["a@example.com"], recipient_store.get_group_recipients("report"))
+            self.assertEqual([], recipient_store.get_group_recipients("safety_alert"))
+            self.assertEqual(1, read.call_count)
+
+            self._write({"schema_version": 2, "report_recipients": ["b@example.com"], "safety_alert_recipients": []})
+            self.assertEqual(["b@example.com"], recipient_store.get_group_recipients("report"))
+            self.assertEqual(2, read.call_count)
+
+        config = recipient_store.load_config()
+        config["report_recipients"].append("c@example.com")
+        self.assertEqual(["b@example.com"], recipient_store.get_group_recipients("report"))
+
+    def test_legacy_file_is_migrated_once(self):
+        self._write({"default_recipients": ["A@example.com"], "custom_recipients": ["a@example.com", "b@example.com"]})
+
+        self.assertEqual(["a@example.com", "b@example.com"], recipient_store.get_group_recipients("safety_alert"))
+        migrated = self._on_disk()
+        self.assertEqual(2, migrated["schema_version"])
+
+        with patch.object(recipient_store, "_save_config") as save:
+            recipient_store.get_group_recipients("report")
+        save.assert_not_called()
+        self.assertFalse(os.path.exists(f"{self.path}.tmp"))
+
+    def test_concurrent_adds_from_threads_and_processes_are_not_lost(self):
+        processes = [
+            subprocess.Popen([sys.executable, "-c", ADD_SCRIPT, str(self.path), f"proc{n}"], cwd=ROOT)
+            for n in range(3)
+        ]
+        threads = [
+            threading.Thread(target=recipient_store.add_group_recipient, args=(f"thread-{n}@example.com",))
+            for n in range(10)
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        for process in processes:
+            self.assertEqual(0, process.wait(timeout=60))
+
+        report = self._on_disk()["report_recipients"]
+        self.assertEqual(1 + 10 + 30, len(report))
+        self.assertEqual(report, recipient_store.get_group_recipients("report"))
+
+        ok, _, remaining = recipient_store.remove_group_recipient("thread-3@example.com")
+        self.assertTrue(ok)
+        self.assertNotIn("thread-3@example.com", self._on_disk()["report_recipients"])
+        self.assertEqual(40, len(remaining))
+
+    def test_add_fails_when_another_process_holds_the_lock(self):
+        holder = FileLock(f"{self.path}.lock", owner="other")
+        self.assertTrue(holder.acquire())
+        self.addCleanup(holder.release)
+
+        with patch.object(recipient_store, "LOCK_TIMEOUT_SECONDS", 0.1), self.assertRaises(LockHeldError):
+            recipient_store.add_group_recipient("b@example.com")
+        self.assertEqual(["a@example.com"], self._on_disk()["report_recipients"])
+
+    def test_lookup_falls_back_to_normalized_config_while_locked(self):
+        self._write({"default_recipients": ["A@example.com"], "custom_recipients": []})
+        holder = FileLock(f"{self.path}.lock", owner="other")
+        self.assertTrue(holder.acquire())
+        self.addCleanup(holder.release)
+
+        with patch.object(recipient_store, "LOCK_TIMEOUT_SECONDS", 0.1), \
+                self.assertLogs("config.recipient_store", level="WARNING"):
+            self.assertEqual(["a@example.com"], recipient_store.get_group_recipients("report"))
+        self.assertNotIn("schema_version", self._on_disk())
+
+        holder.release()
+        self.assertEqual(["a@example.com"], recipient_store.get_group_recipients("report"))
+        self.assertEqual(2, self._on_disk()["schema_version"])
+
+    def test_api_returns_409_while_another_process_holds_the_lock(self):
+        client = create_app().test_client()
+        holder = FileLock(f"{self.path}.lock", owner="other")
+        self.assertTrue(holder.acquire())
+        self.addCleanup(holder.release)
+
+        with patch.object(recipient_store, "LOCK_TIMEOUT_SECONDS", 0.1):
+            added = client.post("/api/recipients?group=report", json={"email": "b@example.com"})
+            removed = client.delete("/api/recipients/a@example.com?group=report")
+
+        self.assertEqual((409, 409), (added.status_code, removed.status_code))
+        self.assertFalse(added.get_json()["success"])
+        self.assertEqual(["a@example.com"], self._on_disk()["report_recipients"])
+
+
+if __name__ == "__main__":
+    unittest.main()
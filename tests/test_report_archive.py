@@ -0,0 +1,166 @@
+from datetime import datetime
+import gzip
+import os
+from pathlib import Path
+import tempfile
+import threading
+import unittest
+from unittest.mock import patch
+
+from notifiers.web_generator import WebGenerator
+from storage import report_archive
+from storage.report_archive import MANIFEST_LOCK_NAME, ReportArchive, load_manifest
+from utils.exceptions import LockHeldError
+from utils.file_lock import FileLock
+from web.app import create_app
+from web.output_files import IMMUTABLE_CACHE_CONTROL
+from web.report_index import ReportIndex
+
+
+class ReportArchiveTests(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmp.cleanup)
+        self.output_dir = Path(self.tmp.name)
+        self.history_dir = self.output_dir / "web" / "history"
+        self.history_dir.mkdir(parents=True)
+
+    def _generate(self, archive, day: int, data=None) -> str:
+        return WebGenerator(archive=archive).generate(
+            data or {},
+            output_path=str(self.output_dir / "web" / "daily_report.html"),
+            report_time=datetime(2026, 3, day, 9),
+            update_latest=False,
+        )
+
+    def test_identical_reports_share_one_blob(self):
+        archive = ReportArchive(str(self.history_dir))
+        first = archive.put("<html>같은 리포트</html>")
+        second = archive.put("<html>같은 리포트</html>")
+
+        self.assertEqual(first, second)
+        with open(archive.blob_path(first), "rb") as f:
+            self.assertEqual("<html>같은 리포트</html>", gzip.decompress(f.read()).decode("utf-8"))
+        self.assertEqual(1, len(list((self.history_dir / "blobs").rglob("*.html.gz"))))
+
+    def test_generate_writes_blob_instead_of_plain_history(self):
+        archive = ReportArchive(str(self.history_dir))
+        history_path = self._generate(archive, 3)
+
+        self.assertFalse(os.path.exists(history_path))
+        record = load_manifest(str(self.history_dir))["daily_report_20260303_090000.html"]
+        self.assertIn("2026년 03월 03일", archive.read_text(record["blob"]))
+
+        index = ReportIndex(self.output_dir)
+        entry = index.latest()
+        self.assertEqual("daily_report_20260303_090000.html", entry.path.name)
+        self.assertIn("2026년 03월 03일", index.read_html(entry))
+
+    def test_compact_migrates_plain_history_and_applies_retention(self):
+        (self.history_dir / "daily_report_20250101_090000.html").write_text("<html>old</html>", encoding="utf-8")
+        (self.history_dir / "daily_report_20260301_090000.html").write_text("<html>new</html>", encoding="utf-8")
+
+        archive = ReportArchive(str(self.history_dir), retention_days=30)
+        stats = archive.compact(now=datetime(2026, 3, 10))
+
+        self.assertEqual(2, stats["migrated"])
+        self.assertEqual(1, stats["expired"])
+        self.assertEqual(1, stats["removed_blobs"])
+        self.assertEqual(["daily_report_20260301_090000.html"], list(load_manifest(str(self.history_dir))))
+        self.assertFalse(list(self.history_dir.glob("daily_report_*.html")))
+
+    def test_compact_caps_blob_bytes_keeping_newest(self):
+        archive = ReportArchive(str(self.history_dir))
+        for day in range(1, 4):
+            self._generate(archive, day, {"strategic_insight": os.urandom(4000).hex()})
+        blob_size = max(p.stat().st_size for p in (self.history_dir / "blobs").rglob("*.html.gz"))
+
+        archive.max_bytes = blob_size * 2
+        archive.compact()
+
+        self.assertEqual(
+            ["daily_report_20260302_090000.html", "daily_report_20260303_090000.html"],
+            sorted(load_manifest(str(self.history_dir))),
+        )
+        self.assertEqual(2, len(list((self.history_dir / "blobs").rglob("*.html.gz"))))
+
+    def test_regenerated_report_gets_a_new_history_name(self):
+        archive = ReportArchive(str(self.history_dir))
+        first = self._generate(archive, 3, {"strategic_insight": "처음"})
+        second = self._generate(archive, 3, {"strategic_insight": "다시"})
+
+        self.assertTrue(first.endswith("daily_report_20260303_090000.html"))
+        self.assertTrue(second.endswith("daily_report_20260303_090001.html"))
+        manifest = load_manifest(str(self.history_dir))
+        self.assertIn("처음", archive.read_text(manifest["daily_report_20260303_090000.html"]["blob"]))
+        self.assertIn("다시", archive.read_text(manifest["daily_report_20260303_090001.html"]["blob"]))
+
+    def test_writes_wait_for_history_lock_held_by_another_process(self):
+        archive = ReportArchive(str(self.history_dir))
+        holder = FileLock(str(self.history_dir / MANIFEST_LOCK_NAME), owner="other")
+        self.assertTrue(holder.acquire())
+        self.addCleanup(holder.release)
+
+        with patch.object(report_archive, "MANIFEST_LOCK_TIMEOUT_SECONDS", 0.1):
+            with self.assertRaises(LockHeldError):
+                archive.add("daily_report_20260303_090000.html", "<html>a</html>", {})
+            with self.assertRaises(LockHeldError):
+                archive.compact()
+        self.assertEqual({}, load_manifest(str(self.history_dir)))
+
+        holder.release()
+        archive.add("daily_report_20260303_090000.html", "<html>a</html>", {})
+        self.assertIn("daily_report_20260303_090000.html", load_manifest(str(self.history_dir)))
+
+    def test_history_locks_are_per_directory(self):
+        other_dir = self.output_dir / "other" / "history"
+        other_dir.mkdir(parents=True)
+        holder = FileLock(str(other_dir / MANIFEST_LOCK_NAME), owner="other")
+        self.assertTrue(holder.acquire())
+        self.addCleanup(holder.release)
+
+        with report_archive._manifest_lock(str(self.history_dir)):
+            # 다른 디렉터리의 중첩 잠금은 그 디렉터리의 파일 잠금을 따로 잡는다
+            with patch.object(report_archive, "MANIFEST_LOCK_TIMEOUT_SECONDS", 0.1):
+                with self.assertRaises(LockHeldError):
+                    with report_archive._manifest_lock(str(other_dir)):
+                        pass
+            holder.release()
+
+            # 다른 스레드도 이 디렉터리 잠금과 관계없이 다른 아카이브에 쓸 수 있다
+            worker = threading.Thread(
+                target=ReportArchive(str(other_dir)).add,
+                args=("daily_report_20260303_090000.html", "<html>b</html>", {}),
+            )
+            worker.start()
+            worker.join(timeout=5)
+            self.assertFalse(worker.is_alive())
+        self.assertIn("daily_report_20260303_090000.html", load_manifest(str(other_dir)))
+
+    def test_archived_report_served_with_gzip_encoding(self):
+        self._generate(ReportArchive(str(self.history_dir)), 3)
+        client = create_app().test_client()
+
+        with patch("web.routes.report_index", ReportIndex(self.output_dir)):
+            gzipped = client.get(
+                "/output/web/history/daily_report_20260303_090000.html",
+                headers={"Accept-Encoding": "gzip"},
+            )
+            plain = client.get("/output/web/history/daily_report_20260303_090000.html")
+            revalidated = client.get(
+                "/output/web/history/daily_report_20260303_090000.html",
+                headers={"If-None-Match": plain.headers["ETag"]},
+            )
+
+        self.assertEqual(200, gzipped.status_code)
+        self.assertEqual("gzip", gzipped.headers["Content-Encoding"])
+        self.assertIn("2026년 03월 03일", gzip.decompress(gzipped.get_data()).decode("utf-8"))
+        gzipped.close()
+        self.assertNotIn("Content-Encoding", plain.headers)
+        self.assertEqual(IMMUTABLE_CACHE_CONTROL, plain.headers["Cache-Control"])
+        self.assertEqual(304, revalidated.status_code)
+        self.assertIn("2026년 03월 03일", plain.get_data(as_text=True))
+
+
+if __name__ == "__main__":
+    unittest.main()
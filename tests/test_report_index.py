@@ -0,0 +1,114 @@
+from datetime import date, datetime
+import os
+from pathlib import Path
+import tempfile
+import unittest
+from unittest.mock import patch
+
+from notifiers.web_generator import WebGenerator
+from web.report_index import ReportIndex
+
+
+class ReportIndexTests(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmp.cleanup)
+        self.output_dir = Path(self.tmp.name)
+        self.history_dir = self.output_dir / "web" / "history"
+        self.history_dir.mkdir(parents=True)
+        self.index = ReportIndex(self.output_dir)
+
+    def _write_history(self, timestamp: str) -> Path:
+        path = self.history_dir / f"daily_report_{timestamp}.html"
+        path.write_text("<html></html>", encoding="utf-8")
+        return path
+
+    def test_orders_history_by_filename_timestamp(self):
+        self._write_history("20260302_090000")
+        self._write_history("20260304_090000")
+        self._write_history("20260303_090000")
+        (self.history_dir / "notes.txt").write_text("x", encoding="utf-8")
+
+        entries = self.index.list(2)
+
+        self.assertEqual(
+            ["daily_report_20260304_090000.html", "daily_report_20260303_090000.html"],
+            [entry.path.name for entry in entries],
+        )
+        self.assertEqual(datetime(2026, 3, 4, 9), entries[0].created_at)
+
+    def test_unchanged_directory_is_not_rescanned(self):
+        self._write_history("20260302_090000")
+        self.index.entries()
+
+        with patch("web.report_index.os.scandir") as scandir:
+            self.assertEqual(1, len(self.index.entries()))
+        scandir.assert_not_called()
+
+    def test_new_report_invalidates_by_directory_mtime(self):
+        self._write_history("20260302_090000")
+        self.assertEqual(1, len(self.index.entries()))
+
+        new_path = self._write_history("20260303_090000")
+        # mtime 해상도가 낮은 파일시스템에서도 변경이 보이도록 디렉터리 mtime을 명시적으로 올린다.
+        stat = self.history_dir.stat()
+        os.utime(self.history_dir, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+
+        self.assertEqual(new_path, self.index.latest().path)
+
+    def test_latest_report_file_is_listed_first_when_newest(self):
+        self._write_history("20000101_000000")
+        (self.output_dir / "web" / "daily_report.html").write_text("<html></html>", encoding="utf-8")
+
+        self.assertEqual("daily_report.html", self.index.latest().path.name)
+
+    def test_cursor_pages_through_history_without_overlap(self):
+        for day in range(1, 8):
+            self._write_history(f"202603{day:02d}_090000")
+
+        names = []
+        entries, cursor = self.index.page(3)
+        while True:
+            names.extend(entry.path.name for entry in entries)
+            if cursor is None:
+                break
+            entries, cursor = self.index.page(3, cursor=cursor)
+
+        self.assertEqual([f"daily_report_202603{day:02d}_090000.html" for day in range(7, 0, -1)], names)
+
+    def test_date_range_filter(self):
+        for day in range(1, 8):
+            self._write_history(f"202603{day:02d}_090000")
+
+        entries, cursor = self.index.page(10, date_from=date(2026, 3, 3), date_to=date(2026, 3, 4))
+
+        self.assertEqual(
+            ["daily_report_20260304_090000.html", "daily_report_20260303_090000.html"],
+            [entry.path.name for entry in entries],
+        )
+        self.assertIsNone(cursor)
+
+    def test_manifest_metadata_written_at_generation(self):
+        data = {
+            "section_voc_esim": [{"title": "a"}, {"title": "b"}],
+            "section_global_trend": [{"title": "c"}],
+            "external_alerts": [{"title": "공지"}],
+        }
+        WebGenerator().generate(
+            data,
+            output_path=str(self.output_dir / "web" / "daily_report.html"),
+            report_time=datetime(2026, 3, 3, 9),
+            run_id="run-1",
+        )
+
+        history = self.index.page(10, date_to=date(2026, 3, 3))[0][0]
+        self.assertEqual("daily_report_20260303_090000.html", history.path.name)
+        self.assertEqual("run-1", history.metadata["run_id"])
+        self.assertEqual(2, history.metadata["article_counts"]["voc_esim"])
+        self.assertEqual(3, history.metadata["total_articles"])
+        self.assertEqual(1, history.metadata["alert_count"])
+        self.assertEqual(3, self.index.latest().metadata["total_articles"])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,118 @@
+from datetime import datetime, timedelta
+import os
+import random
+import tempfile
+import unittest
+
+from utils.exceptions import LockHeldError
+from utils.file_lock import FileLock
+from utils.scheduler import CronSchedule, ScheduledJob, Scheduler
+from utils.time_windows import KST, get_collection_window_kst
+
+
+class FakeClock:
+    def __init__(self, now):
+        self.now = now
+
+    def __call__(self):
+        return self.now
+
+
+class CronScheduleTests(unittest.TestCase):
+    def test_daily_report_time_in_kst(self):
+        cron = CronSchedule("0 9 * * *")
+
+        self.assertEqual(datetime(2026, 3, 3, 9, tzinfo=KST), cron.next_after(datetime(2026, 3, 3, 8, 59, tzinfo=KST)))
+        self.assertEqual(datetime(2026, 3, 4, 9, tzinfo=KST), cron.next_after(datetime(2026, 3, 3, 9, tzinfo=KST)))
+
+    def test_weekday_ranges_and_steps(self):
+        cron = CronSchedule("*/30 9-10 * * 1-5")
+
+        # 2026-03-06 금요일 10:30 다음은 월요일 09:00
+        self.assertEqual(datetime(2026, 3, 9, 9, tzinfo=KST), cron.next_after(datetime(2026, 3, 6, 10, 30, tzinfo=KST)))
+        self.assertEqual(datetime(2026, 3, 9, 9, 30, tzinfo=KST), cron.next_after(datetime(2026, 3, 9, 9, tzinfo=KST)))
+
+    def test_sunday_accepts_zero_and_seven(self):
+        self.assertEqual(CronSchedule("0 9 * * 0").weekdays, CronSchedule("0 9 * * 7").weekdays)
+
+    def test_invalid_expressions(self):
+        for expression in ("0 9 * *", "60 9 * * *", "0 9 * * 1-9", "*/0 * * * *"):
+            with self.assertRaises(ValueError):
+                CronSchedule(expression)
+
+
+class SchedulerTests(unittest.TestCase):
+    def setUp(self):
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        self.state_path = os.path.join(tmp.name, "state.json")
+        self.lock_path = os.path.join(tmp.name, "pipeline.lock")
+        self.runs = []
+
+    def _scheduler(self, clock, **job_kwargs):
+        job = ScheduledJob(name="report", cron=CronSchedule("0 9 * * *"), func=self.runs.append, **job_kwargs)
+        return Scheduler([job], self.state_path, clock=clock, rng=random.Random(7))
+
+    def test_runs_once_when_due_and_applies_jitter(self):
+        clock = FakeClock(datetime(2026, 3, 3, 8, 0, tzinfo=KST))
+        scheduler = self._scheduler(clock, jitter_seconds=120)
+
+        self.assertEqual([], scheduler.run_pending())
+        fire_at = scheduler.jobs[0].fire_at
+        self.assertTrue(datetime(2026, 3, 3, 9, tzinfo=KST) <= fire_at <= datetime(2026, 3, 3, 9, 2, tzinfo=KST))
+
+        clock.now = fire_at
+        self.assertEqual(["report"], scheduler.run_pending())
+        self.assertEqual([datetime(2026, 3, 3, 9, tzinfo=KST)], self.runs)
+        self.assertEqual([], scheduler.run_pending())
+        self.assertEqual(datetime(2026, 3, 4, 9, tzinfo=KST), scheduler.jobs[0].next_due)
+
+    def test_missed_runs_caught_up_once_with_scheduled_time(self):
+        clock = FakeClock(datetime(2026, 3, 6, 8, 0, tzinfo=KST))
+        scheduler = self._scheduler(clock)
+        scheduler.run_pending()
+        clock.now = datetime(2026, 3, 6, 9, 0, tzinfo=KST)
+        scheduler.run_pending()
+
+        # 금요일 이후 꺼져 있다가 월요일 11:00에 재시작: 주말 실행은 합쳐서 월요일 09:00 1회만 보충
+        clock.now = datetime(2026, 3, 9, 11, 0, tzinfo=KST)
+        self._scheduler(clock, catchup_seconds=6 * 3600).run_pending()
+
+        self.assertEqual(datetime(2026, 3, 9, 9, tzinfo=KST), self.runs[-1])
+        self.assertEqual(2, len(self.runs))
+        window = get_collection_window_kst(now_utc=self.runs[-1])
+        self.assertTrue(window.is_monday_special)
+        self.assertEqual(datetime(2026, 3, 9, 9, tzinfo=KST), window.end_kst)
+
+    def test_missed_run_outside_catchup_window_is_skipped(self):
+        clock = FakeClock(datetime(2026, 3, 3, 9, 0, tzinfo=KST))
+        self._scheduler(clock).run_pending()
+
+        clock.now = datetime(2026, 3, 4, 20, 0, tzinfo=KST)
+        scheduler = self._scheduler(clock, catchup_seconds=6 * 3600)
+        scheduler.run_pending()
+
+        self.assertEqual([], self.runs)
+        self.assertEqual(datetime(2026, 3, 5, 9, tzinfo=KST), scheduler.jobs[0].next_due)
+
+    def test_prewarm_offset(self):
+        job = ScheduledJob(
+            name="prewarm", cron=CronSchedule("0 9 * * *"), func=self.runs.append, offset=-timedelta(minutes=10)
+        )
+
+        self.assertEqual(datetime(2026, 3, 3, 8, 50, tzinfo=KST), job.next_after(datetime(2026, 3, 3, 8, 0, tzinfo=KST)))
+
+    def test_file_lock_prevents_overlap(self):
+        with FileLock(self.lock_path, owner="scheduler"):
+            other = FileLock(self.lock_path, owner="cli")
+            self.assertFalse(other.acquire())
+            with self.assertRaises(LockHeldError):
+                other.__enter__()
+            self.assertIn("scheduler", other.holder())
+
+        self.assertTrue(other.acquire())
+        other.release()
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,87 @@
+from datetime import date, datetime, timezone
+import unittest
+
+from storage.article_store import ArticleStore
+from storage.search_index import DOC_TYPE_ALERT, SearchIndex, build_match_query, tokenize
+from utils.article import Article
+
+
+def _article(index: int, title: str, day: int) -> Article:
+    return Article(
+        title=title,
+        link=f"https://blog.example.com/{index}",
+        snippet="일본 여행 eSIM 개통 후기",
+        source="Naver Blog",
+        published=datetime(2026, 3, day, 3, 0, tzinfo=timezone.utc),
+    )
+
+
+class TokenizerTests(unittest.TestCase):
+    def test_hangul_split_into_bigrams(self):
+        self.assertEqual(["kt", "로밍", "말톡", "톡후", "후기"], tokenize("KT로밍 말톡후기"))
+
+    def test_match_query_ands_terms(self):
+        self.assertEqual('"말톡" "esim"*', build_match_query("말톡 eSIM"))
+        self.assertEqual('"로밍 밍서 서비 비스"', build_match_query("로밍서비스"))
+        self.assertIsNone(build_match_query("!!"))
+
+
+class SearchIndexTests(unittest.TestCase):
+    def setUp(self):
+        self.store = ArticleStore(":memory:")
+        self.addCleanup(self.store.close)
+        self.index = SearchIndex(self.store)
+
+        self.store.start_run("run-1")
+        self.store.save_articles("run-1", {
+            "voc_esim": [_article(1, "말톡후기 속도 빠름", 2), _article(2, "유심 구매 팁", 20)],
+        })
+        self.store.save_summaries("run-1", "voc_esim", [
+            {"index": 1, "title": "말톡 속도 만족", "summary": "말톡 eSIM 속도 호평", "link": "https://blog.example.com/1"},
+        ])
+        self.store.save_external_alerts("run-1", [
+            {"title": "통신 장애 안내", "content_one_line": "로밍 서비스 장애", "link": "https://0404.go.kr/1",
+             "board_name": "공지", "published_date": "2026-03-21"},
+        ])
+        self.store.finish_run("run-1")
+
+    def test_index_pending_is_incremental(self):
+        self.assertEqual(4, self.index.index_pending())
+        self.assertEqual(0, self.index.index_pending())
+
+        self.store.start_run("run-2")
+        self.store.save_articles("run-2", {"voc_esim": [_article(1, "말톡후기 속도 빠름", 2)]})
+        self.store.finish_run("run-2")
+
+        # 이미 색인된 링크는 다시 추가하지 않는다.
+        self.assertEqual(0, self.index.index_pending())
+        self.assertEqual(2, self.index.search("말톡")["total"])
+
+    def test_search_matches_inside_compound_words(self):
+        self.index.index_pending()
+
+        result = self.index.search("말톡 속도")
+
+        self.assertEqual(["summary", "article"], [item["type"] for item in result["items"]])
+        self.assertEqual("https://blog.example.com/1", result["items"][1]["link"])
+        self.assertTrue(result["items"][1]["published_at"].startswith("2026-03-02T12:00"))
+
+    def test_filters_and_pagination(self):
+        self.index.index_pending()
+
+        alerts = self.index.search("로밍", doc_types=[DOC_TYPE_ALERT])
+        self.assertEqual(["통신 장애 안내"], [item["title"] for item in alerts["items"]])
+
+        march = self.index.search("esim", category="voc_esim", date_from=date(2026, 3, 10), date_to=date(2026, 3, 31))
+        self.assertEqual(["유심 구매 팁"], [item["title"] for item in march["items"]])
+
+        first_page = self.index.search("esim", page=1, page_size=2)
+        self.assertEqual(3, first_page["total"])
+        self.assertTrue(first_page["has_more"])
+        second_page = self.index.search("esim", page=2, page_size=2)
+        self.assertEqual(1, len(second_page["items"]))
+        self.assertFalse(second_page["has_more"])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,67 @@
+import os
+from pathlib import Path
+import runpy
+import unittest
+from unittest.mock import MagicMock, patch
+
+import serve_web
+
+
+class ServeWebTests(unittest.TestCase):
+    def test_auto_prefers_gunicorn_then_waitress(self):
+        with patch("serve_web._is_installed", side_effect=lambda name: True), patch("serve_web.os.name", "posix"):
+            self.assertEqual("gunicorn", serve_web.resolve_server("auto"))
+        with patch("serve_web._is_installed", side_effect=lambda name: name == "waitress"):
+            self.assertEqual("waitress", serve_web.resolve_server("auto"))
+        with patch("serve_web._is_installed", return_value=False):
+            self.assertIsNone(serve_web.resolve_server("auto"))
+            self.assertIsNone(serve_web.resolve_server("gunicorn"))
+
+    def test_bind_and_pool_size_come_from_environment(self):
+        env = {"WEB_HOST": "127.0.0.1", "WEB_PORT": "8080", "WEB_WORKERS": "3", "WEB_THREADS": "4"}
+        with patch.dict(os.environ, env):
+            args = serve_web.parse_args([])
+            config = runpy.run_path(str(Path(serve_web.__file__).with_name("gunicorn.conf.py")))
+
+        self.assertEqual(("127.0.0.1", 8080, 3, 4), (args.host, args.port, args.workers, args.threads))
+        self.assertEqual("127.0.0.1:8080", config["bind"])
+        self.assertEqual((3, 4, "gthread"), (config["workers"], config["threads"], config["worker_class"]))
+
+    def test_always_runs_analysis_in_worker_process(self):
+        with patch.dict(os.environ, {}, clear=False), \
+                patch("serve_web.load_dotenv"), \
+                patch("serve_web.os.chdir"), \
+                patch("serve_web.resolve_server", return_value="gunicorn"), \
+                patch("serve_web.run_gunicorn") as run, \
+                patch("serve_web.subprocess.Popen") as popen:
+            os.environ.pop("ANALYSIS_WORKER_MODE", None)
+            serve_web.main([])
+            self.assertEqual("external", os.environ["ANALYSIS_WORKER_MODE"])
+
+        run.assert_called_once()
+        self.assertTrue(popen.call_args.args[0][-1].endswith("worker.py"))
+        popen.return_value.terminate.assert_called_once()
+
+    def test_embedded_mode_is_refused(self):
+        with patch.dict(os.environ, {"ANALYSIS_WORKER_MODE": "embedded"}), \
+                patch("serve_web.load_dotenv"), \
+                patch("serve_web.resolve_server", return_value="gunicorn"), \
+                patch("serve_web.run_gunicorn") as run, \
+                patch("serve_web.subprocess.Popen") as popen:
+            with self.assertRaises(SystemExit):
+                serve_web.main([])
+            config = runpy.run_path(str(Path(serve_web.__file__).with_name("gunicorn.conf.py")))
+            with self.assertRaises(SystemExit):
+                config["on_starting"](MagicMock())
+
+        run.assert_not_called()
+        popen.assert_not_called()
+
+    def test_wsgi_module_exposes_app(self):
+        import wsgi
+
+        self.assertEqual(200, wsgi.app.test_client().get("/health").status_code)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,212 @@
+import io
+import logging
+import os
+import tempfile
+import unittest
+from contextlib import redirect_stderr, redirect_stdout
+from datetime import datetime
+from unittest.mock import MagicMock, patch
+
+import main
+from config.settings import APISettings, EmailSettings, Settings
+from storage.article_store import ArticleStore
+from utils import file_lock, metrics
+from utils.article import ArticleBatch
+from utils.checkpoint import (
+    STAGE_EXTERNAL_ALERTS,
+    STAGE_INSIGHTS,
+    STATUS_ANALYZED,
+    STATUS_COLLECTED,
+    STATUS_COMPLETED,
+    RunCheckpoint,
+)
+from utils.exceptions import CheckpointNotFoundError, LockHeldError
+from utils.file_lock import FileLock
+
+CATEGORIES = {"categories": {"roaming": {}, "competitors": {}}}
+INSIGHTS = {"strategic_insight": "전략", "key_findings": [], "recommendations": []}
+
+
+def _settings() -> Settings:
+    return Settings(
+        api=APISettings("id", "secret", "key", "cx", "openai", "https://api.openai.com/v1"),
+        email=EmailSettings("user@example.com", "password", []),
+    )
+
+
+def fake_collect(settings, window=None, fetch_limit=5, store=None, run_id=None, checkpoint=None):
+    data = {
+        "roaming": ArticleBatch([{"title": "로밍 요금", "link": "https://a.example/1"}]),
+        "competitors": ArticleBatch(),
+    }
+    for category, articles in data.items():
+        checkpoint.save_articles(f"filtered/{category}", articles)
+    return data
+
+
+def fake_analyze(collected, settings, store=None, run_id=None, checkpoint=None):
+    checkpoint.save("summaries/roaming", [{"index": 1, "title": "요약"}])
+    checkpoint.save(STAGE_INSIGHTS, INSIGHTS)
+    return {}
+
+
+class StageCommandTests(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmp.cleanup)
+        self.web_generator = MagicMock()
+        self.web_generator.generate.return_value = "output/web/history/daily_report_20260303_090000.html"
+        for patcher in (
+            patch.object(main, "DEFAULT_CHECKPOINT_DIR", self.tmp.name),
+            patch.object(metrics, "DEFAULT_REPORT_DIR", os.path.join(self.tmp.name, "metrics")),
+            patch.object(file_lock, "PIPELINE_LOCK_PATH", os.path.join(self.tmp.name, "pipeline.lock")),
+            patch.object(main, "load_categories", return_value=CATEGORIES),
+            patch.object(main, "collect_articles", side_effect=fake_collect),
+            patch.object(main, "analyze_articles", side_effect=fake_analyze),
+            patch.object(main, "build_web_generator", return_value=self.web_generator),
+        ):
+            patcher.start()
+            self.addCleanup(patcher.stop)
+
+    def _run(self, *argv: str, store=None) -> int:
+        args = main.parse_args(list(argv))
+        with redirect_stdout(io.StringIO()), redirect_stderr(io.StringIO()):
+            return main.STAGE_COMMANDS[args.command](args, _settings(), store)
+
+    def test_stages_hand_off_through_the_run_checkpoint(self):
+        self.assertEqual(0, self._run("collect"))
+        run_id = RunCheckpoint.latest(self.tmp.name).run_id
+
+        with self.assertRaisesRegex(CheckpointNotFoundError, "python main.py analyze"):
+            self._run("render")
+
+        self.assertEqual(0, self._run("analyze", run_id))
+        self.assertEqual(STATUS_ANALYZED, RunCheckpoint.open(self.tmp.name, run_id).status)
+        self.assertEqual(0, self._run("render"))
+
+        data = self.web_generator.generate.call_args.args[0]
+        self.assertEqual("전략", data["strategic_insight"])
+        self.assertEqual([{"index": 1, "title": "요약"}], data["section_roaming"])
+        self.assertEqual([], data["section_competitors"])
+        self.assertEqual([], data["external_alerts"])
+        self.assertEqual(STATUS_COMPLETED, RunCheckpoint.open(self.tmp.name, run_id).status)
+
+        # 다시 렌더링해도 처음 리포트 시각을 쓴다
+        first_time = self.web_generator.generate.call_args.kwargs["report_time"]
+        self.assertEqual(0, self._run("render", run_id, "--history-only"))
+        self.assertEqual(first_time, self.web_generator.generate.call_args.kwargs["report_time"])
+        self.assertFalse(self.web_generator.generate.call_args.kwargs["update_latest"])
+
+    def test_refilter_drops_filtered_and_downstream_stages_but_keeps_raw(self):
+        self._run("collect")
+        checkpoint = RunCheckpoint.latest(self.tmp.name)
+        checkpoint.save_articles("raw/roaming", ArticleBatch())
+        fake_analyze(None, None, checkpoint=checkpoint)
+
+        with patch.object(main, "collect_articles", return_value={}) as collect:
+            self._run("collect", "--run", checkpoint.run_id, "--refilter")
+
+        reopened = RunCheckpoint.open(self.tmp.name, checkpoint.run_id)
+        self.assertEqual(["raw/roaming"], reopened.completed_stages())
+        self.assertEqual(checkpoint.run_id, collect.call_args.kwargs["run_id"])
+
+    def test_failed_0404_collection_keeps_previous_alerts(self):
+        self._run("collect")
+        checkpoint = RunCheckpoint.latest(self.tmp.name)
+        checkpoint.save(STAGE_EXTERNAL_ALERTS, [{"title": "이전 공지"}])
+
+        with patch.object(main, "collect_external_alerts", return_value=[]):
+            self.assertEqual(1, self._run("0404"))
+
+        self.assertEqual(STATUS_COLLECTED, RunCheckpoint.open(self.tmp.name, checkpoint.run_id).status)
+        self.assertEqual([{"title": "이전 공지"}], RunCheckpoint.open(self.tmp.name, checkpoint.run_id).load(STAGE_EXTERNAL_ALERTS))
+
+    def test_stage_statuses_are_recorded_in_store(self):
+        store = ArticleStore(":memory:")
+        self.addCleanup(store.close)
+
+        self._run("collect", store=store)
+        run_id = RunCheckpoint.latest(self.tmp.name).run_id
+        self.assertEqual(STATUS_COLLECTED, store.get_run(run_id)["status"])
+
+        self._run("analyze", run_id, store=store)
+        self.assertEqual(STATUS_ANALYZED, store.get_run(run_id)["status"])
+
+    def test_failed_rerun_keeps_completed_run(self):
+        store = ArticleStore(":memory:")
+        self.addCleanup(store.close)
+        self._run("collect", store=store)
+        run_id = RunCheckpoint.latest(self.tmp.name).run_id
+        self._run("analyze", run_id, store=store)
+        self._run("render", run_id, store=store)
+        self.assertEqual(STATUS_COMPLETED, store.get_run(run_id)["status"])
+
+        with patch.object(main, "analyze_articles", side_effect=RuntimeError("quota exceeded")), \
+                self.assertRaises(RuntimeError):
+            self._run("analyze", run_id, "--force", store=store)
+
+        checkpoint = RunCheckpoint.open(self.tmp.name, run_id)
+        self.assertEqual(STATUS_COMPLETED, checkpoint.status)
+        self.assertEqual("quota exceeded", checkpoint.manifest["stage_error"])
+        self.assertEqual(STATUS_COMPLETED, store.get_run(run_id)["status"])
+
+    def test_render_falls_back_to_store_for_pruned_checkpoint(self):
+        store = ArticleStore(":memory:")
+        self.addCleanup(store.close)
+        run_id = "20260303_090000_abcdef"
+        store.start_run(run_id)
+        store.save_insights(run_id, INSIGHTS)
+        store.finish_run(run_id, report_path="output/web/history/daily_report_20260303_091500.html")
+        self.web_generator.generate_from_store.return_value = "output/web/history/daily_report_20260303_091500.html"
+
+        self.assertEqual(0, self._run("render", run_id, store=store))
+
+        self.web_generator.generate.assert_not_called()
+        self.assertEqual(run_id, self.web_generator.generate_from_store.call_args.args[0])
+        self.assertEqual(
+            datetime(2026, 3, 3, 9, 15), self.web_generator.generate_from_store.call_args.kwargs["report_time"]
+        )
+        self.assertEqual(STATUS_COMPLETED, store.get_run(run_id)["status"])
+
+    def test_send_emails_report_from_checkpoint(self):
+        self._run("collect")
+        fake_analyze(None, None, checkpoint=RunCheckpoint.latest(self.tmp.name))
+
+        with patch.object(main, "send_report_email") as send:
+            self.assertEqual(0, self._run("send"))
+
+        self.assertEqual("전략", send.call_args.args[0]["strategic_insight"])
+        self.web_generator.generate.assert_not_called()
+
+    def test_send_waits_for_pipeline_lock(self):
+        self._run("collect")
+        fake_analyze(None, None, checkpoint=RunCheckpoint.latest(self.tmp.name))
+        holder = FileLock(file_lock.PIPELINE_LOCK_PATH, owner="scheduler")
+        self.assertTrue(holder.acquire())
+        self.addCleanup(holder.release)
+
+        with patch.object(main, "send_report_email") as send, self.assertRaises(LockHeldError):
+            self._run("send")
+        send.assert_not_called()
+
+    def test_stage_command_without_checkpoint_exits_with_error(self):
+        with patch("config.settings.load_settings", return_value=_settings()), \
+                patch("storage.article_store.open_article_store", return_value=None), \
+                patch.object(main, "setup_logger", return_value=logging.getLogger("news_collector")), \
+                self.assertLogs("news_collector", level="ERROR") as logs:
+            self.assertEqual(1, main.main(["analyze"]))
+        self.assertIn("Checkpoint Error", logs.output[0])
+
+    def test_other_missing_files_are_not_reported_as_checkpoint_errors(self):
+        self._run("collect")
+        with patch("config.settings.load_settings", return_value=_settings()), \
+                patch("storage.article_store.open_article_store", return_value=None), \
+                patch.object(main, "setup_logger", return_value=logging.getLogger("news_collector")), \
+                patch.object(main, "load_categories", side_effect=FileNotFoundError("config/categories.yaml")), \
+                self.assertLogs("news_collector", level="ERROR") as logs:
+            self.assertEqual(1, main.main(["analyze"]))
+        self.assertIn("Unexpected Error", logs.output[0])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,102 @@
+import io
+import json
+import os
+import subprocess
+import sys
+import tempfile
+import unittest
+from contextlib import redirect_stderr, redirect_stdout
+from pathlib import Path
+from unittest.mock import patch
+
+import main
+from config import recipient_store
+
+ROOT = Path(__file__).resolve().parent.parent
+
+# `import main` 누적 import 시간 상한 (느린 CI 여유 포함, 로컬 측정 약 60ms)
+IMPORT_BUDGET_US = 300_000
+HEAVY_MODULES = ("openai", "requests", "yaml", "flask", "dotenv", "sqlite3", "smtplib", "cProfile")
+
+
+def _import_times(*args: str):
+    """`python -X importtime ...` 실행 -> ({모듈: 누적 마이크로초}, 완료 프로세스)"""
+    completed = subprocess.run(
+        [sys.executable, "-X", "importtime", *args],
+        cwd=ROOT, capture_output=True, text=True, timeout=60,
+    )
+    times = {}
+    for line in completed.stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        _, cumulative, name = line[len("import time:"):].split("|")
+        times[name.strip()] = int(cumulative)
+    return times, completed
+
+
+class ImportTimeTests(unittest.TestCase):
+    def test_importing_main_skips_heavy_layers_and_stays_in_budget(self):
+        times, completed = _import_times("-c", "import main")
+
+        self.assertEqual(0, completed.returncode, completed.stderr[-2000:])
+        self.assertEqual([], [name for name in HEAVY_MODULES if name in times])
+        self.assertLess(times["main"], IMPORT_BUDGET_US)
+
+    def test_list_recipients_command_does_not_load_pipeline(self):
+        times, completed = _import_times("main.py", "list-recipients", "--group", "report")
+
+        self.assertEqual(0, completed.returncode, completed.stderr[-2000:])
+        self.assertTrue(completed.stdout.strip())
+        self.assertEqual([], [name for name in HEAVY_MODULES if name in times])
+
+
+class SubcommandTests(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmp.cleanup)
+        recipients_file = Path(self.tmp.name) / "email_recipients.json"
+        recipients_file.write_text(json.dumps({
+            "schema_version": 2,
+            "report_recipients": ["a@example.com", "b@example.com"],
+            "safety_alert_recipients": ["c@example.com"],
+        }), encoding="utf-8")
+        patcher = patch.object(recipient_store, "RECIPIENTS_FILE", recipients_file)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def _main(self, *argv: str):
+        stdout, stderr = io.StringIO(), io.StringIO()
+        with redirect_stdout(stdout), redirect_stderr(stderr):
+            code = main.main(list(argv))
+        return code, stdout.getvalue(), stderr.getvalue()
+
+    def test_list_recipients_prints_group_or_all_groups(self):
+        code, out, _ = self._main("list-recipients", "--group", "safety_alert")
+        self.assertEqual((0, "c@example.com\n"), (code, out))
+
+        code, out, _ = self._main("list-recipients")
+        self.assertIn("[report] 2", out)
+        self.assertIn("[safety_alert] 1", out)
+
+    def test_send_latest_uses_latest_report_and_fails_without_one(self):
+        output_dir = os.path.join(self.tmp.name, "output")
+        code, _, err = self._main("send-latest", "--output-dir", output_dir, "--dry-run")
+        self.assertEqual(1, code)
+        self.assertIn("No report found", err)
+
+        history = Path(output_dir) / "web" / "history"
+        history.mkdir(parents=True)
+        (history / "daily_report_20260302_090000.html").write_text("<html>report</html>", encoding="utf-8")
+        code, out, _ = self._main("send-latest", "--output-dir", output_dir, "--dry-run")
+        self.assertEqual(0, code)
+        self.assertIn("daily_report_20260302_090000.html to 2 recipients", out)
+
+        with patch("notifiers.smtp_sender.SMTPSender.send") as send, \
+                patch.dict(os.environ, {"GMAIL_USER": "bot@example.com", "GMAIL_APP_PASSWORD": "pw"}):
+            code, _, _ = self._main("send-latest", "--output-dir", output_dir, "--to", "x@example.com")
+        self.assertEqual(0, code)
+        send.assert_called_once_with("<html>report</html>", ["x@example.com"])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,66 @@
+from datetime import datetime, timedelta, timezone
+import unittest
+
+from benchmarks.micro_bench import run_micro_benchmark
+from benchmarks.synthetic import SyntheticArticleGenerator, SyntheticProfile
+from filters.deduplicator import Deduplicator
+from filters.keyword_filter import KeywordFilter
+from filters.time_filter import TimeFilter
+
+NOW = datetime(2026, 10, 19, 0, 0, tzinfo=timezone.utc)
+
+
+class SyntheticArticleGeneratorTests(unittest.TestCase):
+    def test_same_seed_generates_same_articles(self):
+        first = SyntheticArticleGenerator(now=NOW).batch(500)
+        second = SyntheticArticleGenerator(now=NOW).batch(500)
+
+        self.assertEqual(first.column("title"), second.column("title"))
+        self.assertEqual(first.column("published"), second.column("published"))
+
+    def test_distribution_matches_profile_and_filters_catch_injected_rows(self):
+        profile = SyntheticProfile(duplicate_rate=0.2, blacklist_rate=0.1, excluded_keyword_rate=0.0, in_window_rate=0.6)
+        generator = SyntheticArticleGenerator(profile, blacklist_domains=["promo"], excluded_keywords=["쿠폰"], now=NOW)
+        batch = generator.batch(20_000)
+        stats = generator.stats
+
+        duplicates = stats["duplicate_title"] + stats["duplicate_link"]
+        self.assertAlmostEqual(0.2, duplicates / len(batch), delta=0.02)
+        originals = len(batch) - duplicates
+        self.assertAlmostEqual(0.1, stats["blacklist"] / originals, delta=0.02)
+        self.assertAlmostEqual(0.6, stats["in_window"] / originals, delta=0.02)
+
+        unique = Deduplicator().deduplicate_within_category(batch)
+        self.assertEqual(originals, len(unique))
+        keyword_filter = KeywordFilter(blacklist_domains=["promo"], excluded_keywords=["쿠폰"])
+        self.assertEqual(0, sum(1 for article in keyword_filter.filter_articles(unique) if "promo" in article.link))
+        in_window = TimeFilter(start_time=NOW - timedelta(hours=24), end_time=NOW, missing_date_policy="drop").filter_articles(unique)
+        self.assertEqual(stats["in_window"], len(in_window))
+
+    def test_0404_posts_mix_telecom_and_general_notices(self):
+        generator = SyntheticArticleGenerator(SyntheticProfile(telecom_post_rate=0.5, advisory_post_rate=0.0, excluded_post_rate=0.0))
+        posts = list(generator.iter_0404_posts(200))
+
+        self.assertEqual(200, len(posts))
+        self.assertEqual(200, generator.stats["post_telecom"] + generator.stats["post_general"])
+
+
+class MicroBenchmarkTests(unittest.TestCase):
+    def test_reports_throughput_and_peak_memory(self):
+        result = run_micro_benchmark("dedup_within", count=3_000, chunk_size=1_000)
+
+        self.assertEqual(3_000, result["items"])
+        self.assertLess(result["passed"], 3_000)
+        self.assertGreater(result["items_per_sec"], 0)
+        self.assertGreater(result["peak_memory_mb"], 0)
+
+    def test_classify_0404_counts_matched_posts(self):
+        result = run_micro_benchmark("classify_0404", count=300, chunk_size=100, measure_memory=False)
+
+        self.assertGreater(result["passed"], 0)
+        self.assertLessEqual(result["passed"], result["generated"]["post_telecom"] + result["generated"]["post_excluded"])
+        self.assertIsNone(result["peak_memory_mb"])
+
+
+if __name__ == "__main__":
+    unittest.main()
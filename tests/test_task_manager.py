@@ -0,0 +1,93 @@
+import os
+import tempfile
+import threading
+import unittest
+from unittest.mock import patch
+
+from storage.job_queue import JobQueue
+from web.task_manager import WORKER_MODE_EXTERNAL, TaskCapacityError, TaskManager
+import worker
+
+
+class TaskManagerTests(unittest.TestCase):
+    def setUp(self):
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        self.queue = JobQueue(os.path.join(tmp.name, 'jobs.db'))
+        self.addCleanup(self.queue.close)
+        self.release = threading.Event()
+        self.addCleanup(self.release.set)
+        self.runs = []
+
+        def handler(queue, job_id):
+            self.runs.append(job_id)
+            self.release.wait(5)
+            queue.update(job_id, 'completed', status='completed', progress=100)
+
+        patcher = patch.dict(worker.JOB_HANDLERS, {'analysis': handler})
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def test_concurrent_starts_join_in_flight_run(self):
+        manager = TaskManager(queue=self.queue)
+        self.addCleanup(manager.shutdown)
+
+        first, started = manager.start('analysis')
+        second, joined = manager.start('analysis')
+
+        self.assertTrue(started)
+        self.assertFalse(joined)
+        self.assertEqual(first, second)
+
+        self.release.set()
+        manager.shutdown(wait=True)
+        self.assertEqual([first], self.runs)
+        self.assertEqual('completed', manager.get(first)['status'])
+
+    def test_new_run_starts_after_previous_finishes(self):
+        manager = TaskManager(queue=self.queue)
+        self.addCleanup(manager.shutdown)
+        self.release.set()
+
+        first, _ = manager.start('analysis')
+        manager.shutdown(wait=True)
+
+        second, started = manager.start('analysis')
+        manager.shutdown(wait=True)
+        self.assertTrue(started)
+        self.assertNotEqual(first, second)
+        self.assertEqual([first, second], self.runs)
+
+    def test_active_task_limit(self):
+        manager = TaskManager(queue=self.queue, mode=WORKER_MODE_EXTERNAL, max_active=1)
+
+        manager.start('analysis')
+        with self.assertRaises(TaskCapacityError):
+            manager.start('backfill')
+
+    def test_finished_tasks_evicted_after_ttl(self):
+        manager = TaskManager(queue=self.queue, ttl_seconds=60, prune_interval=0)
+        self.addCleanup(manager.shutdown)
+        self.release.set()
+
+        task_id, _ = manager.start('analysis')
+        manager.shutdown(wait=True)
+        self.assertIsNotNone(manager.get(task_id))
+
+        with patch('storage.job_queue.time.time', return_value=10 ** 10):
+            self.assertIsNone(manager.get(task_id))
+
+    def test_external_mode_only_enqueues_for_worker_process(self):
+        manager = TaskManager(queue=self.queue, mode=WORKER_MODE_EXTERNAL)
+        self.release.set()
+
+        task_id, _ = manager.start('analysis')
+        self.assertEqual('pending', manager.get(task_id)['status'])
+
+        worker.run_worker(self.queue, 'test-worker', once=True)
+        self.assertEqual([task_id], self.runs)
+        self.assertEqual('completed', manager.get(task_id)['status'])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,74 @@
+from datetime import datetime, timedelta, timezone
+import unittest
+from zoneinfo import ZoneInfo
+
+from filters.time_filter import MISSING_DATE_DROP, TimeFilter
+from utils.article import ArticleBatch
+
+
+START = datetime(2026, 3, 27, 0, 0, tzinfo=timezone.utc)
+END = datetime(2026, 3, 30, 0, 0, tzinfo=timezone.utc)
+
+
+class TimeFilterBatchTests(unittest.TestCase):
+    def setUp(self):
+        self.articles = ArticleBatch([
+            {"title": "before", "published": START - timedelta(microseconds=1)},
+            {"title": "start", "published": START},
+            {"title": "kst", "published": datetime(2026, 3, 29, 8, 59, tzinfo=ZoneInfo("Asia/Seoul"))},
+            {"title": "naive", "published": datetime(2026, 3, 28, 12, 0)},
+            {"title": "end", "published": END},
+            {"title": "missing", "published": None},
+        ])
+
+    def test_select_indices_applies_half_open_window(self):
+        time_filter = TimeFilter(start_time=START, end_time=END)
+
+        self.assertEqual([1, 2, 3, 5], time_filter.select_indices(self.articles))
+
+    def test_batch_path_matches_per_article_validation(self):
+        time_filter = TimeFilter(start_time=START, end_time=END)
+        expected = [i for i, a in enumerate(self.articles) if time_filter.is_valid(a.published)]
+
+        self.assertEqual(expected, time_filter.select_indices(self.articles))  # epoch 열 순회
+        self.assertIsNone(self.articles.cached_sorted_epochs())
+        self.articles.sorted_epochs()
+        self.assertEqual(expected, time_filter.select_indices(self.articles))  # 정렬 열 bisect
+
+    def test_missing_date_policy_drop(self):
+        time_filter = TimeFilter(start_time=START, end_time=END)
+
+        filtered = time_filter.filter_batch(self.articles, missing_date_policy=MISSING_DATE_DROP)
+
+        self.assertEqual(["start", "kst", "naive"], [a.title for a in filtered])
+
+    def test_open_ended_window_without_end_time(self):
+        time_filter = TimeFilter(start_time=START, missing_date_policy=MISSING_DATE_DROP)
+
+        self.assertEqual([1, 2, 3, 4], time_filter.select_indices(self.articles))
+
+    def test_epoch_columns_cached_until_batch_changes(self):
+        time_filter = TimeFilter(start_time=START, end_time=END)
+        self.assertIs(self.articles.sorted_epochs(), self.articles.sorted_epochs())
+        epochs = self.articles.published_epochs()
+
+        self.articles.append({"title": "late", "published": START + timedelta(hours=1)})
+
+        self.assertIsNot(epochs, self.articles.published_epochs())
+        self.assertEqual([1, 2, 3, 5, 6], time_filter.select_indices(self.articles))
+
+    def test_filter_articles_matches_batch_path(self):
+        time_filter = TimeFilter(start_time=START, end_time=END)
+
+        self.assertEqual(
+            [a.title for a in time_filter.filter_batch(self.articles)],
+            [a.title for a in time_filter.filter_articles(self.articles)],
+        )
+
+    def test_invalid_policy_rejected(self):
+        with self.assertRaises(ValueError):
+            TimeFilter(missing_date_policy="maybe")
+
+
+if __name__ == "__main__":
+    unittest.main()
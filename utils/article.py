@@ -0,0 +1,296 @@
+"""
+파이프라인 공통 기사 레코드 (Article / ArticleBatch)
+"""
+from __future__ import annotations
+
+from array import array
+from datetime import datetime
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Sequence, Tuple, Union
+
+from utils.time_windows import to_epoch_us
+
+# 필드명 -> 기본값. 문자열 필드는 빈 문자열로 두어 기존 dict 기반 코드의
+# `article.get(key, '')` 패턴과 동일한 결과를 보장한다.
+ARTICLE_FIELDS: Dict[str, Any] = {
+    "title": "",
+    "link": "",
+    "snippet": "",
+    "source": "",
+    "published": None,
+    "published_raw": "",
+    "freshness_source": "",
+    "source_domain": "",
+    "query": "",
+    "quality_flags": None,
+    "type": "",
+    "category": "",
+}
+
+# 필터에서 소문자 비교에 사용하는 필드
+LOWER_FIELDS = ("title", "snippet", "link", "query", "source_domain")
+
+# 게시일이 없는 기사의 epoch 값 (int64 최솟값)
+MISSING_EPOCH = -(2 ** 63)
+
+# 원본 dict에 있던 필드를 비트마스크로 기록한다 (`key in article`의 dict 호환)
+FIELD_BITS: Dict[str, int] = {name: 1 << i for i, name in enumerate(ARTICLE_FIELDS)}
+ALL_FIELDS_MASK = (1 << len(ARTICLE_FIELDS)) - 1
+
+
+class Article:
+    """
+    __slots__ 기반 기사 레코드
+
+    - 정해진 필드는 slot으로 저장하고, 그 외 키는 `extra`에 보관한다 (없으면 None).
+    - `article['title']`, `article.get('link')` 등 dict 호환 접근을 지원한다.
+      `in`/`get`/`keys`는 원본 dict에 실제로 있던 필드만 있는 것으로 본다 (생성자로 만들면 모든 필드).
+      `article['field']`는 원본에 없던 필드도 기본값을 돌려준다.
+    - 소문자 필드(`title_lower` 등)는 원본 값이 바뀌지 않는 한 캐시된다 (첫 조회 때 생성).
+    - 값이 바뀌는 레코드이므로 해시할 수 없다 (`__hash__ = None`).
+    """
+
+    __slots__ = tuple(ARTICLE_FIELDS) + ("extra", "_lower_cache", "_present")
+
+    def __init__(
+        self,
+        title: Optional[str] = "",
+        link: Optional[str] = "",
+        snippet: Optional[str] = "",
+        source: str = "",
+        published: Optional[datetime] = None,
+        published_raw: str = "",
+        freshness_source: str = "",
+        source_domain: str = "",
+        query: str = "",
+        quality_flags: Optional[List[str]] = None,
+        type: str = "",
+        category: str = "",
+        extra: Optional[Dict[str, Any]] = None,
+    ):
+        self.title = title
+        self.link = link
+        self.snippet = snippet
+        self.source = source
+        self.published = published
+        self.published_raw = published_raw
+        self.freshness_source = freshness_source
+        self.source_domain = source_domain
+        self.query = query
+        self.quality_flags = list(quality_flags) if quality_flags else []
+        self.type = type
+        self.category = category
+        self.extra: Optional[Dict[str, Any]] = dict(extra) if extra else None
+        self._lower_cache: Optional[Dict[str, tuple]] = None
+        self._present = ALL_FIELDS_MASK
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "Article":
+        """dict 기사 -> Article 변환 (알 수 없는 키는 extra로 보관)"""
+        if isinstance(data, Article):
+            return data
+        known = {key: data[key] for key in ARTICLE_FIELDS if key in data}
+        extra = {key: value for key, value in data.items() if key not in FIELD_BITS} if len(known) < len(data) else None
+        article = cls(**known, extra=extra)
+        article._present = sum(FIELD_BITS[key] for key in known)
+        return article
+
+    def to_dict(self) -> Dict[str, Any]:
+        """dict 변환 (formatter/직렬화 호환용, 모든 필드 포함)"""
+        data = {key: getattr(self, key) for key in ARTICLE_FIELDS}
+        data["quality_flags"] = list(self.quality_flags)
+        if self.extra:
+            data.update(self.extra)
+        return data
+
+    def lower(self, field: str) -> str:
+        """필드의 소문자 문자열을 반환한다 (원본 값 동일 시 캐시 재사용)."""
+        if field in FIELD_BITS:
+            raw = getattr(self, field)
+        else:
+            raw = self.extra.get(field) if self.extra else None
+        if self._lower_cache is None:
+            self._lower_cache = {}
+        else:
+            cached = self._lower_cache.get(field)
+            if cached is not None and cached[0] is raw:
+                return cached[1]
+        lowered = str(raw or "").lower()
+        self._lower_cache[field] = (raw, lowered)
+        return lowered
+
+    @property
+    def title_lower(self) -> str:
+        return self.lower("title")
+
+    @property
+    def snippet_lower(self) -> str:
+        return self.lower("snippet")
+
+    @property
+    def link_lower(self) -> str:
+        return self.lower("link")
+
+    @property
+    def query_lower(self) -> str:
+        return self.lower("query")
+
+    @property
+    def source_domain_lower(self) -> str:
+        return self.lower("source_domain")
+
+    # dict 호환 shim
+    def __getitem__(self, key: str) -> Any:
+        if key in FIELD_BITS:
+            return getattr(self, key)
+        if self.extra is None:
+            raise KeyError(key)
+        return self.extra[key]
+
+    def __setitem__(self, key: str, value: Any) -> None:
+        bit = FIELD_BITS.get(key)
+        if bit is not None:
+            setattr(self, key, value)
+            self._present |= bit
+        elif self.extra is None:
+            self.extra = {key: value}
+        else:
+            self.extra[key] = value
+
+    def __contains__(self, key: object) -> bool:
+        bit = FIELD_BITS.get(key)
+        if bit is not None:
+            return bool(self._present & bit)
+        return self.extra is not None and key in self.extra
+
+    def get(self, key: str, default: Any = None) -> Any:
+        bit = FIELD_BITS.get(key)
+        if bit is not None:
+            value = getattr(self, key)
+            return default if value is None or not self._present & bit else value
+        return self.extra.get(key, default) if self.extra else default
+
+    def keys(self) -> List[str]:
+        present = [key for key, bit in FIELD_BITS.items() if self._present & bit]
+        return present + list(self.extra) if self.extra else present
+
+    def items(self) -> List[tuple]:
+        return [(key, self[key]) for key in self.keys()]
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, Article):
+            return self.to_dict() == other.to_dict()
+        if isinstance(other, dict):
+            return self.to_dict() == Article.from_dict(other).to_dict()
+        return NotImplemented
+
+    __hash__ = None  # type: ignore[assignment]
+
+    def __repr__(self) -> str:
+        return f"Article(title={self.title!r}, link={self.link!r}, category={self.category!r})"
+
+
+ArticleLike = Union[Article, Dict[str, Any]]
+
+
+class ArticleBatch:
+    """
+    Article 묶음 컨테이너 (카테고리 단위 필터/분석 입력)
+
+    게시일 epoch 열과 그 정렬 순서는 처음 요청할 때 한 번 만들고, append/extend 전까지 재사용한다.
+    batch에 넣은 기사의 `published`를 직접 바꾼 경우에는 invalidate_epochs()를 호출한다.
+    """
+
+    __slots__ = ("_items", "_epochs", "_epoch_order")
+
+    def __init__(self, articles: Optional[Iterable[ArticleLike]] = None):
+        self._items: List[Article] = [Article.from_dict(a) for a in (articles or [])]
+        self._epochs: Optional[array] = None
+        self._epoch_order: Optional[Tuple[List[int], array]] = None
+
+    @classmethod
+    def coerce(cls, articles: Union["ArticleBatch", Iterable[ArticleLike]]) -> "ArticleBatch":
+        """ArticleBatch는 그대로, 그 외 iterable은 새 batch로 변환한다."""
+        if isinstance(articles, ArticleBatch):
+            return articles
+        return cls(articles)
+
+    def take(self, indices: Iterable[int]) -> "ArticleBatch":
+        """인덱스 목록에 해당하는 기사만 담은 새 batch 반환"""
+        batch = ArticleBatch()
+        batch._items = [self._items[i] for i in indices]
+        return batch
+
+    def column(self, field: str) -> List[Any]:
+        """필드 값 목록(열 단위) 반환"""
+        return [article[field] if field in article else None for article in self._items]
+
+    def published_epochs(self) -> array:
+        """
+        게시일을 UTC epoch 마이크로초 int64 배열로 변환한다 (batch에 캐시).
+        게시일이 없으면 MISSING_EPOCH로 채운다.
+        """
+        if self._epochs is None:
+            self._epochs = array("q", (
+                to_epoch_us(article.published) if article.published else MISSING_EPOCH
+                for article in self._items
+            ))
+        return self._epochs
+
+    def sorted_epochs(self) -> Tuple[List[int], array]:
+        """
+        게시일 오름차순 기사 인덱스와 그 순서로 정렬한 epoch 배열 (batch에 캐시).
+
+        시간 구간 선택을 bisect 두 번 + 슬라이스로 처리할 수 있게 한다.
+        같은 게시일은 입력 순서를 유지하고, 게시일 누락(MISSING_EPOCH)은 맨 앞에 모인다.
+        """
+        if self._epoch_order is None:
+            epochs = self.published_epochs()
+            order = sorted(range(len(epochs)), key=epochs.__getitem__)
+            self._epoch_order = (order, array("q", sorted(epochs)))
+        return self._epoch_order
+
+    def cached_sorted_epochs(self) -> Optional[Tuple[List[int], array]]:
+        """sorted_epochs()를 이미 계산했으면 그 결과, 아니면 None (정렬 비용 없이 확인)"""
+        return self._epoch_order
+
+    def invalidate_epochs(self) -> None:
+        """캐시된 epoch 열 폐기 (기사의 published를 직접 바꾼 뒤 호출)"""
+        self._epochs = None
+        self._epoch_order = None
+
+    def append(self, article: ArticleLike) -> None:
+        self._items.append(Article.from_dict(article))
+        self.invalidate_epochs()
+
+    def extend(self, articles: Iterable[ArticleLike]) -> None:
+        self._items.extend(Article.from_dict(a) for a in articles)
+        self.invalidate_epochs()
+
+    def to_dicts(self) -> List[Dict[str, Any]]:
+        return [article.to_dict() for article in self._items]
+
+    def __iter__(self) -> Iterator[Article]:
+        return iter(self._items)
+
+    def __len__(self) -> int:
+        return len(self._items)
+
+    def __bool__(self) -> bool:
+        return bool(self._items)
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            batch = ArticleBatch()
+            batch._items = self._items[index]
+            return batch
+        return self._items[index]
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, ArticleBatch):
+            return self._items == other._items
+        if isinstance(other, Sequence):
+            return list(self._items) == list(other)
+        return NotImplemented
+
+    def __repr__(self) -> str:
+        return f"ArticleBatch({len(self._items)} articles)"
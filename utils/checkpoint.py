@@ -0,0 +1,243 @@
+"""
+파이프라인 단계별 체크포인트 (output/checkpoints/<run_id>/) 저장/복원
+"""
+from __future__ import annotations
+
+import json
+import logging
+import os
+import shutil
+from datetime import datetime
+from typing import Any, Dict, List, Optional
+
+from utils.article import ArticleBatch
+from utils.exceptions import CheckpointNotFoundError
+from utils.time_windows import KST, CollectionWindow
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_CHECKPOINT_DIR = "output/checkpoints"
+MANIFEST_NAME = "manifest.json"
+
+STATUS_RUNNING = "running"
+STATUS_FAILED = "failed"
+STATUS_COMPLETED = "completed"
+# 단계 명령(collect/analyze)만 끝난 실행 (render 전이라 미완료로 취급)
+STATUS_COLLECTED = "collected"
+STATUS_ANALYZED = "analyzed"
+
+# 단계 키 (카테고리 단위 단계는 "<prefix>/<category>")
+STAGE_RAW = "raw"
+STAGE_FILTERED = "filtered"
+STAGE_SUMMARIES = "summaries"
+STAGE_INSIGHTS = "insights"
+STAGE_EXTERNAL_ALERTS = "external_alerts"
+
+
+def _write_json(path: str, data: Any) -> None:
+    tmp_path = f"{path}.tmp"
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        json.dump(data, f, ensure_ascii=False, default=str)
+    os.replace(tmp_path, path)
+
+
+def _encode_article(article) -> Dict[str, Any]:
+    data = article.to_dict()
+    if isinstance(data.get("published"), datetime):
+        data["published"] = data["published"].isoformat()
+    return data
+
+
+def _decode_article(data: Dict[str, Any]) -> Dict[str, Any]:
+    published = data.get("published")
+    if isinstance(published, str) and published:
+        try:
+            data["published"] = datetime.fromisoformat(published)
+        except ValueError:
+            data["published"] = None
+    return data
+
+
+def _window_to_dict(window: CollectionWindow) -> Dict[str, Any]:
+    return {
+        "start_utc": window.start_utc.isoformat(),
+        "end_utc": window.end_utc.isoformat(),
+        "is_monday_special": window.is_monday_special,
+        "label": window.label,
+    }
+
+
+def _window_from_dict(data: Dict[str, Any]) -> CollectionWindow:
+    start_utc = datetime.fromisoformat(data["start_utc"])
+    end_utc = datetime.fromisoformat(data["end_utc"])
+    return CollectionWindow(
+        start_utc=start_utc,
+        end_utc=end_utc,
+        start_kst=start_utc.astimezone(KST),
+        end_kst=end_utc.astimezone(KST),
+        is_monday_special=data.get("is_monday_special", False),
+        label=data.get("label", ""),
+    )
+
+
+class RunCheckpoint:
+    """
+    실행 1건의 단계별 결과를 JSON 파일로 남긴다.
+
+    - raw/<category>: 소스 수집 직후(필터 전) 기사
+    - filtered/<category>: 시간/키워드 필터 + 중복 제거 후 기사
+    - summaries/<category>: 카테고리 요약 결과
+    - insights: 전략 인사이트
+    - external_alerts: 0404 공지
+
+    manifest.json에 실행 윈도우와 완료된 단계 목록을 기록하며, 재개 시 완료된 단계는 파일에서 읽어 건너뛴다.
+    """
+
+    def __init__(self, root: str, run_id: str, manifest: Dict[str, Any]):
+        self.root = root
+        self.run_id = run_id
+        self.dir = os.path.join(root, run_id)
+        self.manifest = manifest
+
+    @classmethod
+    def create(cls, root: str, run_id: str, window: CollectionWindow) -> "RunCheckpoint":
+        """새 실행 체크포인트 디렉터리 생성"""
+        os.makedirs(os.path.join(root, run_id), exist_ok=True)
+        checkpoint = cls(root, run_id, {
+            "run_id": run_id,
+            "created_at": datetime.now().isoformat(),
+            "status": STATUS_RUNNING,
+            "window": _window_to_dict(window),
+            "stages": {},
+        })
+        checkpoint._save_manifest()
+        return checkpoint
+
+    @classmethod
+    def open(cls, root: str, run_id: str) -> "RunCheckpoint":
+        """
+        기존 체크포인트 열기
+
+        Raises:
+            CheckpointNotFoundError: 체크포인트가 없음
+        """
+        try:
+            with open(os.path.join(root, run_id, MANIFEST_NAME), encoding="utf-8") as f:
+                return cls(root, run_id, json.load(f))
+        except FileNotFoundError as e:
+            raise CheckpointNotFoundError(f"No run checkpoint {run_id} under {root}") from e
+
+    @classmethod
+    def latest_incomplete(cls, root: str) -> Optional["RunCheckpoint"]:
+        """완료되지 않은 가장 최근 실행 체크포인트 (없으면 None)"""
+        for run_id in sorted(list_checkpoint_runs(root), reverse=True):
+            try:
+                checkpoint = cls.open(root, run_id)
+            except (OSError, ValueError):
+                continue
+            if checkpoint.manifest.get("status") != STATUS_COMPLETED:
+                return checkpoint
+        return None
+
+    @classmethod
+    def latest(cls, root: str) -> Optional["RunCheckpoint"]:
+        """상태와 관계없이 가장 최근 실행 체크포인트 (없으면 None)"""
+        for run_id in sorted(list_checkpoint_runs(root), reverse=True):
+            try:
+                return cls.open(root, run_id)
+            except (OSError, ValueError):
+                continue
+        return None
+
+    @property
+    def window(self) -> CollectionWindow:
+        return _window_from_dict(self.manifest["window"])
+
+    @property
+    def status(self) -> str:
+        return self.manifest.get("status", STATUS_RUNNING)
+
+    def _save_manifest(self) -> None:
+        _write_json(os.path.join(self.dir, MANIFEST_NAME), self.manifest)
+
+    def _path(self, stage: str) -> str:
+        return os.path.join(self.dir, f"{stage.replace('/', '__')}.json")
+
+    def has(self, stage: str) -> bool:
+        return stage in self.manifest["stages"] and os.path.exists(self._path(stage))
+
+    def save(self, stage: str, payload: Any) -> None:
+        """단계 결과 저장 (파일 작성 후 manifest에 완료 기록)"""
+        _write_json(self._path(stage), payload)
+        self.manifest["stages"][stage] = datetime.now().isoformat()
+        self._save_manifest()
+
+    def load(self, stage: str) -> Any:
+        with open(self._path(stage), encoding="utf-8") as f:
+            return json.load(f)
+
+    def save_articles(self, stage: str, articles: ArticleBatch) -> None:
+        self.save(stage, [_encode_article(article) for article in articles])
+
+    def load_articles(self, stage: str) -> ArticleBatch:
+        return ArticleBatch(_decode_article(item) for item in self.load(stage))
+
+    def categories(self, prefix: str) -> List[str]:
+        """카테고리 단위 단계(prefix/<category>)가 저장된 카테고리 목록"""
+        return sorted(stage.split("/", 1)[1] for stage in self.manifest["stages"] if stage.startswith(f"{prefix}/"))
+
+    def discard(self, *prefixes: str) -> List[str]:
+        """
+        단계 결과 삭제 (다시 실행하도록). 카테고리 단위 단계는 prefix로 모든 카테고리를 지운다.
+
+        Returns:
+            삭제한 단계 목록
+        """
+        doomed = [
+            stage for stage in self.manifest["stages"]
+            if any(stage == prefix or stage.startswith(f"{prefix}/") for prefix in prefixes)
+        ]
+        for stage in doomed:
+            try:
+                os.remove(self._path(stage))
+            except FileNotFoundError:
+                pass
+            del self.manifest["stages"][stage]
+        if doomed:
+            self._save_manifest()
+        return sorted(doomed)
+
+    def mark(self, status: str, **fields: Any) -> None:
+        """실행 상태 기록 (completed/failed + report_path/error 등)"""
+        self.manifest["status"] = status
+        self.manifest["updated_at"] = datetime.now().isoformat()
+        self.manifest.update(fields)
+        self._save_manifest()
+
+    def completed_stages(self) -> List[str]:
+        return sorted(self.manifest["stages"])
+
+
+def list_checkpoint_runs(root: str) -> List[str]:
+    try:
+        return [name for name in os.listdir(root) if os.path.isfile(os.path.join(root, name, MANIFEST_NAME))]
+    except FileNotFoundError:
+        return []
+
+
+def prune_checkpoints(root: str, keep_runs: int) -> int:
+    """
+    최근 keep_runs개 실행만 남기고 오래된 체크포인트 삭제 (run_id는 시각순 정렬 가능)
+
+    Returns:
+        삭제한 실행 수
+    """
+    if keep_runs <= 0:
+        return 0
+    runs = sorted(list_checkpoint_runs(root))
+    doomed = runs[:-keep_runs]
+    for run_id in doomed:
+        shutil.rmtree(os.path.join(root, run_id), ignore_errors=True)
+    if doomed:
+        logger.info(f"Pruned {len(doomed)} old checkpoint(s) from {root}")
+    return len(doomed)
@@ -31,3 +31,13 @@ class AnalysisError(NewsCollectorError):
 class NotificationError(NewsCollectorError):
     """알림 발송 실패"""
     pass
+
+
+class LockHeldError(NewsCollectorError):
+    """다른 프로세스가 실행 잠금을 보유 중"""
+    pass
+
+
+class CheckpointNotFoundError(NewsCollectorError, FileNotFoundError):
+    """실행 체크포인트(또는 필요한 단계 결과)가 없음"""
+    pass
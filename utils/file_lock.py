@@ -0,0 +1,116 @@
+"""
+프로세스 간 파일 잠금 (파이프라인 중복 실행 방지)
+"""
+from __future__ import annotations
+
+import json
+import logging
+import os
+import time
+from datetime import datetime
+from typing import Optional
+
+from utils.exceptions import LockHeldError
+
+if os.name == "nt":
+    import msvcrt
+else:
+    import fcntl
+
+logger = logging.getLogger(__name__)
+
+PIPELINE_LOCK_PATH = "output/locks/pipeline.lock"
+LOCK_POLL_SECONDS = 0.05
+
+
+class FileLock:
+    """
+    배타적 파일 잠금 (POSIX flock / Windows msvcrt.locking).
+
+    잠금은 열린 파일에 묶여 있어 프로세스가 죽으면 OS가 자동으로 해제한다.
+    잠금 파일에는 보유 프로세스 정보(pid, 시각, owner)를 기록해 진단에 사용한다.
+    """
+
+    def __init__(self, path: str, owner: str = ""):
+        self.path = path
+        self.owner = owner
+        self._fd: Optional[int] = None
+
+    @property
+    def locked(self) -> bool:
+        return self._fd is not None
+
+    def acquire(self, timeout: float = 0.0) -> bool:
+        """
+        잠금 시도.
+
+        Args:
+            timeout: 다른 프로세스가 보유 중일 때 기다릴 최대 시간(초, 기본 0 = 기다리지 않음)
+
+        Returns:
+            획득하면 True, 다른 프로세스가 보유 중이면 False
+        """
+        deadline = time.monotonic() + timeout
+        while not self._try_acquire():
+            if time.monotonic() >= deadline:
+                return False
+            time.sleep(LOCK_POLL_SECONDS)
+        return True
+
+    def _try_acquire(self) -> bool:
+        if self._fd is not None:
+            return True
+        directory = os.path.dirname(self.path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+
+        fd = os.open(self.path, os.O_RDWR | os.O_CREAT, 0o644)
+        try:
+            if os.name == "nt":
+                msvcrt.locking(fd, msvcrt.LK_NBLCK, 1)
+            else:
+                fcntl.flock(fd, fcntl.LOCK_EX | fcntl.LOCK_NB)
+        except OSError:
+            os.close(fd)
+            return False
+
+        info = json.dumps({"pid": os.getpid(), "owner": self.owner, "acquired_at": datetime.now().isoformat()})
+        os.ftruncate(fd, 0)
+        os.lseek(fd, 0, os.SEEK_SET)
+        os.write(fd, info.encode("utf-8"))
+        self._fd = fd
+        return True
+
+    def release(self) -> None:
+        if self._fd is None:
+            return
+        fd, self._fd = self._fd, None
+        try:
+            if os.name == "nt":
+                os.lseek(fd, 0, os.SEEK_SET)
+                msvcrt.locking(fd, msvcrt.LK_UNLCK, 1)
+            else:
+                fcntl.flock(fd, fcntl.LOCK_UN)
+        finally:
+            os.close(fd)
+
+    def holder(self) -> str:
+        """현재 잠금 파일에 기록된 보유자 정보 (로그용)"""
+        try:
+            with open(self.path, encoding="utf-8") as f:
+                return f.read().strip()
+        except OSError:
+            return ""
+
+    def __enter__(self) -> "FileLock":
+        if not self.acquire():
+            raise LockHeldError(f"Lock {self.path} is held by another process: {self.holder() or 'unknown'}")
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.release()
+
+
+def pipeline_lock(owner: str, path: Optional[str] = None) -> FileLock:
+    """파이프라인 실행 잠금 (CLI/스케줄러/대시보드 worker가 공유)"""
+    return FileLock(path or PIPELINE_LOCK_PATH, owner=owner)
@@ -1,55 +1,251 @@
 """
-로깅 시스템 (일별 파일)
+로깅 시스템 (비동기 큐 핸들러, 일별 JSON 파일 + 콘솔)
+
+- 로그 호출 스레드는 레코드를 큐에 넣기만 하고, 파일/콘솔 쓰기는 QueueListener 스레드가 맡는다
+  (수집/백필 스레드가 디스크·콘솔 I/O를 기다리지 않음).
+- 파일은 한 줄에 JSON 레코드 1개 (ts, level, logger, message, run_id, job_id, thread, exc ...)로 남긴다.
+- run_id/job_id 상관 ID는 contextvars로 실행 흐름마다 붙인다 (`bind_log_context`, `log_context`).
+- 반복 호출 위치의 DEBUG 로그는 위치별 처음 N건 이후 1/every만 남긴다 (`DebugSampler`).
 """
+import atexit
+import contextvars
+import copy
+import json
 import logging
 import os
+import queue
+import threading
+from contextlib import contextmanager
 from datetime import datetime
+from logging.handlers import QueueHandler, QueueListener
 from pathlib import Path
+from typing import Dict, Iterator, Optional, Tuple
+
+CONTEXT_FIELDS = ("run_id", "job_id")
+DEFAULT_DEBUG_SAMPLE_EVERY = 100
+DEBUG_SAMPLE_BURST = 20
+
+# 로그 레벨을 DEBUG_MODE로 조절하는 애플리케이션 로거 (그 외 라이브러리 로거는 INFO 유지)
+APP_LOGGERS = (
+    "news_collector", "collectors", "filters", "analyzers", "notifiers", "storage", "utils", "web", "config", "worker",
+)
+
+CONSOLE_FORMAT = '[%(asctime)s] [%(levelname)s] [%(name)s] [%(run_id)s] %(message)s'
+
+_context: contextvars.ContextVar[Optional[Dict[str, str]]] = contextvars.ContextVar("log_context", default=None)
+
+# LogRecord 기본 속성 (extra로 넘긴 필드만 JSON에 추가하기 위해 제외)
+_RECORD_ATTRS = set(vars(logging.LogRecord("", 0, "", 0, "", None, None))) | {"message", "asctime", "sampled", *CONTEXT_FIELDS}
+
+_lock = threading.Lock()
+_listener: Optional[QueueListener] = None
+_queue_handler: Optional[QueueHandler] = None
+_sampler: Optional["DebugSampler"] = None
+
+
+def current_log_context() -> Dict[str, str]:
+    """현재 실행 흐름의 상관 ID"""
+    return dict(_context.get() or {})
+
+
+def bind_log_context(**fields: Optional[str]) -> None:
+    """
+    현재 실행 흐름(스레드/컨텍스트)에 상관 ID를 붙인다 (값이 None이면 제거).
+
+    새 run_id를 붙이면 DEBUG 샘플링 카운터를 초기화해 실행마다 처음 로그는 남긴다.
+    """
+    merged = current_log_context()
+    for key, value in fields.items():
+        if value is None:
+            merged.pop(key, None)
+        else:
+            merged[key] = str(value)
+    _context.set(merged)
+    if fields.get("run_id") and _sampler is not None:
+        _sampler.reset()
+
+
+@contextmanager
+def log_context(**fields: Optional[str]) -> Iterator[None]:
+    """블록 안에서만 상관 ID 적용 (블록 안의 bind_log_context도 종료 시 되돌림)"""
+    token = _context.set(current_log_context())
+    try:
+        bind_log_context(**fields)
+        yield
+    finally:
+        _context.reset(token)
+
 
+class ContextFilter(logging.Filter):
+    """레코드에 run_id/job_id 부여 (호출 스레드에서 실행되어야 하므로 QueueHandler에 단다)"""
 
-def setup_logger(log_dir: str = "output/logs", debug_mode: bool = False) -> logging.Logger:
+    def filter(self, record: logging.LogRecord) -> bool:
+        context = _context.get() or {}
+        for key in CONTEXT_FIELDS:
+            setattr(record, key, context.get(key, "-"))
+        return True
+
+
+class DebugSampler(logging.Filter):
     """
-    로거 설정 (일별 파일)
+    DEBUG 레코드를 호출 위치(파일, 줄)별로 처음 `burst`건은 모두, 이후에는 `every`건마다 1건만 통과시킨다.
+
+    f-string 메시지도 호출 위치는 같으므로 키워드/게시글 단위 반복 로그가 한 키로 묶인다.
+    통과한 샘플 레코드에는 `sampled`(=every)가 붙는다. INFO 이상은 건드리지 않는다.
+    """
+
+    def __init__(self, every: int = DEFAULT_DEBUG_SAMPLE_EVERY, burst: int = DEBUG_SAMPLE_BURST):
+        super().__init__()
+        self.every = every
+        self.burst = burst
+        self._counts: Dict[Tuple[str, int], int] = {}
+        self._lock = threading.Lock()
+
+    def reset(self) -> None:
+        with self._lock:
+            self._counts.clear()
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        if record.levelno > logging.DEBUG or self.every <= 1:
+            return True
+        key = (record.pathname, record.lineno)
+        with self._lock:
+            count = self._counts.get(key, 0) + 1
+            self._counts[key] = count
+        if count <= self.burst:
+            return True
+        if count % self.every:
+            return False
+        record.sampled = self.every
+        return True
+
+
+class JsonFormatter(logging.Formatter):
+    """레코드 1건 -> JSON 한 줄 (extra로 넘긴 필드 포함)"""
+
+    def format(self, record: logging.LogRecord) -> str:
+        payload = {
+            "ts": datetime.fromtimestamp(record.created).astimezone().isoformat(timespec="milliseconds"),
+            "level": record.levelname,
+            "logger": record.name,
+            "message": record.getMessage().strip(),
+        }
+        for key in CONTEXT_FIELDS:
+            value = getattr(record, key, None)
+            if value and value != "-":
+                payload[key] = value
+        payload["thread"] = record.threadName
+        if getattr(record, "sampled", None):
+            payload["sampled_every"] = record.sampled
+        for key, value in record.__dict__.items():
+            if key not in _RECORD_ATTRS and key not in payload:
+                payload[key] = value
+        exc_text = record.exc_text or (self.formatException(record.exc_info) if record.exc_info else None)
+        if exc_text:
+            payload["exc"] = exc_text
+        if record.stack_info:
+            payload["stack"] = self.formatStack(record.stack_info)
+        return json.dumps(payload, ensure_ascii=False, default=str)
+
+
+class _RecordQueueHandler(QueueHandler):
+    """
+    기본 QueueHandler.prepare는 메시지와 예외를 한 문자열로 합쳐 버리므로,
+    메시지와 예외 텍스트를 따로 보존해 리스너 쪽 JSON/텍스트 포맷터가 각자 쓰게 한다.
+    """
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        record = copy.copy(record)
+        record.msg = record.getMessage()
+        record.args = None
+        if record.exc_info:
+            record.exc_text = record.exc_text or logging.Formatter().formatException(record.exc_info)
+            record.exc_info = None
+        return record
+
+
+def shutdown_logging() -> None:
+    """리스너를 멈춰 큐에 남은 레코드를 모두 쓰고, 루트 로거에서 큐 핸들러를 뗀다."""
+    global _listener, _queue_handler, _sampler
+    with _lock:
+        listener, handler = _listener, _queue_handler
+        _listener = _queue_handler = _sampler = None
+    if handler is not None:
+        logging.getLogger().removeHandler(handler)
+    if listener is not None:
+        listener.stop()
+        for target in listener.handlers:
+            target.close()
+
+
+atexit.register(shutdown_logging)
+
+
+def _set_levels(debug_mode: bool) -> None:
+    level = logging.DEBUG if debug_mode else logging.INFO
+    for name in APP_LOGGERS:
+        logging.getLogger(name).setLevel(level)
+
+
+def setup_logger(
+    log_dir: str = "output/logs",
+    debug_mode: bool = False,
+    debug_sample_every: int = DEFAULT_DEBUG_SAMPLE_EVERY,
+) -> logging.Logger:
+    """
+    로거 설정 (일별 JSON 파일 + 콘솔, 비동기 큐 핸들러)
+
+    루트 로거에 큐 핸들러를 달아 모든 모듈 로그를 같은 리스너로 보낸다. `logging.basicConfig`가 먼저 단
+    동기 콘솔 핸들러는 리스너의 콘솔 핸들러로 대체된다. 이미 설정되어 있으면 레벨/샘플링만 갱신한다.
 
     Args:
         log_dir: 로그 디렉토리
-        debug_mode: 디버그 모드
+        debug_mode: 디버그 모드 (애플리케이션 로거를 DEBUG로)
+        debug_sample_every: 반복 DEBUG 로그 샘플링 간격 (1 이하면 샘플링 안 함)
 
     Returns:
         설정된 로거
     """
-    # 로그 디렉토리 생성
-    Path(log_dir).mkdir(parents=True, exist_ok=True)
+    global _listener, _queue_handler, _sampler
+    logger = logging.getLogger("news_collector")
+    _set_levels(debug_mode)
 
-    # 일별 로그 파일
-    today = datetime.now().strftime("%Y%m%d")
-    log_file = os.path.join(log_dir, f"news_collector_{today}.log")
+    with _lock:
+        if _listener is not None:
+            _sampler.every = debug_sample_every
+            return logger
 
-    # 로거 생성
-    logger = logging.getLogger("news_collector")
-    logger.setLevel(logging.DEBUG if debug_mode else logging.INFO)
-
-    # 핸들러 초기화 방지
-    if logger.handlers:
-        return logger
-
-    # 파일 핸들러
-    file_handler = logging.FileHandler(log_file, encoding='utf-8')
-    file_handler.setLevel(logging.DEBUG)
-
-    # 콘솔 핸들러
-    console_handler = logging.StreamHandler()
-    console_handler.setLevel(logging.DEBUG if debug_mode else logging.INFO)
-
-    # 포맷
-    formatter = logging.Formatter(
-        '[%(asctime)s] [%(levelname)s] [%(name)s] %(message)s',
-        datefmt='%Y-%m-%d %H:%M:%S'
-    )
-    file_handler.setFormatter(formatter)
-    console_handler.setFormatter(formatter)
-
-    logger.addHandler(file_handler)
-    logger.addHandler(console_handler)
+        # 로그 디렉토리 생성
+        Path(log_dir).mkdir(parents=True, exist_ok=True)
+
+        # 일별 로그 파일
+        today = datetime.now().strftime("%Y%m%d")
+        log_file = os.path.join(log_dir, f"news_collector_{today}.log")
+
+        file_handler = logging.FileHandler(log_file, encoding='utf-8')
+        file_handler.setFormatter(JsonFormatter())
+
+        console_handler = logging.StreamHandler()
+        console_handler.setFormatter(logging.Formatter(CONSOLE_FORMAT, datefmt='%Y-%m-%d %H:%M:%S'))
+
+        _sampler = DebugSampler(every=debug_sample_every)
+        _queue_handler = _RecordQueueHandler(queue.SimpleQueue())
+        _queue_handler.addFilter(_sampler)
+        _queue_handler.addFilter(ContextFilter())
+
+        _listener = QueueListener(_queue_handler.queue, file_handler, console_handler, respect_handler_level=True)
+        _listener.start()
+
+        root = logging.getLogger()
+        for handler in list(root.handlers):
+            if type(handler) is logging.StreamHandler:
+                root.removeHandler(handler)
+        root.addHandler(_queue_handler)
+        if root.level == logging.NOTSET or root.level > logging.INFO:
+            root.setLevel(logging.INFO)
+
+    # 예전처럼 news_collector 로거에 직접 단 핸들러가 있으면 중복 출력되므로 정리
+    for handler in list(logger.handlers):
+        logger.removeHandler(handler)
 
     return logger
@@ -0,0 +1,322 @@
+"""
+단계별 카운터/타이머 수집 (실행 리포트 JSON, Prometheus 텍스트 포맷)
+"""
+from __future__ import annotations
+
+import functools
+import json
+import logging
+import os
+import threading
+import time
+from contextlib import contextmanager
+from datetime import datetime
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_REPORT_DIR = "output/metrics"
+MAX_RUN_REPORTS = 90
+# 지연 시간 히스토그램 버킷(초): HTTP 요청(수백 ms) ~ LLM 호출/전체 단계(수 분)
+LATENCY_BUCKETS = (0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0, 120.0, 300.0)
+
+LabelKey = Tuple[Tuple[str, str], ...]
+
+
+def _label_key(labels: Dict[str, Any]) -> LabelKey:
+    return tuple(sorted((name, str(value)) for name, value in labels.items() if value is not None))
+
+
+def _escape_label(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _format_labels(labels: LabelKey, extra: Optional[Tuple[str, str]] = None) -> str:
+    pairs = list(labels) + ([extra] if extra else [])
+    if not pairs:
+        return ""
+    return "{" + ",".join(f'{name}="{_escape_label(value)}"' for name, value in pairs) + "}"
+
+
+def _format_value(value: float) -> str:
+    return str(int(value)) if float(value).is_integer() else repr(float(value))
+
+
+class _Histogram:
+    __slots__ = ("bucket_counts", "count", "sum")
+
+    def __init__(self, buckets: Tuple[float, ...]):
+        self.bucket_counts = [0] * len(buckets)
+        self.count = 0
+        self.sum = 0.0
+
+
+class MetricsRegistry:
+    """
+    스레드 안전한 카운터/히스토그램 저장소.
+
+    메트릭은 이름 + 라벨(stage, category, keyword, provider, model 등) 조합으로 구분된다.
+    카운터는 누적값만 늘어나므로 실행 전후 스냅샷의 차이로 실행 단위 리포트를 만든다.
+    """
+
+    def __init__(self, buckets: Tuple[float, ...] = LATENCY_BUCKETS):
+        self.buckets = tuple(buckets)
+        self._lock = threading.Lock()
+        self._counters: Dict[str, Dict[LabelKey, float]] = {}
+        self._histograms: Dict[str, Dict[LabelKey, _Histogram]] = {}
+
+    def inc(self, name: str, value: float = 1.0, **labels: Any) -> None:
+        """카운터 증가 (요청 수, 기사 수, 바이트, 토큰, 캐시 적중, 재시도 등)"""
+        key = _label_key(labels)
+        with self._lock:
+            series = self._counters.setdefault(name, {})
+            series[key] = series.get(key, 0.0) + value
+
+    def observe(self, name: str, seconds: float, **labels: Any) -> None:
+        """지연 시간(초) 기록"""
+        key = _label_key(labels)
+        with self._lock:
+            series = self._histograms.setdefault(name, {})
+            histogram = series.get(key)
+            if histogram is None:
+                histogram = series[key] = _Histogram(self.buckets)
+            for index, bound in enumerate(self.buckets):
+                if seconds <= bound:
+                    histogram.bucket_counts[index] += 1
+            histogram.count += 1
+            histogram.sum += seconds
+
+    @contextmanager
+    def timer(self, name: str, **labels: Any) -> Iterator[None]:
+        """with 블록 실행 시간을 히스토그램에 기록 (예외가 나도 기록)"""
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.observe(name, time.perf_counter() - started, **labels)
+
+    def snapshot(self) -> Dict[str, Any]:
+        """현재 누적값 (JSON 직렬화 가능)"""
+        with self._lock:
+            counters = [
+                {"name": name, "labels": dict(key), "value": value}
+                for name, series in sorted(self._counters.items())
+                for key, value in sorted(series.items())
+            ]
+            timers = [
+                {
+                    "name": name,
+                    "labels": dict(key),
+                    "count": histogram.count,
+                    "sum": histogram.sum,
+                    "buckets": list(histogram.bucket_counts),
+                }
+                for name, series in sorted(self._histograms.items())
+                for key, histogram in sorted(series.items())
+            ]
+        return {"buckets": list(self.buckets), "counters": counters, "timers": timers}
+
+    def render_prometheus(self) -> str:
+        """Prometheus 텍스트 포맷 (0.0.4)"""
+        lines: List[str] = []
+        with self._lock:
+            for name, series in sorted(self._counters.items()):
+                lines.append(f"# TYPE {name} counter")
+                for key, value in sorted(series.items()):
+                    lines.append(f"{name}{_format_labels(key)} {_format_value(value)}")
+            for name, series in sorted(self._histograms.items()):
+                lines.append(f"# TYPE {name} histogram")
+                for key, histogram in sorted(series.items()):
+                    for bound, count in zip(self.buckets, histogram.bucket_counts):
+                        lines.append(f"{name}_bucket{_format_labels(key, ('le', _format_value(bound)))} {count}")
+                    lines.append(f"{name}_bucket{_format_labels(key, ('le', '+Inf'))} {histogram.count}")
+                    lines.append(f"{name}_sum{_format_labels(key)} {_format_value(histogram.sum)}")
+                    lines.append(f"{name}_count{_format_labels(key)} {histogram.count}")
+        return "\n".join(lines) + "\n"
+
+    def reset(self) -> None:
+        with self._lock:
+            self._counters.clear()
+            self._histograms.clear()
+
+
+# 프로세스 전역 레지스트리 (수집기/필터/분석기/리포트 생성이 공유)
+REGISTRY = MetricsRegistry()
+
+
+def inc(name: str, value: float = 1.0, **labels: Any) -> None:
+    REGISTRY.inc(name, value, **labels)
+
+
+def observe(name: str, seconds: float, **labels: Any) -> None:
+    REGISTRY.observe(name, seconds, **labels)
+
+
+def timer(name: str, **labels: Any):
+    return REGISTRY.timer(name, **labels)
+
+
+def timed(name: str, **labels: Any) -> Callable:
+    """
+    함수 실행 시간 기록 데코레이터
+
+    Args:
+        name: 히스토그램 이름
+        labels: 고정 라벨 (예: stage="collect")
+    """
+    def decorator(func: Callable) -> Callable:
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs) -> Any:
+            with REGISTRY.timer(name, **labels):
+                return func(*args, **kwargs)
+
+        return wrapper
+    return decorator
+
+
+def _series_id(item: Dict[str, Any]) -> Tuple[str, LabelKey]:
+    return item["name"], _label_key(item["labels"])
+
+
+def diff_snapshots(before: Dict[str, Any], after: Dict[str, Any]) -> Dict[str, Any]:
+    """두 스냅샷 사이에 증가한 값만 남긴다 (실행 단위 집계)"""
+    previous_counters = {_series_id(item): item["value"] for item in before.get("counters", [])}
+    counters = []
+    for item in after.get("counters", []):
+        value = item["value"] - previous_counters.get(_series_id(item), 0.0)
+        if value:
+            counters.append({**item, "value": value})
+
+    previous_timers = {_series_id(item): item for item in before.get("timers", [])}
+    timers = []
+    for item in after.get("timers", []):
+        prior = previous_timers.get(_series_id(item))
+        count = item["count"] - (prior["count"] if prior else 0)
+        if count <= 0:
+            continue
+        total = item["sum"] - (prior["sum"] if prior else 0.0)
+        buckets = [
+            current - (prior["buckets"][index] if prior else 0)
+            for index, current in enumerate(item["buckets"])
+        ]
+        timers.append({**item, "count": count, "sum": total, "avg": total / count, "buckets": buckets})
+    return {"buckets": after.get("buckets", []), "counters": counters, "timers": timers}
+
+
+class RunMetrics:
+    """
+    실행 1건의 메트릭 구간.
+
+    시작 시 전역 레지스트리 스냅샷을 남기고, finish()에서 차이를 실행 리포트 JSON으로 저장한다.
+    같은 프로세스에서 동시에 도는 실행(백필 윈도우 병렬 처리 등)의 값은 서로 섞일 수 있다.
+    """
+
+    def __init__(self, run_id: str, registry: Optional[MetricsRegistry] = None):
+        self.run_id = run_id
+        self.registry = registry or REGISTRY
+        self.started_at = datetime.now()
+        self._started = time.perf_counter()
+        self._baseline = self.registry.snapshot()
+
+    def report(self, status: str) -> Dict[str, Any]:
+        return {
+            "run_id": self.run_id,
+            "status": status,
+            "started_at": self.started_at.isoformat(),
+            "finished_at": datetime.now().isoformat(),
+            "duration_seconds": round(time.perf_counter() - self._started, 3),
+            **diff_snapshots(self._baseline, self.registry.snapshot()),
+        }
+
+    def finish(self, status: str, report_dir: Optional[str] = None) -> Optional[str]:
+        """
+        실행 리포트 저장 + 단계별 소요 시간 로그
+
+        Returns:
+            저장한 리포트 경로 (저장 실패 시 None)
+        """
+        report = self.report(status)
+        stage_times = [
+            f"{item['labels'].get('stage')}={item['sum']:.1f}s"
+            for item in report["timers"]
+            if item["name"] == "news_collector_stage_seconds" and not item["labels"].get("category")
+        ]
+        logger.info(
+            f"Run {self.run_id} metrics ({status}, {report['duration_seconds']:.1f}s): "
+            + (", ".join(stage_times) or "no stage timings")
+        )
+        try:
+            return write_run_report(report, report_dir or DEFAULT_REPORT_DIR)
+        except OSError as e:
+            logger.warning(f"Run metrics report write failed: {e}")
+            return None
+
+
+def write_run_report(report: Dict[str, Any], report_dir: str = DEFAULT_REPORT_DIR) -> str:
+    """실행 리포트를 <report_dir>/run_<run_id>.json으로 저장하고 오래된 리포트 정리"""
+    os.makedirs(report_dir, exist_ok=True)
+    path = os.path.join(report_dir, f"run_{report['run_id']}.json")
+    tmp_path = f"{path}.tmp"
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        json.dump(report, f, ensure_ascii=False, indent=2)
+    os.replace(tmp_path, path)
+
+    reports = sorted(name for name in os.listdir(report_dir) if name.startswith("run_") and name.endswith(".json"))
+    for name in reports[:-MAX_RUN_REPORTS]:
+        try:
+            os.remove(os.path.join(report_dir, name))
+        except OSError:
+            pass
+    return path
+
+
+def load_latest_run_report(report_dir: str = DEFAULT_REPORT_DIR) -> Optional[Dict[str, Any]]:
+    """가장 최근 실행 리포트 (없거나 읽을 수 없으면 None)"""
+    try:
+        reports = sorted(name for name in os.listdir(report_dir) if name.startswith("run_") and name.endswith(".json"))
+    except FileNotFoundError:
+        return None
+    if not reports:
+        return None
+    try:
+        with open(os.path.join(report_dir, reports[-1]), encoding="utf-8") as f:
+            return json.load(f)
+    except (OSError, ValueError) as e:
+        logger.warning(f"Run metrics report unreadable: {e}")
+        return None
+
+
+def render_run_report_prometheus(report: Dict[str, Any]) -> str:
+    """
+    마지막 실행 리포트를 gauge로 변환.
+
+    CLI/스케줄러/외부 worker 실행은 웹 프로세스 레지스트리에 남지 않으므로
+    `news_collector_last_run_*` 이름으로 마지막 실행 값을 함께 노출한다.
+    """
+    def rename(name: str) -> str:
+        return "news_collector_last_run_" + name[len("news_collector_"):] if name.startswith("news_collector_") else f"last_run_{name}"
+
+    run_labels = _label_key({"run_id": report.get("run_id"), "status": report.get("status")})
+    lines = [
+        "# TYPE news_collector_last_run_info gauge",
+        f"news_collector_last_run_info{_format_labels(run_labels)} 1",
+        "# TYPE news_collector_last_run_duration_seconds gauge",
+        f"news_collector_last_run_duration_seconds {_format_value(report.get('duration_seconds', 0.0))}",
+    ]
+    declared = set()
+    for item in report.get("counters", []):
+        name = rename(item["name"])
+        if name not in declared:
+            lines.append(f"# TYPE {name} gauge")
+            declared.add(name)
+        lines.append(f"{name}{_format_labels(_label_key(item['labels']))} {_format_value(item['value'])}")
+    for item in report.get("timers", []):
+        name = rename(item["name"])
+        if name not in declared:
+            lines.append(f"# TYPE {name}_sum gauge")
+            lines.append(f"# TYPE {name}_count gauge")
+            declared.add(name)
+        labels = _format_labels(_label_key(item["labels"]))
+        lines.append(f"{name}_sum{labels} {_format_value(item['sum'])}")
+        lines.append(f"{name}_count{labels} {item['count']}")
+    return "\n".join(lines) + "\n"
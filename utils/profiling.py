@@ -0,0 +1,219 @@
+"""
+실행 단위 프로파일링 (선택한 단계를 cProfile + tracemalloc으로 감싸 output/logs에 산출물 기록)
+
+단계별 산출물 (output/logs/profile_<run_id>/):
+- <stage>.pstats: `python -m pstats`, snakeviz 등으로 열 수 있는 cProfile 통계
+- <stage>.collapsed: flamegraph.pl / speedscope에 바로 넣을 수 있는 collapsed stack (값은 마이크로초)
+- <stage>_alloc.txt: 단계 동안 늘어난 메모리 상위 할당 위치와 최대 추적 메모리
+"""
+from __future__ import annotations
+
+import logging
+import os
+import threading
+import tracemalloc
+from contextlib import contextmanager, nullcontext
+from typing import TYPE_CHECKING, Dict, Iterator, List, Optional, Set, Tuple
+
+if TYPE_CHECKING:  # cProfile/pstats는 프로파일을 켠 실행에서만 불러온다 (CLI 시작 시간)
+    import cProfile
+    import pstats
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_PROFILE_DIR = "output/logs"
+
+PROFILE_STAGES = ("collect", "analyze", "external_alerts", "report")
+ALL_STAGES = "all"
+TRACEMALLOC_FRAMES = 10
+TOP_ALLOCATIONS = 30
+
+FunctionKey = Tuple[str, int, str]
+
+# 프로세스 전체에서 프로파일러는 한 번에 하나만 켠다 (중첩 단계, 동시 실행 스레드 모두 해당)
+_PROFILE_LOCK = threading.Lock()
+
+
+def parse_profile_stages(value) -> Optional[Set[str]]:
+    """
+    프로파일 대상 단계 파싱
+
+    Args:
+        value: True/'all'/''(전체), 'collect,analyze' 같은 콤마 구분 문자열, 또는 단계 리스트
+
+    Returns:
+        단계 집합 (None이면 전체 단계)
+
+    Raises:
+        ValueError: 알 수 없는 단계
+    """
+    if value is True or value is None:
+        return None
+    names = value.split(",") if isinstance(value, str) else list(value)
+    stages = {str(name).strip() for name in names if str(name).strip()}
+    if not stages or ALL_STAGES in stages:
+        return None
+    unknown = stages - set(PROFILE_STAGES)
+    if unknown:
+        raise ValueError(f"Unknown profile stage(s): {', '.join(sorted(unknown))} (choose from {', '.join(PROFILE_STAGES)})")
+    return stages
+
+
+def _frame_label(key: FunctionKey) -> str:
+    filename, line, name = key
+    if filename == "~":
+        return name  # 내장 함수 ('<built-in method ...>')
+    return f"{name} ({os.path.basename(filename)}:{line})"
+
+
+def collapsed_stacks(stats: pstats.Stats, max_depth: int = 64) -> List[str]:
+    """
+    pstats 호출 그래프 -> collapsed stack 라인 ("root;caller;callee 마이크로초")
+
+    cProfile은 전체 스택이 아닌 호출자-피호출자 간선만 기록한다. 모든 호출 경로를 펼치면 경로 수가
+    폭발하므로, 함수마다 누적 시간이 가장 큰 호출자 간선 하나만 남긴 트리로 병합하고
+    각 함수의 자기 시간(tottime)을 그 경로에 한 번만 기록한다 (함수/간선 수에 선형, 합계는 total_tt와 같다).
+    호출자가 없거나 재귀로 순환하는 함수는 경로의 시작이 된다.
+    """
+    raw = stats.stats  # {func: (cc, nc, tt, ct, callers{caller: (cc, nc, tt, ct)})}
+    parents: Dict[FunctionKey, Optional[FunctionKey]] = {}
+    for func, (_, _, _, _, callers) in raw.items():
+        edges = [(edge[3], caller) for caller, edge in callers.items() if caller in raw and caller != func]
+        parents[func] = max(edges, key=lambda edge: (edge[0], edge[1]))[1] if edges else None
+
+    paths: Dict[FunctionKey, Tuple[str, ...]] = {}
+
+    def path_of(func: FunctionKey) -> Tuple[str, ...]:
+        chain: List[FunctionKey] = []
+        node: Optional[FunctionKey] = func
+        while node is not None and node not in paths and node not in chain:
+            chain.append(node)
+            node = parents[node]
+        path = paths.get(node, ()) if node is not None else ()
+        for member in reversed(chain):
+            path = (path + (_frame_label(member),))[-max_depth:]
+            paths[member] = path
+        return paths[func]
+
+    totals: Dict[str, float] = {}
+    for func, (_, _, tottime, _, _) in raw.items():
+        if tottime > 0:
+            key = ";".join(path_of(func))
+            totals[key] = totals.get(key, 0.0) + tottime
+
+    return [f"{stack} {round(seconds * 1_000_000)}" for stack, seconds in sorted(totals.items()) if seconds >= 1e-6]
+
+
+def _format_allocations(before: tracemalloc.Snapshot, after: tracemalloc.Snapshot, peak: int, top_n: int) -> str:
+    ignore = (
+        tracemalloc.Filter(False, tracemalloc.__file__),
+        tracemalloc.Filter(False, "<frozen importlib._bootstrap>"),
+        tracemalloc.Filter(False, "<frozen importlib._bootstrap_external>"),
+    )
+    diff = after.filter_traces(ignore).compare_to(before.filter_traces(ignore), "lineno")
+    current = sum(stat.size for stat in after.statistics("filename"))
+    lines = [
+        f"peak traced memory: {peak / 1024 / 1024:.1f} MiB",
+        f"traced memory at stage end: {current / 1024 / 1024:.1f} MiB",
+        "",
+        f"top {top_n} allocation sites by growth during stage:",
+    ]
+    for stat in diff[:top_n]:
+        frame = stat.traceback[0]
+        lines.append(
+            f"{stat.size_diff / 1024:>+12.1f} KiB {stat.count_diff:>+9} blocks  {frame.filename}:{frame.lineno}"
+        )
+    return "\n".join(lines) + "\n"
+
+
+class RunProfiler:
+    """
+    실행 1건의 단계 프로파일러.
+
+    - 선택한 단계만 cProfile/tracemalloc으로 감싼다 (stages=None이면 전체).
+    - cProfile은 호출한 스레드만 측정하므로, 단계 안에서 스레드 풀로 넘긴 작업은 대기 시간으로만 보인다.
+    - 단계가 중첩되거나 다른 스레드가 이미 측정 중이면 먼저 시작한 단계만 측정한다
+      (프로파일러를 동시에 둘 켤 수 없다).
+    """
+
+    def __init__(
+        self,
+        run_id: str,
+        stages: Optional[Set[str]] = None,
+        output_dir: Optional[str] = None,
+        memory: bool = True,
+        top_n: int = TOP_ALLOCATIONS,
+    ):
+        self.run_id = run_id
+        self.stages = stages
+        self.output_dir = os.path.join(output_dir or DEFAULT_PROFILE_DIR, f"profile_{run_id}")
+        self.memory = memory
+        self.top_n = top_n
+        self.artifacts: List[str] = []
+
+    def enabled_for(self, stage: str) -> bool:
+        return self.stages is None or stage in self.stages
+
+    @contextmanager
+    def stage(self, name: str) -> Iterator[None]:
+        """단계 1개 프로파일 (대상이 아니거나 이미 다른 단계를 측정 중이면 그대로 실행)"""
+        if not self.enabled_for(name) or not _PROFILE_LOCK.acquire(blocking=False):
+            yield
+            return
+
+        import cProfile
+
+        started_tracing = False
+        before = None
+        if self.memory:
+            if not tracemalloc.is_tracing():
+                tracemalloc.start(TRACEMALLOC_FRAMES)
+                started_tracing = True
+            tracemalloc.reset_peak()
+            before = tracemalloc.take_snapshot()
+        profiler = cProfile.Profile()
+        profiler.enable()
+        try:
+            yield
+        finally:
+            profiler.disable()
+            after = peak = None
+            if self.memory:
+                peak = tracemalloc.get_traced_memory()[1]
+                after = tracemalloc.take_snapshot()
+                if started_tracing:
+                    tracemalloc.stop()
+            _PROFILE_LOCK.release()
+            try:
+                self._write(name, profiler, before, after, peak)
+            except Exception as e:
+                logger.warning(f"Profile artifact write failed for stage {name}: {e}")
+
+    def _write(self, name: str, profiler: cProfile.Profile, before, after, peak: Optional[int]) -> None:
+        import pstats
+
+        os.makedirs(self.output_dir, exist_ok=True)
+        base = os.path.join(self.output_dir, name)
+
+        stats = pstats.Stats(profiler)
+        stats.dump_stats(f"{base}.pstats")
+        with open(f"{base}.collapsed", "w", encoding="utf-8") as f:
+            f.write("\n".join(collapsed_stacks(stats)) + "\n")
+        written = [f"{base}.pstats", f"{base}.collapsed"]
+
+        if after is not None:
+            with open(f"{base}_alloc.txt", "w", encoding="utf-8") as f:
+                f.write(_format_allocations(before, after, peak, self.top_n))
+            written.append(f"{base}_alloc.txt")
+
+        self.artifacts.extend(written)
+        logger.info(
+            f"Profile [{name}] {stats.total_tt:.2f}s CPU-profiled"
+            + (f", peak traced memory {peak / 1024 / 1024:.1f} MiB" if peak is not None else "")
+            + f" -> {self.output_dir}"
+        )
+
+
+def profile_stage(profiler: Optional[RunProfiler], name: str):
+    """profiler가 없으면 아무것도 하지 않는 컨텍스트"""
+    return profiler.stage(name) if profiler is not None else nullcontext()
@@ -0,0 +1,33 @@
+"""
+파이프라인 진행 상황 콜백
+"""
+import logging
+from typing import Any, Callable, Dict, Optional
+
+logger = logging.getLogger(__name__)
+
+# progress(event, data) 형태의 콜백. event 예: 'stage', 'category_collected', 'category_analyzed'
+ProgressCallback = Callable[[str, Dict[str, Any]], None]
+
+STAGE_COLLECT = "collect"
+STAGE_ANALYZE = "analyze"
+STAGE_ALERTS = "alerts"
+STAGE_SAVE = "save"
+STAGE_NOTIFY = "notify"
+
+
+def report_progress(progress: Optional[ProgressCallback], event: str, **data: Any) -> None:
+    """
+    진행 상황 콜백 호출 (콜백 오류는 파이프라인을 멈추지 않도록 로그만 남긴다)
+
+    Args:
+        progress: 콜백 (None이면 무시)
+        event: 이벤트 이름
+        **data: 이벤트 데이터
+    """
+    if progress is None:
+        return
+    try:
+        progress(event, data)
+    except Exception as e:
+        logger.warning(f"Progress callback failed ({event}): {e}")
@@ -6,6 +6,8 @@ import functools
 from typing import Callable, Any
 import logging
 
+from utils import metrics
+
 logger = logging.getLogger(__name__)
 
 
@@ -36,6 +38,7 @@ def retry(
                 except exceptions as e:
                     last_exception = e
                     if attempt < max_attempts - 1:
+                        metrics.inc("news_collector_retries_total", function=func.__name__)
                         wait_time = backoff_factor ** attempt
                         logger.warning(
                             f"{func.__name__} attempt {attempt + 1} failed: {e}. "
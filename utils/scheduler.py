@@ -0,0 +1,243 @@
+"""
+프로세스 내 cron 스케줄러 (KST 기준, 누락 실행 보충, jitter)
+"""
+from __future__ import annotations
+
+import json
+import logging
+import os
+import random
+import time
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta
+from typing import Callable, Dict, List, Optional, Set
+
+from utils.time_windows import KST
+
+logger = logging.getLogger(__name__)
+
+# (필드명, 최소값, 최대값)
+_CRON_FIELDS = (
+    ("minute", 0, 59),
+    ("hour", 0, 23),
+    ("day", 1, 31),
+    ("month", 1, 12),
+    ("weekday", 0, 7),
+)
+# 다음 실행 시각 탐색 상한 (2월 29일 같은 드문 조합도 찾을 수 있도록 4년+)
+_MAX_SEARCH_DAYS = 366 * 5
+
+
+def _parse_cron_field(spec: str, low: int, high: int) -> Set[int]:
+    values: Set[int] = set()
+    for part in spec.split(","):
+        step = 1
+        if "/" in part:
+            part, step_text = part.split("/", 1)
+            step = int(step_text)
+            if step <= 0:
+                raise ValueError(f"invalid cron step: {spec}")
+        if part == "*":
+            start, end = low, high
+        elif "-" in part:
+            start_text, end_text = part.split("-", 1)
+            start, end = int(start_text), int(end_text)
+        else:
+            start = int(part)
+            end = high if step > 1 else start
+        if start < low or end > high or start > end:
+            raise ValueError(f"cron value out of range ({low}-{high}): {spec}")
+        values.update(range(start, end + 1, step))
+    return values
+
+
+class CronSchedule:
+    """
+    5필드 cron 표현식 (분 시 일 월 요일, 요일은 0/7=일요일).
+
+    `*`, 목록(`1,15`), 범위(`1-5`), 간격(`*/10`, `0-30/5`)을 지원하며 KST 벽시계 기준으로 계산한다.
+    일/요일 필드가 모두 제한되면 표준 cron처럼 둘 중 하나만 맞아도 실행한다.
+    """
+
+    def __init__(self, expression: str):
+        parts = expression.split()
+        if len(parts) != 5:
+            raise ValueError(f"cron expression needs 5 fields: {expression!r}")
+        self.expression = expression
+        parsed = [_parse_cron_field(part, low, high) for part, (_, low, high) in zip(parts, _CRON_FIELDS)]
+        self.minutes, self.hours, self.days, self.months, weekdays = parsed
+        # cron 요일(0=일) -> datetime.weekday()(0=월)
+        self.weekdays = {(value - 1) % 7 for value in weekdays}
+        self._day_restricted = parts[2] != "*"
+        self._weekday_restricted = parts[4] != "*"
+
+    def _day_matches(self, day: datetime) -> bool:
+        if day.month not in self.months:
+            return False
+        day_ok = day.day in self.days
+        weekday_ok = day.weekday() in self.weekdays
+        if self._day_restricted and self._weekday_restricted:
+            return day_ok or weekday_ok
+        return day_ok and weekday_ok
+
+    def next_after(self, moment: datetime) -> datetime:
+        """moment 이후(초과) 첫 실행 시각 (KST aware)"""
+        moment = moment.astimezone(KST) if moment.tzinfo else moment.replace(tzinfo=KST)
+        candidate = moment.replace(second=0, microsecond=0) + timedelta(minutes=1)
+        day = candidate.replace(hour=0, minute=0)
+        for _ in range(_MAX_SEARCH_DAYS):
+            if self._day_matches(day):
+                for hour in sorted(self.hours):
+                    for minute in sorted(self.minutes):
+                        fire = day.replace(hour=hour, minute=minute)
+                        if fire >= candidate:
+                            return fire
+            day = (day + timedelta(days=1)).replace(hour=0, minute=0)
+            candidate = max(candidate, day)
+        raise ValueError(f"cron expression never fires: {self.expression!r}")
+
+
+@dataclass
+class ScheduledJob:
+    """
+    스케줄 작업.
+
+    Attributes:
+        name: 상태 파일 키/로그 이름
+        cron: 기준 cron 일정
+        func: 실행 함수 (예정 시각 KST datetime을 받는다)
+        offset: 기준 일정 대비 실행 시각 보정 (예: 리포트 10분 전 pre-warm은 -10분)
+        jitter_seconds: 예정 시각 뒤 0~jitter초 무작위 지연
+        catchup_seconds: 이 시간 안에 놓친 실행은 1회로 합쳐 즉시 보충 (0이면 보충하지 않음)
+    """
+
+    name: str
+    cron: CronSchedule
+    func: Callable[[datetime], None]
+    offset: timedelta = timedelta(0)
+    jitter_seconds: float = 0.0
+    catchup_seconds: float = 0.0
+    next_due: Optional[datetime] = field(default=None, init=False)
+    fire_at: Optional[datetime] = field(default=None, init=False)
+
+    def next_after(self, moment: datetime) -> datetime:
+        return self.cron.next_after(moment - self.offset) + self.offset
+
+
+class Scheduler:
+    """
+    등록된 작업을 예정 시각(+jitter)에 실행한다.
+
+    마지막 실행 예정 시각을 상태 파일에 남겨, 프로세스가 꺼져 있던 동안 놓친 실행을 재시작 시 보충한다.
+    """
+
+    def __init__(
+        self,
+        jobs: List[ScheduledJob],
+        state_path: str,
+        clock: Callable[[], datetime] = lambda: datetime.now(KST),
+        sleep: Callable[[float], None] = time.sleep,
+        rng: Optional[random.Random] = None,
+    ):
+        self.jobs = jobs
+        self.state_path = state_path
+        self.clock = clock
+        self.sleep = sleep
+        self.rng = rng or random.Random()
+        self._state = self._load_state()
+
+    def _load_state(self) -> Dict[str, str]:
+        try:
+            with open(self.state_path, encoding="utf-8") as f:
+                state = json.load(f)
+            return state if isinstance(state, dict) else {}
+        except FileNotFoundError:
+            return {}
+        except (OSError, ValueError) as e:
+            logger.warning(f"Scheduler state unreadable ({self.state_path}): {e}")
+            return {}
+
+    def _save_state(self) -> None:
+        directory = os.path.dirname(self.state_path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        tmp_path = f"{self.state_path}.tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(self._state, f, ensure_ascii=False, indent=2)
+        os.replace(tmp_path, self.state_path)
+
+    def _plan(self, job: ScheduledJob, now: datetime) -> None:
+        """다음 실행 예정 시각 결정 (놓친 실행이 있으면 가장 최근 1회를 보충 대상으로)"""
+        last_text = self._state.get(job.name)
+        last = datetime.fromisoformat(last_text) if last_text else None
+        if last is None:
+            # 첫 실행: 지금을 기준점으로 남겨 이후 재시작 시 누락 여부를 판단한다.
+            self._state[job.name] = now.isoformat()
+            self._save_state()
+
+        if job.next_due is None and last is not None:
+            due = job.next_after(last)
+            if due <= now:
+                latest_missed = due
+                while True:
+                    following = job.next_after(latest_missed)
+                    if following > now:
+                        break
+                    latest_missed = following
+                if job.catchup_seconds and (now - latest_missed).total_seconds() <= job.catchup_seconds:
+                    logger.info(f"Scheduler: catching up missed '{job.name}' run scheduled at {latest_missed.isoformat()}")
+                    self._set_due(job, latest_missed, jitter=False)
+                    return
+                logger.warning(f"Scheduler: skipping missed '{job.name}' run(s), latest {latest_missed.isoformat()}")
+                self._state[job.name] = latest_missed.isoformat()
+                self._save_state()
+                last = latest_missed
+
+        self._set_due(job, job.next_after(last if last and last > now else now))
+
+    def _set_due(self, job: ScheduledJob, due: datetime, jitter: bool = True) -> None:
+        job.next_due = due
+        delay = self.rng.uniform(0, job.jitter_seconds) if jitter and job.jitter_seconds else 0.0
+        job.fire_at = due + timedelta(seconds=delay)
+        logger.info(f"Scheduler: next '{job.name}' at {job.fire_at.isoformat()} (scheduled {due.isoformat()})")
+
+    def run_pending(self) -> List[str]:
+        """
+        실행 시각이 된 작업을 실행한다.
+
+        Returns:
+            실행한 작업 이름 목록
+        """
+        ran: List[str] = []
+        for job in self.jobs:
+            now = self.clock()
+            if job.next_due is None:
+                self._plan(job, now)
+            if job.fire_at > now:
+                continue
+
+            scheduled = job.next_due
+            logger.info(f"Scheduler: running '{job.name}' (scheduled {scheduled.isoformat()})")
+            try:
+                job.func(scheduled)
+            except Exception as e:
+                logger.exception(f"Scheduler: '{job.name}' failed: {e}")
+            self._state[job.name] = scheduled.isoformat()
+            self._save_state()
+            ran.append(job.name)
+            self._set_due(job, job.next_after(max(scheduled, self.clock())))
+        return ran
+
+    def seconds_until_next(self) -> float:
+        now = self.clock()
+        pending = [job.fire_at for job in self.jobs if job.fire_at is not None]
+        if not pending:
+            return 0.0
+        return max(0.0, (min(pending) - now).total_seconds())
+
+    def run_forever(self, max_sleep: float = 60.0) -> None:
+        """작업을 계속 실행 (시계 변경/절전 복귀에 대비해 최대 max_sleep초씩 대기)"""
+        logger.info(f"Scheduler started with {len(self.jobs)} job(s)")
+        while True:
+            self.run_pending()
+            self.sleep(min(max_sleep, self.seconds_until_next()) or 1.0)
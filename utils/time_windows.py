@@ -5,10 +5,19 @@ from __future__ import annotations
 
 from dataclasses import dataclass
 from datetime import datetime, timedelta, timezone
-from typing import Optional
+from typing import List, Optional
 from zoneinfo import ZoneInfo
 
 KST = ZoneInfo("Asia/Seoul")
+EPOCH_UTC = datetime(1970, 1, 1, tzinfo=timezone.utc)
+_ONE_MICROSECOND = timedelta(microseconds=1)
+
+
+def to_epoch_us(dt: datetime) -> int:
+    """datetime을 UTC epoch 마이크로초(int64)로 변환한다. naive 값은 UTC로 간주한다."""
+    if dt.tzinfo is None:
+        dt = dt.replace(tzinfo=timezone.utc)
+    return (dt - EPOCH_UTC) // _ONE_MICROSECOND
 
 
 @dataclass
@@ -60,3 +69,34 @@ def get_collection_window_kst(window_hours: int = 24, now_utc: Optional[datetime
         is_monday_special=False,
         label=f"최근 {window_hours}시간",
     )
+
+
+def split_backfill_windows(
+    start_date_kst: str,
+    end_date_kst: str,
+    window_hours: int = 24,
+    report_hour_kst: int = 9,
+    skip_weekends: bool = True,
+) -> List[CollectionWindow]:
+    """
+    KST 날짜 범위(YYYY-MM-DD, 양끝 포함)를 일별 수집 윈도우로 분할한다.
+
+    각 날짜의 report_hour_kst(기본 09:00)에 정기 실행한 것과 동일한 윈도우를 만든다.
+    즉 월요일은 금요일 09:00 ~ 월요일 09:00 특수 구간이 그대로 적용된다.
+    skip_weekends=True면 토/일 윈도우는 만들지 않는다 (월요일 구간에 이미 포함되어 기사가 중복된다).
+    """
+    start_day = datetime.strptime(start_date_kst, "%Y-%m-%d").date()
+    end_day = datetime.strptime(end_date_kst, "%Y-%m-%d").date()
+    if end_day < start_day:
+        raise ValueError(f"Invalid backfill range: {start_date_kst} > {end_date_kst}")
+
+    windows: List[CollectionWindow] = []
+    day = start_day
+    while day <= end_day:
+        if skip_weekends and day.weekday() >= 5:
+            day += timedelta(days=1)
+            continue
+        anchor_kst = datetime(day.year, day.month, day.day, report_hour_kst, tzinfo=KST)
+        windows.append(get_collection_window_kst(window_hours=window_hours, now_utc=anchor_kst))
+        day += timedelta(days=1)
+    return windows
@@ -1,11 +1,15 @@
 """
 Flask Web Application for News Collector Dashboard
 """
-from flask import Flask, render_template, send_from_directory
+from flask import Flask, Response, render_template
+from werkzeug.exceptions import NotFound
 from flask_cors import CORS
 import logging
 from pathlib import Path
 
+from utils import metrics
+from web.output_files import serve_output_file
+
 logger = logging.getLogger(__name__)
 
 
@@ -19,6 +23,10 @@ def create_app():
     # Enable CORS for all routes
     CORS(app)
 
+    # Load .env once per app, before the routes module reads ANALYSIS_WORKER_MODE / JOB_QUEUE_PATH
+    from dotenv import load_dotenv
+    load_dotenv()
+
     # Register blueprints
     from web.routes import api_bp
     app.register_blueprint(api_bp)
@@ -34,13 +42,24 @@ def create_app():
         """Health check endpoint"""
         return {'status': 'healthy'}, 200
 
+    @app.route('/metrics')
+    def prometheus_metrics():
+        """Prometheus metrics (this process + last pipeline run report)"""
+        body = metrics.REGISTRY.render_prometheus()
+        report = metrics.load_latest_run_report(str(Path(__file__).parent.parent / metrics.DEFAULT_REPORT_DIR))
+        if report is not None:
+            body += metrics.render_run_report_prometheus(report)
+        return Response(body, content_type='text/plain; version=0.0.4; charset=utf-8')
+
     # Serve output files (HTML reports)
     @app.route('/output/<path:filepath>')
     def serve_output(filepath):
         """Serve files from the output directory"""
         try:
             output_dir = Path(__file__).parent.parent / 'output'
-            return send_from_directory(output_dir, filepath)
+            return serve_output_file(output_dir, filepath)
+        except NotFound:
+            return {'error': 'File not found'}, 404
         except Exception as e:
             logger.error(f"Error serving file: {e}")
             return {'error': 'File not found'}, 404
@@ -0,0 +1,164 @@
+"""
+/output 파일 서빙 (강한 ETag, 조건부 GET, 사전 압축 파일, 리포트 아카이브)
+"""
+import gzip
+import hashlib
+import mimetypes
+import re
+import threading
+from collections import OrderedDict
+from pathlib import Path
+from typing import Optional, Tuple
+
+from flask import Response, request, send_file
+from werkzeug.exceptions import NotFound
+from werkzeug.security import safe_join
+
+from storage.report_archive import BLOB_DIR_NAME, BLOB_SUFFIX, HISTORY_NAME_RE
+
+# 내용 해시 이름의 아카이브 blob과 타임스탬프 이력 리포트(한 번만 쓰고 덮어쓰지 않음)는 1년 immutable 캐시
+IMMUTABLE_CACHE_CONTROL = "public, max-age=31536000, immutable"
+# 최신 리포트 등 같은 이름으로 다시 쓰는 파일은 매번 ETag로 재검증
+REVALIDATE_CACHE_CONTROL = "no-cache"
+
+BLOB_NAME_RE = re.compile(r"^([0-9a-f]{2})[0-9a-f]{62}" + re.escape(BLOB_SUFFIX) + "$")
+
+# 선호 순서대로 (Content-Encoding, 사전 압축 파일 확장자)
+PRECOMPRESSED_ENCODINGS = (("br", ".br"), ("gzip", ".gz"))
+
+_ETAG_CACHE_SIZE = 1024
+_etag_cache: "OrderedDict[Tuple[str, int, int], str]" = OrderedDict()
+_etag_lock = threading.Lock()
+
+
+def file_etag(path: Path) -> str:
+    """
+    파일 내용 sha256 기반 강한 ETag 값 (따옴표 제외).
+
+    (경로, mtime, 크기)가 같으면 해시를 다시 계산하지 않는다.
+    """
+    stat = path.stat()
+    key = (str(path), stat.st_mtime_ns, stat.st_size)
+    with _etag_lock:
+        cached = _etag_cache.get(key)
+        if cached is not None:
+            _etag_cache.move_to_end(key)
+            return cached
+
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(1024 * 1024), b""):
+            digest.update(chunk)
+    etag = digest.hexdigest()
+
+    with _etag_lock:
+        _etag_cache[key] = etag
+        while len(_etag_cache) > _ETAG_CACHE_SIZE:
+            _etag_cache.popitem(last=False)
+    return etag
+
+
+def is_immutable_path(filepath: str) -> bool:
+    """
+    내용이 바뀌지 않는 경로인지
+
+    - 타임스탬프 이력 리포트: web/history/daily_report_YYYYMMDD_HHMMSS.html
+    - 내용 해시 이름의 아카이브 blob: web/history/blobs/<앞 2자리>/<sha256>.html.gz
+    """
+    parts = Path(filepath).parts
+    if len(parts) == 3 and parts[:2] == ("web", "history"):
+        return HISTORY_NAME_RE.match(parts[2]) is not None
+    if len(parts) != 5 or parts[:3] != ("web", "history", BLOB_DIR_NAME):
+        return False
+    match = BLOB_NAME_RE.match(parts[4])
+    return match is not None and match.group(1) == parts[3]
+
+
+def _precompressed_sibling(target: Path) -> Tuple[Optional[str], Path]:
+    """클라이언트가 받을 수 있고 원본보다 오래되지 않은 .br/.gz 파일 선택"""
+    target_mtime = target.stat().st_mtime_ns
+    for encoding, suffix in PRECOMPRESSED_ENCODINGS:
+        if encoding not in request.accept_encodings:
+            continue
+        sibling = target.with_name(target.name + suffix)
+        try:
+            if sibling.stat().st_mtime_ns >= target_mtime:
+                return encoding, sibling
+        except OSError:
+            continue
+    return None, target
+
+
+def _not_modified(etag: str, cache_control: str) -> Response:
+    response = Response(status=304)
+    response.set_etag(etag)
+    response.headers["Cache-Control"] = cache_control
+    response.headers["Vary"] = "Accept-Encoding"
+    return response
+
+
+def _finalize(response: Response, etag: str, cache_control: str, encoding: Optional[str]) -> Response:
+    response.set_etag(etag)
+    response.headers["Cache-Control"] = cache_control
+    response.headers["Vary"] = "Accept-Encoding"
+    if encoding:
+        response.headers["Content-Encoding"] = encoding
+    return response
+
+
+def _serve_archived_report(filepath: str) -> Optional[Response]:
+    """압축 아카이브로만 존재하는 이력 리포트를 gzip 그대로 응답한다 (대상이 아니면 None)."""
+    from web.routes import report_index
+
+    requested = Path(filepath)
+    if requested.parent != Path("web/history"):
+        return None
+    entry = report_index.find(requested.name)
+    blob_path = report_index.blob_path(entry) if entry else None
+    if blob_path is None or not blob_path.exists():
+        return None
+
+    # blob 이름이 원문 sha256이므로 해시 계산 없이 ETag로 사용한다.
+    # 이력 파일명은 한 번만 쓰므로(unused_history_filename) 파일명 -> blob 매핑도 바뀌지 않는다.
+    use_gzip = "gzip" in request.accept_encodings
+    etag = f"{entry.blob}-gzip" if use_gzip else entry.blob
+    if request.if_none_match.contains(etag):
+        return _not_modified(etag, IMMUTABLE_CACHE_CONTROL)
+
+    if use_gzip:
+        response = send_file(blob_path, mimetype="text/html", conditional=False, etag=False)
+        return _finalize(response, etag, IMMUTABLE_CACHE_CONTROL, "gzip")
+    with open(blob_path, "rb") as f:
+        response = Response(gzip.decompress(f.read()), mimetype="text/html")
+    return _finalize(response, etag, IMMUTABLE_CACHE_CONTROL, None)
+
+
+def serve_output_file(output_dir: Path, filepath: str) -> Response:
+    """
+    output 디렉터리 파일 응답.
+
+    - 강한 ETag(내용 sha256, 인코딩별 접미사)와 If-None-Match 304 응답
+    - 타임스탬프 이력 리포트와 내용 해시 이름의 아카이브 blob은 `Cache-Control: immutable`, 그 외(최신 리포트 등)는 `no-cache`(재검증)
+    - 클라이언트가 지원하면 미리 만들어 둔 `.br`/`.gz` 파일을 `Content-Encoding`과 함께 전송
+
+    Raises:
+        NotFound: 파일이 없거나 output 밖을 가리키는 경로
+    """
+    joined = safe_join(str(output_dir), filepath)
+    target = Path(joined) if joined else None
+    if target is None or not target.is_file():
+        archived = _serve_archived_report(filepath) if joined else None
+        if archived is not None:
+            return archived
+        raise NotFound()
+
+    cache_control = IMMUTABLE_CACHE_CONTROL if is_immutable_path(filepath) else REVALIDATE_CACHE_CONTROL
+    encoding, body_path = _precompressed_sibling(target)
+    base_etag = file_etag(target)
+    etag = f"{base_etag}-{encoding}" if encoding else base_etag
+    if request.if_none_match.contains(etag):
+        return _not_modified(etag, cache_control)
+
+    mimetype = mimetypes.guess_type(target.name)[0] or "application/octet-stream"
+    response = send_file(body_path, mimetype=mimetype, conditional=False, etag=False)
+    return _finalize(response, etag, cache_control, encoding)
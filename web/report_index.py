@@ -0,0 +1,198 @@
+"""
+리포트 파일 목록 인덱스 (디렉터리 mtime 기반 캐시)
+"""
+import os
+import threading
+from bisect import bisect_left
+from dataclasses import dataclass, field
+from datetime import date, datetime, time, timedelta
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+from storage.report_archive import REPORT_MANIFEST_NAME, ReportArchive, history_created_at, load_manifest
+
+LATEST_REPORT_NAME = "daily_report.html"
+
+
+@dataclass(frozen=True)
+class ReportEntry:
+    """리포트 파일 1건 (created_at은 파일명 타임스탬프 기준, metadata는 manifest 기록)"""
+
+    path: Path
+    created_at: datetime
+    metadata: Dict[str, Any] = field(default_factory=dict, compare=False)
+
+    @property
+    def blob(self) -> Optional[str]:
+        """아카이브 blob digest (평문 파일로 저장된 리포트는 None)"""
+        return self.metadata.get("blob")
+
+    @property
+    def sort_key(self) -> Tuple[datetime, str]:
+        return self.created_at, self.path.name
+
+    @property
+    def cursor(self) -> str:
+        """이 항목 다음(더 오래된) 페이지를 가리키는 커서"""
+        return f"{self.created_at.isoformat()}|{self.path.name}"
+
+
+def parse_cursor(cursor: str) -> Tuple[datetime, str]:
+    """커서 문자열 파싱 (형식 오류 시 ValueError)"""
+    created_at, sep, name = cursor.partition("|")
+    if not sep or not name:
+        raise ValueError(f"Invalid cursor: {cursor}")
+    return datetime.fromisoformat(created_at), name
+
+
+class ReportIndex:
+    """
+    `output/web`의 최신 리포트와 `history/` 이력 리포트를 최신순으로 캐시한다.
+
+    history 디렉터리, manifest, 최신 리포트의 mtime이 바뀌었을 때만 다시 읽어 정렬하며,
+    이력 파일은 stat 없이 파일명 타임스탬프로 정렬한다. 변경이 없으면 목록 조회는 O(limit)이고,
+    커서/기간 페이지 조회는 이분 탐색으로 시작 위치를 찾으므로 O(log n + limit)이다.
+    """
+
+    def __init__(self, output_dir: Path):
+        self.output_dir = Path(output_dir)
+        self.report_dir = self.output_dir / "web"
+        self.history_dir = self.report_dir / "history"
+        self._lock = threading.Lock()
+        self._signature: Optional[Tuple[int, int, int]] = None
+        self._entries: List[ReportEntry] = []
+        self._keys: List[Tuple[datetime, str]] = []  # 오래된 순 정렬 키 (bisect용)
+        self._by_name: Dict[str, ReportEntry] = {}
+        self.archive = ReportArchive(str(self.history_dir))
+
+    def _current_signature(self) -> Tuple[int, int, int]:
+        def mtime_ns(path: Path) -> int:
+            try:
+                return path.stat().st_mtime_ns
+            except OSError:
+                return -1
+
+        return (
+            mtime_ns(self.history_dir),
+            mtime_ns(self.history_dir / REPORT_MANIFEST_NAME),
+            mtime_ns(self.report_dir / LATEST_REPORT_NAME),
+        )
+
+    def _scan(self, signature: Tuple[int, int, int]) -> List[ReportEntry]:
+        manifest = load_manifest(str(self.history_dir)) if signature[1] >= 0 else {}
+        entries: List[ReportEntry] = []
+        plain_names = set()
+
+        if signature[0] >= 0:
+            with os.scandir(self.history_dir) as it:
+                for entry in it:
+                    if not (entry.name.startswith("daily_report_") and entry.name.endswith(".html")):
+                        continue
+                    created_at = history_created_at(entry.name)
+                    if created_at is None:
+                        # 타임스탬프 형식이 아닌 파일명만 mtime으로 정렬한다.
+                        created_at = datetime.fromtimestamp(entry.stat().st_mtime)
+                    plain_names.add(entry.name)
+                    entries.append(ReportEntry(
+                        path=Path(entry.path),
+                        created_at=created_at,
+                        metadata=manifest.get(entry.name, {}),
+                    ))
+
+        # 아카이브(blob)로만 존재하는 이력은 manifest 기록으로 목록에 포함한다.
+        for name, record in manifest.items():
+            created_at = history_created_at(name)
+            if name in plain_names or not record.get("blob") or created_at is None:
+                continue
+            entries.append(ReportEntry(path=self.history_dir / name, created_at=created_at, metadata=record))
+
+        if signature[2] >= 0:
+            # 최신 리포트는 최신본으로 기록된 마지막 manifest 항목의 메타데이터를 공유한다.
+            latest_records = [record for record in manifest.values() if record.get("latest")]
+            latest_metadata = max(latest_records, key=lambda r: r.get("created_at", "")) if latest_records else {}
+            entries.append(ReportEntry(
+                path=self.report_dir / LATEST_REPORT_NAME,
+                created_at=datetime.fromtimestamp(signature[2] / 1e9),
+                metadata=latest_metadata,
+            ))
+
+        entries.sort(key=lambda item: item.sort_key)
+        return entries
+
+    def _refresh(self) -> Tuple[List[ReportEntry], List[Tuple[datetime, str]]]:
+        signature = self._current_signature()
+        with self._lock:
+            if signature != self._signature:
+                self._entries = self._scan(signature)
+                self._keys = [entry.sort_key for entry in self._entries]
+                self._by_name = {entry.path.name: entry for entry in self._entries}
+                self._signature = signature
+            return self._entries, self._keys
+
+    def entries(self) -> List[ReportEntry]:
+        """최신순 리포트 목록 (변경 시에만 재구성)"""
+        return list(reversed(self._refresh()[0]))
+
+    def invalidate(self) -> None:
+        """다음 조회 시 디렉터리를 다시 읽도록 캐시를 비운다."""
+        with self._lock:
+            self._signature = None
+
+    def list(self, limit: int) -> List[ReportEntry]:
+        return self.page(limit)[0]
+
+    def latest(self) -> Optional[ReportEntry]:
+        entries = self._refresh()[0]
+        return entries[-1] if entries else None
+
+    def blob_path(self, entry: ReportEntry) -> Optional[Path]:
+        """아카이브된 리포트의 gzip blob 경로 (평문 파일 리포트는 None)"""
+        if entry.path.exists() or not entry.blob:
+            return None
+        return Path(self.archive.blob_path(entry.blob))
+
+    def read_html(self, entry: ReportEntry) -> str:
+        """리포트 HTML 본문 (평문 파일 또는 아카이브 blob)"""
+        blob_path = self.blob_path(entry)
+        if blob_path is not None:
+            return self.archive.read_text(entry.blob)
+        return entry.path.read_text(encoding="utf-8")
+
+    def find(self, filename: str) -> Optional[ReportEntry]:
+        """파일명으로 리포트 조회 (O(1))"""
+        self._refresh()
+        with self._lock:
+            return self._by_name.get(filename)
+
+    def page(
+        self,
+        limit: int,
+        cursor: Optional[str] = None,
+        date_from: Optional[date] = None,
+        date_to: Optional[date] = None,
+    ) -> Tuple[List[ReportEntry], Optional[str]]:
+        """
+        최신순 페이지 조회.
+
+        Args:
+            limit: 페이지 크기
+            cursor: 이전 페이지의 next_cursor (해당 항목보다 오래된 리포트부터)
+            date_from: 생성일 하한 (포함)
+            date_to: 생성일 상한 (포함)
+
+        Returns:
+            (리포트 목록, 다음 페이지 커서 또는 None)
+        """
+        entries, keys = self._refresh()
+
+        lo = bisect_left(keys, (datetime.combine(date_from, time.min), "")) if date_from else 0
+        hi = len(entries)
+        if date_to:
+            hi = bisect_left(keys, (datetime.combine(date_to + timedelta(days=1), time.min), ""))
+        if cursor:
+            hi = min(hi, bisect_left(keys, parse_cursor(cursor)))
+
+        start = max(lo, hi - limit)
+        page_entries = entries[start:hi][::-1]
+        next_cursor = page_entries[-1].cursor if page_entries and start > lo else None
+        return page_entries, next_cursor
@@ -1,78 +1,123 @@
 """
 API Routes for News Collector Dashboard
 """
-from flask import Blueprint, jsonify, request
+from flask import Blueprint, Response, jsonify, request
+import json
 import threading
-import uuid
 from pathlib import Path
-import sys
 import logging
 from datetime import datetime
 import os
-from dotenv import load_dotenv
 from config.recipient_store import (
     GROUP_TO_KEY,
     add_group_recipient,
     get_group_recipients,
     remove_group_recipient,
 )
+from utils.exceptions import LockHeldError
+from web.report_index import ReportEntry, ReportIndex
+from storage.job_queue import resolve_job_queue_path
+from web.task_manager import WORKER_MODE_EXTERNAL, TaskCapacityError, TaskManager
+from utils.profiling import parse_profile_stages
 
-# Load environment variables from .env file
-load_dotenv()
-
-# Add parent directory to path for imports
-sys.path.append(str(Path(__file__).parent.parent))
-
+# .env is loaded by create_app() before this module is imported (see web/app.py)
 logger = logging.getLogger(__name__)
 
 api_bp = Blueprint('api', __name__, url_prefix='/api')
 
-# Global task storage
-analysis_tasks = {}
-task_lock = threading.Lock()
-
-
-def _list_report_files():
-    """리포트 HTML 파일 목록(최신순) 반환"""
-    output_dir = Path(__file__).parent.parent / 'output'
-    report_dir = output_dir / 'web'
-    if not report_dir.exists():
-        return output_dir, []
-
-    candidates = []
-    latest_path = report_dir / 'daily_report.html'
-    if latest_path.exists():
-        candidates.append(latest_path)
+# Background analysis runs are persisted in the SQLite job queue; one pipeline at a time,
+# concurrent starts join the in-flight run. ANALYSIS_WORKER_MODE=external leaves execution to worker.py.
+ANALYSIS_TASK_KEY = 'analysis'
+task_manager = TaskManager(
+    queue_path=resolve_job_queue_path(),
+    mode=os.getenv('ANALYSIS_WORKER_MODE', WORKER_MODE_EXTERNAL).strip().lower(),
+    max_workers=1,
+    max_active=1,
+    ttl_seconds=3600,
+    max_tasks=50,
+)
 
-    history_dir = report_dir / 'history'
-    if history_dir.exists():
-        candidates.extend(history_dir.glob('daily_report_*.html'))
+# Each SSE client holds a request thread for the whole run: cap streams at half of WEB_THREADS per process
+# (extra clients get 503 and the dashboard falls back to status polling) and keep heartbeats sparse.
+SSE_KEEPALIVE_SECONDS = 30
+SSE_MAX_STREAMS = max(1, int(os.getenv('WEB_THREADS', '8')) // 2)
+_sse_slots = threading.BoundedSemaphore(SSE_MAX_STREAMS)
 
-    def sort_key(file_path: Path):
-        name = file_path.stem  # daily_report_YYYYMMDD_HHMMSS
-        if name.startswith('daily_report_'):
-            ts = name.replace('daily_report_', '')
-            try:
-                return datetime.strptime(ts, "%Y%m%d_%H%M%S")
-            except ValueError:
-                pass
-        return datetime.fromtimestamp(file_path.stat().st_mtime)
+# Report file index (re-scanned only when the report directories change)
+report_index = ReportIndex(Path(__file__).parent.parent / 'output')
 
-    ordered = sorted(candidates, key=sort_key, reverse=True)
-    return output_dir, ordered
+# Article store and full-text search index (lazy, shared across requests)
+_article_store = None
+_search_index = None
+_search_lock = threading.Lock()
 
 
-def _build_report_item(output_dir: Path, report_file: Path):
+def _build_report_item(entry: ReportEntry):
     """리포트 파일 응답 객체 생성"""
-    relative_path = report_file.relative_to(output_dir)
+    relative_path = entry.path.relative_to(report_index.output_dir)
     return {
-        'filename': report_file.name,
+        'filename': entry.path.name,
         'relative_path': str(relative_path),
         'url': f'/output/{relative_path}',
-        'created_at': datetime.fromtimestamp(report_file.stat().st_mtime).isoformat(),
+        'created_at': entry.created_at.isoformat(),
+        'run_id': entry.metadata.get('run_id'),
+        'article_counts': entry.metadata.get('article_counts'),
+        'total_articles': entry.metadata.get('total_articles'),
+        'alert_count': entry.metadata.get('alert_count'),
+        'llm_usage': entry.metadata.get('llm_usage'),
     }
 
 
+def _article_store_enabled():
+    """ARTICLE_STORE_ENABLED (config.settings와 같은 기본값/해석)"""
+    return os.getenv('ARTICLE_STORE_ENABLED', 'true').lower() == 'true'
+
+
+def _article_store_disabled_response():
+    return jsonify({
+        'success': False,
+        'message': '기사 저장소가 비활성화되어 있습니다 (ARTICLE_STORE_ENABLED=false)'
+    }), 503
+
+
+def _get_article_store():
+    """기사 저장소 열기 (최초 1회). 비활성화되어 있으면 None (파일을 만들지 않는다)"""
+    global _article_store
+    if not _article_store_enabled():
+        return None
+    with _search_lock:
+        if _article_store is None:
+            from storage.article_store import DEFAULT_STORE_PATH, ArticleStore
+
+            store_path = Path(os.getenv('ARTICLE_STORE_PATH', DEFAULT_STORE_PATH))
+            if not store_path.is_absolute():
+                store_path = Path(__file__).parent.parent / store_path
+            _article_store = ArticleStore(str(store_path))
+        return _article_store
+
+
+def _get_search_index():
+    """검색 인덱스를 열고 아직 색인되지 않은 실행을 반영한다 (최초 1회). 저장소 비활성화 시 None"""
+    global _search_index
+    store = _get_article_store()
+    if store is None:
+        return None
+    with _search_lock:
+        if _search_index is None:
+            from storage.search_index import SearchIndex
+
+            _search_index = SearchIndex(store)
+            _search_index.index_pending()
+        return _search_index
+
+
+def _parse_date_arg(name):
+    value = request.args.get(name, '').strip()
+    if not value:
+        return None
+    return datetime.strptime(value, '%Y-%m-%d').date()
+
+
 def _resolve_group():
     group = request.args.get("group", "report").strip()
     if group not in GROUP_TO_KEY:
@@ -86,100 +131,50 @@ def _resolve_group():
     return group, None
 
 
-def run_analysis_task(task_id):
-    """Run news collection and analysis task in background"""
-    try:
-        with task_lock:
-            analysis_tasks[task_id]['status'] = 'running'
-            analysis_tasks[task_id]['start_time'] = datetime.now().isoformat()
-            analysis_tasks[task_id]['progress'] = 0
-
-        # Import main collector
-        from main import NewsCollector, send_safety_alert_notification
-
-        # Create collector instance
-        collector = NewsCollector()
-
-        # Update progress
-        with task_lock:
-            analysis_tasks[task_id]['progress'] = 10
-
-        # Collect news
-        logger.info(f"Task {task_id}: Starting news collection")
-        all_news = collector.collect_all_categories()
-
-        with task_lock:
-            analysis_tasks[task_id]['progress'] = 50
-            analysis_tasks[task_id]['news_collected'] = len(all_news)
-
-        # Analyze news
-        logger.info(f"Task {task_id}: Analyzing {len(all_news)} news items")
-        analyzed_news = collector.analyze_news(all_news)
-        analyzed_news['external_alerts'] = collector.collect_external_alerts()
-
-        with task_lock:
-            analysis_tasks[task_id]['progress'] = 80
-            analysis_tasks[task_id]['news_analyzed'] = len(analyzed_news)
-
-        # Save results
-        logger.info(f"Task {task_id}: Saving results")
-        collector.save_results(analyzed_news)
-
-        # 해외 안전 공지 자동 메일 발송
-        if analyzed_news.get('external_alerts'):
-            logger.info(f"Task {task_id}: Sending safety alert digest")
-            send_safety_alert_notification(analyzed_news['external_alerts'], collector.settings)
-
-        with task_lock:
-            analysis_tasks[task_id]['status'] = 'completed'
-            analysis_tasks[task_id]['progress'] = 100
-            analysis_tasks[task_id]['end_time'] = datetime.now().isoformat()
-            analysis_tasks[task_id]['result'] = {
-                'total': 'Analysis completed',
-                'message': '분석이 완료되었습니다'
-            }
-
-        logger.info(f"Task {task_id}: Completed successfully")
-
-    except Exception as e:
-        logger.error(f"Task {task_id}: Error - {e}")
-        with task_lock:
-            analysis_tasks[task_id]['status'] = 'failed'
-            analysis_tasks[task_id]['error'] = str(e)
-            analysis_tasks[task_id]['end_time'] = datetime.now().isoformat()
-
-
 @api_bp.route('/analysis/start', methods=['POST'])
 def start_analysis():
-    """Start news collection and analysis task"""
+    """Start news collection and analysis task (joins the in-flight run if one exists)
+
+    Optional JSON body: {"profile": true | "collect,analyze"} writes per-stage cProfile/tracemalloc
+    artifacts to output/logs/profile_<run_id>/.
+    """
+    data = request.get_json(silent=True) or {}
+    profile = data.get('profile') or None
+    if profile is not None:
+        try:
+            parse_profile_stages(profile)
+        except (ValueError, TypeError) as e:
+            return jsonify({
+                'success': False,
+                'message': f'잘못된 프로파일 단계입니다: {e}'
+            }), 400
+
     try:
-        task_id = str(uuid.uuid4())
-
-        # Initialize task
-        with task_lock:
-            analysis_tasks[task_id] = {
-                'status': 'pending',
-                'progress': 0,
-                'start_time': None,
-                'end_time': None,
-                'news_collected': 0,
-                'news_analyzed': 0,
-                'error': None
-            }
-
-        # Start background task
-        thread = threading.Thread(target=run_analysis_task, args=(task_id,))
-        thread.daemon = True
-        thread.start()
-
-        logger.info(f"Started analysis task {task_id}")
+        params = {'profile': profile} if profile is not None else None
+        task_id, started = task_manager.start(ANALYSIS_TASK_KEY, params=params)
+
+        if started:
+            logger.info(f"Queued analysis task {task_id} ({task_manager.mode} worker, profile={profile})")
+            message = '뉴스 분석이 시작되었습니다'
+        else:
+            logger.info(f"Joined in-flight analysis task {task_id}")
+            message = '이미 진행 중인 분석에 연결되었습니다'
 
         return jsonify({
             'success': True,
             'task_id': task_id,
-            'message': '뉴스 분석이 시작되었습니다'
+            'coalesced': not started,
+            'profile': profile if started else None,
+            'message': message
         }), 200
 
+    except TaskCapacityError as e:
+        logger.warning(f"Analysis start rejected: {e}")
+        return jsonify({
+            'success': False,
+            'message': '대기 중인 분석 작업이 많습니다. 잠시 후 다시 시도하세요'
+        }), 429
+
     except Exception as e:
         logger.error(f"Error starting analysis: {e}")
         return jsonify({
@@ -192,23 +187,16 @@ def start_analysis():
 def get_analysis_status(task_id):
     """Get analysis task status"""
     try:
-        with task_lock:
-            if task_id not in analysis_tasks:
-                return jsonify({
-                    'success': False,
-                    'message': 'Task not found'
-                }), 404
-
-            task = analysis_tasks[task_id]
+        payload = task_manager.get(task_id)
+        if payload is None:
+            return jsonify({
+                'success': False,
+                'message': 'Task not found'
+            }), 404
 
         return jsonify({
             'success': True,
-            'status': task['status'],
-            'progress': task['progress'],
-            'news_collected': task.get('news_collected', 0),
-            'news_analyzed': task.get('news_analyzed', 0),
-            'error': task.get('error'),
-            'result': task.get('result')
+            **payload
         }), 200
 
     except Exception as e:
@@ -219,6 +207,54 @@ def get_analysis_status(task_id):
         }), 500
 
 
+@api_bp.route('/analysis/events/<task_id>', methods=['GET'])
+def stream_analysis_events(task_id):
+    """Stream analysis progress as server-sent events (resumable via Last-Event-ID)"""
+    if task_manager.get(task_id) is None:
+        return jsonify({
+            'success': False,
+            'message': 'Task not found'
+        }), 404
+
+    if not _sse_slots.acquire(blocking=False):
+        return jsonify({
+            'success': False,
+            'message': '실시간 진행 스트림 연결이 너무 많습니다. 상태 조회를 사용하세요.'
+        }), 503, {'Retry-After': str(SSE_KEEPALIVE_SECONDS)}
+
+    last_event_id = request.headers.get('Last-Event-ID', default=0, type=int) or 0
+
+    def generate():
+        sent = last_event_id
+        yield 'retry: 3000\n\n'
+        while True:
+            waited = task_manager.wait_events(task_id, sent, timeout=SSE_KEEPALIVE_SECONDS)
+            if waited is None:
+                return
+            pending, finished = waited
+
+            if not pending:
+                if finished:
+                    return
+                yield ': keep-alive\n\n'
+                continue
+
+            for event in pending:
+                data = json.dumps(event['data'], ensure_ascii=False)
+                yield f"id: {event['id']}\nevent: {event['event']}\ndata: {data}\n\n"
+                sent = event['id']
+            if finished:
+                return
+
+    response = Response(generate(), mimetype='text/event-stream', headers={
+        'Cache-Control': 'no-cache',
+        'X-Accel-Buffering': 'no',
+    })
+    # 클라이언트가 끊거나 스트림이 끝나면 슬롯을 돌려준다
+    response.call_on_close(_sse_slots.release)
+    return response
+
+
 @api_bp.route('/recipients', methods=['GET'])
 def get_recipients():
     """Get all email recipients"""
@@ -270,6 +306,13 @@ def add_recipient():
             'count': len(recipients)
         }), 200
 
+    except LockHeldError as e:
+        logger.warning(f"Recipient file busy while adding recipient: {e}")
+        return jsonify({
+            'success': False,
+            'message': '다른 작업이 수신자 목록을 수정 중입니다. 잠시 후 다시 시도하세요.'
+        }), 409
+
     except Exception as e:
         logger.error(f"Error adding recipient: {e}")
         return jsonify({
@@ -300,6 +343,13 @@ def remove_recipient(email):
             'message': message
         }), 400
 
+    except LockHeldError as e:
+        logger.warning(f"Recipient file busy while removing recipient: {e}")
+        return jsonify({
+            'success': False,
+            'message': '다른 작업이 수신자 목록을 수정 중입니다. 잠시 후 다시 시도하세요.'
+        }), 409
+
     except Exception as e:
         logger.error(f"Error removing recipient: {e}")
         return jsonify({
@@ -345,20 +395,16 @@ def send_email():
         from notifiers.email_formatter import EmailFormatter
 
         # Get latest analyzed news
-        output_dir, report_files = _list_report_files()
+        latest_report = report_index.latest()
 
-        if not report_files:
+        if latest_report is None:
             return jsonify({
                 'success': False,
                 'message': '발송할 뉴스가 없습니다. 먼저 분석을 실행해주세요.'
             }), 400
 
-        # Get latest HTML file
-        latest_html = report_files[0]
-
-        # Read HTML content
-        with open(latest_html, 'r', encoding='utf-8') as f:
-            html_content = f.read()
+        # Read latest HTML content (plain file or compressed archive)
+        html_content = report_index.read_html(latest_report)
 
         # Create sender with credentials
         sender = SMTPSender(user=gmail_user, password=gmail_app_password)
@@ -386,16 +432,15 @@ def send_email():
 def get_latest_report():
     """Get the latest HTML report file path"""
     try:
-        output_dir, report_files = _list_report_files()
+        latest_report = report_index.latest()
 
-        if not report_files:
+        if latest_report is None:
             return jsonify({
                 'success': False,
                 'message': '생성된 리포트가 없습니다'
             }), 404
 
-        latest_html = report_files[0]
-        payload = _build_report_item(output_dir, latest_html)
+        payload = _build_report_item(latest_report)
 
         return jsonify({
             'success': True,
@@ -412,25 +457,35 @@ def get_latest_report():
 
 @api_bp.route('/reports', methods=['GET'])
 def get_reports():
-    """Get report history (latest first)"""
+    """Get report history (latest first, cursor paginated)"""
     try:
-        output_dir, report_files = _list_report_files()
-        if not report_files:
-            return jsonify({
-                'success': True,
-                'reports': [],
-                'count': 0
-            }), 200
-
         limit = request.args.get('limit', default=30, type=int)
         if limit is None or limit < 1:
             limit = 30
-        reports = [_build_report_item(output_dir, report) for report in report_files[:limit]]
+        limit = min(limit, 200)
+
+        try:
+            date_from = _parse_date_arg('date_from')
+            date_to = _parse_date_arg('date_to')
+            entries, next_cursor = report_index.page(
+                limit,
+                cursor=request.args.get('cursor', '').strip() or None,
+                date_from=date_from,
+                date_to=date_to,
+            )
+        except ValueError:
+            return jsonify({
+                'success': False,
+                'message': '유효하지 않은 cursor 또는 날짜(YYYY-MM-DD) 입니다'
+            }), 400
+
+        reports = [_build_report_item(entry) for entry in entries]
 
         return jsonify({
             'success': True,
             'reports': reports,
-            'count': len(reports)
+            'count': len(reports),
+            'next_cursor': next_cursor
         }), 200
     except Exception as e:
         logger.error(f"Error getting reports: {e}")
@@ -438,3 +493,90 @@ def get_reports():
             'success': False,
             'message': str(e)
         }), 500
+
+
+@api_bp.route('/runs/<run_id>/usage', methods=['GET'])
+def get_run_usage(run_id):
+    """LLM token/latency/cost totals for a run, per category and model"""
+    from analyzers.usage import summarize_usage
+
+    try:
+        store = _get_article_store()
+        if store is None:
+            return _article_store_disabled_response()
+        if store.get_run(run_id) is None:
+            return jsonify({
+                'success': False,
+                'message': '실행 기록을 찾을 수 없습니다'
+            }), 404
+
+        return jsonify({
+            'success': True,
+            'run_id': run_id,
+            **summarize_usage(store.load_llm_usage(run_id))
+        }), 200
+    except Exception as e:
+        logger.error(f"Error getting LLM usage: {e}")
+        return jsonify({
+            'success': False,
+            'message': str(e)
+        }), 500
+
+
+@api_bp.route('/search', methods=['GET'])
+def search_archive():
+    """Full-text search over archived articles, summaries and 0404 alerts"""
+    from storage.search_index import DOC_TYPES, SORT_RELEVANCE, SORT_RECENT
+
+    query = request.args.get('q', '').strip()
+    if not query:
+        return jsonify({
+            'success': False,
+            'message': '검색어(q)를 입력하세요'
+        }), 400
+
+    doc_type = request.args.get('type', '').strip()
+    if doc_type and doc_type not in DOC_TYPES:
+        return jsonify({
+            'success': False,
+            'message': '유효하지 않은 type 입니다. article, summary 또는 alert를 사용하세요.'
+        }), 400
+
+    sort = request.args.get('sort', SORT_RECENT).strip()
+    if sort not in (SORT_RECENT, SORT_RELEVANCE):
+        sort = SORT_RECENT
+
+    try:
+        date_from = _parse_date_arg('date_from')
+        date_to = _parse_date_arg('date_to')
+    except ValueError:
+        return jsonify({
+            'success': False,
+            'message': '날짜는 YYYY-MM-DD 형식으로 입력하세요'
+        }), 400
+
+    try:
+        search_index = _get_search_index()
+        if search_index is None:
+            return _article_store_disabled_response()
+        result = search_index.search(
+            query,
+            doc_types=[doc_type] if doc_type else None,
+            category=request.args.get('category', '').strip() or None,
+            date_from=date_from,
+            date_to=date_to,
+            page=request.args.get('page', default=1, type=int) or 1,
+            page_size=request.args.get('page_size', default=20, type=int) or 20,
+            sort=sort,
+        )
+        return jsonify({
+            'success': True,
+            'query': query,
+            **result
+        }), 200
+    except Exception as e:
+        logger.error(f"Error searching archive: {e}")
+        return jsonify({
+            'success': False,
+            'message': str(e)
+        }), 500
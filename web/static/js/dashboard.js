@@ -5,7 +5,28 @@
 // Global state
 let currentTaskId = null;
 let progressInterval = null;
+let progressSource = null;
 let activities = [];
+let searchState = { params: null, page: 1 };
+let reportNextCursor = null;
+
+const ANALYSIS_EVENTS = ['stage', 'category_collected', 'category_analyzed', 'completed', 'failed'];
+
+const STAGE_LABELS = {
+    start: '분석 준비 중...',
+    collect: '뉴스 수집 중...',
+    analyze: '뉴스 분석 중...',
+    alerts: '0404 공지 수집 중...',
+    save: '결과 저장 중...',
+    notify: '안전 공지 메일 발송 중...',
+    done: '완료!'
+};
+
+const SEARCH_TYPE_LABELS = {
+    article: '기사',
+    summary: '요약',
+    alert: '0404 공지'
+};
 
 const RECIPIENT_GROUPS = {
     report: {
@@ -42,6 +63,15 @@ function setupEventListeners() {
     document.getElementById('start-analysis').addEventListener('click', startAnalysis);
     document.getElementById('view-results').addEventListener('click', viewResults);
     document.getElementById('send-email').addEventListener('click', sendEmail);
+    document.getElementById('report-more').addEventListener('click', () => loadReportOptions(true));
+    document.getElementById('report-select').addEventListener('change', loadSelectedRunUsage);
+    document.getElementById('search-submit').addEventListener('click', () => searchArchive());
+    document.getElementById('search-more').addEventListener('click', () => searchArchive(true));
+    document.getElementById('search-query').addEventListener('keypress', (e) => {
+        if (e.key === 'Enter') {
+            searchArchive();
+        }
+    });
 
     setupRecipientGroupEvents('report');
     setupRecipientGroupEvents('safety_alert');
@@ -62,22 +92,34 @@ function setupRecipientGroupEvents(group) {
 
 /**
  * Start news analysis
+ * (대시보드 URL에 ?profile 또는 ?profile=collect,analyze를 붙이면 단계별 프로파일링을 요청)
  */
 async function startAnalysis() {
     try {
         const button = document.getElementById('start-analysis');
         button.disabled = true;
 
+        const params = new URLSearchParams(window.location.search);
+        const body = params.has('profile') ? { profile: params.get('profile') || true } : {};
         const response = await fetch('/api/analysis/start', {
             method: 'POST',
-            headers: { 'Content-Type': 'application/json' }
+            headers: { 'Content-Type': 'application/json' },
+            body: JSON.stringify(body)
         });
         const data = await response.json();
 
         if (data.success) {
             currentTaskId = data.task_id;
-            showToast('분석 시작', data.message, 'info');
-            addActivity('🚀', '뉴스 분석 시작', data.message);
+            if (data.coalesced) {
+                showToast('분석 진행 중', data.message, 'info');
+                addActivity('🔗', '진행 중인 분석에 연결', data.message);
+            } else {
+                showToast('분석 시작', data.message, 'info');
+                addActivity('🚀', '뉴스 분석 시작', data.message);
+                if (data.profile) {
+                    addActivity('🔬', '프로파일링 활성화', `단계: ${data.profile === true ? '전체' : data.profile} (output/logs)`);
+                }
+            }
 
             document.getElementById('progress-container').style.display = 'block';
             updateSystemStatus('running');
@@ -94,13 +136,46 @@ async function startAnalysis() {
 }
 
 /**
- * Monitor analysis progress
+ * Monitor analysis progress (SSE, falls back to polling)
  */
 function monitorProgress(taskId) {
-    if (progressInterval) {
-        clearInterval(progressInterval);
+    stopProgressMonitor();
+
+    if (!window.EventSource) {
+        pollProgress(taskId);
+        return;
     }
 
+    const source = new EventSource(`/api/analysis/events/${taskId}`);
+    progressSource = source;
+
+    ANALYSIS_EVENTS.forEach(eventName => {
+        source.addEventListener(eventName, event => {
+            const data = JSON.parse(event.data);
+            updateProgress(data);
+            if (eventName === 'completed') {
+                stopProgressMonitor();
+                handleAnalysisComplete(data);
+            } else if (eventName === 'failed') {
+                stopProgressMonitor();
+                handleAnalysisFailed(data.error);
+            }
+        });
+    });
+
+    source.onerror = () => {
+        // 브라우저가 재연결을 포기한 경우(CLOSED, 동시 스트림 초과 503 포함)에만 폴링으로 전환
+        if (source.readyState === EventSource.CLOSED && progressSource === source) {
+            stopProgressMonitor();
+            pollProgress(taskId);
+        }
+    };
+}
+
+/**
+ * Poll analysis status (fallback when SSE is unavailable)
+ */
+function pollProgress(taskId) {
     progressInterval = setInterval(async () => {
         try {
             const response = await fetch(`/api/analysis/status/${taskId}`);
@@ -109,10 +184,10 @@ function monitorProgress(taskId) {
             if (data.success) {
                 updateProgress(data);
                 if (data.status === 'completed') {
-                    clearInterval(progressInterval);
+                    stopProgressMonitor();
                     handleAnalysisComplete(data);
                 } else if (data.status === 'failed') {
-                    clearInterval(progressInterval);
+                    stopProgressMonitor();
                     handleAnalysisFailed(data.error);
                 }
             }
@@ -122,6 +197,20 @@ function monitorProgress(taskId) {
     }, 2000);
 }
 
+/**
+ * Stop SSE stream and polling
+ */
+function stopProgressMonitor() {
+    if (progressSource) {
+        progressSource.close();
+        progressSource = null;
+    }
+    if (progressInterval) {
+        clearInterval(progressInterval);
+        progressInterval = null;
+    }
+}
+
 /**
  * Update progress display
  */
@@ -137,7 +226,9 @@ function updateProgress(data) {
     progressText.textContent = `${progressPercent}%`;
     progressBar.style.width = `${progressPercent}%`;
 
-    if (progressPercent < 30) {
+    if (data.stage && STAGE_LABELS[data.stage]) {
+        progressStatus.textContent = STAGE_LABELS[data.stage];
+    } else if (progressPercent < 30) {
         progressStatus.textContent = '뉴스 수집 중...';
     } else if (progressPercent < 60) {
         progressStatus.textContent = '뉴스 분석 중...';
@@ -151,6 +242,12 @@ function updateProgress(data) {
         progressDetails.style.display = 'flex';
         newsCollected.textContent = `수집: ${data.news_collected}건`;
         newsAnalyzed.textContent = `분석: ${data.news_analyzed}건`;
+        const categoryCount = Object.keys(data.categories || {}).length;
+        if (categoryCount > 0) {
+            newsCollected.title = Object.entries(data.categories)
+                .map(([name, counts]) => `${name}: 수집 ${counts.collected || 0} / 분석 ${counts.analyzed || 0}`)
+                .join('\n');
+        }
     }
 }
 
@@ -282,6 +379,9 @@ async function addRecipient(group) {
             addActivity('➕', `${config.label} 수신자 추가`, `${email} 추가됨`);
             emailInput.value = '';
             loadRecipients(group);
+        } else if (response.status === 409) {
+            // 다른 프로세스가 수신자 파일을 잠그고 있음 (재시도 가능)
+            showToast('잠시 후 다시 시도', data.message, 'warning');
         } else {
             showToast('실패', data.message, 'error');
         }
@@ -311,6 +411,8 @@ async function removeRecipient(group, email) {
             showToast('성공', data.message, 'success');
             addActivity('🗑️', `${config.label} 수신자 삭제`, `${email} 삭제됨`);
             loadRecipients(group);
+        } else if (response.status === 409) {
+            showToast('잠시 후 다시 시도', data.message, 'warning');
         } else {
             showToast('실패', data.message, 'error');
         }
@@ -384,48 +486,200 @@ async function viewResults() {
     }
 }
 
-async function loadReportOptions() {
+async function loadReportOptions(loadMore = false) {
     const reportHistory = document.getElementById('report-history');
     const reportSelect = document.getElementById('report-select');
+    const reportMoreBtn = document.getElementById('report-more');
     const viewResultsBtn = document.getElementById('view-results');
 
     if (!reportHistory || !reportSelect || !viewResultsBtn) {
         return;
     }
 
+    const params = new URLSearchParams({ limit: '50' });
+    if (loadMore && reportNextCursor) {
+        params.set('cursor', reportNextCursor);
+    }
+
     try {
-        const response = await fetch('/api/reports?limit=50');
+        const response = await fetch(`/api/reports?${params.toString()}`);
         const data = await response.json();
 
-        if (!data.success || !Array.isArray(data.reports) || data.reports.length === 0) {
+        if (!loadMore) {
             reportSelect.innerHTML = '';
+        }
+
+        if (!data.success || !Array.isArray(data.reports) || (!loadMore && data.reports.length === 0)) {
             reportHistory.style.display = 'none';
             return;
         }
 
-        reportSelect.innerHTML = '';
         data.reports.forEach((report) => {
             const option = document.createElement('option');
             option.value = report.url;
+            option.dataset.runId = report.run_id || '';
             option.textContent = formatReportLabel(report);
             reportSelect.appendChild(option);
         });
 
+        reportNextCursor = data.next_cursor || null;
+        if (reportMoreBtn) {
+            reportMoreBtn.style.display = reportNextCursor ? 'inline-flex' : 'none';
+        }
+
         reportHistory.style.display = 'flex';
         viewResultsBtn.style.display = 'inline-flex';
+        if (!loadMore) {
+            loadSelectedRunUsage();
+        }
     } catch (error) {
         console.error('Error loading report options:', error);
     }
 }
 
 function formatReportLabel(report) {
+    const usage = report.llm_usage
+        ? ` · 토큰 ${report.llm_usage.total_tokens.toLocaleString('ko-KR')}${formatCost(report.llm_usage.cost_usd, ' · ')}`
+        : '';
+    const counts = typeof report.total_articles === 'number'
+        ? ` (기사 ${report.total_articles}건 · 공지 ${report.alert_count || 0}건${usage})`
+        : '';
     if (report.created_at) {
         const parsed = new Date(report.created_at);
         if (!Number.isNaN(parsed.getTime())) {
-            return `${parsed.toLocaleString('ko-KR')} - ${report.filename}`;
+            return `${parsed.toLocaleString('ko-KR')} - ${report.filename}${counts}`;
         }
     }
-    return report.filename || '리포트';
+    return `${report.filename || '리포트'}${counts}`;
+}
+
+function formatCost(cost, prefix = '') {
+    return typeof cost === 'number' ? `${prefix}$${cost.toFixed(4)}` : '';
+}
+
+/**
+ * LLM token/cost breakdown for the selected report's run
+ */
+async function loadSelectedRunUsage() {
+    const usagePanel = document.getElementById('report-usage');
+    const reportSelect = document.getElementById('report-select');
+    const runId = reportSelect?.selectedOptions[0]?.dataset.runId;
+
+    if (!usagePanel) {
+        return;
+    }
+    if (!runId) {
+        usagePanel.style.display = 'none';
+        return;
+    }
+
+    try {
+        const response = await fetch(`/api/runs/${encodeURIComponent(runId)}/usage`);
+        const data = await response.json();
+
+        if (!data.success || !data.calls) {
+            usagePanel.style.display = 'none';
+            return;
+        }
+
+        const rows = document.getElementById('report-usage-rows');
+        rows.innerHTML = '';
+        Object.entries(data.categories)
+            .sort((a, b) => b[1].total_tokens - a[1].total_tokens)
+            .forEach(([category, totals]) => {
+                const tr = document.createElement('tr');
+                tr.innerHTML = `
+                    <td>${escapeHtml(category)}</td>
+                    <td>${totals.calls}${totals.failed_calls ? ` (실패 ${totals.failed_calls})` : ''}</td>
+                    <td>${totals.prompt_tokens.toLocaleString('ko-KR')}</td>
+                    <td>${totals.completion_tokens.toLocaleString('ko-KR')}</td>
+                    <td>${totals.latency_seconds.toFixed(1)}초</td>
+                    <td>${formatCost(totals.cost_usd) || '-'}</td>
+                `;
+                rows.appendChild(tr);
+            });
+
+        const models = Object.keys(data.models).map(escapeHtml).join(', ');
+        document.getElementById('report-usage-total').innerHTML =
+            `LLM 사용량: 호출 ${data.calls}회 · 토큰 ${data.total_tokens.toLocaleString('ko-KR')}` +
+            `${formatCost(data.cost_usd, ' · ')} · ${data.latency_seconds.toFixed(1)}초 (${models})`;
+        usagePanel.style.display = 'block';
+    } catch (error) {
+        console.error('Error loading LLM usage:', error);
+        usagePanel.style.display = 'none';
+    }
+}
+
+/**
+ * Full-text search over archived articles, summaries and 0404 alerts
+ */
+async function searchArchive(loadMore = false) {
+    const resultList = document.getElementById('search-results');
+
+    if (!loadMore) {
+        const query = document.getElementById('search-query').value.trim();
+        if (!query) {
+            showToast('입력 오류', '검색어를 입력하세요', 'warning');
+            return;
+        }
+
+        const params = new URLSearchParams({ q: query, page_size: '20' });
+        const filters = {
+            type: document.getElementById('search-type').value,
+            date_from: document.getElementById('search-date-from').value,
+            date_to: document.getElementById('search-date-to').value
+        };
+        Object.entries(filters).forEach(([key, value]) => {
+            if (value) {
+                params.set(key, value);
+            }
+        });
+
+        searchState = { params, page: 1 };
+        resultList.innerHTML = '';
+    } else {
+        searchState.page += 1;
+    }
+
+    searchState.params.set('page', String(searchState.page));
+
+    try {
+        const response = await fetch(`/api/search?${searchState.params.toString()}`);
+        const data = await response.json();
+
+        if (!data.success) {
+            showToast('검색 실패', data.message, 'error');
+            return;
+        }
+
+        data.items.forEach((item) => resultList.appendChild(renderSearchResult(item)));
+
+        document.getElementById('search-total').textContent = data.total_capped ? `${data.total}+` : data.total;
+        document.getElementById('search-summary').style.display = 'flex';
+        document.getElementById('search-more').style.display = data.has_more ? 'inline-flex' : 'none';
+    } catch (error) {
+        console.error('Error searching archive:', error);
+        showToast('오류', '검색 중 오류가 발생했습니다', 'error');
+    }
+}
+
+function renderSearchResult(item) {
+    const li = document.createElement('li');
+    li.className = 'search-result';
+
+    const published = item.published_at ? new Date(item.published_at).toLocaleDateString('ko-KR') : '';
+    const meta = [SEARCH_TYPE_LABELS[item.type] || item.type, item.category, item.source, published]
+        .filter(Boolean)
+        .map(escapeHtml)
+        .join(' • ');
+
+    li.innerHTML = `
+        <a target="_blank" rel="noopener">${escapeHtml(item.title || item.link)}</a>
+        <div class="search-result-body">${escapeHtml(item.body)}</div>
+        <div class="search-result-meta">${meta}</div>
+    `;
+    li.querySelector('a').href = item.link;
+    return li;
 }
 
 /**
@@ -0,0 +1,137 @@
+"""
+백그라운드 분석 작업 관리 (SQLite 작업 큐 등록, 내장/외부 worker 실행, 완료 작업 TTL 정리)
+"""
+import logging
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, List, Optional, Tuple
+
+from storage.job_queue import STALE_JOB_SECONDS, STATUS_PENDING, JobQueue, JobQueueFullError
+
+logger = logging.getLogger(__name__)
+
+WORKER_MODE_EMBEDDED = 'embedded'
+WORKER_MODE_EXTERNAL = 'external'
+
+
+class TaskCapacityError(RuntimeError):
+    """실행 중/대기 중 작업 수가 상한에 도달함"""
+
+
+class TaskManager:
+    """
+    작업 상태/이벤트는 JobQueue(SQLite)에 저장하고, 실행은 worker가 맡는다.
+
+    - `embedded`: 웹 프로세스 안의 `max_workers` 크기 스레드 풀이 큐를 비운다 (개발/단일 프로세스용).
+    - `external`: 등록만 하고 `python worker.py` 프로세스가 실행한다 (웹 요청 처리와 GIL을 나누지 않음).
+    - 같은 key의 대기/실행 중 작업이 있으면 새로 등록하지 않고 기존 task_id를 돌려준다 (single-flight).
+    - 대기+실행 작업은 `max_active`개로 제한하고, 완료 후 `ttl_seconds`가 지났거나 `max_tasks`를 넘는 작업은 정리한다.
+    """
+
+    def __init__(
+        self,
+        queue_path: Optional[str] = None,
+        queue: Optional[JobQueue] = None,
+        mode: str = WORKER_MODE_EMBEDDED,
+        max_workers: int = 1,
+        max_active: int = 4,
+        ttl_seconds: int = 3600,
+        max_tasks: int = 100,
+        prune_interval: float = 60.0,
+    ):
+        """
+        Args:
+            queue_path: 작업 큐 DB 경로 (queue 미지정 시 첫 사용 때 연다)
+            queue: 이미 연 JobQueue
+            mode: 'embedded' 또는 'external'
+        """
+        self.queue_path = queue_path
+        self.mode = mode
+        self.max_workers = max(1, max_workers)
+        self.max_active = max(1, max_active)
+        self.ttl_seconds = ttl_seconds
+        self.max_tasks = max(1, max_tasks)
+        self.prune_interval = prune_interval
+        self._queue = queue
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._lock = threading.Lock()
+        self._last_prune = 0.0
+
+    @property
+    def queue(self) -> JobQueue:
+        with self._lock:
+            if self._queue is None:
+                self._queue = JobQueue(self.queue_path)
+            return self._queue
+
+    def start(self, key: str, params: Optional[Dict[str, Any]] = None) -> Tuple[str, bool]:
+        """
+        작업 등록 (같은 key의 작업이 진행 중이면 그 작업에 합류).
+
+        Args:
+            key: single-flight 키 = 작업 종류 (예: 'analysis', worker.JOB_HANDLERS의 키)
+            params: worker에 넘길 실행 옵션 (예: {'profile': 'collect'})
+
+        Returns:
+            (task_id, 새로 등록했는지 여부)
+
+        Raises:
+            TaskCapacityError: 실행 중/대기 중 작업이 max_active개 이상
+        """
+        self._maybe_prune()
+        try:
+            task_id, created = self.queue.enqueue(key, max_active=self.max_active, params=params)
+        except JobQueueFullError as e:
+            raise TaskCapacityError(str(e)) from e
+        # 재시작 전에 등록만 되고 실행되지 않은 작업에 합류한 경우에도 내장 worker를 깨운다.
+        if self.mode == WORKER_MODE_EMBEDDED and (created or self.queue.get(task_id)['status'] == STATUS_PENDING):
+            self._submit_drain([key])
+        return task_id, created
+
+    def _submit_drain(self, kinds: List[str]) -> None:
+        from worker import default_worker_id, process_next_job
+
+        with self._lock:
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix='analysis-task')
+            executor = self._executor
+
+        def drain():
+            worker_id = default_worker_id('web')
+            while process_next_job(self.queue, worker_id, kinds=kinds):
+                pass
+
+        executor.submit(drain)
+
+    def _maybe_prune(self) -> None:
+        now = time.monotonic()
+        if self._last_prune and now - self._last_prune < self.prune_interval:
+            return
+        self._last_prune = now
+        try:
+            self.queue.recover_stale(STALE_JOB_SECONDS)
+            self.queue.prune(self.ttl_seconds, self.max_tasks)
+        except Exception as e:
+            logger.warning(f"Task pruning failed: {e}")
+
+    def get(self, task_id: str) -> Optional[Dict[str, Any]]:
+        """작업 상태 스냅샷 (없거나 정리된 작업이면 None)"""
+        self._maybe_prune()
+        return self.queue.get(task_id)
+
+    def wait_events(self, task_id: str, after: int, timeout: float) -> Optional[Tuple[List[Dict[str, Any]], bool]]:
+        """
+        `after` 이후 이벤트가 생기거나 작업이 끝날 때까지 최대 timeout초 대기.
+
+        Returns:
+            (새 이벤트 목록, 작업 종료 여부), 작업이 없으면 None
+        """
+        return self.queue.wait_events(task_id, after, timeout)
+
+    def shutdown(self, wait: bool = True) -> None:
+        """내장 worker 스레드 풀 종료 (wait=True면 실행 중인 작업이 끝날 때까지 대기)"""
+        with self._lock:
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=wait)
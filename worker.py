@@ -0,0 +1,215 @@
+"""
+분석 작업 Worker (웹 대시보드가 작업 큐에 등록한 분석 작업을 별도 프로세스에서 실행)
+"""
+import argparse
+import logging
+import os
+import socket
+import sys
+import threading
+import time
+from datetime import datetime
+from typing import Callable, Dict, List, Optional
+
+from storage.job_queue import (
+    STALE_JOB_SECONDS,
+    STATUS_COMPLETED,
+    STATUS_FAILED,
+    STATUS_RUNNING,
+    JobQueue,
+    resolve_job_queue_path,
+)
+from utils.exceptions import LockHeldError
+from utils.file_lock import pipeline_lock
+from utils.logger import log_context
+from utils.progress import STAGE_ALERTS, STAGE_ANALYZE, STAGE_COLLECT, STAGE_NOTIFY, STAGE_SAVE
+
+logger = logging.getLogger(__name__)
+
+ANALYSIS_JOB = 'analysis'
+HEARTBEAT_SECONDS = 30
+JOB_TTL_SECONDS = 3600
+MAX_FINISHED_JOBS = 50
+
+
+def default_worker_id(suffix: str = "worker") -> str:
+    return f"{socket.gethostname()}:{os.getpid()}:{suffix}"
+
+
+def _make_progress_callback(queue: JobQueue, job_id: str):
+    """파이프라인 진행 콜백 -> 카테고리별 카운터/진행률 반영"""
+    def compute(event, data, state):
+        categories = dict(state['categories'])
+        counters = dict(categories.get(data.get('category'), {}))
+        fields = {}
+        if event == 'category_collected':
+            counters['collected'] = data['count']
+            fields['progress'] = 10 + int(40 * data['done'] / max(1, data['total']))
+        elif event == 'category_analyzed':
+            counters['analyzed'] = data['count']
+            fields['progress'] = 50 + int(25 * data['done'] / max(1, data['total']))
+        else:
+            return None
+        categories[data['category']] = counters
+        fields['categories'] = categories
+        fields['news_collected'] = sum(c.get('collected', 0) for c in categories.values())
+        fields['news_analyzed'] = sum(c.get('analyzed', 0) for c in categories.values())
+        return fields
+
+    def on_progress(event, data):
+        queue.apply(job_id, event, lambda state: compute(event, data, state), detail=data)
+
+    return on_progress
+
+
+def run_analysis_job(queue: JobQueue, job_id: str) -> None:
+    """뉴스 수집/분석/저장/알림 파이프라인 실행 (진행 상황은 작업 큐 이벤트로 기록)"""
+    collector = None
+    try:
+        queue.update(job_id, 'stage', stage='start', progress=0, start_time=datetime.now().isoformat())
+
+        # CLI/스케줄러 실행과 겹치지 않도록 파이프라인 잠금
+        with pipeline_lock("dashboard"):
+            # Import main collector
+            from main import NewsCollector, send_safety_alert_notification
+
+            # Create collector instance
+            params = queue.get_params(job_id)
+            collector = NewsCollector(
+                progress=_make_progress_callback(queue, job_id), profile=params.get('profile')
+            )
+
+            # Collect news
+            queue.update(job_id, 'stage', stage=STAGE_COLLECT, progress=10)
+            logger.info(f"Job {job_id}: Starting news collection")
+            all_news = collector.collect_all_categories()
+
+            # Analyze news
+            queue.update(job_id, 'stage', stage=STAGE_ANALYZE, progress=50)
+            logger.info(f"Job {job_id}: Analyzing {len(all_news)} categories")
+            analyzed_news = collector.analyze_news(all_news)
+
+            queue.update(job_id, 'stage', stage=STAGE_ALERTS, progress=75)
+            analyzed_news['external_alerts'] = collector.collect_external_alerts()
+
+            # Save results
+            queue.update(job_id, 'stage', stage=STAGE_SAVE, progress=80,
+                         detail={'alerts': len(analyzed_news['external_alerts'] or [])})
+            logger.info(f"Job {job_id}: Saving results")
+            collector.save_results(analyzed_news)
+
+            # 해외 안전 공지 자동 메일 발송
+            if analyzed_news.get('external_alerts'):
+                queue.update(job_id, 'stage', stage=STAGE_NOTIFY, progress=90)
+                logger.info(f"Job {job_id}: Sending safety alert digest")
+                send_safety_alert_notification(analyzed_news['external_alerts'], collector.settings)
+
+            news_collected = queue.get(job_id)['news_collected']
+            queue.update(
+                job_id, STATUS_COMPLETED, status=STATUS_COMPLETED,
+                stage='done', progress=100, end_time=datetime.now().isoformat(),
+                result={
+                    'total': news_collected,
+                    'message': '분석이 완료되었습니다'
+                },
+            )
+
+        logger.info(f"Job {job_id}: Completed successfully")
+
+    except LockHeldError as e:
+        logger.warning(f"Job {job_id}: {e}")
+        queue.update(job_id, STATUS_FAILED, status=STATUS_FAILED,
+                     error='다른 파이프라인 실행(CLI/스케줄러)이 진행 중입니다', end_time=datetime.now().isoformat())
+    except Exception as e:
+        logger.error(f"Job {job_id}: Error - {e}")
+        if collector is not None:
+            try:
+                collector.fail_run(str(e))
+            except Exception as fail_error:
+                logger.warning(f"Job {job_id}: could not record run failure - {fail_error}")
+        queue.update(job_id, STATUS_FAILED, status=STATUS_FAILED, error=str(e), end_time=datetime.now().isoformat())
+
+
+JOB_HANDLERS: Dict[str, Callable[[JobQueue, str], None]] = {
+    ANALYSIS_JOB: run_analysis_job,
+}
+
+
+def process_next_job(queue: JobQueue, worker_id: str, kinds: Optional[List[str]] = None) -> bool:
+    """
+    대기 작업 1건을 선점해 실행한다 (실행 중에는 heartbeat 갱신).
+
+    Returns:
+        작업을 실행했으면 True, 대기 작업이 없으면 False
+    """
+    job = queue.claim(worker_id, kinds=kinds or list(JOB_HANDLERS))
+    if job is None:
+        return False
+
+    job_id = job['job_id']
+    logger.info(f"Worker {worker_id}: Running {job['kind']} job {job_id}")
+    stop = threading.Event()
+
+    def beat():
+        while not stop.wait(HEARTBEAT_SECONDS):
+            try:
+                queue.heartbeat(job_id)
+            except Exception as e:
+                logger.warning(f"Job {job_id}: heartbeat failed: {e}")
+
+    heartbeat = threading.Thread(target=beat, name=f"heartbeat-{job_id[:8]}", daemon=True)
+    heartbeat.start()
+    try:
+        with log_context(job_id=job_id):
+            JOB_HANDLERS[job['kind']](queue, job_id)
+    except Exception as e:
+        logger.error(f"Job {job_id}: Unhandled error - {e}")
+    finally:
+        stop.set()
+        heartbeat.join()
+        snapshot = queue.get(job_id)
+        if snapshot and snapshot['status'] == STATUS_RUNNING:
+            queue.update(job_id, STATUS_FAILED, status=STATUS_FAILED,
+                         error=snapshot.get('error') or 'Job ended without a result')
+    return True
+
+
+def run_worker(queue: JobQueue, worker_id: str, poll_interval: float = 2.0, once: bool = False) -> None:
+    """대기 작업을 계속 가져와 실행 (once=True면 대기 작업이 없을 때 종료)"""
+    logger.info(f"Worker {worker_id}: watching {queue.path}")
+    while True:
+        queue.recover_stale(STALE_JOB_SECONDS)
+        queue.prune(JOB_TTL_SECONDS, MAX_FINISHED_JOBS)
+        if process_next_job(queue, worker_id):
+            continue
+        if once:
+            return
+        time.sleep(poll_interval)
+
+
+def parse_args(argv: Optional[List[str]] = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="뉴스 분석 작업 Worker")
+    parser.add_argument("--queue", help="작업 큐 DB 경로 (기본: JOB_QUEUE_PATH 또는 output/store/jobs.db)")
+    parser.add_argument("--poll-interval", type=float, default=2.0, help="대기 작업 확인 간격(초, 기본 2)")
+    parser.add_argument("--once", action="store_true", help="대기 작업을 모두 처리하면 종료")
+    return parser.parse_args(argv)
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    logging.basicConfig(
+        level=logging.INFO,
+        format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+    )
+    args = parse_args(argv)
+    queue = JobQueue(resolve_job_queue_path(args.queue))
+    try:
+        run_worker(queue, default_worker_id(), poll_interval=args.poll_interval, once=args.once)
+    except KeyboardInterrupt:
+        logger.info("Worker stopped by user")
+        sys.exit(0)
+    finally:
+        queue.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,6 @@
+"""
+WSGI 진입점 (gunicorn wsgi:app -c gunicorn.conf.py)
+"""
+from web.app import create_app
+
+app = create_app()